@@ -1,15 +1,23 @@
 #!/usr/bin/env python3
 """
 Script to add 72 new test cases to Hello Master test cases.xlsx
+
+Usage:
+    python add_test_cases.py
+    python add_test_cases.py --journal   # record the rows, apply later with compact_journal.py
 """
 import sys
 import re
+import argparse
+from itertools import groupby
 from pathlib import Path
 
 # Add parent directory to path to import common utilities
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from common.excel_utils import (
+    append_rows,
+    get_data_extent,
     load_excel_safely,
     save_excel_safely,
     get_excel_path,
@@ -17,21 +25,110 @@ from common.excel_utils import (
     print_section_header,
     print_separator
 )
+from common.atomic_io import DEFAULT_BACKUP_COUNT
+from common.mutation_journal import OP_INSERT, JournalEntry, MutationJournal, get_journal_path
 from openpyxl.styles import Font, Alignment
+from typing import Dict, Iterable, Iterator, Tuple
+
+# Section headings in the markdown file and the sheet group they feed
+SECTION_SHEETS = {
+    'SECTION 1: ADMIN - TEACHER URL GENERATION': 'Admin Onboard',
+    'SECTION 2: ADMIN - SCHOOL REGISTRATION': 'Admin Onboard',
+    'SECTION 3: TEACHER - REPORTING & MONITORING': 'Teacher - Email',
+    'SECTION 4: SECURITY TESTING': 'Security Testing',
+    'SECTION 5: NEGATIVE SCENARIOS - AUTHENTICATION': 'Negative Scenarios'
+}
+
+SECTION_PATTERN = re.compile('|'.join(re.escape(key) for key in SECTION_SHEETS))
+MODULE_PREFIX = '### Module:'
+ROW_PREFIX = '| **'
+BULLET_PATTERN = re.compile(r'^- ', re.MULTILINE)
+
+# Sheet layout: record key for each column (Pass/Failed and Notes start empty)
+SHEET_HEADERS = ['#', 'Module', 'Tittle', 'Pre-Conditioin', 'Steps to folow', 'Expected results',
+                 'Pass/Failed', 'Notes']
+TEST_CASE_COLUMNS = ['test_id', 'module', 'title', 'precondition', 'test_steps', 'expected_result',
+                     None, None]
+
+
+def _parse_row(line: str, module: str) -> dict:
+    """
+    Parse one test case table row.
+
+    Args:
+        line: Stripped table row starting with '| **'
+        module: Module heading the row belongs to
+
+    Returns:
+        dict: Test case fields, or None if the row has too few columns
+    """
+    parts = [p.strip() for p in line.split('|')]
+
+    # At least Test ID, Title, Priority, Pre-condition, Test Steps, Expected Result
+    if len(parts) < 7:
+        return None
+
+    # Clean HTML tags from steps and expected results, and remove
+    # bullet points (- ) from expected results
+    expected_result = BULLET_PATTERN.sub('', parts[6].replace('<br>', '\n'))
+
+    return {
+        'test_id': parts[1].replace('**', '').strip(),
+        'module': module,
+        'title': parts[2],
+        'priority': parts[3],
+        'precondition': parts[4],
+        'test_steps': parts[5].replace('<br>', '\n'),
+        'expected_result': expected_result
+    }
+
 
-def parse_markdown_test_cases(file_path: Path):
+def iter_test_case_rows(lines: Iterable[str]) -> Iterator[Tuple[str, dict]]:
     """
-    Parse test cases from markdown file.
+    Tokenize markdown lines into test cases in a single pass.
+
+    Each line is classified once (table row, module heading or section
+    heading) and only the current section and module are kept, so any
+    number of lines can be parsed in constant memory.
+
+    Args:
+        lines: Markdown lines (e.g. an open file)
+
+    Yields:
+        tuple: (sheet group, test case dict) for each test case row
+    """
+    current_section = None
+    current_module = None
+
+    for line in lines:
+        line = line.strip()
+
+        if line.startswith(ROW_PREFIX):
+            if current_section:
+                test_case = _parse_row(line, current_module)
+                if test_case:
+                    yield current_section, test_case
+        elif line.startswith(MODULE_PREFIX):
+            current_module = line[len(MODULE_PREFIX):].strip()
+        else:
+            match = SECTION_PATTERN.search(line)
+            if match:
+                current_section = SECTION_SHEETS[match.group(0)]
+
+
+def iter_markdown_test_cases(file_path: Path) -> Iterator[Tuple[str, dict]]:
+    """
+    Stream test cases from a markdown file.
 
     Args:
         file_path: Path to the markdown file
 
-    Returns:
-        dict: Parsed test cases organized by section
+    Yields:
+        tuple: (sheet group, test case dict) for each test case row
     """
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+            yield from iter_test_case_rows(f)
     except FileNotFoundError:
         print(f"Error: Markdown file not found at {file_path}", file=sys.stderr)
         raise
@@ -39,89 +136,53 @@ def parse_markdown_test_cases(file_path: Path):
         print(f"Error reading markdown file: {e}", file=sys.stderr)
         raise
 
-    test_cases = {
-        'Admin Onboard': [],
-        'Teacher - Email': [],
-        'Security Testing': [],
-        'Negative Scenarios': []
-    }
 
-    # Define sections
-    sections = {
-        'SECTION 1: ADMIN - TEACHER URL GENERATION': 'Admin Onboard',
-        'SECTION 2: ADMIN - SCHOOL REGISTRATION': 'Admin Onboard',
-        'SECTION 3: TEACHER - REPORTING & MONITORING': 'Teacher - Email',
-        'SECTION 4: SECURITY TESTING': 'Security Testing',
-        'SECTION 5: NEGATIVE SCENARIOS - AUTHENTICATION': 'Negative Scenarios'
-    }
+def _empty_stats() -> Dict[str, int]:
+    """Per-sheet counts, starting at 0 for every sheet the markdown feeds."""
+    return {sheet: 0 for sheet in dict.fromkeys(SECTION_SHEETS.values())}
 
-    current_section = None
-    current_module = None
 
-    lines = content.split('\n')
-    i = 0
-
-    while i < len(lines):
-        line = lines[i].strip()
-
-        # Detect section headers
-        for section_key, sheet_name in sections.items():
-            if section_key in line:
-                current_section = sheet_name
-                print(f"Found section: {section_key} -> Sheet: {sheet_name}")
-                break
-
-        # Detect module (### Module: ...)
-        if line.startswith('### Module:'):
-            current_module = line.replace('### Module:', '').strip()
-            print(f"  Module: {current_module}")
-
-        # Look for table rows starting with |
-        if line.startswith('| **') and current_section:
-            # This is a test case row
-            # Parse the table row
-            parts = [p.strip() for p in line.split('|')]
-
-            if len(parts) >= 7:  # At least Test ID, Title, Priority, Pre-condition, Test Steps, Expected Result
-                test_id = parts[1].replace('**', '').strip()
-                title = parts[2].strip()
-                priority = parts[3].strip()
-                precondition = parts[4].strip()
-                test_steps = parts[5].strip()
-                expected_result = parts[6].strip()
-
-                # Clean HTML tags from steps and expected results
-                test_steps = test_steps.replace('<br>', '\n')
-                expected_result = expected_result.replace('<br>', '\n')
-
-                # Remove bullet points (- ) from expected results
-                expected_result = re.sub(r'^- ', '', expected_result, flags=re.MULTILINE)
-                expected_result = re.sub(r'\n- ', '\n', expected_result)
-
-                test_case = {
-                    'test_id': test_id,
-                    'module': current_module,
-                    'title': title,
-                    'priority': priority,
-                    'precondition': precondition,
-                    'test_steps': test_steps,
-                    'expected_result': expected_result
-                }
-
-                test_cases[current_section].append(test_case)
-                print(f"    Added: {test_id} - {title}")
-
-        i += 1
-
-    return test_cases
-
-def add_test_cases_to_excel(excel_path: Path, test_cases: dict):
+def get_or_create_sheet(wb, sheet_name: str):
+    """
+    Get a worksheet, creating it with the standard test case headers.
+
+    Args:
+        wb: Workbook to look in
+        sheet_name: Name of the sheet
+
+    Returns:
+        Worksheet
+    """
+    if sheet_name in wb.sheetnames:
+        print(f"Using existing '{sheet_name}' sheet")
+        return wb[sheet_name]
+
+    ws = wb.create_sheet(sheet_name)
+    print(f"Created new '{sheet_name}' sheet")
+
+    append_rows(ws, [SHEET_HEADERS], start_row=1)
+    for cell in ws[1]:
+        cell.font = Font(bold=True)
+        cell.alignment = Alignment(horizontal='center', vertical='center')
+    return ws
+
+
+def add_test_cases_to_excel(excel_path: Path, test_cases: Iterable[Tuple[str, dict]],
+                            backups: int = 0):
     """
     Add test cases to the Excel file.
 
+    Test cases are streamed straight into the sheet of the same name as
+    their section: each run of consecutive cases for one sheet is written
+    by one append_rows() call, styled like the sheet's last existing test
+    case. Only the next free row of each open sheet is kept, never the
+    cases themselves.
+
     Args:
         excel_path: Path to the Excel file
-        test_cases: Dictionary of test cases to add
+        test_cases: (section, test case dict) pairs, e.g. from
+            iter_markdown_test_cases()
+        backups: Number of previous versions to keep in test_cases/backups/
 
     Returns:
         dict: Statistics of test cases added
@@ -134,151 +195,33 @@ def add_test_cases_to_excel(excel_path: Path, test_cases: dict):
         print(f"Error loading Excel file: {e}", file=sys.stderr)
         raise
 
-    # Define mapping
-    sheet_mapping = {
-        'Admin Onboard': 'Admin Onboard',
-        'Teacher - Email': 'Teacher - Email',
-        'Security Testing': None,  # Need to create new sheet
-        'Negative Scenarios': 'Admin Onboard'  # Add to appropriate sheet based on test ID
-    }
+    stats = _empty_stats()
+    # Open sheets: section -> (worksheet, next free row, style row)
+    sheets = {}
 
-    # Statistics
-    stats = {
-        'Admin Onboard': 0,
-        'Teacher - Email': 0,
-        'Security Testing': 0,
-        'Negative Scenarios': 0
-    }
+    for section, run in groupby(test_cases, key=lambda pair: pair[0]):
+        if section not in sheets:
+            print(f"\n{'='*60}")
+            print(f"Processing section: {section}")
+            print(f"{'='*60}")
+
+            ws = get_or_create_sheet(wb, section)
+            last_row = get_data_extent(ws).max_row
+            sheets[section] = (ws, last_row + 1, last_row if last_row > 1 else None)
 
-    # Process each section
-    for section, cases in test_cases.items():
-        if not cases:
-            continue
-
-        print(f"\n{'='*60}")
-        print(f"Processing section: {section}")
-        print(f"Number of test cases: {len(cases)}")
-        print(f"{'='*60}")
-
-        # Handle Security Testing - create new sheet
-        if section == 'Security Testing':
-            if 'Security Testing' in wb.sheetnames:
-                ws = wb['Security Testing']
-                print("Using existing 'Security Testing' sheet")
-            else:
-                ws = wb.create_sheet('Security Testing')
-                print("Created new 'Security Testing' sheet")
-
-                # Add headers
-                headers = ['#', 'Module', 'Tittle', 'Pre-Conditioin', 'Steps to folow', 'Expected results', 'Pass/Failed', 'Notes']
-                for col_idx, header in enumerate(headers, start=1):
-                    cell = ws.cell(row=1, column=col_idx)
-                    cell.value = header
-                    cell.font = Font(bold=True)
-                    cell.alignment = Alignment(horizontal='center', vertical='center')
-
-            # Get next available row
-            next_row = ws.max_row + 1
-
-            # Add test cases
-            for tc in cases:
-                ws.cell(row=next_row, column=1, value=tc['test_id'])
-                ws.cell(row=next_row, column=2, value=tc['module'])
-                ws.cell(row=next_row, column=3, value=tc['title'])
-                ws.cell(row=next_row, column=4, value=tc['precondition'])
-                ws.cell(row=next_row, column=5, value=tc['test_steps'])
-                ws.cell(row=next_row, column=6, value=tc['expected_result'])
-                ws.cell(row=next_row, column=7, value='')  # Pass/Failed - empty
-                ws.cell(row=next_row, column=8, value='')  # Notes - empty
-
-                print(f"Added {tc['test_id']}: {tc['title']}")
-                next_row += 1
-                stats[section] += 1
-
-        # Handle Admin Onboard
-        elif section == 'Admin Onboard':
-            sheet_name = 'Admin Onboard'
-            ws = wb[sheet_name]
-            next_row = ws.max_row + 1
-
-            # Add test cases
-            for tc in cases:
-                ws.cell(row=next_row, column=1, value=tc['test_id'])
-                ws.cell(row=next_row, column=2, value=tc['module'])
-                ws.cell(row=next_row, column=3, value=tc['title'])
-                ws.cell(row=next_row, column=4, value=tc['precondition'])
-                ws.cell(row=next_row, column=5, value=tc['test_steps'])
-                ws.cell(row=next_row, column=6, value=tc['expected_result'])
-                ws.cell(row=next_row, column=7, value='')  # Pass/Failed - empty
-                ws.cell(row=next_row, column=8, value='')  # Notes - empty
-
-                print(f"Added {tc['test_id']}: {tc['title']}")
-                next_row += 1
-                stats[section] += 1
-
-        # Handle Teacher - Email
-        elif section == 'Teacher - Email':
-            sheet_name = 'Teacher - Email'
-            ws = wb[sheet_name]
-            next_row = ws.max_row + 1
-
-            # Add test cases
-            for tc in cases:
-                ws.cell(row=next_row, column=1, value=tc['test_id'])
-                ws.cell(row=next_row, column=2, value=tc['module'])
-                ws.cell(row=next_row, column=3, value=tc['title'])
-                ws.cell(row=next_row, column=4, value=tc['precondition'])
-                ws.cell(row=next_row, column=5, value=tc['test_steps'])
-                ws.cell(row=next_row, column=6, value=tc['expected_result'])
-                ws.cell(row=next_row, column=7, value='')  # Pass/Failed - empty
-                ws.cell(row=next_row, column=8, value='')  # Notes - empty
-
-                print(f"Added {tc['test_id']}: {tc['title']}")
-                next_row += 1
-                stats[section] += 1
-
-        # Handle Negative Scenarios - distribute based on test ID prefix
-        elif section == 'Negative Scenarios':
-            # These are authentication negative scenarios, add to a new sheet or appropriate existing sheet
-            # For now, let's create a new sheet "Negative Scenarios"
-            if 'Negative Scenarios' in wb.sheetnames:
-                ws = wb['Negative Scenarios']
-                print("Using existing 'Negative Scenarios' sheet")
-            else:
-                ws = wb.create_sheet('Negative Scenarios')
-                print("Created new 'Negative Scenarios' sheet")
-
-                # Add headers
-                headers = ['#', 'Module', 'Tittle', 'Pre-Conditioin', 'Steps to folow', 'Expected results', 'Pass/Failed', 'Notes']
-                for col_idx, header in enumerate(headers, start=1):
-                    cell = ws.cell(row=1, column=col_idx)
-                    cell.value = header
-                    cell.font = Font(bold=True)
-                    cell.alignment = Alignment(horizontal='center', vertical='center')
-
-            # Get next available row
-            next_row = ws.max_row + 1
-
-            # Add test cases
-            for tc in cases:
-                ws.cell(row=next_row, column=1, value=tc['test_id'])
-                ws.cell(row=next_row, column=2, value=tc['module'])
-                ws.cell(row=next_row, column=3, value=tc['title'])
-                ws.cell(row=next_row, column=4, value=tc['precondition'])
-                ws.cell(row=next_row, column=5, value=tc['test_steps'])
-                ws.cell(row=next_row, column=6, value=tc['expected_result'])
-                ws.cell(row=next_row, column=7, value='')  # Pass/Failed - empty
-                ws.cell(row=next_row, column=8, value='')  # Notes - empty
-
-                print(f"Added {tc['test_id']}: {tc['title']}")
-                next_row += 1
-                stats[section] += 1
+        ws, next_row, style_row = sheets[section]
+        added = append_rows(ws, (case for _, case in run), TEST_CASE_COLUMNS,
+                            start_row=next_row, style_row=style_row)
+        if added.count:
+            print(f"Added {added.count} test cases to rows {added.first_row}-{added.last_row}")
+        sheets[section] = (ws, next_row + added.count, style_row)
+        stats[section] = stats.get(section, 0) + added.count
 
     # Save the workbook
     print_separator("=", 60)
     print("Saving updated Excel file...")
 
-    success = save_excel_safely(wb, excel_path)
+    success = save_excel_safely(wb, excel_path, backups=backups)
     wb.close()
 
     if not success:
@@ -288,8 +231,46 @@ def add_test_cases_to_excel(excel_path: Path, test_cases: dict):
 
     return stats
 
+def journal_test_cases(journal: MutationJournal, test_cases: Iterable[Tuple[str, dict]]):
+    """
+    Record test cases as journal inserts instead of saving the workbook.
+
+    The rows are written to the workbook by compact_journal.py, styled the
+    same way as add_test_cases_to_excel() would. Only the content columns
+    are recorded; Pass/Failed and Notes are left for the tester.
+
+    Args:
+        journal: Journal to append to
+        test_cases: (section, test case dict) pairs, e.g. from
+            iter_markdown_test_cases()
+
+    Returns:
+        dict: Statistics of test cases recorded
+    """
+    stats = _empty_stats()
+
+    def entries():
+        for section, case in test_cases:
+            fields = {header: case.get(key)
+                      for header, key in zip(SHEET_HEADERS, TEST_CASE_COLUMNS) if key}
+            stats[section] = stats.get(section, 0) + 1
+            yield JournalEntry(OP_INSERT, section, case['test_id'], fields)
+
+    recorded = journal.record(entries())
+    print(f"Recorded {recorded} inserts in {journal.path}")
+    return stats
+
+
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Add new test cases from markdown to the workbook")
+    parser.add_argument(
+        '--journal',
+        action='store_true',
+        help='Record the rows in the mutation journal instead of saving the workbook'
+    )
+    args = parser.parse_args()
+
     markdown_file = get_docs_path('New_Test_Cases_To_Add.md')
     excel_file = get_excel_path()
 
@@ -305,22 +286,14 @@ def main():
         sys.exit(1)
 
     try:
-        # Parse markdown
-        print("\n1. Parsing markdown file...")
-        test_cases = parse_markdown_test_cases(markdown_file)
-
-        # Summary of parsed test cases
-        print_section_header("PARSING SUMMARY", "=", 60)
-        total = 0
-        for section, cases in test_cases.items():
-            count = len(cases)
-            total += count
-            print(f"{section}: {count} test cases")
-        print(f"TOTAL: {total} test cases")
-
-        # Add to Excel
-        print("\n2. Adding test cases to Excel...")
-        stats = add_test_cases_to_excel(excel_file, test_cases)
+        # The markdown is parsed while the rows are written, one line at a time
+        test_cases = iter_markdown_test_cases(markdown_file)
+        if args.journal:
+            print("\nRecording test cases from the markdown file in the journal...")
+            stats = journal_test_cases(MutationJournal(get_journal_path(excel_file)), test_cases)
+        else:
+            print("\nAdding test cases from the markdown file to Excel...")
+            stats = add_test_cases_to_excel(excel_file, test_cases, backups=DEFAULT_BACKUP_COUNT)
 
         # Final summary
         print_section_header("FINAL SUMMARY", "=", 60)
@@ -330,6 +303,8 @@ def main():
             total_added += count
         print(f"TOTAL ADDED: {total_added} test cases")
         print_separator("=", 60)
+        if args.journal:
+            print("\nRun compact_journal.py to write them to the workbook.")
         print("\nTask completed successfully!")
 
     except Exception as e:
@@ -9,85 +9,183 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from common.excel_utils import (
-    load_excel_safely,
+    load_excel_streaming,
+    iter_sheet_rows,
+    get_data_extent,
     get_excel_path,
     get_data_path,
     print_section_header
 )
+from common.snapshot_cache import (
+    compute_file_hash,
+    load_workbook_snapshot,
+    snapshot_sheet
+)
+from common.case_index import get_index_path, index_suite_table
+from common.suite_table import SuiteTable, build_sheet_table
+import argparse
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Workbook opened once per worker process by _init_worker()
+_worker_wb = None
+
+# Keys added to each sheet's analysis only with --data-extent, so the
+# default excel_analysis.json keeps its original schema
+EXTENT_KEYS = ('data_max_row', 'data_max_col')
+
+
+def analyze_sheet(ws) -> dict:
+    """
+    Analyze a single sheet.
+
+    Args:
+        ws: Worksheet, read-only worksheet or SheetSnapshot
+
+    Returns:
+        dict: Sheet analysis in the excel_analysis.json schema, plus the
+        'data_max_row'/'data_max_col' extent (saved only on request, see
+        EXTENT_KEYS) and a 'sample_rows' list of (row number, values) used
+        for printing
+    """
+    # Get dimensions (declared range vs. cells that hold data)
+    extent = get_data_extent(ws)
+
+    # Header row (assuming row 1 is header), over the declared width as
+    # excel_analysis.json has always listed it
+    header = next(iter_sheet_rows(ws, max_row=1, max_col=ws.max_column), None)
+    headers = list(header.values) if header is not None else []
+
+    # Single pass over the data range: sample data (first 3 rows after
+    # header) and test case IDs from column A
+    sample_rows = []
+    test_case_ids = []
+    for row in iter_sheet_rows(ws, min_row=2, max_row=extent.max_row, max_col=extent.max_col):
+        if row.row < 5:
+            sample_rows.append((row.row, list(row.values)))
+        if row.test_id:
+            test_case_ids.append(row.test_id)
+
+    return {
+        'max_row': ws.max_row,
+        'max_col': ws.max_column,
+        'data_max_row': extent.max_row,
+        'data_max_col': extent.max_col,
+        'headers': headers,
+        'test_case_count': len(test_case_ids),
+        'first_id': test_case_ids[0] if test_case_ids else None,
+        'last_id': test_case_ids[-1] if test_case_ids else None,
+        'sample_rows': sample_rows
+    }
+
+
+def print_sheet_analysis(sheet_name: str, result: dict) -> None:
+    """Print the analysis of a single sheet."""
+    print(f"\n{'='*60}")
+    print(f"Sheet: {sheet_name}")
+    print(f"{'='*60}")
+
+    print(f"Dimensions: {result['max_row']} rows x {result['max_col']} columns")
+    print(f"Data range: {result['data_max_row']} rows x {result['data_max_col']} columns")
+
+    print(f"\nHeaders: {result['headers']}")
+
+    print(f"\nSample data (first 3 rows):")
+    for row_num, values in result['sample_rows']:
+        print(f"Row {row_num}: {values}")
+
+    if result['test_case_count']:
+        print(f"\nFirst Test Case ID: {result['first_id']}")
+        print(f"Last Test Case ID: {result['last_id']}")
+        print(f"Total test cases in sheet: {result['test_case_count']}")
 
 
-def analyze_excel_file(file_path: Path):
+def _init_worker(file_path: Path) -> None:
+    """Open the workbook read-only once in each worker process."""
+    global _worker_wb
+    _worker_wb = load_excel_streaming(file_path)
+
+
+def _analyze_sheet_worker(sheet_name: str):
+    """
+    Analyze one sheet in a worker process.
+
+    The sheet is streamed once into an in-memory snapshot, so the analysis
+    and the columnar table do not re-parse the sheet XML.
+
+    Returns:
+        tuple: (sheet analysis dict, SheetTable)
+    """
+    sheet = snapshot_sheet(_worker_wb[sheet_name])
+    return analyze_sheet(sheet), build_sheet_table(sheet)
+
+
+def _analyze_sheets_parallel(file_path: Path, sheetnames: list, jobs: int) -> list:
+    """
+    Analyze sheets across a process pool.
+
+    Returns:
+        list: (sheet analysis, SheetTable) per sheet, in sheetnames order
+    """
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(sheetnames)),
+        initializer=_init_worker,
+        initargs=(file_path,)
+    ) as executor:
+        return list(executor.map(_analyze_sheet_worker, sheetnames))
+
+
+def analyze_excel_file(file_path: Path, jobs: int = 1, include_extent: bool = False):
     """
     Analyze the structure of the Excel file.
 
     Args:
         file_path: Path to the Excel file
+        jobs: Number of worker processes. 1 analyzes the cached workbook
+            snapshot in this process; more fan per-sheet analysis out to a
+            process pool, each worker reading the workbook read-only.
+        include_extent: Also save each sheet's data range (EXTENT_KEYS)
+            in excel_analysis.json
 
     Returns:
         dict: Analysis results
     """
     try:
-        # Load the workbook
-        wb = load_excel_safely(file_path)
+        if jobs > 1:
+            wb = load_excel_streaming(file_path)
+            sheetnames = list(wb.sheetnames)
+            wb.close()
+            source_hash = compute_file_hash(file_path)
+            print(f"Analyzing sheets with {min(jobs, len(sheetnames))} worker processes")
+            sheet_results = _analyze_sheets_parallel(file_path, sheetnames, jobs)
+        else:
+            # Load the workbook values (cached snapshot when unchanged)
+            wb = load_workbook_snapshot(file_path)
+            sheetnames = wb.sheetnames
+            source_hash = wb.source_hash
+            sheet_results = [(analyze_sheet(ws), build_sheet_table(ws)) for ws in wb.worksheets]
+            wb.close()
 
         # Get sheet names
-        print(f"Total sheets: {len(wb.sheetnames)}")
-        print(f"Sheet names: {wb.sheetnames}\n")
+        print(f"Total sheets: {len(sheetnames)}")
+        print(f"Sheet names: {sheetnames}\n")
 
         analysis = {}
+        tables = []
 
-        # Analyze each sheet
-        for sheet_name in wb.sheetnames:
-            ws = wb[sheet_name]
-            print(f"\n{'='*60}")
-            print(f"Sheet: {sheet_name}")
-            print(f"{'='*60}")
+        # Merge per-sheet results in workbook order
+        for sheet_name, (result, table) in zip(sheetnames, sheet_results):
+            print_sheet_analysis(sheet_name, result)
+            result.pop('sample_rows')
+            if not include_extent:
+                for key in EXTENT_KEYS:
+                    result.pop(key)
+            analysis[sheet_name] = result
+            tables.append(table)
 
-            # Get dimensions
-            max_row = ws.max_row
-            max_col = ws.max_column
-            print(f"Dimensions: {max_row} rows x {max_col} columns")
-
-            # Get header row (assuming row 1 is header)
-            headers = []
-            for col in range(1, max_col + 1):
-                cell_value = ws.cell(1, col).value
-                headers.append(cell_value)
-
-            print(f"\nHeaders: {headers}")
-
-            # Get sample data (first 3 rows after header)
-            print(f"\nSample data (first 3 rows):")
-            for row in range(2, min(5, max_row + 1)):
-                row_data = []
-                for col in range(1, max_col + 1):
-                    cell_value = ws.cell(row, col).value
-                    row_data.append(cell_value)
-                print(f"Row {row}: {row_data}")
-
-            # Find last test case ID
-            test_case_ids = []
-            for row in range(2, max_row + 1):
-                test_id = ws.cell(row, 1).value  # Assuming first column is Test ID
-                if test_id:
-                    test_case_ids.append(str(test_id))
-
-            if test_case_ids:
-                print(f"\nFirst Test Case ID: {test_case_ids[0]}")
-                print(f"Last Test Case ID: {test_case_ids[-1]}")
-                print(f"Total test cases in sheet: {len(test_case_ids)}")
-
-            analysis[sheet_name] = {
-                'max_row': max_row,
-                'max_col': max_col,
-                'headers': headers,
-                'test_case_count': len(test_case_ids),
-                'first_id': test_case_ids[0] if test_case_ids else None,
-                'last_id': test_case_ids[-1] if test_case_ids else None
-            }
-
-        wb.close()
+        # Build the test case ID index from the same pass
+        index = index_suite_table(SuiteTable(tables, source_hash=source_hash))
 
         # Save analysis to JSON
         output_path = get_data_path('excel_analysis.json')
@@ -97,6 +195,10 @@ def analyze_excel_file(file_path: Path):
             with open(output_path, 'w') as f:
                 json.dump(analysis, f, indent=2)
 
+            index_path = get_index_path()
+            if index.save(index_path):
+                print(f"\nTest case index ({len(index)} IDs) saved to {index_path}")
+
             print(f"\n{'='*60}")
             print(f"Analysis complete! Saved to {output_path}")
             print(f"{'='*60}")
@@ -118,6 +220,22 @@ def analyze_excel_file(file_path: Path):
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Analyze the Excel test case file structure")
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Number of worker processes for per-sheet analysis (0 = all CPU cores, default: 1)'
+    )
+    parser.add_argument(
+        '--data-extent',
+        action='store_true',
+        help='Also save each sheet\'s data range (data_max_row, data_max_col) in the JSON'
+    )
+    args = parser.parse_args()
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
     print_section_header("Excel File Analysis")
 
     file_path = get_excel_path()
@@ -127,7 +245,7 @@ def main():
         print(f"Error: File not found at {file_path}", file=sys.stderr)
         sys.exit(1)
 
-    result = analyze_excel_file(file_path)
+    result = analyze_excel_file(file_path, jobs=jobs, include_extent=args.data_extent)
 
     if result is None:
         print("Analysis failed.", file=sys.stderr)
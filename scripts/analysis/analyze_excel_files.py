@@ -1,10 +1,35 @@
 #!/usr/bin/env python3
 """
-Script to analyze both Excel files and understand their structure
+Script to compare the ORIGINAL backup with the current Excel file
+
+Reports test cases added, removed and modified per sheet (keyed by test ID)
+and can export the changes as a JSON Patch. Use --structure to also print
+each workbook's sheet dimensions, merged cells and tab colors.
+
+Usage:
+    python analyze_excel_files.py
+    python analyze_excel_files.py --json data/suite_diff.json
+    python analyze_excel_files.py old.xlsx new.xlsx --structure
 """
-import openpyxl
+import sys
+import argparse
+from pathlib import Path
+
+# Add parent directory to path to import common utilities
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
 from openpyxl import load_workbook
-import json
+
+from common.excel_utils import (
+    count_non_empty_rows,
+    get_backup_path,
+    get_excel_path,
+    print_section_header
+)
+from common.workbook_diff import diff_workbook_files, format_diff, write_patch
+
+ORIGINAL_FILENAME = 'Hello Master test cases - ORIGINAL.xlsx'
+
 
 def analyze_workbook(filename):
     """Analyze an Excel workbook and return its structure"""
@@ -15,7 +40,7 @@ def analyze_workbook(filename):
     wb = load_workbook(filename, data_only=False)
 
     info = {
-        'filename': filename,
+        'filename': str(filename),
         'sheet_names': wb.sheetnames,
         'sheets': {}
     }
@@ -29,11 +54,7 @@ def analyze_workbook(filename):
         min_col = ws.min_column
         max_col = ws.max_column
 
-        # Count non-empty rows
-        non_empty_rows = 0
-        for row in ws.iter_rows(min_row=min_row, max_row=max_row):
-            if any(cell.value is not None for cell in row):
-                non_empty_rows += 1
+        non_empty_rows = count_non_empty_rows(ws)
 
         sheet_info = {
             'dimensions': f"{ws.dimensions}",
@@ -58,49 +79,72 @@ def analyze_workbook(filename):
     wb.close()
     return info
 
-def main():
-    import os
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.join(script_dir, '..', '..')
-    original_file = os.path.join(project_root, 'test_cases', 'backups', 'Hello Master test cases - ORIGINAL.xlsx')
-    modified_file = os.path.join(project_root, 'test_cases', 'current', 'Hello Master test cases.xlsx')
-
-    original_info = analyze_workbook(original_file)
-    modified_info = analyze_workbook(modified_file)
 
-    # Compare sheets
-    print(f"\n{'='*80}")
-    print("COMPARISON")
-    print('='*80)
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Compare two versions of the test case workbook by test ID"
+    )
+    parser.add_argument(
+        'original',
+        type=Path,
+        nargs='?',
+        default=get_backup_path(ORIGINAL_FILENAME),
+        help='Old workbook (default: the ORIGINAL backup)'
+    )
+    parser.add_argument(
+        'modified',
+        type=Path,
+        nargs='?',
+        default=get_excel_path(),
+        help='New workbook (default: the current master file)'
+    )
+    parser.add_argument(
+        '--json',
+        type=Path,
+        metavar='FILE',
+        help='Also write the changes as a JSON Patch (RFC 6902) to FILE'
+    )
+    parser.add_argument(
+        '--structure',
+        action='store_true',
+        help='Print sheet dimensions, merged cells and tab colors of both files'
+    )
+    parser.add_argument(
+        '--show-unchanged',
+        action='store_true',
+        help='List sheets without changes too'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Parse both workbooks instead of using cached snapshots'
+    )
+    args = parser.parse_args()
+
+    for path in (args.original, args.modified):
+        if not path.exists():
+            print(f"Error: File not found at {path}", file=sys.stderr)
+            sys.exit(1)
+
+    if args.structure:
+        analyze_workbook(args.original)
+        analyze_workbook(args.modified)
+
+    try:
+        diff = diff_workbook_files(args.original, args.modified, use_cache=not args.no_cache)
+    except Exception as e:
+        print(f"Error: Failed to compare workbooks: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print_section_header("COMPARISON")
+    print(format_diff(diff, show_unchanged=args.show_unchanged))
+
+    if args.json:
+        if not write_patch(diff, args.json):
+            sys.exit(1)
+        print(f"\nJSON Patch written to: {args.json}")
 
-    original_sheets = set(original_info['sheet_names'])
-    modified_sheets = set(modified_info['sheet_names'])
-
-    print(f"\nSheets in ORIGINAL: {len(original_sheets)}")
-    for sheet in original_info['sheet_names']:
-        rows = original_info['sheets'][sheet]['non_empty_rows']
-        print(f"  - {sheet}: {rows} rows")
-
-    print(f"\nSheets in MODIFIED: {len(modified_sheets)}")
-    for sheet in modified_info['sheet_names']:
-        rows = modified_info['sheets'][sheet]['non_empty_rows']
-        print(f"  - {sheet}: {rows} rows")
-
-    new_sheets = modified_sheets - original_sheets
-    if new_sheets:
-        print(f"\nNEW sheets in MODIFIED: {new_sheets}")
-
-    common_sheets = original_sheets & modified_sheets
-    print(f"\nCommon sheets: {len(common_sheets)}")
-
-    # Compare row counts for common sheets
-    print("\nRow count differences in common sheets:")
-    for sheet in sorted(common_sheets):
-        orig_rows = original_info['sheets'][sheet]['non_empty_rows']
-        mod_rows = modified_info['sheets'][sheet]['non_empty_rows']
-        diff = mod_rows - orig_rows
-        if diff != 0:
-            print(f"  {sheet}: ORIGINAL={orig_rows}, MODIFIED={mod_rows}, DIFF={diff:+d}")
 
 if __name__ == "__main__":
     main()
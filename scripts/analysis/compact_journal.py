@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Script to apply the pending mutation journal to the Excel file
+
+Scripts run with --journal record test case inserts, updates and deletes
+in data/journal/<workbook>.jsonl instead of rewriting the workbook. This
+replays every pending record with a single load and save, then trims the
+journal. Safe to re-run after an interruption.
+
+Usage:
+    python compact_journal.py
+    python compact_journal.py --status
+    python compact_journal.py --dry-run
+"""
+import sys
+import argparse
+from collections import Counter
+from pathlib import Path
+
+# Add parent directory to path to import common utilities
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from common.atomic_io import DEFAULT_BACKUP_COUNT
+from common.excel_utils import get_excel_path, print_section_header, print_separator
+from common.mutation_journal import MutationJournal, compact_journal, get_journal_path
+
+
+def print_status(journal):
+    """Print pending journal records per sheet and operation."""
+    entries, _ = journal.read()
+    print(f"Journal: {journal.path}")
+    print(f"Pending records: {len(entries)}")
+    counts = Counter((entry.sheet, entry.op) for entry in entries)
+    for sheet in dict.fromkeys(entry.sheet for entry in entries):
+        ops = ', '.join(f"{op} {counts[sheet, op]}" for op in ('insert', 'update', 'delete')
+                        if counts[sheet, op])
+        print(f"  {sheet}: {ops}")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Apply pending journaled test case changes to the workbook"
+    )
+    parser.add_argument(
+        '--excel',
+        type=Path,
+        default=get_excel_path(),
+        help='Workbook to update (default: the master file)'
+    )
+    parser.add_argument(
+        '--journal',
+        type=Path,
+        help='Journal file (default: data/journal/<workbook>.jsonl)'
+    )
+    parser.add_argument(
+        '--status',
+        action='store_true',
+        help='Only list pending records'
+    )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Replay without saving the workbook or trimming the journal'
+    )
+    parser.add_argument(
+        '--keep-backups',
+        type=int,
+        default=DEFAULT_BACKUP_COUNT,
+        metavar='N',
+        help=f'Previous versions of the workbook to keep in test_cases/backups/ (default: {DEFAULT_BACKUP_COUNT})'
+    )
+    args = parser.parse_args()
+
+    journal = MutationJournal(args.journal or get_journal_path(args.excel))
+
+    print_section_header("MUTATION JOURNAL")
+    print_status(journal)
+    if args.status:
+        return
+
+    if not args.excel.exists():
+        print(f"Error: Excel file not found at {args.excel}", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        result = compact_journal(args.excel, journal.path, dry_run=args.dry_run,
+                                 backups=args.keep_backups)
+    except Exception as e:
+        print(f"Error: Compaction failed: {e}", file=sys.stderr)
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+    if not result.entries:
+        print("\nNothing to apply")
+        return
+
+    print_separator()
+    print(f"Records replayed: {result.entries}")
+    print(f"Rows inserted: {result.inserted}, updated: {result.updated}, "
+          f"deleted: {result.deleted}, skipped: {result.skipped}")
+
+    if args.dry_run:
+        print("\n[DRY RUN] Workbook and journal left unchanged")
+    elif result.saved:
+        print(f"\nWorkbook updated: {args.excel}")
+    else:
+        print("Error: Could not save the workbook; journal kept for retry", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Script to merge two edited copies of the master test case file
+
+Performs a three-way merge against the common base (by default the
+ORIGINAL backup): test cases are matched by test ID, changes from both
+copies are combined, and cells changed differently in both copies are
+reported as conflicts. Rows that changed keep the base file's formatting.
+
+Usage:
+    python merge_test_cases.py ours.xlsx theirs.xlsx
+    python merge_test_cases.py ours.xlsx theirs.xlsx -o merged.xlsx --prefer theirs
+    python merge_test_cases.py ours.xlsx theirs.xlsx --dry-run --conflicts conflicts.json
+
+Exit status is 1 if there are conflicts (the merged file is still written,
+with the --prefer side's values in conflicting cells).
+"""
+import sys
+import argparse
+import json
+from pathlib import Path
+
+# Add parent directory to path to import common utilities
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from common.excel_utils import get_backup_path, print_section_header, print_separator
+from common.workbook_merge import merge_workbook_files
+
+ORIGINAL_FILENAME = 'Hello Master test cases - ORIGINAL.xlsx'
+
+
+def _short(value, length=40):
+    text = repr(value) if value is not None else '(empty)'
+    text = text.replace('\\n', ' ')
+    return text if len(text) <= length else text[:length - 3] + '...'
+
+
+def print_merge_report(result):
+    """Print per-sheet merge statistics and conflicts."""
+    for plan in result.sheets:
+        if plan.status == 'unchanged':
+            continue
+        if plan.status in ('added', 'deleted', 'kept'):
+            print(f"\n{plan.sheet}: sheet {plan.status}")
+        else:
+            print(f"\n{plan.sheet}: {len(plan.rewrite)} rewritten, {len(plan.append)} appended, "
+                  f"{len(plan.delete)} deleted, {len(plan.restyle)} restyled, "
+                  f"{plan.unchanged} unchanged")
+        for conflict in plan.conflicts:
+            print(f"  CONFLICT ({conflict.kind}) {conflict.key} [{conflict.field}]: "
+                  f"base={_short(conflict.base)} ours={_short(conflict.ours)} "
+                  f"theirs={_short(conflict.theirs)}")
+
+    totals = result.totals()
+    print_separator()
+    print(f"Rows rewritten: {totals['rewritten']}, appended: {totals['appended']}, "
+          f"deleted: {totals['deleted']}, unchanged: {totals['unchanged']}")
+    print(f"Conflicts: {totals['conflicts']}")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Three-way merge two edited copies of the test case workbook"
+    )
+    parser.add_argument('ours', type=Path, help='Our edited copy (the result is based on it)')
+    parser.add_argument('theirs', type=Path, help='Their edited copy')
+    parser.add_argument(
+        '--base',
+        type=Path,
+        default=get_backup_path(ORIGINAL_FILENAME),
+        help='Common ancestor (default: the ORIGINAL backup)'
+    )
+    parser.add_argument(
+        '-o', '--output',
+        type=Path,
+        help='Merged file (default: <ours>_MERGED.xlsx next to ours)'
+    )
+    parser.add_argument(
+        '--prefer',
+        choices=['ours', 'theirs'],
+        default='ours',
+        help='Value kept in conflicting cells (default: ours)'
+    )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Report the merge without writing a file'
+    )
+    parser.add_argument(
+        '--conflicts',
+        type=Path,
+        metavar='FILE',
+        help='Write conflicts to FILE as JSON'
+    )
+    args = parser.parse_args()
+
+    for path in (args.base, args.ours, args.theirs):
+        if not path.exists():
+            print(f"Error: File not found at {path}", file=sys.stderr)
+            sys.exit(1)
+
+    output = args.output or args.ours.with_name(f"{args.ours.stem}_MERGED.xlsx")
+
+    print_section_header("THREE-WAY MERGE")
+    print(f"Base:   {args.base}")
+    print(f"Ours:   {args.ours}")
+    print(f"Theirs: {args.theirs}")
+
+    try:
+        result = merge_workbook_files(args.base, args.ours, args.theirs, output,
+                                      prefer=args.prefer, dry_run=args.dry_run)
+    except Exception as e:
+        print(f"Error: Merge failed: {e}", file=sys.stderr)
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+    print_merge_report(result)
+
+    if args.conflicts:
+        with open(args.conflicts, 'w', encoding='utf-8') as f:
+            json.dump([c._asdict() for c in result.conflicts], f, indent=2,
+                      ensure_ascii=False, default=str)
+        print(f"Conflicts written to: {args.conflicts}")
+
+    if args.dry_run:
+        print("\n[DRY RUN] No file written")
+    elif result.saved:
+        if not result.changed:
+            print("\nNothing to merge: the merged file is a copy of ours")
+        print(f"\nMerged file: {output}")
+    elif result.changed or output.resolve() != args.ours.resolve():
+        print("Error: Could not save the merged file", file=sys.stderr)
+        sys.exit(1)
+    else:
+        print("\nNothing to merge: no changes on either side")
+
+    if result.conflicts:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
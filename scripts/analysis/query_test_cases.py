@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Script to query test cases from the SQLite export of the Excel file
+
+The test cases are exported to data/test_cases.sqlite (indexed by test
+ID, sheet, module and Pass/Failed status). Before each query the export
+is synced with the workbook: nothing is read if the workbook hash is
+unchanged, and only changed rows are rewritten otherwise.
+
+Usage:
+    python query_test_cases.py --sheet "Security Testing" --status Failed
+    python query_test_cases.py --id AO013
+    python query_test_cases.py --counts
+    python query_test_cases.py --sync
+"""
+import sys
+import argparse
+import json
+import time
+from pathlib import Path
+
+# Add parent directory to path to import common utilities
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from common.excel_utils import get_excel_path, print_section_header
+from common.suite_db import get_db_path, open_suite_db, query_test_cases, status_counts, sync_suite_db
+
+
+def _short(value, length=60):
+    text = ' '.join(str(value).split()) if value is not None else ''
+    return text if len(text) <= length else text[:length - 3] + '...'
+
+
+def print_test_cases(rows):
+    """Print one line per test case."""
+    for row in rows:
+        status = row['status'] or '-'
+        print(f"{row['test_id']:<10} {status:<8} {row['sheet']} (row {row['row']}): "
+              f"{_short(row['title'])}")
+
+
+def print_counts(counts):
+    """Print Pass/Failed counts per sheet."""
+    for sheet, statuses in counts.items():
+        total = sum(statuses.values())
+        breakdown = ', '.join(f"{status or 'no status'}: {count}"
+                              for status, count in statuses.items())
+        print(f"{sheet}: {total} ({breakdown})")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Query test cases through the indexed SQLite export of the workbook"
+    )
+    parser.add_argument('--sheet', help='Sheet name, e.g. "Security Testing"')
+    parser.add_argument('--status', help='Pass/Failed value, e.g. Failed (case-insensitive)')
+    parser.add_argument('--module', help='Module name (case-insensitive)')
+    parser.add_argument('--id', dest='test_id', help='Test case ID')
+    parser.add_argument('--search', help='Text contained in the title')
+    parser.add_argument('--limit', type=int, help='Maximum number of results')
+    parser.add_argument('--counts', action='store_true',
+                        help='Show Pass/Failed counts per sheet instead of test cases')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    parser.add_argument('--excel', type=Path, default=get_excel_path(),
+                        help='Workbook to export (default: the master file)')
+    parser.add_argument('--db', type=Path, default=get_db_path(),
+                        help='Database file (default: data/test_cases.sqlite)')
+    parser.add_argument('--sync', action='store_true',
+                        help='Only sync the database with the workbook')
+    parser.add_argument('--rebuild', action='store_true',
+                        help='Compare every row even if the workbook is unchanged')
+    parser.add_argument('--no-sync', action='store_true',
+                        help='Query the database as is, without checking the workbook')
+    args = parser.parse_args()
+
+    conn = open_suite_db(args.db)
+    try:
+        if not args.no_sync:
+            start = time.perf_counter()
+            try:
+                result = sync_suite_db(conn, args.excel, force=args.rebuild)
+            except FileNotFoundError as e:
+                print(f"Error: {e}", file=sys.stderr)
+                sys.exit(1)
+            elapsed = (time.perf_counter() - start) * 1000
+            if args.sync or not result.up_to_date:
+                print(f"Synced {args.db.name}: {result.inserted} inserted, {result.updated} updated, "
+                      f"{result.deleted} deleted, {result.unchanged} unchanged ({elapsed:.0f} ms)",
+                      file=sys.stderr)
+        if args.sync:
+            return
+
+        start = time.perf_counter()
+        if args.counts:
+            counts = status_counts(conn, args.sheet)
+            elapsed = (time.perf_counter() - start) * 1000
+            if args.json:
+                print(json.dumps(counts, indent=2, ensure_ascii=False))
+            else:
+                print_section_header("TEST CASE STATUS")
+                print_counts(counts)
+                print(f"\nCounted in {elapsed:.1f} ms")
+            return
+
+        rows = query_test_cases(conn, sheet=args.sheet, status=args.status, module=args.module,
+                                test_id=args.test_id, search=args.search, limit=args.limit)
+        elapsed = (time.perf_counter() - start) * 1000
+        if args.json:
+            print(json.dumps([dict(row) for row in rows], indent=2, ensure_ascii=False))
+        else:
+            print_test_cases(rows)
+            print(f"\n{len(rows)} test case(s) in {elapsed:.1f} ms")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Atomic, crash-safe file writes.
+
+Writing a workbook or document straight over its path leaves a truncated,
+unreadable file if the process dies mid-save. atomic_write() writes to a
+temporary file in the same directory, fsyncs it, and renames it over the
+target (an atomic replace on both POSIX and Windows), then fsyncs the
+directory so the rename itself is durable. Readers see either the old
+file or the new one, never a partial write.
+
+Optionally the previous version is kept in a backups directory, with
+the newest N versions retained. Because the target is only ever replaced
+by rename, never rewritten in place, the backup can share its data with
+the old file: it is a reflink (copy-on-write clone) where the filesystem
+supports it, otherwise a hard link, and a plain copy only as a fallback.
+
+Example:
+    >>> atomic_write(excel_path, workbook.save, backups=3)
+    >>> atomic_write_text(index_path, json.dumps(data))
+"""
+import errno
+import os
+import re
+import shutil
+import stat
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Callable, List, Optional
+
+from .path_utils import get_project_root
+
+# Number of previous versions kept by scripts that rewrite the master workbook
+DEFAULT_BACKUP_COUNT = 3
+
+# Linux FICLONE ioctl: clone a file's extents (btrfs, XFS, ...)
+_FICLONE = 0x40049409
+
+_TIMESTAMP_FORMAT = '%Y%m%d-%H%M%S-%f'
+_TIMESTAMP_PATTERN = r'\d{8}-\d{6}-\d{6}'
+
+
+def get_backup_dir() -> Path:
+    """
+    Get the directory that receives rotated backups.
+
+    Returns:
+        Path: test_cases/backups/ under the project root
+    """
+    return get_project_root() / "test_cases" / "backups"
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Flush a directory entry change to disk (not supported on Windows)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _file_mode(target: Path) -> int:
+    """Permissions for the new file: the target's, or the umask default."""
+    try:
+        return stat.S_IMODE(target.stat().st_mode)
+    except OSError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def _reflink(source: Path, target: Path) -> bool:
+    """Clone source into target with FICLONE; False if unsupported."""
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    try:
+        with open(source, 'rb') as src, open(target, 'wb') as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        return True
+    except OSError:
+        try:
+            target.unlink()
+        except OSError:
+            pass
+        return False
+
+
+def link_or_copy(source: Path, target: Path) -> str:
+    """
+    Make target a copy of source, sharing data blocks when possible.
+
+    Tries a reflink, then a hard link, then a regular copy.
+
+    Args:
+        source: Existing file
+        target: Path to create (must not exist)
+
+    Returns:
+        str: 'reflink', 'hardlink' or 'copy'
+    """
+    if _reflink(source, target):
+        return 'reflink'
+    try:
+        os.link(source, target)
+        return 'hardlink'
+    except OSError as e:
+        if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP,
+                           errno.EOPNOTSUPP, errno.EACCES):
+            raise
+    shutil.copy2(source, target)
+    return 'copy'
+
+
+def list_backups(target: Path, backup_dir: Optional[Path] = None) -> List[Path]:
+    """
+    List rotated backups of a file, oldest first.
+
+    Only files named by rotate_backup() are matched, so hand-made backups
+    such as '<name> - ORIGINAL.xlsx' are never listed (or pruned).
+
+    Args:
+        target: File the backups were taken of
+        backup_dir: Backups directory (default: test_cases/backups/)
+
+    Returns:
+        List of backup paths sorted by age
+    """
+    backup_dir = backup_dir or get_backup_dir()
+    if not backup_dir.is_dir():
+        return []
+    pattern = re.compile(rf'^{re.escape(target.stem)}\.{_TIMESTAMP_PATTERN}{re.escape(target.suffix)}$')
+    return sorted(path for path in backup_dir.iterdir() if pattern.match(path.name))
+
+
+def rotate_backup(target: Path, keep: int, backup_dir: Optional[Path] = None) -> Optional[Path]:
+    """
+    Keep the current version of target as a timestamped backup.
+
+    Backups beyond the newest keep are deleted.
+
+    Args:
+        target: File about to be replaced
+        keep: Number of backups to retain (0 disables backups)
+        backup_dir: Backups directory (default: test_cases/backups/)
+
+    Returns:
+        Path of the new backup, or None if target doesn't exist or keep is 0
+    """
+    if keep <= 0 or not target.exists():
+        return None
+    backup_dir = backup_dir or get_backup_dir()
+    backup_dir.mkdir(parents=True, exist_ok=True)
+
+    stamp = datetime.now().strftime(_TIMESTAMP_FORMAT)
+    backup_path = backup_dir / f"{target.stem}.{stamp}{target.suffix}"
+    link_or_copy(target, backup_path)
+
+    for old in list_backups(target, backup_dir)[:-keep]:
+        try:
+            old.unlink()
+        except OSError as e:
+            print(f"Warning: Could not remove old backup {old}: {e}", file=sys.stderr)
+    return backup_path
+
+
+def atomic_write(
+    target: Path,
+    write: Callable[[BinaryIO], None],
+    backups: int = 0,
+    backup_dir: Optional[Path] = None
+) -> Path:
+    """
+    Write a file atomically.
+
+    write() receives a binary file object for a temporary file in the
+    target's directory. Once it returns, the data is fsynced, the previous
+    version is optionally rotated into the backups directory, and the
+    temporary file is renamed over the target. On error the temporary
+    file is removed and the target is left untouched.
+
+    Args:
+        target: File to create or replace
+        write: Callable writing the content, e.g. workbook.save or doc.save
+        backups: Number of previous versions to keep (0: none)
+        backup_dir: Backups directory (default: test_cases/backups/)
+
+    Returns:
+        Path: The target path
+
+    Raises:
+        Exception: Whatever write() or the file operations raise
+    """
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, temp_name = tempfile.mkstemp(prefix=f".{target.name}.", suffix='.tmp', dir=target.parent)
+    temp_path = Path(temp_name)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(temp_path, _file_mode(target))
+        rotate_backup(target, backups, backup_dir)
+        os.replace(temp_path, target)
+    except BaseException:
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+    _fsync_directory(target.parent)
+    return target
+
+
+def atomic_write_bytes(target: Path, data: bytes) -> Path:
+    """Atomically replace target with data."""
+    return atomic_write(target, lambda f: f.write(data))
+
+
+def atomic_write_text(target: Path, text: str, encoding: str = 'utf-8') -> Path:
+    """Atomically replace target with text."""
+    return atomic_write_bytes(target, text.encode(encoding))
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Test case ID index for constant-time lookups across all sheets.
+
+The index maps every test case ID to its sheet, row, title, module and
+Pass/Failed status. It is a lookup view of the columnar suite model
+(suite_table.SuiteTable), so columns are located by the same header
+lookup everywhere. It can be persisted to data/test_case_index.json (next
+to excel_analysis.json) and is reused as long as the workbook's content
+hash is unchanged.
+
+Example:
+    >>> index = load_test_case_index(get_excel_path())
+    >>> entry = index.get('AO013', 'Admin Onboard')
+    >>> print(entry.row, entry.title)
+"""
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+from .atomic_io import atomic_write_text
+from .excel_utils import get_data_path
+from .snapshot_cache import compute_file_hash, load_workbook_snapshot
+from .suite_table import SheetTable, SuiteTable, build_suite_table
+
+INDEX_FILENAME = 'test_case_index.json'
+
+# Bump when the persisted layout changes so stale index files are rebuilt
+INDEX_VERSION = 2
+
+
+class TestCaseEntry(NamedTuple):
+    """Location and summary fields of a single test case."""
+
+    test_id: str
+    sheet: str
+    row: int
+    title: Any
+    module: Any
+    status: Any
+
+
+class TestCaseIndex:
+    """
+    In-memory index of test case IDs.
+
+    Lookups by ID (optionally scoped to a sheet) are dictionary accesses.
+    Per-sheet ID lists keep workbook row order.
+    """
+
+    def __init__(self, source_hash: str = ''):
+        self.source_hash = source_hash
+        self.sheetnames: List[str] = []
+        self.sheet_max_rows: Dict[str, int] = {}
+        self._by_sheet: Dict[str, Dict[str, TestCaseEntry]] = {}
+        self._sheet_entries: Dict[str, List[TestCaseEntry]] = {}
+        self._by_id: Dict[str, TestCaseEntry] = {}
+
+    def add_sheet(self, sheet_name: str, max_row: int = 0) -> None:
+        """Register a sheet, even if it ends up holding no test cases."""
+        if sheet_name not in self._by_sheet:
+            self.sheetnames.append(sheet_name)
+            self._by_sheet[sheet_name] = {}
+            self._sheet_entries[sheet_name] = []
+        self.sheet_max_rows[sheet_name] = max_row
+
+    def add(self, entry: TestCaseEntry) -> None:
+        """
+        Add a test case entry.
+
+        The first occurrence of an ID wins for lookups; later duplicates
+        are still listed in sheet_ids() and iteration.
+        """
+        if entry.sheet not in self._by_sheet:
+            self.add_sheet(entry.sheet)
+        self._sheet_entries[entry.sheet].append(entry)
+        self._by_sheet[entry.sheet].setdefault(entry.test_id, entry)
+        self._by_id.setdefault(entry.test_id, entry)
+
+    def get(self, test_id: str, sheet_name: Optional[str] = None) -> Optional[TestCaseEntry]:
+        """
+        Look up a test case by ID.
+
+        Args:
+            test_id: Test case ID (e.g. "AO013")
+            sheet_name: Restrict the lookup to one sheet
+
+        Returns:
+            TestCaseEntry if found, None otherwise
+        """
+        if sheet_name is None:
+            return self._by_id.get(test_id)
+        return self._by_sheet.get(sheet_name, {}).get(test_id)
+
+    def __contains__(self, test_id: str) -> bool:
+        return test_id in self._by_id
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._sheet_entries.values())
+
+    def __iter__(self) -> Iterator[TestCaseEntry]:
+        for sheet_name in self.sheetnames:
+            yield from self._sheet_entries[sheet_name]
+
+    def sheet_entries(self, sheet_name: str) -> List[TestCaseEntry]:
+        """Test case entries of a sheet in row order."""
+        return list(self._sheet_entries.get(sheet_name, []))
+
+    def sheet_ids(self, sheet_name: str) -> List[str]:
+        """Test case IDs of a sheet in row order."""
+        return [e.test_id for e in self._sheet_entries.get(sheet_name, [])]
+
+    def count(self, sheet_name: str) -> int:
+        """Number of test cases in a sheet."""
+        return len(self._sheet_entries.get(sheet_name, []))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialise the index to JSON-compatible types."""
+        return {
+            'version': INDEX_VERSION,
+            'source_hash': self.source_hash,
+            'sheets': {
+                sheet_name: {
+                    'max_row': self.sheet_max_rows.get(sheet_name, 0),
+                    'test_cases': [
+                        [e.test_id, e.row, e.title, e.module, e.status]
+                        for e in self._sheet_entries[sheet_name]
+                    ],
+                }
+                for sheet_name in self.sheetnames
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TestCaseIndex':
+        """Rebuild an index from to_dict() output."""
+        index = cls(source_hash=data.get('source_hash', ''))
+        for sheet_name, sheet in data['sheets'].items():
+            index.add_sheet(sheet_name, sheet.get('max_row', 0))
+            for test_id, row, title, module, status in sheet['test_cases']:
+                index.add(TestCaseEntry(test_id, sheet_name, row, title, module, status))
+        return index
+
+    def save(self, file_path: Path) -> bool:
+        """
+        Persist the index as JSON.
+
+        Args:
+            file_path: Destination JSON file
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            atomic_write_text(file_path, json.dumps(self.to_dict(), indent=2, default=str))
+            return True
+        except Exception as e:
+            print(f"Error saving test case index to '{file_path}': {e}", file=sys.stderr)
+            return False
+
+    @classmethod
+    def load(cls, file_path: Path) -> Optional['TestCaseIndex']:
+        """
+        Load a persisted index.
+
+        Args:
+            file_path: JSON file written by save()
+
+        Returns:
+            TestCaseIndex, or None if the file is missing or outdated
+        """
+        if not file_path.exists():
+            return None
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable test case index {file_path}: {e}", file=sys.stderr)
+            return None
+        if data.get('version') != INDEX_VERSION:
+            return None
+        return cls.from_dict(data)
+
+
+def build_sheet_entries(table: SheetTable) -> List[TestCaseEntry]:
+    """
+    Collect the index entries of one sheet from its columnar table.
+
+    Args:
+        table: SheetTable of the sheet
+
+    Returns:
+        Entries for every test case in the table, in row order
+    """
+    columns = table.columns
+    return [
+        TestCaseEntry(test_id, table.title, row, title, module, status)
+        for test_id, row, title, module, status in zip(
+            columns['test_id'], table.rows, columns['title'], columns['module'], columns['status'])
+    ]
+
+
+def index_suite_table(suite: SuiteTable) -> TestCaseIndex:
+    """
+    Build a test case index from the columnar suite model.
+
+    Args:
+        suite: SuiteTable of the workbook
+
+    Returns:
+        TestCaseIndex of every test case in the suite
+    """
+    index = TestCaseIndex(source_hash=suite.source_hash)
+    for table in suite:
+        index.add_sheet(table.title, table.max_row)
+        for entry in build_sheet_entries(table):
+            index.add(entry)
+    return index
+
+
+def build_test_case_index(wb, source_hash: str = '') -> TestCaseIndex:
+    """
+    Build a test case index in one pass over a workbook.
+
+    Args:
+        wb: Workbook, read-only workbook or WorkbookSnapshot
+        source_hash: Content hash of the source file
+
+    Returns:
+        TestCaseIndex of every non-empty column A value below the header
+    """
+    return index_suite_table(build_suite_table(wb, source_hash=source_hash))
+
+
+def get_index_path() -> Path:
+    """
+    Get the default location of the persisted index.
+
+    Returns:
+        Path: data/test_case_index.json
+    """
+    return get_data_path(INDEX_FILENAME)
+
+
+def load_test_case_index(
+    excel_path: Path,
+    index_path: Optional[Path] = None,
+    rebuild: bool = False,
+    cache_dir: Optional[Path] = None
+) -> TestCaseIndex:
+    """
+    Load the test case index for a workbook, rebuilding it if stale.
+
+    Args:
+        excel_path: Path to the Excel file
+        index_path: Persisted index location (default: data/test_case_index.json)
+        rebuild: Force a rebuild even if the persisted index is current
+        cache_dir: Snapshot cache directory used when rebuilding
+
+    Returns:
+        TestCaseIndex matching the workbook's current content
+
+    Raises:
+        FileNotFoundError: If the Excel file doesn't exist
+    """
+    if not excel_path.exists():
+        raise FileNotFoundError(f"Excel file not found: {excel_path}")
+
+    index_path = index_path or get_index_path()
+    content_hash = compute_file_hash(excel_path)
+
+    if not rebuild:
+        index = TestCaseIndex.load(index_path)
+        if index is not None and index.source_hash == content_hash:
+            return index
+
+    snapshot = load_workbook_snapshot(excel_path, cache_dir=cache_dir)
+    index = build_test_case_index(snapshot, source_hash=content_hash)
+    index.save(index_path)
+    return index
@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Optional
 from docx import Document
 
+from .atomic_io import atomic_write
 from .path_utils import get_project_root
 
 
@@ -83,6 +84,9 @@ def save_docx_safely(doc: Document, file_path: Path) -> bool:
     """
     Safely save a DOCX file with error handling.
 
+    The document is written atomically (see atomic_io.atomic_write), so an
+    interrupted save leaves the previous file intact.
+
     Args:
         doc: Document object to save
         file_path: Path where to save the file
@@ -91,11 +95,7 @@ def save_docx_safely(doc: Document, file_path: Path) -> bool:
         True if successful, False otherwise
     """
     try:
-        # Ensure parent directory exists
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Save the document
-        doc.save(str(file_path))
+        atomic_write(Path(file_path), doc.save)
         return True
 
     except PermissionError:
@@ -2,13 +2,17 @@
 """
 Common Excel utilities for test case management
 """
+import hashlib
 import os
 import sys
+from copy import copy
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterable, Iterator, Mapping, NamedTuple, Optional, Sequence, Tuple
 from openpyxl import load_workbook
+from openpyxl.cell.cell import Cell
 from openpyxl.workbook import Workbook
 
+from .atomic_io import atomic_write
 from .path_utils import get_project_root
 
 
@@ -68,13 +72,21 @@ def get_docs_path(filename: str) -> Path:
     return project_root / "documentation" / "reports" / filename
 
 
-def load_excel_safely(file_path: Path, data_only: bool = False) -> Optional[Workbook]:
+def load_excel_safely(
+    file_path: Path,
+    data_only: bool = False,
+    read_only: bool = False
+) -> Optional[Workbook]:
     """
     Safely load an Excel workbook with proper error handling.
 
     Args:
         file_path: Path to the Excel file
         data_only: Whether to load only data values (no formulas)
+        read_only: Whether to open the workbook in streaming read-only mode.
+            Worksheets are parsed lazily row by row and styles are not
+            materialised, so this is much faster for scripts that only read
+            values. The workbook cannot be saved in this mode.
 
     Returns:
         Workbook object if successful, None if error occurs
@@ -87,29 +99,333 @@ def load_excel_safely(file_path: Path, data_only: bool = False) -> Optional[Work
         raise FileNotFoundError(f"Excel file not found: {file_path}")
 
     try:
-        wb = load_workbook(file_path, data_only=data_only)
+        wb = load_workbook(file_path, data_only=data_only, read_only=read_only)
         return wb
     except Exception as e:
         print(f"Error loading workbook '{file_path}': {e}", file=sys.stderr)
         raise
 
 
-def save_excel_safely(workbook: Workbook, file_path: Path) -> bool:
+def load_excel_streaming(file_path: Path) -> Optional[Workbook]:
+    """
+    Load an Excel workbook in streaming read-only mode for value lookups.
+
+    Use this in analysis and verification scripts that never modify the
+    workbook. Rows should be read with iter_sheet_rows() rather than
+    ws.cell(), which is slow on read-only worksheets.
+
+    Args:
+        file_path: Path to the Excel file
+
+    Returns:
+        Read-only Workbook object
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    return load_excel_safely(file_path, data_only=True, read_only=True)
+
+
+class SheetRow(NamedTuple):
+    """A worksheet row produced by iter_sheet_rows()."""
+
+    row: int
+    values: Tuple[Any, ...]
+
+    def value(self, column: int) -> Any:
+        """
+        Get a cell value by 1-based column index.
+
+        Args:
+            column: Column number (1 = column A)
+
+        Returns:
+            Cell value, or None if the row is shorter than the column
+        """
+        if 1 <= column <= len(self.values):
+            return self.values[column - 1]
+        return None
+
+    @property
+    def test_id(self) -> Optional[str]:
+        """Test case ID from column A, or None if the cell is empty."""
+        test_id = self.value(1)
+        return str(test_id) if test_id else None
+
+    @property
+    def is_empty(self) -> bool:
+        """True if every cell in the row is empty."""
+        return all(v is None for v in self.values)
+
+
+def iter_sheet_rows(
+    ws,
+    min_row: int = 1,
+    max_row: Optional[int] = None,
+    max_col: Optional[int] = None
+) -> Iterator[SheetRow]:
+    """
+    Iterate over worksheet rows as plain values.
+
+    Works with both regular and read-only worksheets. Rows are read
+    sequentially, which avoids the per-cell lookups of ws.cell().
+
+    Args:
+        ws: Worksheet to read
+        min_row: First row number to yield (1-based)
+        max_row: Last row number to yield (default: worksheet max_row)
+        max_col: Number of columns to read (default: worksheet max_column)
+
+    Yields:
+        SheetRow with the row number and a tuple of cell values
+    """
+    # openpyxl treats 0 as "no limit"; an empty range should yield nothing
+    if (max_row is not None and max_row < min_row) or max_col == 0:
+        return
+
+    rows = ws.iter_rows(
+        min_row=min_row,
+        max_row=max_row,
+        max_col=max_col,
+        values_only=True
+    )
+    for row_num, values in enumerate(rows, start=min_row):
+        yield SheetRow(row_num, tuple(values))
+
+
+class SheetExtent(NamedTuple):
+    """Last populated row and column of a worksheet (0 if empty)."""
+
+    max_row: int
+    max_col: int
+
+
+def get_data_extent(ws) -> SheetExtent:
+    """
+    Find the real used range of a worksheet.
+
+    ws.max_row/ws.max_column (and the <dimension> element in the sheet XML)
+    include every formatted cell, so sheets holding a few dozen test cases
+    often report ~1000 rows. This returns the last row and column that
+    actually contain a value, so scanning loops can stop there.
+
+    Regular worksheets are measured from the loaded cell map without
+    creating cell proxies. Read-only worksheets and snapshots are streamed
+    once, bounded by their declared dimension, trimming trailing empty
+    cells from each row.
+
+    Args:
+        ws: Worksheet, read-only worksheet or SheetSnapshot
+
+    Returns:
+        SheetExtent(max_row, max_col)
+    """
+    if hasattr(ws, 'data_extent'):
+        return ws.data_extent()
+
+    max_row = max_col = 0
+    cells = getattr(ws, '_cells', None)
+    if cells is not None:
+        for (row_idx, col_idx), cell in cells.items():
+            if cell._value is not None:
+                max_row = max(max_row, row_idx)
+                max_col = max(max_col, col_idx)
+        return SheetExtent(max_row, max_col)
+
+    for row in iter_sheet_rows(ws):
+        values = row.values
+        end = len(values)
+        while end and values[end - 1] is None:
+            end -= 1
+        if end:
+            max_row = row.row
+            max_col = max(max_col, end)
+    return SheetExtent(max_row, max_col)
+
+
+def count_non_empty_rows(ws) -> int:
+    """
+    Count rows that contain at least one value.
+
+    Args:
+        ws: Worksheet (or workbook snapshot sheet) to count
+
+    Returns:
+        Number of non-empty rows
+    """
+    return sum(1 for row in iter_sheet_rows(ws) if not row.is_empty)
+
+
+def row_content_hash(values) -> str:
+    """
+    Hash the values of a row so rows can be compared across workbooks.
+
+    Trailing empty cells are ignored, so the same row read with different
+    column bounds hashes identically.
+
+    Args:
+        values: Sequence of cell values (e.g. SheetRow.values)
+
+    Returns:
+        Hex digest of the row content
+    """
+    values = list(values)
+    while values and values[-1] is None:
+        values.pop()
+    return hashlib.sha1(repr(values).encode('utf-8')).hexdigest()
+
+
+def _color_key(color) -> Optional[Tuple[Any, ...]]:
+    """Reduce an openpyxl Color to a hashable tuple."""
+    if color is None:
+        return None
+    if color.type == 'rgb':
+        value = color.rgb
+    elif color.type == 'theme':
+        value = color.theme
+    else:
+        value = color.indexed
+    return (color.type, value, color.tint)
+
+
+def cell_style_signature(cell) -> Tuple[Any, ...]:
+    """
+    Build a hashable signature of a cell's visible formatting.
+
+    Covers font, fill, border, alignment and number format, which are the
+    attributes compared by the formatting verification scripts.
+
+    Args:
+        cell: openpyxl cell (must come from a workbook not opened read-only)
+
+    Returns:
+        Tuple of primitive values describing the cell style
+    """
+    return style_signature(cell.font, cell.fill, cell.border, cell.alignment,
+                           cell.number_format)
+
+
+def style_signature(font, fill, border, alignment, number_format: str) -> Tuple[Any, ...]:
+    """
+    Build the style signature from individual style objects.
+
+    Same result as cell_style_signature, for callers that resolve style
+    objects from the workbook style tables instead of from a cell.
+    """
+    return (
+        (font.name, font.size, font.bold, font.italic, font.underline,
+         _color_key(font.color)),
+        (getattr(fill, 'patternType', None),
+         _color_key(getattr(fill, 'fgColor', None))),
+        tuple(
+            (side.style, _color_key(side.color)) if side is not None else None
+            for side in (border.left, border.right, border.top, border.bottom)
+        ),
+        (alignment.horizontal, alignment.vertical, alignment.wrap_text),
+        number_format,
+    )
+
+
+class AppendResult(NamedTuple):
+    """Rows written by append_rows() (count 0 if nothing was written)."""
+
+    first_row: int
+    count: int
+
+    @property
+    def last_row(self) -> int:
+        """Last row number written."""
+        return self.first_row + self.count - 1
+
+
+def append_rows(
+    ws,
+    records: Iterable[Any],
+    columns: Optional[Sequence[Optional[str]]] = None,
+    start_row: Optional[int] = None,
+    style_row: Optional[int] = None
+) -> AppendResult:
+    """
+    Append records to a worksheet as whole rows.
+
+    Cells are created directly in the worksheet's cell map, one row at a
+    time, instead of through ws.cell() lookups. Styles are copied from a
+    template row by style table index, so no style objects are created
+    per cell.
+
+    Args:
+        ws: Worksheet to append to (not read-only)
+        records: Mappings (when columns is given) or sequences of values
+        columns: Record key for each column, starting at column A; None
+            leaves that column empty
+        start_row: First row to write (default: after the last row with a
+            value, see get_data_extent)
+        style_row: Row whose cell styles are applied to every appended row
+            (default: keep the style of any formatted empty cells)
+
+    Returns:
+        AppendResult(first_row, count)
+    """
+    if start_row is None:
+        start_row = get_data_extent(ws).max_row + 1
+
+    template = {}
+    if style_row is not None:
+        for (row_idx, col_idx), cell in ws._cells.items():
+            if row_idx == style_row and cell.has_style:
+                template[col_idx] = cell._style
+
+    cells = ws._cells
+    row_idx = start_row
+    for record in records:
+        if columns is None:
+            values = record
+        else:
+            values = [record.get(key) if key is not None else None for key in columns]
+
+        for col_idx, value in enumerate(values, start=1):
+            style = template.get(col_idx)
+            if style is None and style_row is None:
+                existing = cells.get((row_idx, col_idx))
+                style = existing._style if existing is not None and existing.has_style else None
+            if value is None and style is None:
+                cells.pop((row_idx, col_idx), None)
+                continue
+
+            cell = Cell(ws, row=row_idx, column=col_idx, value=value)
+            if style is not None:
+                cell._style = copy(style)
+            cells[(row_idx, col_idx)] = cell
+        row_idx += 1
+
+    # Keep ws.append() writing after the rows added here
+    ws._current_row = max(ws._current_row, row_idx - 1)
+    return AppendResult(start_row, row_idx - start_row)
+
+
+def save_excel_safely(
+    workbook: Workbook,
+    file_path: Path,
+    backups: int = 0,
+    backup_dir: Optional[Path] = None
+) -> bool:
     """
     Safely save an Excel workbook with proper error handling.
 
+    The workbook is written atomically (see atomic_io.atomic_write), so an
+    interrupted save leaves the previous file intact.
+
     Args:
         workbook: Workbook object to save
         file_path: Path where to save the file
+        backups: Number of previous versions to keep in backup_dir (0: none)
+        backup_dir: Backups directory (default: test_cases/backups/)
 
     Returns:
         True if successful, False otherwise
     """
     try:
-        # Ensure parent directory exists
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-
-        workbook.save(file_path)
+        atomic_write(file_path, workbook.save, backups=backups, backup_dir=backup_dir)
         print(f"Successfully saved: {file_path}")
         return True
     except PermissionError:
@@ -0,0 +1,490 @@
+#!/usr/bin/env python3
+"""
+Write-ahead journal of test case row mutations.
+
+Saving the master workbook means rewriting the whole xlsx, which costs
+seconds even when only a few rows changed. Scripts can instead record
+row inserts, updates and deletes, keyed by sheet and test ID, in an
+append-only JSONL journal (data/journal/<workbook>.jsonl). Each record
+is flushed and fsynced, so it survives a crash as soon as the call
+returns. compact_journal() later replays all pending records into the
+workbook with a single load and a single (atomic) save.
+
+Replay is idempotent (insert of an existing test ID updates it, delete
+of a missing ID is a no-op), so if compaction is interrupted before the
+journal is trimmed, running it again gives the same workbook. The
+workbook is saved atomically, so an interrupted save leaves the previous
+file and the journal intact.
+
+Several processes may use the same journal: appends, trims and whole
+compactions are serialised by an exclusive lock on a sidecar
+<journal>.lock file (fcntl.flock on POSIX, msvcrt.locking on Windows).
+Without it, a record appended while a compaction trims the journal could
+be dropped, and two compactions could trim the same records twice.
+
+Example:
+    >>> journal = MutationJournal(get_journal_path(excel_path))
+    >>> journal.update('Admin Onboard', 'AO013', {'Pass/Failed': 'Pass'})
+    >>> compact_journal(excel_path)
+"""
+import json
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from openpyxl.styles import Alignment, Font
+from openpyxl.utils import column_index_from_string
+
+from .atomic_io import atomic_write_bytes
+from .excel_utils import (
+    append_rows,
+    get_data_extent,
+    get_data_path,
+    iter_sheet_rows,
+    load_excel_safely,
+    save_excel_safely
+)
+
+JOURNAL_DIRNAME = 'journal'
+
+OP_INSERT = 'insert'
+OP_UPDATE = 'update'
+OP_DELETE = 'delete'
+OPS = (OP_INSERT, OP_UPDATE, OP_DELETE)
+
+
+class JournalEntry(NamedTuple):
+    """
+    One recorded row mutation.
+
+    fields maps header names (or column letters) to cell values. For an
+    insert into a sheet that doesn't exist yet, the field names become the
+    new sheet's headers, in order.
+    """
+
+    op: str
+    sheet: str
+    key: str
+    fields: Dict[str, Any]
+    ts: str = ''
+
+    def to_json(self) -> str:
+        return json.dumps(self._asdict(), ensure_ascii=False, default=str)
+
+
+class RowChange(NamedTuple):
+    """Net effect of all journal entries for one test case."""
+
+    delete: bool  # remove the existing row first
+    op: Optional[str]  # OP_INSERT, OP_UPDATE or None (delete only)
+    fields: Dict[str, Any]
+
+
+class CompactionResult(NamedTuple):
+    """Outcome of replaying a journal into a workbook."""
+
+    entries: int
+    inserted: int
+    updated: int
+    deleted: int
+    skipped: int
+    saved: bool
+
+
+def get_journal_path(excel_path: Path) -> Path:
+    """
+    Get the default journal location for a workbook.
+
+    Args:
+        excel_path: Path to the Excel file
+
+    Returns:
+        Path: data/journal/<workbook stem>.jsonl
+    """
+    return get_data_path(JOURNAL_DIRNAME) / f"{Path(excel_path).stem}.jsonl"
+
+
+@contextmanager
+def _exclusive_file_lock(lock_path: Path) -> Iterator[None]:
+    """Hold an exclusive OS lock on lock_path, waiting until it is free."""
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, 'a+b') as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            return
+
+        f.seek(0)
+        while True:
+            try:
+                # LK_LOCK gives up after ~10 seconds; keep waiting
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                break
+            except OSError:
+                continue
+        try:
+            yield
+        finally:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class MutationJournal:
+    """
+    Append-only JSONL journal of row mutations.
+
+    Records are appended with one write and one fsync per call, so
+    recording is cheap compared to saving the workbook. Appends and trims
+    take the journal lock (see lock()).
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(self.path.name + '.lock')
+        self._thread_lock = threading.RLock()
+        self._lock_depth = 0
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """
+        Hold the journal's exclusive lock across processes.
+
+        Re-entrant for the thread holding it, so a compaction can keep the
+        lock while it reads, replays and trims.
+        """
+        with self._thread_lock:
+            if self._lock_depth:
+                self._lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._lock_depth -= 1
+                return
+            with _exclusive_file_lock(self.lock_path):
+                self._lock_depth = 1
+                try:
+                    yield
+                finally:
+                    self._lock_depth = 0
+
+    def record(self, entries: Iterable[JournalEntry]) -> int:
+        """
+        Durably append entries to the journal.
+
+        Args:
+            entries: Entries to append, in order
+
+        Returns:
+            Number of entries written
+
+        Raises:
+            ValueError: If an entry has an unknown op or no test ID
+        """
+        ts = datetime.now().isoformat(timespec='seconds')
+        lines = []
+        for entry in entries:
+            if entry.op not in OPS:
+                raise ValueError(f"Unknown journal op {entry.op!r}")
+            if not entry.key:
+                raise ValueError(f"Journal entry for sheet {entry.sheet!r} has no test ID")
+            lines.append(entry._replace(key=str(entry.key), ts=entry.ts or ts).to_json() + '\n')
+        if not lines:
+            return 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.lock(), open(self.path, 'a', encoding='utf-8') as f:
+            f.write(''.join(lines))
+            f.flush()
+            os.fsync(f.fileno())
+        return len(lines)
+
+    def insert(self, sheet: str, key: str, fields: Dict[str, Any]) -> None:
+        """Record a new test case row (or an update if the ID already exists)."""
+        self.record([JournalEntry(OP_INSERT, sheet, key, dict(fields))])
+
+    def update(self, sheet: str, key: str, fields: Dict[str, Any]) -> None:
+        """Record new values for some fields of an existing test case."""
+        self.record([JournalEntry(OP_UPDATE, sheet, key, dict(fields))])
+
+    def delete(self, sheet: str, key: str) -> None:
+        """Record the removal of a test case row."""
+        self.record([JournalEntry(OP_DELETE, sheet, key, {})])
+
+    def read(self) -> Tuple[List[JournalEntry], int]:
+        """
+        Read all complete entries.
+
+        A final line without a newline (a write cut short by a crash) is
+        ignored; other unreadable lines are skipped with a warning.
+
+        Returns:
+            tuple: (entries, byte offset just past the last complete line)
+        """
+        if not self.path.exists():
+            return [], 0
+        with open(self.path, 'rb') as f:
+            data = f.read()
+
+        end = data.rfind(b'\n') + 1
+        if end < len(data):
+            print(f"Warning: Ignoring incomplete last record in {self.path}", file=sys.stderr)
+
+        entries = []
+        for line_no, line in enumerate(data[:end].splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                if record['op'] not in OPS:
+                    raise ValueError(f"unknown op {record['op']!r}")
+                entries.append(JournalEntry(record['op'], record['sheet'], str(record['key']),
+                                            record.get('fields') or {}, record.get('ts', '')))
+            except (ValueError, KeyError, TypeError) as e:
+                print(f"Warning: Skipping bad record at {self.path}:{line_no}: {e}", file=sys.stderr)
+        return entries, end
+
+    def __len__(self) -> int:
+        return len(self.read()[0])
+
+    def trim(self, offset: int) -> None:
+        """
+        Drop the first offset bytes (records already compacted).
+
+        Records appended after the journal was read are kept: the tail is
+        read and written back under the journal lock, so no append can land
+        in between. Callers should hold lock() from read() to trim() so the
+        offset still refers to the same records.
+
+        Args:
+            offset: Byte offset returned by read()
+        """
+        with self.lock():
+            if not self.path.exists():
+                return
+            with open(self.path, 'rb') as f:
+                f.seek(offset)
+                tail = f.read()
+            atomic_write_bytes(self.path, tail)
+
+
+def fold_entries(entries: Iterable[JournalEntry]) -> Dict[str, Dict[str, RowChange]]:
+    """
+    Collapse journal entries into one net change per test case.
+
+    Later field values win; an insert after a delete re-creates the row.
+
+    Args:
+        entries: Journal entries in recorded order
+
+    Returns:
+        dict: sheet -> test ID -> RowChange, in first-seen order
+    """
+    changes: Dict[str, Dict[str, RowChange]] = {}
+    for entry in entries:
+        sheet_changes = changes.setdefault(entry.sheet, {})
+        current = sheet_changes.get(entry.key)
+
+        if entry.op == OP_DELETE:
+            sheet_changes[entry.key] = RowChange(True, None, {})
+        elif current is None:
+            sheet_changes[entry.key] = RowChange(False, entry.op, dict(entry.fields))
+        elif current.op is None:
+            sheet_changes[entry.key] = RowChange(True, entry.op, dict(entry.fields))
+        else:
+            op = OP_INSERT if OP_INSERT in (current.op, entry.op) else OP_UPDATE
+            sheet_changes[entry.key] = RowChange(current.delete, op,
+                                                 {**current.fields, **entry.fields})
+    return changes
+
+
+def _create_sheet(wb, title: str, headers: List[str]):
+    """Create a sheet with a bold header row."""
+    ws = wb.create_sheet(title)
+    append_rows(ws, [headers], start_row=1)
+    for cell in ws[1]:
+        cell.font = Font(bold=True)
+        cell.alignment = Alignment(horizontal='center', vertical='center')
+    return ws
+
+
+def _column_map(ws) -> Dict[str, int]:
+    """Map stripped header names to 1-based column numbers."""
+    columns = {}
+    for col_idx, header in enumerate(next(ws.iter_rows(max_row=1, values_only=True), ()), start=1):
+        if header is not None:
+            columns.setdefault(str(header).strip(), col_idx)
+    return columns
+
+
+def _resolve_column(columns: Dict[str, int], field: str) -> Optional[int]:
+    if field in columns:
+        return columns[field]
+    if field.isalpha() and field.isupper() and len(field) <= 3:
+        return column_index_from_string(field)
+    return None
+
+
+def apply_sheet_changes(ws, changes: Dict[str, RowChange]) -> Dict[str, int]:
+    """
+    Apply net row changes to one worksheet.
+
+    Updates are written in place, inserts are appended in one
+    append_rows() call styled like the last existing test case, and
+    deleted rows are removed bottom-up afterwards. An insert for a test ID
+    already in the sheet is skipped with a warning, so existing rows (and
+    their Pass/Failed results) are never overwritten by an insert, the same
+    as adding test cases directly.
+
+    Args:
+        ws: Worksheet (not read-only)
+        changes: test ID -> RowChange from fold_entries()
+
+    Returns:
+        dict: Counts of 'inserted', 'updated', 'deleted' and 'skipped' changes
+    """
+    counts = {'inserted': 0, 'updated': 0, 'deleted': 0, 'skipped': 0}
+    extent = get_data_extent(ws)
+    rows: Dict[str, int] = {}
+    for row in iter_sheet_rows(ws, min_row=2, max_row=extent.max_row, max_col=1):
+        if row.test_id:
+            rows.setdefault(row.test_id, row.row)
+    columns = _column_map(ws)
+
+    def cells_for(key, fields):
+        resolved = []
+        for field, value in fields.items():
+            col_idx = _resolve_column(columns, field)
+            if col_idx is None:
+                print(f"Warning: Unknown column {field!r} for {ws.title}/{key}, skipped",
+                      file=sys.stderr)
+                continue
+            resolved.append((col_idx, value))
+        return resolved
+
+    delete_rows = []
+    new_rows = []
+    for key, change in changes.items():
+        row_idx = rows.get(key)
+        if change.delete and row_idx is not None:
+            delete_rows.append(row_idx)
+            counts['deleted'] += 1
+            row_idx = None
+
+        if change.op is None:
+            continue
+        if row_idx is not None and change.op == OP_INSERT:
+            print(f"Warning: Insert for existing test case {ws.title}/{key} "
+                  f"(row {row_idx}), skipped", file=sys.stderr)
+            counts['skipped'] += 1
+        elif row_idx is not None:
+            for col_idx, value in cells_for(key, change.fields):
+                ws.cell(row=row_idx, column=col_idx).value = value
+            counts['updated'] += 1
+        elif change.op == OP_INSERT:
+            resolved = cells_for(key, change.fields)
+            values = [None] * max([col for col, _ in resolved] + [1])
+            values[0] = key
+            for col_idx, value in resolved:
+                values[col_idx - 1] = value
+            new_rows.append(values)
+            counts['inserted'] += 1
+        else:
+            print(f"Warning: Update for missing test case {ws.title}/{key}, skipped",
+                  file=sys.stderr)
+            counts['skipped'] += 1
+
+    if new_rows:
+        style_row = extent.max_row if extent.max_row > 1 else None
+        append_rows(ws, new_rows, start_row=extent.max_row + 1, style_row=style_row)
+
+    for row_idx in sorted(delete_rows, reverse=True):
+        ws.delete_rows(row_idx)
+    return counts
+
+
+def apply_journal(wb, entries: Iterable[JournalEntry]) -> Dict[str, int]:
+    """
+    Replay journal entries into a loaded workbook.
+
+    Args:
+        wb: Workbook (not read-only)
+        entries: Journal entries in recorded order
+
+    Returns:
+        dict: Total counts of 'inserted', 'updated', 'deleted' and 'skipped' changes
+    """
+    totals = {'inserted': 0, 'updated': 0, 'deleted': 0, 'skipped': 0}
+    for sheet, changes in fold_entries(entries).items():
+        if sheet in wb.sheetnames:
+            ws = wb[sheet]
+        else:
+            first_insert = next((c for c in changes.values() if c.op == OP_INSERT), None)
+            if first_insert is None:
+                print(f"Warning: Sheet '{sheet}' not found, {len(changes)} change(s) skipped",
+                      file=sys.stderr)
+                totals['skipped'] += len(changes)
+                continue
+            ws = _create_sheet(wb, sheet, list(first_insert.fields))
+        for name, count in apply_sheet_changes(ws, changes).items():
+            totals[name] += count
+    return totals
+
+
+def compact_journal(
+    excel_path: Path,
+    journal_path: Optional[Path] = None,
+    dry_run: bool = False,
+    backups: int = 0
+) -> CompactionResult:
+    """
+    Replay the pending journal into the workbook with one save.
+
+    The replayed records are removed from the journal only once the
+    workbook has been saved. The journal lock is held throughout, so
+    concurrent compactions run one after the other and records made in
+    the meantime wait and are kept for the next compaction.
+
+    Args:
+        excel_path: Path to the Excel file
+        journal_path: Journal location (default: get_journal_path(excel_path))
+        dry_run: Apply to the loaded workbook but save nothing and keep the journal
+        backups: Number of previous workbook versions to keep in test_cases/backups/
+
+    Returns:
+        CompactionResult with entry and change counts
+
+    Raises:
+        FileNotFoundError: If the Excel file doesn't exist
+    """
+    journal = MutationJournal(journal_path or get_journal_path(excel_path))
+    with journal.lock():
+        entries, offset = journal.read()
+        if not entries:
+            return CompactionResult(0, 0, 0, 0, 0, False)
+
+        wb = load_excel_safely(excel_path)
+        try:
+            counts = apply_journal(wb, entries)
+            saved = False
+            if not dry_run:
+                saved = save_excel_safely(wb, excel_path, backups=backups)
+        finally:
+            wb.close()
+
+        if saved:
+            journal.trim(offset)
+    return CompactionResult(len(entries), counts['inserted'], counts['updated'],
+                            counts['deleted'], counts['skipped'], saved)
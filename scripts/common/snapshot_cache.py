@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+On-disk snapshot cache for parsed Excel workbooks.
+
+Parsing the master workbook with openpyxl dominates the run time of the
+analysis and verification scripts. This module stores a compact pickled
+copy of every sheet's cell values (and optionally a style signature per
+cell) under data/cache/. Snapshots are keyed by the workbook's mtime/size
+and SHA-256 content hash, so repeated runs against an unchanged workbook
+skip openpyxl parsing entirely.
+
+Example:
+    >>> snapshot = load_workbook_snapshot(get_excel_path())
+    >>> ws = snapshot['Admin Onboard']
+    >>> for row in iter_sheet_rows(ws, min_row=2, max_col=3):
+    ...     print(row.test_id, row.value(3))
+"""
+import hashlib
+import pickle
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .atomic_io import atomic_write
+from .excel_utils import (
+    load_excel_safely,
+    iter_sheet_rows,
+    cell_style_signature,
+    SheetExtent
+)
+from .path_utils import get_project_root
+
+# Bump when the pickled layout changes so stale snapshots are ignored
+SNAPSHOT_VERSION = 1
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def get_cache_dir() -> Path:
+    """
+    Get the directory where workbook snapshots are stored.
+
+    Returns:
+        Path: data/cache/ under the project root
+    """
+    return get_project_root() / "data" / "cache"
+
+
+def compute_file_hash(file_path: Path) -> str:
+    """
+    Compute the SHA-256 hash of a file's content.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Hex digest of the file content
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _trim_row(values: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """Drop trailing empty cells so sparse rows pickle compactly."""
+    end = len(values)
+    while end and values[end - 1] is None:
+        end -= 1
+    return values[:end]
+
+
+class SheetSnapshot:
+    """
+    Cached values of a single worksheet.
+
+    Exposes the subset of the openpyxl worksheet API used by the scripts
+    (title, max_row, max_column, iter_rows) so it can be passed to
+    iter_sheet_rows() and count_non_empty_rows() in place of a worksheet.
+    """
+
+    def __init__(
+        self,
+        title: str,
+        max_row: int,
+        max_column: int,
+        rows: List[Tuple[Any, ...]],
+        styles: Optional[List[Tuple[Any, ...]]] = None
+    ):
+        self.title = title
+        self.max_row = max_row
+        self.max_column = max_column
+        self.rows = rows
+        self.styles = styles
+
+    def iter_rows(
+        self,
+        min_row: Optional[int] = None,
+        max_row: Optional[int] = None,
+        min_col: Optional[int] = None,
+        max_col: Optional[int] = None,
+        values_only: bool = True
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        Iterate over cached row values, padded to the requested width.
+
+        Only values_only=True is supported since no cell objects are kept.
+        """
+        if not values_only:
+            raise ValueError("SheetSnapshot only supports values_only=True")
+
+        min_row = min_row or 1
+        min_col = min_col or 1
+        max_row = max_row or self.max_row
+        max_col = max_col or self.max_column
+        width = max_col - min_col + 1
+
+        for row_idx in range(min_row, max_row + 1):
+            if row_idx <= len(self.rows):
+                values = self.rows[row_idx - 1][min_col - 1:max_col]
+            else:
+                values = ()
+            yield values + (None,) * (width - len(values))
+
+    def data_extent(self) -> SheetExtent:
+        """
+        Last populated row and column, from the trimmed cached rows.
+
+        Returns:
+            SheetExtent(max_row, max_col)
+        """
+        max_row = len(self.rows)
+        while max_row and not self.rows[max_row - 1]:
+            max_row -= 1
+        max_col = max((len(row) for row in self.rows[:max_row]), default=0)
+        return SheetExtent(max_row, max_col)
+
+    def style_at(self, row: int, column: int) -> Optional[Tuple[Any, ...]]:
+        """
+        Get the cached style signature of a cell.
+
+        Args:
+            row: 1-based row number
+            column: 1-based column number
+
+        Returns:
+            Style signature tuple, or None if styles were not cached
+        """
+        if self.styles is None or row > len(self.styles):
+            return None
+        row_styles = self.styles[row - 1]
+        return row_styles[column - 1] if column <= len(row_styles) else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialise to plain Python types for pickling."""
+        return {
+            'title': self.title,
+            'max_row': self.max_row,
+            'max_column': self.max_column,
+            'rows': self.rows,
+            'styles': self.styles,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SheetSnapshot':
+        """Rebuild a snapshot from to_dict() output."""
+        return cls(**data)
+
+
+class WorkbookSnapshot:
+    """
+    Cached values of a whole workbook.
+
+    Mirrors the read-only parts of the openpyxl Workbook API used by the
+    scripts: sheetnames, item access by sheet name, worksheets and close().
+    """
+
+    def __init__(self, sheets: List[SheetSnapshot], source_hash: str = ''):
+        self._sheets = {sheet.title: sheet for sheet in sheets}
+        self.sheetnames = [sheet.title for sheet in sheets]
+        self.source_hash = source_hash
+
+    def __getitem__(self, sheet_name: str) -> SheetSnapshot:
+        return self._sheets[sheet_name]
+
+    def __contains__(self, sheet_name: str) -> bool:
+        return sheet_name in self._sheets
+
+    @property
+    def worksheets(self) -> List[SheetSnapshot]:
+        """Sheet snapshots in workbook order."""
+        return [self._sheets[name] for name in self.sheetnames]
+
+    @property
+    def has_styles(self) -> bool:
+        """True if the snapshot includes per-cell style signatures."""
+        return all(sheet.styles is not None for sheet in self._sheets.values())
+
+    def close(self) -> None:
+        """No-op, so snapshots can replace workbooks in existing code."""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialise to plain Python types for pickling."""
+        return {
+            'source_hash': self.source_hash,
+            'sheets': [sheet.to_dict() for sheet in self.worksheets],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'WorkbookSnapshot':
+        """Rebuild a snapshot from to_dict() output."""
+        sheets = [SheetSnapshot.from_dict(s) for s in data['sheets']]
+        return cls(sheets, source_hash=data.get('source_hash', ''))
+
+
+def snapshot_sheet(ws) -> SheetSnapshot:
+    """
+    Read a worksheet's values into a SheetSnapshot in one streaming pass.
+
+    Args:
+        ws: Worksheet or read-only worksheet
+
+    Returns:
+        SheetSnapshot holding the sheet's values (no styles)
+    """
+    rows = []
+    max_column = 0
+    for row in iter_sheet_rows(ws):
+        max_column = max(max_column, len(row.values))
+        rows.append(_trim_row(row.values))
+
+    # Sheets saved without a <dimension> element report None here
+    return SheetSnapshot(
+        ws.title,
+        ws.max_row or len(rows),
+        ws.max_column or max_column,
+        rows
+    )
+
+
+def build_workbook_snapshot(
+    file_path: Path,
+    include_styles: bool = False,
+    source_hash: str = ''
+) -> WorkbookSnapshot:
+    """
+    Parse a workbook with openpyxl and build an in-memory snapshot.
+
+    Values are read in streaming mode. Style signatures require the full
+    workbook, so include_styles=True is considerably slower.
+
+    Args:
+        file_path: Path to the Excel file
+        include_styles: Whether to capture a style signature per cell
+        source_hash: Content hash to record on the snapshot
+
+    Returns:
+        WorkbookSnapshot of the workbook
+    """
+    sheets = []
+
+    if include_styles:
+        wb = load_excel_safely(file_path)
+        for ws in wb.worksheets:
+            rows = []
+            styles = []
+            for row in ws.iter_rows():
+                rows.append(_trim_row(tuple(cell.value for cell in row)))
+                styles.append(tuple(cell_style_signature(cell) for cell in row))
+            sheets.append(SheetSnapshot(ws.title, ws.max_row, ws.max_column, rows, styles))
+    else:
+        wb = load_excel_safely(file_path, data_only=True, read_only=True)
+        for ws in wb.worksheets:
+            sheets.append(snapshot_sheet(ws))
+
+    wb.close()
+    return WorkbookSnapshot(sheets, source_hash=source_hash)
+
+
+def _snapshot_cache_path(file_path: Path, include_styles: bool, cache_dir: Path) -> Path:
+    """Get the cache file used for a workbook path."""
+    path_key = hashlib.sha256(str(file_path.resolve()).encode('utf-8')).hexdigest()[:16]
+    suffix = '-styles' if include_styles else ''
+    return cache_dir / f"{file_path.stem}-{path_key}{suffix}.pickle"
+
+
+def _read_cache_entry(cache_path: Path) -> Optional[Dict[str, Any]]:
+    """Read a cache entry, returning None if it is missing or unreadable."""
+    if not cache_path.exists():
+        return None
+    try:
+        with open(cache_path, 'rb') as f:
+            entry = pickle.load(f)
+    except Exception as e:
+        print(f"Warning: Ignoring unreadable snapshot cache {cache_path}: {e}", file=sys.stderr)
+        return None
+    if not isinstance(entry, dict) or entry.get('version') != SNAPSHOT_VERSION:
+        return None
+    return entry
+
+
+def _write_cache_entry(cache_path: Path, entry: Dict[str, Any]) -> None:
+    """Write a cache entry, warning (not failing) on errors."""
+    try:
+        atomic_write(cache_path, lambda f: pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception as e:
+        print(f"Warning: Could not write snapshot cache {cache_path}: {e}", file=sys.stderr)
+
+
+def load_workbook_snapshot(
+    file_path: Path,
+    include_styles: bool = False,
+    use_cache: bool = True,
+    cache_dir: Optional[Path] = None
+) -> WorkbookSnapshot:
+    """
+    Load a workbook snapshot, reusing the on-disk cache when possible.
+
+    The cache is valid when the workbook's mtime and size are unchanged,
+    or when its content hash still matches (e.g. after a touch or copy).
+    Otherwise the workbook is parsed and the cache is refreshed.
+
+    Args:
+        file_path: Path to the Excel file
+        include_styles: Whether to include per-cell style signatures
+        use_cache: Set to False to always parse the workbook
+        cache_dir: Override the cache directory (default: data/cache/)
+
+    Returns:
+        WorkbookSnapshot of the workbook
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    if not file_path.exists():
+        raise FileNotFoundError(f"Excel file not found: {file_path}")
+
+    if not use_cache:
+        return build_workbook_snapshot(file_path, include_styles=include_styles)
+
+    cache_dir = cache_dir or get_cache_dir()
+    cache_path = _snapshot_cache_path(file_path, include_styles, cache_dir)
+    stat = file_path.stat()
+
+    entry = _read_cache_entry(cache_path)
+    if entry is not None:
+        if entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            return WorkbookSnapshot.from_dict(entry['snapshot'])
+
+        content_hash = compute_file_hash(file_path)
+        if entry['sha256'] == content_hash:
+            # Same content with a new mtime: refresh the key, keep the data
+            entry['mtime_ns'] = stat.st_mtime_ns
+            entry['size'] = stat.st_size
+            _write_cache_entry(cache_path, entry)
+            return WorkbookSnapshot.from_dict(entry['snapshot'])
+    else:
+        content_hash = compute_file_hash(file_path)
+
+    snapshot = build_workbook_snapshot(
+        file_path,
+        include_styles=include_styles,
+        source_hash=content_hash
+    )
+    _write_cache_entry(cache_path, {
+        'version': SNAPSHOT_VERSION,
+        'source': str(file_path.resolve()),
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'sha256': content_hash,
+        'snapshot': snapshot.to_dict(),
+    })
+    return snapshot
+
+
+def clear_snapshot_cache(cache_dir: Optional[Path] = None) -> int:
+    """
+    Delete all cached workbook snapshots.
+
+    Args:
+        cache_dir: Override the cache directory (default: data/cache/)
+
+    Returns:
+        Number of cache files removed
+    """
+    cache_dir = cache_dir or get_cache_dir()
+    removed = 0
+    if cache_dir.exists():
+        for cache_file in cache_dir.glob('*.pickle'):
+            cache_file.unlink()
+            removed += 1
+    return removed
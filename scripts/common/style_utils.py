@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Style copying utilities for Excel workbooks.
+
+openpyxl stores each cell's formatting as a StyleArray of indices into the
+workbook's shared style tables (fonts, fills, borders, number formats,
+protections, alignments). Copying styles attribute by attribute creates a
+new style object for every cell. StyleMapper instead translates each
+distinct source style array into target table indices once and then
+assigns the translated array directly to every cell that uses it.
+
+StyleHasher applies the same idea to verification: each distinct style
+array is reduced to a signature hash once, so whole sheets can be compared
+cell by cell at the cost of a dict lookup per cell.
+"""
+import hashlib
+from copy import copy
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.styles.numbers import (
+    BUILTIN_FORMATS,
+    BUILTIN_FORMATS_MAX_SIZE,
+    BUILTIN_FORMATS_REVERSE
+)
+
+from .excel_utils import style_signature
+
+# fontId, fillId, borderId, numFmtId, protectionId, alignmentId
+StyleIds = Tuple[int, int, int, int, int, int]
+
+DEFAULT_STYLE_IDS: StyleIds = (0, 0, 0, 0, 0, 0)
+
+
+def resolve_number_format(wb, num_fmt_id: int) -> str:
+    """
+    Get the format string for a number format id of a workbook.
+
+    Matches what cell.number_format returns for a cell with that id.
+    """
+    if num_fmt_id < BUILTIN_FORMATS_MAX_SIZE:
+        return BUILTIN_FORMATS.get(num_fmt_id, "General")
+    return wb._number_formats[num_fmt_id - BUILTIN_FORMATS_MAX_SIZE]
+
+
+class StyleMapper:
+    """
+    Copy cell styles from one workbook to another by style table index.
+
+    Each distinct source style is resolved against the target workbook's
+    style tables once and cached, so copying a whole sheet costs one dict
+    lookup per cell. The target's named style, quotePrefix and pivotButton
+    flags are left untouched, like assigning font/fill/border/alignment/
+    protection/number_format individually.
+
+    Example:
+        >>> mapper = StyleMapper(original_wb, result_wb)
+        >>> mapper.copy_range(original_ws, result_ws, 1, 100, 8)
+    """
+
+    def __init__(self, source_wb, target_wb):
+        self.source_wb = source_wb
+        self.target_wb = target_wb
+        self._cache: Dict[StyleIds, StyleIds] = {}
+
+    @property
+    def mapped_count(self) -> int:
+        """Number of distinct source styles translated so far."""
+        return len(self._cache)
+
+    def _map_number_format(self, num_fmt_id: int) -> int:
+        """Translate a number format id, matching NumberFormatDescriptor."""
+        fmt = resolve_number_format(self.source_wb, num_fmt_id)
+        if fmt in BUILTIN_FORMATS_REVERSE:
+            return BUILTIN_FORMATS_REVERSE[fmt]
+        return self.target_wb._number_formats.add(fmt) + BUILTIN_FORMATS_MAX_SIZE
+
+    def map_style(self, style: StyleArray) -> StyleIds:
+        """
+        Translate a source style array into target style table indices.
+
+        Args:
+            style: StyleArray of a cell in the source workbook
+
+        Returns:
+            Tuple of (font, fill, border, number format, protection,
+            alignment) indices valid in the target workbook
+        """
+        key = tuple(style[:6])
+        mapped = self._cache.get(key)
+        if mapped is None:
+            source, target = self.source_wb, self.target_wb
+            mapped = (
+                target._fonts.add(copy(source._fonts[style.fontId])),
+                target._fills.add(copy(source._fills[style.fillId])),
+                target._borders.add(copy(source._borders[style.borderId])),
+                self._map_number_format(style.numFmtId),
+                target._protections.add(copy(source._protections[style.protectionId])),
+                target._alignments.add(copy(source._alignments[style.alignmentId])),
+            )
+            self._cache[key] = mapped
+        return mapped
+
+    def resolve(self, source_cell) -> Optional[StyleIds]:
+        """
+        Get the translated style of a source cell.
+
+        Returns:
+            Target style indices, or None if the cell has no style
+        """
+        if source_cell is None or not source_cell.has_style:
+            return None
+        return self.map_style(source_cell._style)
+
+    @staticmethod
+    def apply(mapped: StyleIds, target_cell) -> None:
+        """Assign translated style indices to a target cell."""
+        current = target_cell._style
+        extra = tuple(current[6:]) if current is not None else (0, 0, 0)
+        target_cell._style = StyleArray(mapped + extra)
+
+    def copy_style(self, source_cell, target_cell) -> None:
+        """
+        Copy the style of a single cell.
+
+        Cells without a style leave the target unchanged.
+        """
+        mapped = self.resolve(source_cell)
+        if mapped is not None:
+            self.apply(mapped, target_cell)
+
+    def copy_range(
+        self,
+        source_ws,
+        target_ws,
+        min_row: int,
+        max_row: int,
+        max_col: int,
+        source_row: Optional[int] = None
+    ) -> int:
+        """
+        Copy styles for a block of cells (columns 1..max_col).
+
+        Source cells are read from the worksheet's cell map, so no cells are
+        created in the source sheet. Unstyled source cells are skipped.
+
+        Args:
+            source_ws: Worksheet to copy styles from
+            target_ws: Worksheet to copy styles to
+            min_row: First target row
+            max_row: Last target row
+            max_col: Last column
+            source_row: If given, every target row takes its styles from this
+                single source row (e.g. a template row for appended data)
+
+        Returns:
+            Number of cells styled
+        """
+        source_cells = source_ws._cells
+        styled = 0
+
+        if source_row is not None:
+            template = [
+                (col_idx, self.resolve(source_cells.get((source_row, col_idx))))
+                for col_idx in range(1, max_col + 1)
+            ]
+            template = [(col_idx, mapped) for col_idx, mapped in template if mapped]
+            for row_idx in range(min_row, max_row + 1):
+                for col_idx, mapped in template:
+                    self.apply(mapped, target_ws.cell(row=row_idx, column=col_idx))
+                    styled += 1
+            return styled
+
+        for row_idx in range(min_row, max_row + 1):
+            for col_idx in range(1, max_col + 1):
+                mapped = self.resolve(source_cells.get((row_idx, col_idx)))
+                if mapped is not None:
+                    self.apply(mapped, target_ws.cell(row=row_idx, column=col_idx))
+                    styled += 1
+        return styled
+
+
+class StyleHasher:
+    """
+    Hash the visible formatting of cells in a workbook.
+
+    Hashes cover the same attributes as cell_style_signature (font, fill,
+    border, alignment, number format) and are computed once per distinct
+    style array, then looked up for every cell that uses it. Hashes from
+    different workbooks are comparable.
+    """
+
+    def __init__(self, wb):
+        self.wb = wb
+        self._cache: Dict[StyleIds, str] = {}
+
+    def style_hash(self, style: Optional[StyleArray]) -> str:
+        """Get the signature hash of a style array (None is the default style)."""
+        key = tuple(style[:6]) if style is not None else DEFAULT_STYLE_IDS
+        digest = self._cache.get(key)
+        if digest is None:
+            wb = self.wb
+            signature = style_signature(
+                wb._fonts[key[0]],
+                wb._fills[key[1]],
+                wb._borders[key[2]],
+                wb._alignments[key[5]],
+                resolve_number_format(wb, key[3])
+            )
+            digest = hashlib.sha1(repr(signature).encode('utf-8')).hexdigest()[:16]
+            self._cache[key] = digest
+        return digest
+
+    def cell_hash(self, ws, row: int, column: int) -> str:
+        """Get the signature hash of a cell without creating it."""
+        cell = ws._cells.get((row, column))
+        return self.style_hash(cell._style if cell is not None else None)
+
+    def row_hashes(self, ws, row: int, max_col: int) -> Tuple[str, Tuple[str, ...]]:
+        """
+        Hash every cell of a row plus a rollup hash for the whole row.
+
+        Returns:
+            Tuple of (row rollup hash, per-cell hashes for columns 1..max_col)
+        """
+        cells = tuple(self.cell_hash(ws, row, col_idx) for col_idx in range(1, max_col + 1))
+        rollup = hashlib.sha1(''.join(cells).encode('ascii')).hexdigest()
+        return rollup, cells
+
+
+class StyleComparison(NamedTuple):
+    """Result of comparing the formatting of two sheets cell by cell."""
+    rows_checked: int
+    cells_checked: int
+    mismatched_rows: List[int]
+    mismatched_cells: List[Tuple[int, int]]
+
+
+def compare_sheet_styles(
+    expected_ws,
+    actual_ws,
+    max_row: int,
+    max_col: int,
+    expected_hasher: Optional[StyleHasher] = None,
+    actual_hasher: Optional[StyleHasher] = None
+) -> StyleComparison:
+    """
+    Compare the formatting of every cell in rows 1..max_row, columns 1..max_col.
+
+    Rows are compared by rollup hash first; only rows whose rollups differ
+    are compared cell by cell.
+
+    Args:
+        expected_ws: Worksheet with the reference formatting
+        actual_ws: Worksheet to check
+        max_row: Last row to compare
+        max_col: Last column to compare
+        expected_hasher: StyleHasher for expected_ws's workbook (created if None)
+        actual_hasher: StyleHasher for actual_ws's workbook (created if None)
+
+    Returns:
+        StyleComparison listing mismatching rows and (row, column) cells
+    """
+    expected_hasher = expected_hasher or StyleHasher(expected_ws.parent)
+    actual_hasher = actual_hasher or StyleHasher(actual_ws.parent)
+
+    mismatched_rows = []
+    mismatched_cells = []
+    for row_idx in range(1, max_row + 1):
+        expected_rollup, expected_cells = expected_hasher.row_hashes(expected_ws, row_idx, max_col)
+        actual_rollup, actual_cells = actual_hasher.row_hashes(actual_ws, row_idx, max_col)
+        if expected_rollup == actual_rollup:
+            continue
+
+        mismatched_rows.append(row_idx)
+        mismatched_cells.extend(
+            (row_idx, col_idx)
+            for col_idx, (expected, actual) in enumerate(zip(expected_cells, actual_cells), 1)
+            if expected != actual
+        )
+
+    return StyleComparison(max_row, max_row * max_col, mismatched_rows, mismatched_cells)
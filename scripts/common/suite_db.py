@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+SQLite store of the test case suite for indexed queries.
+
+Every sheet's test cases are exported to a local SQLite database
+(data/test_cases.sqlite) with indexes on test ID, sheet, module and
+Pass/Failed status, so questions like "all failed Security Testing cases"
+are answered by an index lookup instead of reparsing the workbook.
+
+sync_suite_db() is incremental: it skips the workbook entirely if its
+content hash matches the last sync, and otherwise compares each row's
+content hash (see workbook_diff.read_sheet_rows) with the stored one,
+writing only inserted, changed and deleted test cases in one transaction.
+
+Example:
+    >>> conn = open_suite_db()
+    >>> sync_suite_db(conn, get_excel_path())
+    >>> for case in query_test_cases(conn, sheet='Security Testing', status='Failed'):
+    ...     print(case['test_id'], case['title'])
+"""
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from .excel_utils import get_data_path
+from .snapshot_cache import compute_file_hash, load_workbook_snapshot
+from .suite_table import SUITE_COLUMNS, locate_columns
+from .workbook_diff import read_sheet_rows
+
+DB_FILENAME = 'test_cases.sqlite'
+
+# Bump when the schema changes so old databases are rebuilt
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS sheets (
+    name TEXT PRIMARY KEY,
+    position INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS test_cases (
+    sheet TEXT NOT NULL,
+    case_key TEXT NOT NULL,
+    test_id TEXT NOT NULL,
+    row INTEGER NOT NULL,
+    module TEXT,
+    title TEXT,
+    precondition TEXT,
+    steps TEXT,
+    expected TEXT,
+    status TEXT,
+    notes TEXT,
+    row_hash TEXT NOT NULL,
+    PRIMARY KEY (sheet, case_key)
+);
+CREATE INDEX IF NOT EXISTS idx_test_cases_test_id ON test_cases (test_id);
+CREATE INDEX IF NOT EXISTS idx_test_cases_sheet_status ON test_cases (sheet, status COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_test_cases_module ON test_cases (module COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_test_cases_status ON test_cases (status COLLATE NOCASE);
+"""
+
+# Test case fields stored as columns, after test_id
+CASE_FIELDS = SUITE_COLUMNS[1:]
+
+_INSERT_SQL = (
+    f"INSERT OR REPLACE INTO test_cases (sheet, case_key, test_id, row, {', '.join(CASE_FIELDS)}, "
+    f"row_hash) VALUES ({', '.join('?' * (len(CASE_FIELDS) + 5))})"
+)
+
+
+class SyncResult(NamedTuple):
+    """Outcome of syncing the database with a workbook."""
+
+    inserted: int
+    updated: int
+    deleted: int
+    unchanged: int
+    up_to_date: bool  # workbook hash matched the last sync; nothing was read
+
+
+def get_db_path() -> Path:
+    """
+    Get the default database location.
+
+    Returns:
+        Path: data/test_cases.sqlite
+    """
+    return get_data_path(DB_FILENAME)
+
+
+def open_suite_db(db_path: Optional[Path] = None) -> sqlite3.Connection:
+    """
+    Open (creating if needed) the test case database.
+
+    A database written with an older schema is emptied and recreated; the
+    next sync repopulates it.
+
+    Args:
+        db_path: Database file (default: data/test_cases.sqlite)
+
+    Returns:
+        sqlite3.Connection whose rows can be indexed by column name
+    """
+    db_path = Path(db_path or get_db_path())
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path))
+    conn.row_factory = sqlite3.Row
+
+    if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        with conn:
+            for table in ('test_cases', 'sheets', 'meta'):
+                conn.execute(f"DROP TABLE IF EXISTS {table}")
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return conn
+
+
+def _sql_value(value: Any) -> Any:
+    """Cell value as a type SQLite stores natively."""
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return str(value)
+
+
+def _get_meta(conn: sqlite3.Connection, key: str) -> Optional[str]:
+    row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def sync_sheet(conn: sqlite3.Connection, ws) -> Dict[str, int]:
+    """
+    Bring one sheet's stored test cases in line with the worksheet.
+
+    Rows without a test ID (section notes, blank separators) are not
+    stored. Must be called inside a transaction.
+
+    Args:
+        conn: Database connection
+        ws: Worksheet, read-only worksheet or SheetSnapshot
+
+    Returns:
+        dict: Counts of 'inserted', 'updated', 'deleted' and 'unchanged' test cases
+    """
+    fields, rows = read_sheet_rows(ws)
+    positions = locate_columns(fields)
+    stored = {key: (row_hash, row) for key, row_hash, row in conn.execute(
+        "SELECT case_key, row_hash, row FROM test_cases WHERE sheet = ?", (ws.title,))}
+
+    counts = {'inserted': 0, 'updated': 0, 'deleted': 0, 'unchanged': 0}
+    upserts = []
+    moves = []
+    for key, row in rows.items():
+        if key.startswith('row:'):
+            continue
+        previous = stored.pop(key, None)
+        if previous is not None and previous[0] == row.content_hash:
+            counts['unchanged'] += 1
+            if previous[1] != row.row:
+                moves.append((row.row, ws.title, key))
+            continue
+
+        values = row.values
+        record = [_sql_value(values[positions[name] - 1]) if positions[name] <= len(values) else None
+                  for name in CASE_FIELDS]
+        upserts.append((ws.title, key, str(values[0]).strip(), row.row, *record, row.content_hash))
+        counts['updated' if previous is not None else 'inserted'] += 1
+
+    conn.executemany(_INSERT_SQL, upserts)
+    conn.executemany("UPDATE test_cases SET row = ? WHERE sheet = ? AND case_key = ?", moves)
+    conn.executemany("DELETE FROM test_cases WHERE sheet = ? AND case_key = ?",
+                     [(ws.title, key) for key in stored])
+    counts['deleted'] = len(stored)
+    return counts
+
+
+def sync_suite_db(
+    conn: sqlite3.Connection,
+    excel_path: Path,
+    force: bool = False,
+    cache_dir: Optional[Path] = None
+) -> SyncResult:
+    """
+    Incrementally sync the database with a workbook.
+
+    Args:
+        conn: Connection from open_suite_db()
+        excel_path: Path to the Excel file
+        force: Compare every row even if the workbook hash is unchanged
+        cache_dir: Snapshot cache directory (default: data/cache/)
+
+    Returns:
+        SyncResult with per-row counts
+
+    Raises:
+        FileNotFoundError: If the Excel file doesn't exist
+    """
+    if not excel_path.exists():
+        raise FileNotFoundError(f"Excel file not found: {excel_path}")
+
+    source_hash = compute_file_hash(excel_path)
+    if not force and _get_meta(conn, 'source_hash') == source_hash:
+        total = conn.execute("SELECT COUNT(*) FROM test_cases").fetchone()[0]
+        return SyncResult(0, 0, 0, total, True)
+
+    snapshot = load_workbook_snapshot(excel_path, cache_dir=cache_dir)
+    totals = {'inserted': 0, 'updated': 0, 'deleted': 0, 'unchanged': 0}
+    with conn:
+        titles = [ws.title for ws in snapshot.worksheets]
+        for ws in snapshot.worksheets:
+            for name, count in sync_sheet(conn, ws).items():
+                totals[name] += count
+
+        placeholders = ', '.join('?' * len(titles))
+        cursor = conn.execute(f"DELETE FROM test_cases WHERE sheet NOT IN ({placeholders})", titles)
+        totals['deleted'] += cursor.rowcount
+        conn.execute("DELETE FROM sheets")
+        conn.executemany("INSERT INTO sheets (name, position) VALUES (?, ?)",
+                         [(title, position) for position, title in enumerate(titles)])
+        conn.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", [
+            ('source_path', str(excel_path)),
+            ('source_hash', source_hash),
+            ('synced_at', datetime.now().isoformat(timespec='seconds')),
+        ])
+
+    return SyncResult(totals['inserted'], totals['updated'], totals['deleted'],
+                      totals['unchanged'], False)
+
+
+def query_test_cases(
+    conn: sqlite3.Connection,
+    sheet: Optional[str] = None,
+    status: Optional[str] = None,
+    module: Optional[str] = None,
+    test_id: Optional[str] = None,
+    search: Optional[str] = None,
+    limit: Optional[int] = None
+) -> List[sqlite3.Row]:
+    """
+    Find test cases matching all given filters.
+
+    Status and module match case-insensitively; search is a substring
+    match on the title. Results are in workbook order.
+
+    Args:
+        conn: Connection from open_suite_db()
+        sheet: Sheet name
+        status: Pass/Failed value, e.g. 'Failed'
+        module: Module name
+        test_id: Test case ID
+        search: Text contained in the title
+        limit: Maximum number of results
+
+    Returns:
+        List of rows with sheet, test_id, row and the CASE_FIELDS columns
+    """
+    clauses = []
+    params: List[Any] = []
+    for column, value, condition in (
+        ('sheet', sheet, "t.sheet = ?"),
+        ('status', status, "t.status = ? COLLATE NOCASE"),
+        ('module', module, "t.module = ? COLLATE NOCASE"),
+        ('test_id', test_id, "t.test_id = ?"),
+        ('title', search, "t.title LIKE ?"),
+    ):
+        if value is not None:
+            clauses.append(condition)
+            params.append(f"%{value}%" if column == 'title' else value)
+
+    sql = (f"SELECT t.sheet, t.test_id, t.row, {', '.join('t.' + f for f in CASE_FIELDS)} "
+           "FROM test_cases t LEFT JOIN sheets s ON s.name = t.sheet")
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += " ORDER BY s.position, t.row"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+    return conn.execute(sql, params).fetchall()
+
+
+def status_counts(conn: sqlite3.Connection, sheet: Optional[str] = None) -> Dict[str, Dict[Any, int]]:
+    """
+    Count test cases per Pass/Failed value for each sheet.
+
+    Args:
+        conn: Connection from open_suite_db()
+        sheet: Only count this sheet
+
+    Returns:
+        dict: sheet -> {status: count}, sheets in workbook order
+    """
+    sql = ("SELECT t.sheet, t.status, COUNT(*) FROM test_cases t "
+           "LEFT JOIN sheets s ON s.name = t.sheet")
+    params = []
+    if sheet is not None:
+        sql += " WHERE t.sheet = ?"
+        params.append(sheet)
+    sql += " GROUP BY t.sheet, t.status ORDER BY s.position, t.status"
+
+    counts: Dict[str, Dict[Any, int]] = {}
+    for sheet_name, status, count in conn.execute(sql, params):
+        counts.setdefault(sheet_name, {})[status] = count
+    return counts
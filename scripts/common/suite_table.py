@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Columnar in-memory model of the test case suite.
+
+Each sheet is held as one list per field (test ID, module, title,
+precondition, steps, expected result, status, notes) plus the source row
+numbers, instead of a grid of cells. Filters produce boolean masks over
+whole columns, and counting and grouping work on a single column, so
+report code never loops over worksheet cells.
+
+Tables are built from any workbook-like object (openpyxl workbook,
+read-only workbook or WorkbookSnapshot). load_suite_table() reads through
+the snapshot cache by default.
+
+Example:
+    >>> suite = load_suite_table(get_excel_path())
+    >>> admin = suite['Admin Onboard']
+    >>> failed = admin.filter(admin.equals('status', 'Failed'))
+    >>> print(len(failed), suite.value_counts('status'))
+"""
+from collections import Counter
+from itertools import compress
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from .excel_utils import get_data_extent, iter_sheet_rows, load_excel_streaming
+from .snapshot_cache import load_workbook_snapshot
+
+# Field names in the standard sheet layout order (column A = test_id)
+SUITE_COLUMNS = ('test_id', 'module', 'title', 'precondition', 'steps', 'expected',
+                 'status', 'notes')
+
+# Header names (lower-cased) used to locate each field; fields whose header
+# is not found fall back to their position in the standard layout
+COLUMN_HEADERS = {
+    'module': ('module',),
+    'title': ('tittle', 'title'),
+    'precondition': ('pre-conditioin', 'pre-condition', 'precondition'),
+    'steps': ('steps to folow', 'steps to follow', 'test steps', 'steps'),
+    'expected': ('expected results', 'expected result'),
+    'status': ('pass/failed', 'status'),
+    'notes': ('notes',),
+}
+
+
+def locate_columns(headers: Sequence[Any]) -> Dict[str, int]:
+    """
+    Map each test case field to its column from the header row.
+
+    This is the one header lookup for the standard sheet layout; every
+    reader of test case fields goes through it.
+
+    Args:
+        headers: Header row values, starting at column A
+
+    Returns:
+        dict: Field name (see SUITE_COLUMNS) -> 1-based column
+    """
+    normalized = [h.strip().lower() if isinstance(h, str) else None for h in headers]
+    positions = {'test_id': 1}
+    for position, name in enumerate(SUITE_COLUMNS[1:], start=2):
+        for header in COLUMN_HEADERS[name]:
+            if header in normalized:
+                positions[name] = normalized.index(header) + 1
+                break
+        else:
+            positions[name] = position
+    return positions
+
+
+class SheetTable:
+    """
+    Test cases of one sheet stored column by column.
+
+    Columns are plain lists of equal length, indexed by field name.
+    Masks are lists of booleans, one per test case, and can be combined
+    with mask_and()/mask_or().
+    """
+
+    def __init__(
+        self,
+        title: str,
+        rows: Optional[List[int]] = None,
+        columns: Optional[Dict[str, List[Any]]] = None,
+        max_row: int = 0
+    ):
+        self.title = title
+        self.max_row = max_row
+        self.rows = rows or []
+        self.columns = columns or {name: [] for name in SUITE_COLUMNS}
+        self._positions: Optional[Dict[str, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, name: str) -> List[Any]:
+        return self.columns[name]
+
+    def __contains__(self, test_id: str) -> bool:
+        return test_id in self._id_positions()
+
+    def _id_positions(self) -> Dict[str, int]:
+        """First position of each test ID, built on first lookup."""
+        if self._positions is None:
+            self._positions = {}
+            for position, test_id in enumerate(self.columns['test_id']):
+                self._positions.setdefault(test_id, position)
+        return self._positions
+
+    def equals(self, name: str, value: Any) -> List[bool]:
+        """Mask of test cases whose field equals value."""
+        return [v == value for v in self.columns[name]]
+
+    def isin(self, name: str, values: Iterable[Any]) -> List[bool]:
+        """Mask of test cases whose field is one of values."""
+        values = set(values)
+        return [v in values for v in self.columns[name]]
+
+    def where(self, name: str, predicate: Callable[[Any], bool]) -> List[bool]:
+        """Mask of test cases whose field satisfies predicate."""
+        return [bool(predicate(v)) for v in self.columns[name]]
+
+    def filter(self, mask: Sequence[bool]) -> 'SheetTable':
+        """
+        Select the test cases where mask is True.
+
+        Args:
+            mask: One boolean per test case
+
+        Returns:
+            New SheetTable with the selected test cases
+        """
+        if len(mask) != len(self):
+            raise ValueError(f"Mask length {len(mask)} does not match {len(self)} test cases")
+        return SheetTable(
+            self.title,
+            list(compress(self.rows, mask)),
+            {name: list(compress(column, mask)) for name, column in self.columns.items()},
+            self.max_row
+        )
+
+    def take(self, positions: Sequence[int]) -> 'SheetTable':
+        """New SheetTable with the test cases at the given positions."""
+        return SheetTable(
+            self.title,
+            [self.rows[p] for p in positions],
+            {name: [column[p] for p in positions] for name, column in self.columns.items()},
+            self.max_row
+        )
+
+    def value_counts(self, name: str) -> Counter:
+        """Count test cases per distinct value of a field."""
+        return Counter(self.columns[name])
+
+    def group_by(self, name: str) -> Dict[Any, 'SheetTable']:
+        """
+        Split the table by the values of a field.
+
+        Args:
+            name: Field to group by
+
+        Returns:
+            dict: Field value -> SheetTable, in order of first appearance
+        """
+        groups: Dict[Any, List[int]] = {}
+        for position, value in enumerate(self.columns[name]):
+            groups.setdefault(value, []).append(position)
+        return {value: self.take(positions) for value, positions in groups.items()}
+
+    def get(self, test_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a test case by ID.
+
+        Args:
+            test_id: Test case ID (e.g. "AO013")
+
+        Returns:
+            dict of field values plus 'row', or None if not found
+        """
+        position = self._id_positions().get(test_id)
+        if position is None:
+            return None
+        record = {name: column[position] for name, column in self.columns.items()}
+        record['row'] = self.rows[position]
+        return record
+
+    def missing(self, test_ids: Iterable[str]) -> List[str]:
+        """Test IDs from test_ids that are not in the sheet, in given order."""
+        present = self._id_positions()
+        return [test_id for test_id in test_ids if test_id not in present]
+
+
+def mask_and(*masks: Sequence[bool]) -> List[bool]:
+    """Combine masks: True where every mask is True."""
+    return [all(values) for values in zip(*masks)]
+
+
+def mask_or(*masks: Sequence[bool]) -> List[bool]:
+    """Combine masks: True where any mask is True."""
+    return [any(values) for values in zip(*masks)]
+
+
+class SuiteTable:
+    """All sheets of a workbook as SheetTables, in workbook order."""
+
+    def __init__(self, sheets: Optional[List[SheetTable]] = None, source_hash: str = ''):
+        self.source_hash = source_hash
+        self.sheets: Dict[str, SheetTable] = {sheet.title: sheet for sheet in sheets or []}
+
+    @property
+    def sheetnames(self) -> List[str]:
+        return list(self.sheets)
+
+    def __getitem__(self, sheet_name: str) -> SheetTable:
+        return self.sheets[sheet_name]
+
+    def __contains__(self, sheet_name: str) -> bool:
+        return sheet_name in self.sheets
+
+    def __iter__(self) -> Iterator[SheetTable]:
+        return iter(self.sheets.values())
+
+    def __len__(self) -> int:
+        return sum(len(sheet) for sheet in self.sheets.values())
+
+    def counts(self) -> Dict[str, int]:
+        """Number of test cases per sheet."""
+        return {title: len(sheet) for title, sheet in self.sheets.items()}
+
+    def value_counts(self, name: str) -> Counter:
+        """Count test cases per distinct value of a field across all sheets."""
+        total = Counter()
+        for sheet in self.sheets.values():
+            total.update(sheet.columns[name])
+        return total
+
+
+def build_sheet_table(ws) -> SheetTable:
+    """
+    Read the test cases of one sheet into columns.
+
+    Rows below the header with a value in column A are test cases. The
+    rows are read once, bounded by the real data range, and transposed
+    into one list per field.
+
+    Args:
+        ws: Worksheet, read-only worksheet or SheetSnapshot
+
+    Returns:
+        SheetTable of the sheet's test cases
+    """
+    extent = get_data_extent(ws)
+    table = SheetTable(ws.title, max_row=ws.max_row or 0)
+    if not extent.max_row:
+        return table
+
+    rows = iter_sheet_rows(ws, max_row=extent.max_row, max_col=extent.max_col)
+    positions = locate_columns(next(rows).values)
+    body = [row for row in rows if row.test_id]
+    if not body:
+        return table
+
+    columns = list(zip(*(row.values for row in body)))
+    empty = [None] * len(body)
+    table.rows = [row.row for row in body]
+    for name, position in positions.items():
+        table.columns[name] = list(columns[position - 1]) if position <= len(columns) else list(empty)
+    table.columns['test_id'] = [str(test_id) for test_id in table.columns['test_id']]
+    return table
+
+
+def build_suite_table(wb, source_hash: str = '') -> SuiteTable:
+    """
+    Build the columnar model of every sheet in a workbook.
+
+    Args:
+        wb: Workbook, read-only workbook or WorkbookSnapshot
+        source_hash: Content hash of the source file
+
+    Returns:
+        SuiteTable with one SheetTable per worksheet
+    """
+    return SuiteTable([build_sheet_table(ws) for ws in wb.worksheets],
+                      source_hash=source_hash or getattr(wb, 'source_hash', ''))
+
+
+def load_suite_table(
+    excel_path: Path,
+    use_cache: bool = True,
+    cache_dir: Optional[Path] = None
+) -> SuiteTable:
+    """
+    Load the columnar model of a workbook.
+
+    Args:
+        excel_path: Path to the Excel file
+        use_cache: Read through the snapshot cache (parses the workbook
+            only when it changed); False reads the xlsx directly
+        cache_dir: Snapshot cache directory (default: data/cache/)
+
+    Returns:
+        SuiteTable of the workbook
+
+    Raises:
+        FileNotFoundError: If the Excel file doesn't exist
+    """
+    if not excel_path.exists():
+        raise FileNotFoundError(f"Excel file not found: {excel_path}")
+
+    if use_cache:
+        return build_suite_table(load_workbook_snapshot(excel_path, cache_dir=cache_dir))
+
+    wb = load_excel_streaming(excel_path)
+    try:
+        return build_suite_table(wb)
+    finally:
+        wb.close()
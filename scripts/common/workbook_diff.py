@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+Test-case level diff between two versions of a workbook.
+
+Rows are keyed by the test ID in column A and compared by their content
+hash (row_content_hash), so unchanged test cases are skipped with a single
+string comparison. Only rows whose hash differs are compared field by
+field. The result can be printed for review or exported as an RFC 6902
+JSON Patch.
+
+Rows without a test ID are keyed by their content hash, and repeated
+keys get an "@2", "@3", ... suffix in order of appearance, so every
+non-empty row below the header has a stable key.
+
+The JSON Patch applies to a document of the form:
+    {sheet: {"headers": [...], "cases": {key: {field: value}}}}
+
+Example:
+    >>> diff = diff_workbook_files(get_backup_path('Hello Master test cases - ORIGINAL.xlsx'),
+    ...                            get_excel_path())
+    >>> print(format_diff(diff))
+    >>> write_patch(diff, Path('suite.patch.json'))
+"""
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from openpyxl.utils import get_column_letter
+
+from .excel_utils import get_data_extent, iter_sheet_rows, row_content_hash
+from .snapshot_cache import load_workbook_snapshot
+
+# Header names (lower-cased) of the column shown next to a key in reports
+LABEL_HEADERS = ('tittle', 'title', 'edge case', 'ui element / feature tested')
+
+# Longest value printed by format_diff before it is truncated
+MAX_VALUE_CHARS = 60
+
+
+class CaseRecord(NamedTuple):
+    """A test case present on only one side of the diff."""
+
+    key: str
+    row: int
+    fields: Dict[str, Any]
+
+
+class CaseChange(NamedTuple):
+    """A test case present on both sides whose content differs."""
+
+    key: str
+    old_row: int
+    new_row: int
+    changes: Dict[str, Tuple[Any, Any]]
+
+
+class SheetDiff(NamedTuple):
+    """Differences within one sheet."""
+
+    sheet: str
+    status: str  # 'added', 'removed', 'changed' or 'unchanged'
+    added: List[CaseRecord]
+    removed: List[CaseRecord]
+    modified: List[CaseChange]
+    unchanged: int
+    old_headers: List[str]
+    new_headers: List[str]
+
+    @property
+    def has_changes(self) -> bool:
+        return self.status != 'unchanged'
+
+
+class WorkbookDiff(NamedTuple):
+    """Differences between two workbooks, in new-workbook sheet order."""
+
+    old_name: str
+    new_name: str
+    sheets: List[SheetDiff]
+
+    @property
+    def changed_sheets(self) -> List[SheetDiff]:
+        return [sheet for sheet in self.sheets if sheet.has_changes]
+
+    def totals(self) -> Dict[str, int]:
+        """Added, removed, modified and unchanged test cases over all sheets."""
+        return {
+            'added': sum(len(s.added) for s in self.sheets),
+            'removed': sum(len(s.removed) for s in self.sheets),
+            'modified': sum(len(s.modified) for s in self.sheets),
+            'unchanged': sum(s.unchanged for s in self.sheets),
+        }
+
+
+class _KeyedRow(NamedTuple):
+    row: int
+    values: Tuple[Any, ...]
+    content_hash: str
+
+
+def _field_names(header_values: Tuple[Any, ...], width: int) -> List[str]:
+    """
+    Name each column after its header, falling back to the column letter.
+
+    Empty and repeated headers are replaced by the column letter so every
+    field name in a sheet is unique.
+    """
+    names = []
+    for col_idx in range(1, width + 1):
+        header = header_values[col_idx - 1] if col_idx <= len(header_values) else None
+        name = str(header).strip() if header is not None else ''
+        if not name or name in names:
+            name = get_column_letter(col_idx)
+        names.append(name)
+    return names
+
+
+def read_sheet_rows(ws) -> Tuple[List[str], Dict[str, _KeyedRow]]:
+    """
+    Read a sheet into field names and content-hashed rows keyed by test ID.
+
+    Args:
+        ws: Worksheet, read-only worksheet or SheetSnapshot
+
+    Returns:
+        tuple: (field names, {key: row}) in row order
+    """
+    extent = get_data_extent(ws)
+    if not extent.max_row:
+        return [], {}
+
+    rows = iter_sheet_rows(ws, max_row=extent.max_row, max_col=extent.max_col)
+    fields = _field_names(next(rows).values, extent.max_col)
+
+    keyed: Dict[str, _KeyedRow] = {}
+    seen: Dict[str, int] = {}
+    for row in rows:
+        if row.is_empty:
+            continue
+        content_hash = row_content_hash(row.values)
+        key = row.test_id.strip() if row.test_id else f"row:{content_hash[:12]}"
+        seen[key] = seen.get(key, 0) + 1
+        if seen[key] > 1:
+            key = f"{key}@{seen[key]}"
+        keyed[key] = _KeyedRow(row.row, row.values, content_hash)
+
+    return fields, keyed
+
+
+def _record_fields(fields: List[str], values: Tuple[Any, ...]) -> Dict[str, Any]:
+    """Map non-empty cell values to field names."""
+    return {field: value for field, value in zip(fields, values) if value is not None}
+
+
+def _compare_rows(
+    old_fields: List[str],
+    old: Tuple[Any, ...],
+    new_fields: List[str],
+    new: Tuple[Any, ...]
+) -> Dict[str, Tuple[Any, Any]]:
+    """Field-by-field changes between two versions of a row."""
+    changes = {}
+    width = max(len(old_fields), len(new_fields))
+    for col_idx in range(width):
+        old_value = old[col_idx] if col_idx < len(old) else None
+        new_value = new[col_idx] if col_idx < len(new) else None
+        if old_value != new_value:
+            fields = new_fields if col_idx < len(new_fields) else old_fields
+            changes[fields[col_idx]] = (old_value, new_value)
+    return changes
+
+
+def diff_sheets(old_ws, new_ws) -> SheetDiff:
+    """
+    Diff two versions of a sheet by test ID.
+
+    Args:
+        old_ws: Sheet in the old workbook, or None if the sheet is new
+        new_ws: Sheet in the new workbook, or None if it was removed
+
+    Returns:
+        SheetDiff
+    """
+    title = (new_ws if new_ws is not None else old_ws).title
+    old_fields, old_rows = read_sheet_rows(old_ws) if old_ws is not None else ([], {})
+    new_fields, new_rows = read_sheet_rows(new_ws) if new_ws is not None else ([], {})
+
+    added = [CaseRecord(key, row.row, _record_fields(new_fields, row.values))
+             for key, row in new_rows.items() if key not in old_rows]
+    removed = [CaseRecord(key, row.row, _record_fields(old_fields, row.values))
+               for key, row in old_rows.items() if key not in new_rows]
+
+    modified = []
+    unchanged = 0
+    for key, new_row in new_rows.items():
+        old_row = old_rows.get(key)
+        if old_row is None:
+            continue
+        if old_row.content_hash == new_row.content_hash:
+            unchanged += 1
+            continue
+        modified.append(CaseChange(key, old_row.row, new_row.row,
+                                   _compare_rows(old_fields, old_row.values,
+                                                 new_fields, new_row.values)))
+
+    if old_ws is None:
+        status = 'added'
+    elif new_ws is None:
+        status = 'removed'
+    elif added or removed or modified or old_fields != new_fields:
+        status = 'changed'
+    else:
+        status = 'unchanged'
+
+    return SheetDiff(title, status, added, removed, modified, unchanged, old_fields, new_fields)
+
+
+def diff_workbooks(old_wb, new_wb, old_name: str = 'old', new_name: str = 'new') -> WorkbookDiff:
+    """
+    Diff every sheet of two workbooks.
+
+    Args:
+        old_wb: Old workbook (Workbook, read-only workbook or WorkbookSnapshot)
+        new_wb: New workbook
+        old_name: Label of the old workbook in reports
+        new_name: Label of the new workbook in reports
+
+    Returns:
+        WorkbookDiff with sheets in new-workbook order, removed sheets last
+    """
+    old_sheets = {ws.title: ws for ws in old_wb.worksheets}
+    new_titles = set()
+
+    sheets = []
+    for new_ws in new_wb.worksheets:
+        new_titles.add(new_ws.title)
+        sheets.append(diff_sheets(old_sheets.get(new_ws.title), new_ws))
+    for title, old_ws in old_sheets.items():
+        if title not in new_titles:
+            sheets.append(diff_sheets(old_ws, None))
+
+    return WorkbookDiff(old_name, new_name, sheets)
+
+
+def diff_workbook_files(
+    old_path: Path,
+    new_path: Path,
+    use_cache: bool = True,
+    cache_dir: Optional[Path] = None
+) -> WorkbookDiff:
+    """
+    Diff two workbook files.
+
+    Both files are read through the snapshot cache, so a workbook that has
+    not changed since the last run is not parsed again.
+
+    Args:
+        old_path: Path to the old workbook (e.g. the ORIGINAL backup)
+        new_path: Path to the new workbook
+        use_cache: Set to False to always parse the workbooks
+        cache_dir: Snapshot cache directory (default: data/cache/)
+
+    Returns:
+        WorkbookDiff
+
+    Raises:
+        FileNotFoundError: If either file doesn't exist
+    """
+    old_wb = load_workbook_snapshot(old_path, use_cache=use_cache, cache_dir=cache_dir)
+    new_wb = load_workbook_snapshot(new_path, use_cache=use_cache, cache_dir=cache_dir)
+    return diff_workbooks(old_wb, new_wb, old_path.name, new_path.name)
+
+
+def _pointer(*parts: str) -> str:
+    """Build an RFC 6901 JSON Pointer from unescaped parts."""
+    return ''.join('/' + str(part).replace('~', '~0').replace('/', '~1') for part in parts)
+
+
+def diff_to_patch(diff: WorkbookDiff) -> List[Dict[str, Any]]:
+    """
+    Express a diff as RFC 6902 JSON Patch operations.
+
+    Args:
+        diff: WorkbookDiff to convert
+
+    Returns:
+        List of patch operations ('add', 'remove', 'replace')
+    """
+    ops = []
+    for sheet in diff.sheets:
+        if sheet.status == 'unchanged':
+            continue
+        if sheet.status == 'added':
+            ops.append({'op': 'add', 'path': _pointer(sheet.sheet), 'value': {
+                'headers': sheet.new_headers,
+                'cases': {record.key: record.fields for record in sheet.added},
+            }})
+            continue
+        if sheet.status == 'removed':
+            ops.append({'op': 'remove', 'path': _pointer(sheet.sheet)})
+            continue
+
+        if sheet.old_headers != sheet.new_headers:
+            ops.append({'op': 'replace', 'path': _pointer(sheet.sheet, 'headers'),
+                        'value': sheet.new_headers})
+        for record in sheet.removed:
+            ops.append({'op': 'remove', 'path': _pointer(sheet.sheet, 'cases', record.key)})
+        for change in sheet.modified:
+            for field, (old_value, new_value) in change.changes.items():
+                path = _pointer(sheet.sheet, 'cases', change.key, field)
+                if new_value is None:
+                    ops.append({'op': 'remove', 'path': path})
+                elif old_value is None:
+                    ops.append({'op': 'add', 'path': path, 'value': new_value})
+                else:
+                    ops.append({'op': 'replace', 'path': path, 'value': new_value})
+        for record in sheet.added:
+            ops.append({'op': 'add', 'path': _pointer(sheet.sheet, 'cases', record.key),
+                        'value': record.fields})
+    return ops
+
+
+def write_patch(diff: WorkbookDiff, file_path: Path) -> bool:
+    """
+    Write the diff as a JSON Patch file.
+
+    Args:
+        diff: WorkbookDiff to export
+        file_path: Destination JSON file
+
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(diff_to_patch(diff), f, indent=2, ensure_ascii=False, default=str)
+        return True
+    except Exception as e:
+        print(f"Error writing patch to '{file_path}': {e}", file=sys.stderr)
+        return False
+
+
+def _short(value: Any) -> str:
+    """Single-line, truncated representation of a cell value."""
+    text = repr(value) if value is not None else '(empty)'
+    text = text.replace('\\n', ' ')
+    if len(text) > MAX_VALUE_CHARS:
+        text = text[:MAX_VALUE_CHARS - 3] + '...'
+    return text
+
+
+def _label(fields: Dict[str, Any]) -> str:
+    """Title-like field of a record, for one-line summaries."""
+    for field, value in fields.items():
+        if field.lower() in LABEL_HEADERS:
+            return _short(value)
+    return ''
+
+
+def format_diff(diff: WorkbookDiff, show_unchanged: bool = False) -> str:
+    """
+    Render a diff for human review.
+
+    Args:
+        diff: WorkbookDiff to render
+        show_unchanged: Also list sheets without changes
+
+    Returns:
+        Multi-line report
+    """
+    lines = [f"Comparing {diff.old_name} -> {diff.new_name}"]
+
+    for sheet in diff.sheets:
+        if not sheet.has_changes and not show_unchanged:
+            continue
+        lines.append('')
+        if sheet.status == 'added':
+            lines.append(f"NEW SHEET: {sheet.sheet} ({len(sheet.added)} test cases)")
+        elif sheet.status == 'removed':
+            lines.append(f"REMOVED SHEET: {sheet.sheet} ({len(sheet.removed)} test cases)")
+        else:
+            lines.append(f"SHEET: {sheet.sheet} (+{len(sheet.added)} added, "
+                         f"-{len(sheet.removed)} removed, ~{len(sheet.modified)} modified, "
+                         f"{sheet.unchanged} unchanged)")
+            if sheet.old_headers != sheet.new_headers:
+                lines.append(f"  headers: {sheet.old_headers} -> {sheet.new_headers}")
+
+        if sheet.status == 'removed':
+            continue
+        for record in sheet.removed:
+            lines.append(f"  - {record.key} (row {record.row}) {_label(record.fields)}".rstrip())
+        for change in sheet.modified:
+            lines.append(f"  ~ {change.key} (row {change.old_row} -> {change.new_row})")
+            for field, (old_value, new_value) in change.changes.items():
+                lines.append(f"      {field}: {_short(old_value)} -> {_short(new_value)}")
+        for record in sheet.added:
+            lines.append(f"  + {record.key} (row {record.row}) {_label(record.fields)}".rstrip())
+
+    totals = diff.totals()
+    lines.append('')
+    lines.append(f"{len(diff.changed_sheets)} of {len(diff.sheets)} sheets changed: "
+                 f"{totals['added']} added, {totals['removed']} removed, "
+                 f"{totals['modified']} modified, {totals['unchanged']} unchanged")
+    return '\n'.join(lines)
@@ -0,0 +1,506 @@
+#!/usr/bin/env python3
+"""
+Three-way merge of test case workbooks by test ID.
+
+Two testers editing copies of the master workbook produce "ours" and
+"theirs"; "base" is the version both started from (normally the ORIGINAL
+backup). Rows are matched by test ID across the three versions (see
+workbook_diff.read_sheet_rows) and merged like a version control merge:
+
+    - a row changed on one side only takes that side's version
+    - a row changed on both sides is merged cell by cell; cells changed
+      differently on both sides are conflicts
+    - a row deleted on one side and changed on the other is kept and
+      reported as a conflict
+    - rows added on one side are appended
+
+The merge plan is computed from cached value snapshots, and rows whose
+content hash matches the base on both sides are skipped without looking
+at their cells. The result is written into the "ours" workbook, touching
+only rows the merge changes. Every row that differs from the base gets
+the base row's formatting back through StyleMapper (style table index
+mapping), so merged rows keep the original look. New rows take the
+formatting of the base sheet's first data row.
+
+Values are read from data-only snapshots, so rows rewritten from theirs
+store formula results rather than formulas.
+
+Example:
+    >>> result = merge_workbook_files(base_path, ours_path, theirs_path, output_path)
+    >>> for conflict in result.conflicts:
+    ...     print(conflict.sheet, conflict.key, conflict.field)
+"""
+import shutil
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from openpyxl.utils import get_column_letter
+
+from .atomic_io import atomic_write
+from .excel_utils import (
+    append_rows,
+    get_data_extent,
+    iter_sheet_rows,
+    load_excel_safely,
+    save_excel_safely
+)
+from .snapshot_cache import load_workbook_snapshot
+from .style_utils import StyleMapper
+from .workbook_diff import read_sheet_rows
+
+# Key used for the header row in conflicts
+HEADER_KEY = '(header)'
+
+# Conflict kinds
+MODIFY_MODIFY = 'modify/modify'
+DELETE_MODIFY = 'delete/modify'
+ADD_ADD = 'add/add'
+
+SIDES = ('ours', 'theirs')
+
+# Sheet statuses that change our workbook; 'unchanged' and 'kept' sheets
+# are taken from ours as they are
+APPLIED_STATUSES = ('merged', 'added', 'deleted')
+
+
+class MergeConflict(NamedTuple):
+    """A change made differently on both sides."""
+
+    sheet: str
+    key: str
+    field: str
+    kind: str
+    base: Any
+    ours: Any
+    theirs: Any
+
+
+class SheetMerge(NamedTuple):
+    """
+    Merge plan for one sheet, in terms of rows of the "ours" sheet.
+
+    rewrite maps ours row numbers to the merged values to write there.
+    restyle maps result row numbers (including appended rows) to the base
+    row whose formatting they take (None: the base sheet's template row).
+    """
+
+    sheet: str
+    status: str  # 'merged', 'unchanged', 'added', 'deleted' or 'kept'
+    rewrite: Dict[int, Tuple[Any, ...]]
+    append: List[Tuple[Tuple[Any, ...], Optional[int]]]
+    delete: List[int]
+    restyle: Dict[int, Optional[int]]
+    conflicts: List[MergeConflict]
+    unchanged: int
+
+
+class MergeResult(NamedTuple):
+    """Outcome of merging two workbooks."""
+
+    sheets: List[SheetMerge]
+    saved: bool
+
+    @property
+    def conflicts(self) -> List[MergeConflict]:
+        return [c for sheet in self.sheets for c in sheet.conflicts]
+
+    @property
+    def changed(self) -> bool:
+        """True if the merge changes our workbook."""
+        return any(sheet.status in APPLIED_STATUSES for sheet in self.sheets)
+
+    def totals(self) -> Dict[str, int]:
+        """Rows rewritten, appended and deleted, conflicts and unchanged rows."""
+        return {
+            'rewritten': sum(len(s.rewrite) for s in self.sheets),
+            'appended': sum(len(s.append) for s in self.sheets),
+            'deleted': sum(len(s.delete) for s in self.sheets),
+            'conflicts': sum(len(s.conflicts) for s in self.sheets),
+            'unchanged': sum(s.unchanged for s in self.sheets),
+        }
+
+
+def _pad(values: Tuple[Any, ...], width: int) -> Tuple[Any, ...]:
+    return tuple(values) + (None,) * (width - len(values))
+
+
+def _trim(values: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    end = len(values)
+    while end and values[end - 1] is None:
+        end -= 1
+    return tuple(values[:end])
+
+
+def merge_values(
+    base: Tuple[Any, ...],
+    ours: Tuple[Any, ...],
+    theirs: Tuple[Any, ...],
+    fields: List[str],
+    prefer: str = 'ours'
+) -> Tuple[Tuple[Any, ...], List[Tuple[str, Any, Any, Any]]]:
+    """
+    Merge three versions of a row cell by cell.
+
+    Args:
+        base: Base row values
+        ours: Our row values
+        theirs: Their row values
+        fields: Field names for conflict reports (column letters beyond)
+        prefer: Side whose value is kept in a conflicting cell
+
+    Returns:
+        tuple: (merged values, [(field, base, ours, theirs) per conflicting cell])
+    """
+    width = max(len(base), len(ours), len(theirs))
+    base, ours, theirs = _pad(base, width), _pad(ours, width), _pad(theirs, width)
+
+    merged = []
+    conflicts = []
+    for col_idx, (b, o, t) in enumerate(zip(base, ours, theirs)):
+        if o == t or t == b:
+            merged.append(o)
+        elif o == b:
+            merged.append(t)
+        else:
+            field = fields[col_idx] if col_idx < len(fields) else get_column_letter(col_idx + 1)
+            conflicts.append((field, b, o, t))
+            merged.append(o if prefer == 'ours' else t)
+    return _trim(merged), conflicts
+
+
+def _header_values(ws) -> Tuple[Any, ...]:
+    if ws is None:
+        return ()
+    extent = get_data_extent(ws)
+    if not extent.max_row:
+        return ()
+    return _trim(next(iter_sheet_rows(ws, max_row=1, max_col=extent.max_col)).values)
+
+
+def plan_sheet_merge(base_ws, ours_ws, theirs_ws, prefer: str = 'ours') -> SheetMerge:
+    """
+    Work out how to merge one sheet present in ours.
+
+    Only the values of the three sheets are read (snapshots or read-only
+    worksheets are fine). Rows are compared by content hash first, so rows
+    untouched on both sides cost one comparison each.
+
+    Args:
+        base_ws: Sheet in the base workbook, or None if new on both sides
+        ours_ws: Sheet in our workbook
+        theirs_ws: Sheet in their workbook, or None if they deleted it
+        prefer: Side whose value is kept in conflicting cells
+
+    Returns:
+        SheetMerge plan against the rows of ours_ws
+    """
+    title = ours_ws.title
+    base_fields, base_rows = read_sheet_rows(base_ws) if base_ws is not None else ([], {})
+    ours_fields, ours_rows = read_sheet_rows(ours_ws)
+    theirs_fields, theirs_rows = read_sheet_rows(theirs_ws) if theirs_ws is not None else ([], {})
+    fields = ours_fields or theirs_fields or base_fields
+
+    rewrite: Dict[int, Tuple[Any, ...]] = {}
+    append: List[Tuple[Tuple[Any, ...], Optional[int]]] = []
+    delete: List[int] = []
+    restyle: Dict[int, Optional[int]] = {}
+    conflicts: List[MergeConflict] = []
+    unchanged = 0
+
+    def conflict(key, field, kind, base, ours, theirs):
+        conflicts.append(MergeConflict(title, key, field, kind, base, ours, theirs))
+
+    # Header row: merged like any other row
+    base_header = _header_values(base_ws)
+    ours_header = _header_values(ours_ws)
+    theirs_header = _header_values(theirs_ws) if theirs_ws is not None else base_header
+    if ours_header != base_header or theirs_header != base_header:
+        header, cell_conflicts = merge_values(base_header, ours_header, theirs_header,
+                                              fields, prefer)
+        for field, b, o, t in cell_conflicts:
+            conflict(HEADER_KEY, field, MODIFY_MODIFY, b, o, t)
+        if header != ours_header:
+            rewrite[1] = header
+        restyle[1] = 1 if base_ws is not None else None
+
+    for key, ours_row in ours_rows.items():
+        base_row = base_rows.get(key)
+        theirs_row = theirs_rows.get(key)
+        base_hash = base_row.content_hash if base_row else None
+        theirs_hash = theirs_row.content_hash if theirs_row else None
+        style_source = base_row.row if base_row else None
+
+        if ours_row.content_hash == base_hash == theirs_hash:
+            unchanged += 1
+            continue
+
+        if theirs_row is None:
+            if base_row is None:
+                # Added by us
+                restyle[ours_row.row] = None
+            elif ours_row.content_hash == base_hash:
+                # Deleted by them, untouched by us
+                delete.append(ours_row.row)
+            else:
+                # Deleted by them, changed by us: keep ours
+                conflict(key, '(row)', DELETE_MODIFY, None, 'modified', 'deleted')
+                restyle[ours_row.row] = style_source
+            continue
+
+        if theirs_hash == base_hash or theirs_hash == ours_row.content_hash:
+            # Only we changed it (or both made the same change)
+            restyle[ours_row.row] = style_source
+            continue
+
+        base_values = base_row.values if base_row else ()
+        if ours_row.content_hash == base_hash:
+            merged, cell_conflicts = theirs_row.values, []
+        else:
+            merged, cell_conflicts = merge_values(base_values, ours_row.values, theirs_row.values,
+                                                  fields, prefer)
+        kind = MODIFY_MODIFY if base_row else ADD_ADD
+        for field, b, o, t in cell_conflicts:
+            conflict(key, field, kind, b, o, t)
+
+        if _trim(merged) != _trim(ours_row.values):
+            rewrite[ours_row.row] = _trim(merged)
+        restyle[ours_row.row] = style_source
+
+    for key, theirs_row in theirs_rows.items():
+        if key in ours_rows:
+            continue
+        base_row = base_rows.get(key)
+        if base_row is None:
+            # Added by them
+            append.append((theirs_row.values, None))
+        elif theirs_row.content_hash != base_row.content_hash:
+            # Deleted by us, changed by them: bring their version back
+            conflict(key, '(row)', DELETE_MODIFY, None, 'deleted', 'modified')
+            append.append((theirs_row.values, base_row.row))
+        # Deleted by us, untouched by them: stays deleted
+
+    if base_ws is None:
+        # Nothing to take formatting from
+        restyle = {}
+
+    changed = rewrite or append or delete or restyle or conflicts
+    return SheetMerge(title, 'merged' if changed else 'unchanged', rewrite, append,
+                      sorted(delete), restyle, conflicts, unchanged)
+
+
+def _sheet_changed(base_ws, ws) -> bool:
+    """True if a sheet's values differ from the base sheet."""
+    base_fields, base_rows = read_sheet_rows(base_ws)
+    fields, rows = read_sheet_rows(ws)
+    if fields != base_fields or rows.keys() != base_rows.keys():
+        return True
+    return any(row.content_hash != base_rows[key].content_hash for key, row in rows.items())
+
+
+def plan_workbook_merge(base_wb, ours_wb, theirs_wb, prefer: str = 'ours') -> List[SheetMerge]:
+    """
+    Plan the merge of every sheet.
+
+    Sheets are matched by name. A sheet deleted on one side is dropped if
+    the other side left it unchanged, and kept (as a conflict) otherwise.
+    Sheets added by us are kept; sheets added by them are added to the
+    result.
+
+    Args:
+        base_wb: Base workbook (WorkbookSnapshot or read-only workbook)
+        ours_wb: Our workbook
+        theirs_wb: Their workbook
+        prefer: Side whose value is kept in conflicting cells
+
+    Returns:
+        List of SheetMerge plans, ours order first, then sheets added by them
+    """
+    base_sheets = {ws.title: ws for ws in base_wb.worksheets}
+    theirs_sheets = {ws.title: ws for ws in theirs_wb.worksheets}
+    ours_titles = [ws.title for ws in ours_wb.worksheets]
+
+    plans = []
+    for ours_ws in ours_wb.worksheets:
+        title = ours_ws.title
+        base_ws = base_sheets.get(title)
+        theirs_ws = theirs_sheets.get(title)
+
+        if theirs_ws is None and base_ws is None:
+            # Added by us only
+            plans.append(SheetMerge(title, 'kept', {}, [], [], {}, [], 0))
+            continue
+
+        if theirs_ws is None:
+            if _sheet_changed(base_ws, ours_ws):
+                conflict = MergeConflict(title, '(sheet)', '(sheet)', DELETE_MODIFY,
+                                         None, 'modified', 'deleted')
+                plans.append(SheetMerge(title, 'kept', {}, [], [], {}, [conflict], 0))
+            else:
+                plans.append(SheetMerge(title, 'deleted', {}, [], [], {}, [], 0))
+            continue
+
+        plans.append(plan_sheet_merge(base_ws, ours_ws, theirs_ws, prefer))
+
+    for title, theirs_ws in theirs_sheets.items():
+        if title in ours_titles:
+            continue
+        base_ws = base_sheets.get(title)
+        if base_ws is None:
+            plans.append(SheetMerge(title, 'added', {}, [], [], {}, [], 0))
+        elif _sheet_changed(base_ws, theirs_ws):
+            conflict = MergeConflict(title, '(sheet)', '(sheet)', DELETE_MODIFY,
+                                     None, 'deleted', 'modified')
+            plans.append(SheetMerge(title, 'added', {}, [], [], {}, [conflict], 0))
+
+    return plans
+
+
+def _row_runs(rows: List[int]) -> List[Tuple[int, int]]:
+    """Group sorted row numbers into (first, last) runs of consecutive rows."""
+    runs: List[List[int]] = []
+    for row_idx in rows:
+        if runs and runs[-1][1] == row_idx - 1:
+            runs[-1][1] = row_idx
+        else:
+            runs.append([row_idx, row_idx])
+    return [(first, last) for first, last in runs]
+
+
+def apply_sheet_merge(plan: SheetMerge, result_ws, base_ws=None,
+                      style_mapper: Optional[StyleMapper] = None) -> None:
+    """
+    Apply a merge plan to the "ours" sheet of the result workbook.
+
+    Args:
+        plan: SheetMerge from plan_sheet_merge()
+        result_ws: Worksheet loaded from our workbook (not read-only)
+        base_ws: Base worksheet with styles (not read-only), if any
+        style_mapper: StyleMapper from the base workbook to the result
+    """
+    width = max([len(v) for v in plan.rewrite.values()] +
+                [len(v) for v, _ in plan.append] + [get_data_extent(result_ws).max_col])
+
+    for row_idx, values in plan.rewrite.items():
+        for col_idx, value in enumerate(_pad(values, width), start=1):
+            cell = result_ws._cells.get((row_idx, col_idx))
+            if cell is not None or value is not None:
+                result_ws.cell(row=row_idx, column=col_idx).value = value
+
+    restyle = dict(plan.restyle)
+    if plan.append:
+        added = append_rows(result_ws, [values for values, _ in plan.append])
+        for offset, (_, base_row) in enumerate(plan.append):
+            restyle[added.first_row + offset] = base_row
+
+    if base_ws is not None and style_mapper is not None and restyle:
+        template_row = 2 if get_data_extent(base_ws).max_row >= 2 else 1
+        for row_idx, base_row in sorted(restyle.items()):
+            style_mapper.copy_range(base_ws, result_ws, row_idx, row_idx, width,
+                                    source_row=base_row or template_row)
+
+    # Bottom-up, so earlier row numbers stay valid
+    for first, last in reversed(_row_runs(plan.delete)):
+        result_ws.delete_rows(first, last - first + 1)
+
+
+def _copy_sheet(source_ws, result_wb, style_mapper: StyleMapper) -> None:
+    """Copy a whole sheet (values, styles, column widths) into result_wb."""
+    target = result_wb.create_sheet(source_ws.title)
+    extent = get_data_extent(source_ws)
+    if not extent.max_row:
+        return
+    append_rows(target, (row.values for row in iter_sheet_rows(
+        source_ws, max_row=extent.max_row, max_col=extent.max_col)), start_row=1)
+    style_mapper.copy_range(source_ws, target, 1, extent.max_row, extent.max_col)
+    for col_letter, dimension in source_ws.column_dimensions.items():
+        target.column_dimensions[col_letter].width = dimension.width
+
+
+def _copy_workbook(source: Path, target: Path) -> bool:
+    """Atomically save a byte-for-byte copy of a workbook."""
+    try:
+        with open(source, 'rb') as f:
+            atomic_write(target, lambda out: shutil.copyfileobj(f, out))
+    except OSError as e:
+        print(f"Error saving workbook to '{target}': {e}", file=sys.stderr)
+        return False
+    print(f"Successfully saved: {target}")
+    return True
+
+
+def merge_workbook_files(
+    base_path: Path,
+    ours_path: Path,
+    theirs_path: Path,
+    output_path: Optional[Path] = None,
+    prefer: str = 'ours',
+    dry_run: bool = False,
+    cache_dir: Optional[Path] = None
+) -> MergeResult:
+    """
+    Three-way merge two edited copies of a workbook.
+
+    The plan is computed from cached value snapshots. The result is our
+    workbook with the plan applied; the base workbook is only loaded with
+    styles when rows need restyling, and theirs only when it adds sheets.
+    If the merge changes nothing, a separate output_path still receives
+    a copy of ours.
+
+    Args:
+        base_path: Common ancestor (e.g. the ORIGINAL backup)
+        ours_path: Our edited copy; the result is built from it
+        theirs_path: Their edited copy
+        output_path: Where to save the result (default: ours_path)
+        prefer: 'ours' or 'theirs', the value kept in conflicting cells
+        dry_run: Plan only, without loading or saving the result
+        cache_dir: Snapshot cache directory (default: data/cache/)
+
+    Returns:
+        MergeResult with the per-sheet plans (and conflicts)
+
+    Raises:
+        FileNotFoundError: If any input file doesn't exist
+        ValueError: If prefer is not 'ours' or 'theirs'
+    """
+    if prefer not in SIDES:
+        raise ValueError(f"prefer must be 'ours' or 'theirs', got {prefer!r}")
+
+    snapshots = [load_workbook_snapshot(path, cache_dir=cache_dir)
+                 for path in (base_path, ours_path, theirs_path)]
+    plans = plan_workbook_merge(*snapshots, prefer=prefer)
+
+    if dry_run:
+        return MergeResult(plans, False)
+    if not MergeResult(plans, False).changed:
+        if output_path is None or Path(output_path).resolve() == Path(ours_path).resolve():
+            return MergeResult(plans, False)
+        return MergeResult(plans, _copy_workbook(ours_path, output_path))
+
+    result_wb = load_excel_safely(ours_path)
+    base_wb = theirs_wb = None
+    try:
+        if any(plan.restyle or plan.append for plan in plans):
+            base_wb = load_excel_safely(base_path)
+        base_mapper = StyleMapper(base_wb, result_wb) if base_wb is not None else None
+
+        for plan in plans:
+            if plan.status == 'merged':
+                base_ws = base_wb[plan.sheet] if base_wb and plan.sheet in base_wb.sheetnames else None
+                apply_sheet_merge(plan, result_wb[plan.sheet], base_ws, base_mapper)
+            elif plan.status == 'deleted':
+                del result_wb[plan.sheet]
+            elif plan.status == 'added':
+                if theirs_wb is None:
+                    theirs_wb = load_excel_safely(theirs_path)
+                    theirs_mapper = StyleMapper(theirs_wb, result_wb)
+                _copy_sheet(theirs_wb[plan.sheet], result_wb, theirs_mapper)
+
+        saved = save_excel_safely(result_wb, output_path or ours_path)
+    finally:
+        result_wb.close()
+        for wb in (base_wb, theirs_wb):
+            if wb is not None:
+                wb.close()
+
+    return MergeResult(plans, saved)
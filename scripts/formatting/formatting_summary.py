@@ -2,10 +2,19 @@
 """
 Generate a detailed summary of formatting in the restored file
 """
+import sys
+from pathlib import Path
+
 import openpyxl
 from openpyxl import load_workbook
 from openpyxl.utils import get_column_letter
 
+# Add parent directory to path to import common utilities
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from common.excel_utils import count_non_empty_rows
+from common.snapshot_cache import load_workbook_snapshot
+
 def describe_cell_format(cell):
     """Generate a human-readable description of cell formatting"""
     details = []
@@ -137,11 +146,13 @@ def main():
     print("Summary of All Sheets")
     print('='*80)
 
+    values = load_workbook_snapshot(Path(result_file))
+
     print(f"\nTotal sheets: {len(wb.sheetnames)}")
     print(f"\nSheet list:")
     for idx, sheet_name in enumerate(wb.sheetnames, 1):
         ws = wb[sheet_name]
-        row_count = sum(1 for row in ws.iter_rows() if any(c.value is not None for c in row))
+        row_count = count_non_empty_rows(values[sheet_name])
         freeze = f" | Freeze: {ws.freeze_panes}" if ws.freeze_panes else ""
         print(f"  {idx:2d}. {sheet_name:35s} ({row_count:3d} rows{freeze})")
 
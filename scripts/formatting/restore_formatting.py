@@ -9,34 +9,16 @@ from openpyxl.styles import Font, Fill, Border, Alignment, Protection, PatternFi
 from openpyxl.styles.colors import Color
 from openpyxl.utils import get_column_letter
 from copy import copy, deepcopy
+import argparse
 import sys
+from pathlib import Path
 
-def copy_cell_style(source_cell, target_cell):
-    """Copy all style attributes from source cell to target cell"""
-    if source_cell.has_style:
-        # Copy font
-        if source_cell.font:
-            target_cell.font = copy(source_cell.font)
+# Add parent directory to path to import common utilities
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-        # Copy fill
-        if source_cell.fill:
-            target_cell.fill = copy(source_cell.fill)
-
-        # Copy border
-        if source_cell.border:
-            target_cell.border = copy(source_cell.border)
-
-        # Copy alignment
-        if source_cell.alignment:
-            target_cell.alignment = copy(source_cell.alignment)
-
-        # Copy number format
-        if source_cell.number_format:
-            target_cell.number_format = source_cell.number_format
-
-        # Copy protection
-        if source_cell.protection:
-            target_cell.protection = copy(source_cell.protection)
+from common.atomic_io import DEFAULT_BACKUP_COUNT
+from common.excel_utils import get_data_extent, iter_sheet_rows, row_content_hash, save_excel_safely
+from common.style_utils import StyleMapper
 
 def copy_column_dimensions(source_ws, target_ws):
     """Copy column widths from source to target worksheet"""
@@ -95,9 +77,33 @@ def copy_conditional_formatting(source_ws, target_ws):
             for rule in rules:
                 target_ws.conditional_formatting.add(range_string, copy(rule))
 
-def restore_sheet_formatting(original_ws, modified_ws, result_ws, sheet_name):
+def copy_sheet_layout(original_ws, result_ws, original_max_row):
+    """Copy sheet-level formatting (dimensions, properties, merges, rules)"""
+    # Copy column dimensions
+    copy_column_dimensions(original_ws, result_ws)
+
+    # Copy row dimensions (for all rows including new ones)
+    copy_row_dimensions(original_ws, result_ws, original_max_row)
+
+    # Copy sheet properties
+    copy_sheet_properties(original_ws, result_ws)
+
+    # Copy merged cells
+    copy_merged_cells(original_ws, result_ws)
+
+    # Copy conditional formatting
+    try:
+        copy_conditional_formatting(original_ws, result_ws)
+        print(f"  Conditional formatting copied")
+    except Exception as e:
+        print(f"  Warning: Could not copy conditional formatting: {e}")
+
+def restore_sheet_formatting(original_ws, modified_ws, result_ws, sheet_name, style_mapper=None):
     """
     Copy content from modified sheet and formatting from original sheet to result sheet
+
+    style_mapper is a StyleMapper from the original to the result workbook;
+    pass the same one for every sheet so each distinct style is mapped once.
     """
     print(f"\nProcessing sheet: {sheet_name}")
 
@@ -111,75 +117,162 @@ def restore_sheet_formatting(original_ws, modified_ws, result_ws, sheet_name):
     if original_ws:
         print(f"  Original sheet has {original_max_row} rows")
 
+    # Bound all cell loops by the real data range. max_row/max_column count
+    # every formatted cell (~1000 rows per sheet); cells past the data range
+    # are empty and keep the styles they already have in the modified file.
+    modified_extent = get_data_extent(modified_ws)
+    original_extent = get_data_extent(original_ws) if original_ws else modified_extent
+    data_max_row = max(modified_extent.max_row, original_extent.max_row)
+    data_max_col = max(modified_extent.max_col, original_extent.max_col)
+    print(f"  Data range: {data_max_row} rows, {data_max_col} columns")
+
     # Step 1: Copy all content from modified sheet
     print(f"  Copying content from modified sheet...")
-    for row in modified_ws.iter_rows(min_row=1, max_row=max_row):
-        for cell in row:
-            result_cell = result_ws.cell(row=cell.row, column=cell.column)
-            result_cell.value = cell.value
+    if modified_extent.max_row:
+        for row in modified_ws.iter_rows(min_row=1, max_row=modified_extent.max_row,
+                                         max_col=modified_extent.max_col):
+            for cell in row:
+                result_cell = result_ws.cell(row=cell.row, column=cell.column)
+                result_cell.value = cell.value
 
-            # Copy hyperlink if exists
-            if cell.hyperlink:
-                result_cell.hyperlink = copy(cell.hyperlink)
+                # Copy hyperlink if exists
+                if cell.hyperlink:
+                    result_cell.hyperlink = copy(cell.hyperlink)
 
     # Step 2: Apply formatting from original sheet
     if original_ws:
         print(f"  Applying formatting from original sheet...")
 
-        # Copy formatting for all cells in the original range
-        for row_idx in range(1, original_max_row + 1):
-            for col_idx in range(1, max_col + 1):
-                orig_cell = original_ws.cell(row=row_idx, column=col_idx)
-                result_cell = result_ws.cell(row=row_idx, column=col_idx)
+        if style_mapper is None:
+            style_mapper = StyleMapper(original_ws.parent, result_ws.parent)
 
-                # Copy style from original
-                copy_cell_style(orig_cell, result_cell)
+        # Copy formatting for all cells in the original range
+        style_rows = min(original_max_row, data_max_row)
+        style_mapper.copy_range(original_ws, result_ws, 1, style_rows, data_max_col)
 
-                # If original cell has a hyperlink, preserve it unless modified has one
-                if orig_cell.hyperlink and not result_cell.hyperlink:
+        # If original cell has a hyperlink, preserve it unless modified has one
+        for (row_idx, col_idx), orig_cell in original_ws._cells.items():
+            if row_idx <= style_rows and col_idx <= data_max_col and orig_cell.hyperlink:
+                result_cell = result_ws.cell(row=row_idx, column=col_idx)
+                if not result_cell.hyperlink:
                     result_cell.hyperlink = copy(orig_cell.hyperlink)
 
         # For new rows beyond original, apply formatting from the last data row
-        if max_row > original_max_row:
-            print(f"  Applying formatting template to {max_row - original_max_row} new rows...")
+        new_rows_end = min(max_row, data_max_row)
+        if new_rows_end > original_max_row:
+            print(f"  Applying formatting template to {new_rows_end - original_max_row} new rows...")
 
             # Find a good template row (usually row 2 or the last data row)
             template_row = min(original_max_row, 2)
 
-            for row_idx in range(original_max_row + 1, max_row + 1):
-                for col_idx in range(1, max_col + 1):
-                    template_cell = original_ws.cell(row=template_row, column=col_idx)
-                    result_cell = result_ws.cell(row=row_idx, column=col_idx)
+            # Only copy style, keep the value from modified sheet
+            style_mapper.copy_range(original_ws, result_ws, original_max_row + 1, new_rows_end,
+                                    data_max_col, source_row=template_row)
+
+        copy_sheet_layout(original_ws, result_ws, original_max_row)
+
+    else:
+        # For new sheets, try to infer formatting from a similar sheet
+        print(f"  New sheet - will use default formatting")
 
-                    # Only copy style, keep the value from modified sheet
-                    copy_cell_style(template_cell, result_cell)
+    print(f"  Sheet '{sheet_name}' completed")
 
-        # Copy column dimensions
-        copy_column_dimensions(original_ws, result_ws)
+def find_changed_rows(original_ws, modified_ws, max_row, max_col):
+    """
+    Find rows of the modified sheet whose content differs from the original
 
-        # Copy row dimensions (for all rows including new ones)
-        copy_row_dimensions(original_ws, result_ws, original_max_row)
+    Rows are compared position by position using a hash of their values.
+    Rows beyond the end of the original data are always reported.
 
-        # Copy sheet properties
-        copy_sheet_properties(original_ws, result_ws)
+    Returns:
+        Sorted list of changed row numbers (1-based)
+    """
+    original_hashes = {
+        row.row: row_content_hash(row.values)
+        for row in iter_sheet_rows(original_ws, max_row=max_row, max_col=max_col)
+    }
+    return [
+        row.row
+        for row in iter_sheet_rows(modified_ws, max_row=max_row, max_col=max_col)
+        if original_hashes.get(row.row) != row_content_hash(row.values)
+    ]
+
+def _row_runs(rows):
+    """Group sorted row numbers into (first, last) runs of consecutive rows"""
+    runs = []
+    for row_idx in rows:
+        if runs and runs[-1][1] == row_idx - 1:
+            runs[-1][1] = row_idx
+        else:
+            runs.append([row_idx, row_idx])
+    return [tuple(run) for run in runs]
 
-        # Copy merged cells
-        copy_merged_cells(original_ws, result_ws)
+def restore_sheet_incremental(original_ws, result_ws, sheet_name, style_mapper):
+    """
+    Restore original formatting only on rows that are new or changed
 
-        # Copy conditional formatting
-        try:
-            copy_conditional_formatting(original_ws, result_ws)
-            print(f"  Conditional formatting copied")
-        except Exception as e:
-            print(f"  Warning: Could not copy conditional formatting: {e}")
+    result_ws is the modified sheet itself, so its values are already in
+    place. Rows whose content matches the original row at the same position
+    are assumed to still carry their formatting and are left untouched.
+    """
+    print(f"\nProcessing sheet: {sheet_name}")
 
-    else:
-        # For new sheets, try to infer formatting from a similar sheet
-        print(f"  New sheet - will use default formatting")
+    max_row = result_ws.max_row
+    original_max_row = original_ws.max_row
+
+    modified_extent = get_data_extent(result_ws)
+    original_extent = get_data_extent(original_ws)
+    data_max_row = max(modified_extent.max_row, original_extent.max_row)
+    data_max_col = max(modified_extent.max_col, original_extent.max_col)
+    print(f"  Data range: {data_max_row} rows, {data_max_col} columns")
+
+    changed_rows = find_changed_rows(original_ws, result_ws, data_max_row, data_max_col)
+    print(f"  Changed or new rows: {len(changed_rows)}")
+
+    # Rows inside the original range get the original row's formatting
+    template_row = min(original_max_row, 2)
+    new_rows_end = min(max_row, data_max_row)
+    for first, last in _row_runs(changed_rows):
+        if first <= original_max_row:
+            style_end = min(last, original_max_row)
+            style_mapper.copy_range(original_ws, result_ws, first, style_end, data_max_col)
+            for row_idx in range(first, style_end + 1):
+                for col_idx in range(1, data_max_col + 1):
+                    orig_cell = original_ws._cells.get((row_idx, col_idx))
+                    if orig_cell is not None and orig_cell.hyperlink:
+                        result_cell = result_ws.cell(row=row_idx, column=col_idx)
+                        if not result_cell.hyperlink:
+                            result_cell.hyperlink = copy(orig_cell.hyperlink)
+            first = style_end + 1
+
+        # Rows past the original range take the template row's formatting
+        last = min(last, new_rows_end)
+        if first <= last:
+            style_mapper.copy_range(original_ws, result_ws, first, last,
+                                    data_max_col, source_row=template_row)
+
+    copy_sheet_layout(original_ws, result_ws, original_max_row)
 
     print(f"  Sheet '{sheet_name}' completed")
 
 def main():
+    parser = argparse.ArgumentParser(
+        description='Restore original formatting while preserving new test cases'
+    )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Only restore formatting on rows that are new or changed since the original'
+    )
+    parser.add_argument(
+        '--keep-backups',
+        type=int,
+        default=DEFAULT_BACKUP_COUNT,
+        metavar='N',
+        help=f'Previous versions of the file to keep in test_cases/backups/ (default: {DEFAULT_BACKUP_COUNT})'
+    )
+    args = parser.parse_args()
+
     print("="*80)
     print("Excel Formatting Restoration Tool")
     print("="*80)
@@ -190,7 +283,6 @@ def main():
     original_file = os.path.join(project_root, 'test_cases', 'backups', 'Hello Master test cases - ORIGINAL.xlsx')
     modified_file = os.path.join(project_root, 'test_cases', 'current', 'Hello Master test cases.xlsx')
     output_file = os.path.join(project_root, 'test_cases', 'current', 'Hello Master test cases.xlsx')
-    temp_file = os.path.join(project_root, 'test_cases', 'current', 'Hello Master test cases_TEMP.xlsx')
 
     print(f"\nLoading files...")
     print(f"  Original file: {original_file}")
@@ -211,10 +303,19 @@ def main():
         print(f"ERROR: Could not load modified file: {e}")
         sys.exit(1)
 
-    # Create a new workbook for the result
-    # We'll copy from modified to preserve all sheets and content
-    result_wb = load_workbook(modified_file, data_only=False)
-    print(f"  Result workbook created")
+    if args.incremental:
+        # Update the modified workbook in place; its values are already final
+        result_wb = modified_wb
+        print(f"  Incremental mode: restoring changed rows only")
+    else:
+        # Create a new workbook for the result
+        # We'll copy from modified to preserve all sheets and content
+        result_wb = load_workbook(modified_file, data_only=False)
+        print(f"  Result workbook created")
+
+    # Styles are mapped from the original workbook's style tables into the
+    # result workbook once and shared across all sheets
+    style_mapper = StyleMapper(original_wb, result_wb)
 
     # Process each sheet in the modified workbook
     print(f"\n{'='*80}")
@@ -228,7 +329,10 @@ def main():
         # Check if sheet exists in original
         if sheet_name in original_wb.sheetnames:
             original_ws = original_wb[sheet_name]
-            restore_sheet_formatting(original_ws, modified_ws, result_ws, sheet_name)
+            if args.incremental:
+                restore_sheet_incremental(original_ws, result_ws, sheet_name, style_mapper)
+            else:
+                restore_sheet_formatting(original_ws, modified_ws, result_ws, sheet_name, style_mapper)
         else:
             # New sheet - try to apply formatting from a similar sheet
             print(f"\nProcessing NEW sheet: {sheet_name}")
@@ -240,22 +344,19 @@ def main():
                 template_ws = original_wb[template_sheet_name]
                 print(f"  Using '{template_sheet_name}' as formatting template")
 
+                # Only style the range that actually holds data
+                extent = get_data_extent(modified_ws)
+
                 # Apply basic formatting from template (just header row)
-                for col_idx in range(1, modified_ws.max_column + 1):
-                    template_cell = template_ws.cell(row=1, column=col_idx)
-                    result_cell = result_ws.cell(row=1, column=col_idx)
-                    copy_cell_style(template_cell, result_cell)
+                style_mapper.copy_range(template_ws, result_ws, 1, 1, extent.max_col)
 
                 # Apply data row formatting
                 if template_ws.max_row >= 2:
-                    for row_idx in range(2, modified_ws.max_row + 1):
-                        for col_idx in range(1, modified_ws.max_column + 1):
-                            template_cell = template_ws.cell(row=2, column=col_idx)
-                            result_cell = result_ws.cell(row=row_idx, column=col_idx)
-                            copy_cell_style(template_cell, result_cell)
+                    style_mapper.copy_range(template_ws, result_ws, 2, extent.max_row,
+                                            extent.max_col, source_row=2)
 
                 # Copy basic column widths
-                for col_idx in range(1, min(modified_ws.max_column, template_ws.max_column) + 1):
+                for col_idx in range(1, min(extent.max_col, template_ws.max_column) + 1):
                     col_letter = get_column_letter(col_idx)
                     if col_letter in template_ws.column_dimensions:
                         result_ws.column_dimensions[col_letter].width = \
@@ -263,16 +364,13 @@ def main():
 
             print(f"  New sheet '{sheet_name}' completed")
 
-    # Save the result to a temporary file first
+    # Save atomically over the modified file, keeping the previous version
     print(f"\n{'='*80}")
-    print(f"Saving result to temporary file: {temp_file}")
+    print(f"Saving result to: {output_file}")
     print('='*80)
 
-    try:
-        result_wb.save(temp_file)
-        print(f"  Temporary file saved successfully")
-    except Exception as e:
-        print(f"ERROR: Could not save temporary file: {e}")
+    if not save_excel_safely(result_wb, Path(output_file), backups=args.keep_backups):
+        print(f"ERROR: Could not save result file; {output_file} is unchanged")
         sys.exit(1)
 
     # Close all workbooks
@@ -286,7 +384,7 @@ def main():
 
     # Verify the result
     try:
-        verify_wb = load_workbook(temp_file, data_only=False)
+        verify_wb = load_workbook(output_file, data_only=False)
         print(f"\nVerification:")
         print(f"  Total sheets: {len(verify_wb.sheetnames)}")
 
@@ -303,9 +401,9 @@ def main():
         print(f"\n{'='*80}")
         print("SUCCESS!")
         print('='*80)
-        print(f"\nThe formatted file has been saved as: {temp_file}")
-        print(f"\nTo replace the original modified file, rename:")
-        print(f"  {temp_file} -> {output_file}")
+        print(f"\nThe formatted file has been saved as: {output_file}")
+        if args.keep_backups > 0:
+            print(f"Previous version kept in: test_cases/backups/")
 
     except Exception as e:
         print(f"ERROR during verification: {e}")
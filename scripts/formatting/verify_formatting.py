@@ -2,11 +2,22 @@
 """
 Script to verify that formatting was properly restored
 """
+import argparse
+import sys
+from pathlib import Path
+
 import openpyxl
 from openpyxl import load_workbook
 from openpyxl.styles import Font, Fill, Border, Alignment
 from openpyxl.utils import get_column_letter
 
+# Add parent directory to path to import common utilities
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from common.excel_utils import count_non_empty_rows
+from common.snapshot_cache import load_workbook_snapshot
+from common.style_utils import compare_sheet_styles
+
 def compare_cell_formatting(orig_cell, result_cell, cell_ref):
     """Compare formatting between two cells and report differences"""
     differences = []
@@ -58,8 +69,43 @@ def compare_cell_formatting(orig_cell, result_cell, cell_ref):
 
     return differences
 
-def verify_sheet_formatting(original_ws, result_ws, sheet_name, sample_size=10):
-    """Verify that formatting was properly copied from original to result"""
+def verify_all_cell_formatting(original_ws, result_ws):
+    """Compare the formatting of every cell in the used range of both sheets"""
+    print(f"    Checking cell formatting (all cells)...")
+    issues = []
+
+    # max_row/max_column cover every stored cell, styled empty cells
+    # included, so formatting past the last value is compared too
+    max_row = max(original_ws.max_row, result_ws.max_row)
+    max_col = max(original_ws.max_column, result_ws.max_column)
+
+    comparison = compare_sheet_styles(original_ws, result_ws, max_row, max_col)
+
+    # Only the mismatching cells are inspected attribute by attribute
+    for row, col in comparison.mismatched_cells[:3]:
+        cell_ref = f"{get_column_letter(col)}{row}"
+        diffs = compare_cell_formatting(original_ws.cell(row=row, column=col),
+                                        result_ws.cell(row=row, column=col), cell_ref)
+        print(f"      Cell {cell_ref}: {'; '.join(diffs[:2])}")
+
+    cell_issues = len(comparison.mismatched_cells)
+    if cell_issues == 0:
+        print(f"    Cell formatting: {comparison.cells_checked} cells checked - ALL MATCH")
+    else:
+        print(f"    Cell formatting: {cell_issues}/{comparison.cells_checked} cells in "
+              f"{len(comparison.mismatched_rows)} rows have differences")
+        issues.append(f"{cell_issues} cells have formatting differences")
+
+    return issues
+
+def verify_sheet_formatting(original_ws, result_ws, sheet_name, sample_size=10, exhaustive=False):
+    """
+    Verify that formatting was properly copied from original to result
+
+    By default only a sample of row heights and cells is checked. With
+    exhaustive=True every row height and every cell in the used range
+    (styled cells included) is compared using style signature hashes.
+    """
     print(f"\n  Sheet: {sheet_name}")
 
     issues = []
@@ -80,14 +126,18 @@ def verify_sheet_formatting(original_ws, result_ws, sheet_name, sample_size=10):
     # Check row heights (sample)
     row_height_match = 0
     row_height_total = 0
-    for row_num in list(original_ws.row_dimensions.keys())[:sample_size]:
+    row_numbers = list(original_ws.row_dimensions.keys())
+    if not exhaustive:
+        row_numbers = row_numbers[:sample_size]
+    for row_num in row_numbers:
         row_height_total += 1
         if row_num in result_ws.row_dimensions:
             if original_ws.row_dimensions[row_num].height == result_ws.row_dimensions[row_num].height:
                 row_height_match += 1
 
     if row_height_total > 0:
-        print(f"    Row heights (sample): {row_height_match}/{row_height_total} match")
+        label = "Row heights" if exhaustive else "Row heights (sample)"
+        print(f"    {label}: {row_height_match}/{row_height_total} match")
 
     # Check merged cells
     orig_merged = len(original_ws.merged_cells.ranges)
@@ -115,6 +165,10 @@ def verify_sheet_formatting(original_ws, result_ws, sheet_name, sample_size=10):
         print(f"    Tab color: DIFFER")
         issues.append(f"Tab color differs")
 
+    if exhaustive:
+        issues.extend(verify_all_cell_formatting(original_ws, result_ws))
+        return issues
+
     # Sample cell formatting check
     print(f"    Checking cell formatting (sample)...")
     cell_issues = 0
@@ -146,6 +200,14 @@ def verify_sheet_formatting(original_ws, result_ws, sheet_name, sample_size=10):
     return issues
 
 def main():
+    parser = argparse.ArgumentParser(description='Verify that formatting was properly restored')
+    parser.add_argument(
+        '--exhaustive',
+        action='store_true',
+        help='Compare the formatting of every cell instead of a sample'
+    )
+    args = parser.parse_args()
+
     print("="*80)
     print("Excel Formatting Verification Report")
     print("="*80)
@@ -179,7 +241,8 @@ def main():
         return
 
     try:
-        backup_wb = load_workbook(backup_file, data_only=False)
+        # Only values are needed from the backup, so use the cached snapshot
+        backup_wb = load_workbook_snapshot(Path(backup_file))
         print(f"  Backup: {len(backup_wb.sheetnames)} sheets")
     except Exception as e:
         print(f"ERROR: Could not load backup file: {e}")
@@ -190,15 +253,16 @@ def main():
     print("CONTENT VERIFICATION (comparing Result vs Backup)")
     print('='*80)
 
+    # Row counts come from value snapshots rather than the styled workbooks
+    original_values = load_workbook_snapshot(Path(original_file))
+    result_values = load_workbook_snapshot(Path(result_file))
+
     if backup_wb:
         content_preserved = True
         for sheet_name in backup_wb.sheetnames:
-            if sheet_name in result_wb.sheetnames:
-                backup_ws = backup_wb[sheet_name]
-                result_ws = result_wb[sheet_name]
-
-                backup_rows = sum(1 for row in backup_ws.iter_rows() if any(c.value is not None for c in row))
-                result_rows = sum(1 for row in result_ws.iter_rows() if any(c.value is not None for c in row))
+            if sheet_name in result_values.sheetnames:
+                backup_rows = count_non_empty_rows(backup_wb[sheet_name])
+                result_rows = count_non_empty_rows(result_values[sheet_name])
 
                 if backup_rows != result_rows:
                     print(f"  WARNING: '{sheet_name}' row count changed: {backup_rows} -> {result_rows}")
@@ -228,7 +292,8 @@ def main():
             original_ws = original_wb[sheet_name]
             result_ws = result_wb[sheet_name]
 
-            issues = verify_sheet_formatting(original_ws, result_ws, sheet_name)
+            issues = verify_sheet_formatting(original_ws, result_ws, sheet_name,
+                                             exhaustive=args.exhaustive)
             if issues:
                 all_issues[sheet_name] = issues
         else:
@@ -262,15 +327,11 @@ def main():
     total_orig = 0
     total_result = 0
 
-    for sheet_name in original_wb.sheetnames:
-        orig_ws = original_wb[sheet_name]
-        rows = sum(1 for row in orig_ws.iter_rows() if any(c.value is not None for c in row))
-        total_orig += rows
+    for orig_ws in original_values.worksheets:
+        total_orig += count_non_empty_rows(orig_ws)
 
-    for sheet_name in result_wb.sheetnames:
-        result_ws = result_wb[sheet_name]
-        rows = sum(1 for row in result_ws.iter_rows() if any(c.value is not None for c in row))
-        total_result += rows
+    for result_ws in result_values.worksheets:
+        total_result += count_non_empty_rows(result_ws)
 
     print(f"\nTotal rows with data:")
     print(f"  Original file: {total_orig}")
@@ -278,11 +339,7 @@ def main():
     print(f"  Difference:    {total_result - total_orig:+d} rows")
 
     if backup_wb:
-        total_backup = 0
-        for sheet_name in backup_wb.sheetnames:
-            backup_ws = backup_wb[sheet_name]
-            rows = sum(1 for row in backup_ws.iter_rows() if any(c.value is not None for c in row))
-            total_backup += rows
+        total_backup = sum(count_non_empty_rows(ws) for ws in backup_wb.worksheets)
         print(f"  Backup file:   {total_backup}")
 
         if total_result == total_backup:
@@ -9,7 +9,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from docx import Document
 from docx.shared import Pt, RGBColor, Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from common.docx_utils import get_report_output_path
+from common.docx_utils import get_report_output_path, save_docx_safely
 
 def create_bug_report():
     """Create the bug report DOCX file."""
@@ -197,7 +197,8 @@ def create_bug_report():
 
     # Save the document
     output_path = Path(get_report_output_path('BUG_2025-11-10_Classroom_Game_Stars.docx'))
-    doc.save(str(output_path))
+    if not save_docx_safely(doc, output_path):
+        raise IOError(f"Could not save bug report to {output_path}")
     print(f"\n[OK] Bug report created successfully: {output_path}")
     return output_path
 
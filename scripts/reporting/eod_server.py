@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Serve EOD report generation over local HTTP.
+
+Keeps the parsed EOD template and the tester name (from git config) in
+memory, so each report costs only the rendering itself instead of
+interpreter startup, imports, a git subprocess and template parsing.
+
+Endpoints:
+    GET  /health  - Server status as JSON
+    POST /render  - Body: EOD input as YAML or JSON (same fields as the
+                    YAML input file). Response: the generated .docx, with
+                    the standard report filename in Content-Disposition.
+
+Usage:
+    # Listen on localhost TCP (default 127.0.0.1:8765)
+    python eod_server.py --port 8765
+
+    # Listen on a Unix socket instead
+    python eod_server.py --socket /tmp/eod_report.sock
+
+    # Render a report
+    curl --data-binary @eod_notes.yaml http://127.0.0.1:8765/render -o report.docx
+    curl --unix-socket /tmp/eod_report.sock --data-binary @eod_notes.yaml \
+        http://localhost/render -o report.docx
+
+Author: QA Team
+"""
+
+import sys
+import argparse
+import json
+import os
+import re
+import socketserver
+import stat
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import quote
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from common.docx_utils import print_section_header
+from reporting.generate_eod_report import (
+    CompiledTemplate,
+    get_user_fullname,
+    load_eod_template,
+    render_eod_report
+)
+
+import yaml
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_REQUEST_BYTES = 1024 * 1024
+DOCX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+# Characters kept in the plain filename= parameter; anything else (quotes,
+# CR/LF, non-ASCII from the tester name) becomes an underscore
+UNSAFE_FILENAME_CHARS = re.compile(r'[^A-Za-z0-9 _.-]')
+
+
+def content_disposition(filename: str) -> str:
+    """
+    Build a Content-Disposition header value for a download.
+
+    The tester name in the filename comes from the request, so the plain
+    filename= parameter is restricted to safe characters and the exact
+    name is sent percent-encoded in filename*= (RFC 5987).
+
+    Args:
+        filename: Report filename
+
+    Returns:
+        Header value, e.g. attachment; filename="EOD_..."; filename*=UTF-8''EOD_...
+    """
+    fallback = UNSAFE_FILENAME_CHARS.sub('_', filename)
+    return f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{quote(filename, safe='')}"
+
+
+def remove_stale_socket(socket_path: Path) -> None:
+    """
+    Remove a Unix socket left behind by a previous server.
+
+    Args:
+        socket_path: Socket path to clear
+
+    Raises:
+        FileExistsError: If something other than a socket exists at the path
+    """
+    try:
+        mode = os.lstat(socket_path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"{socket_path} exists and is not a socket; refusing to remove it")
+    os.unlink(socket_path)
+
+
+class EODRequestHandler(BaseHTTPRequestHandler):
+    """Handle /health and /render requests against the server's warm template."""
+
+    server_version = "EODReportServer/1.0"
+
+    def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path != "/health":
+            self._send_json(404, {"error": f"Unknown path: {self.path}"})
+            return
+
+        self._send_json(200, {
+            "status": "ok",
+            "tester": self.server.default_tester,
+            "reports_rendered": self.server.reports_rendered,
+        })
+
+    def do_POST(self):
+        if self.path != "/render":
+            self._send_json(404, {"error": f"Unknown path: {self.path}"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = -1
+        if length <= 0:
+            self._send_json(411, {"error": "Request body with Content-Length is required"})
+            return
+        if length > MAX_REQUEST_BYTES:
+            self._send_json(413, {"error": f"Request body larger than {MAX_REQUEST_BYTES} bytes"})
+            return
+
+        raw = self.rfile.read(length)
+        try:
+            # YAML parsing also accepts JSON bodies
+            data = yaml.safe_load(raw.decode('utf-8'))
+            filename, content = self.server.render(data)
+        except (yaml.YAMLError, UnicodeDecodeError) as e:
+            self._send_json(400, {"error": f"Invalid YAML format: {e}"})
+            return
+        except (ValueError, AttributeError) as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        except Exception as e:
+            print(f"ERROR: Could not render report: {e}", file=sys.stderr)
+            self._send_json(500, {"error": f"Could not render report: {e}"})
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", DOCX_CONTENT_TYPE)
+        self.send_header("Content-Disposition", content_disposition(filename))
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        print(f"[{self.log_date_time_string()}] {format % args}", file=sys.stderr)
+
+
+class _EODServerMixin:
+    """Warm state shared by the TCP and Unix socket servers."""
+
+    daemon_threads = True
+
+    def setup_eod(self, template: CompiledTemplate, default_tester: str) -> None:
+        self.template = template
+        self.default_tester = default_tester
+        self.reports_rendered = 0
+        # Connections are handled in threads; rendering is serialized
+        self._render_lock = threading.Lock()
+
+    def render(self, data: Any):
+        with self._render_lock:
+            result = render_eod_report(self.template, data, self.default_tester)
+            self.reports_rendered += 1
+        return result
+
+
+class EODHTTPServer(_EODServerMixin, ThreadingHTTPServer):
+    """EOD report server on a TCP address."""
+
+
+class EODUnixHTTPServer(_EODServerMixin, socketserver.ThreadingUnixStreamServer):
+    """EOD report server on a Unix domain socket."""
+
+    def get_request(self):
+        request, _ = super().get_request()
+        # BaseHTTPRequestHandler expects a (host, port) client address
+        return request, ("local", 0)
+
+
+def create_server(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    socket_path: Optional[Path] = None,
+    template: Optional[CompiledTemplate] = None,
+    default_tester: Optional[str] = None
+):
+    """
+    Create the report server with the template and tester name loaded.
+
+    Args:
+        host: Address to listen on (TCP)
+        port: Port to listen on (TCP, 0 picks a free port)
+        socket_path: Listen on this Unix socket instead of TCP
+        template: Compiled template (loaded from the default path if None)
+        default_tester: Tester name for inputs without one (git config if None)
+
+    Returns:
+        Server instance; call serve_forever() to start handling requests
+    """
+    if template is None:
+        template = load_eod_template()
+    if default_tester is None:
+        default_tester = get_user_fullname()
+
+    if socket_path is not None:
+        remove_stale_socket(socket_path)
+        server = EODUnixHTTPServer(str(socket_path), EODRequestHandler)
+    else:
+        server = EODHTTPServer((host, port), EODRequestHandler)
+
+    server.setup_eod(template, default_tester)
+    return server
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Serve EOD report generation with a warm template"
+    )
+    parser.add_argument(
+        '--host',
+        default=DEFAULT_HOST,
+        help=f'Address to listen on (default: {DEFAULT_HOST})'
+    )
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=DEFAULT_PORT,
+        help=f'Port to listen on (default: {DEFAULT_PORT})'
+    )
+    parser.add_argument(
+        '--socket',
+        type=Path,
+        help='Listen on a Unix socket instead of TCP'
+    )
+    args = parser.parse_args()
+
+    try:
+        server = create_server(args.host, args.port, args.socket)
+    except (FileNotFoundError, ValueError, OSError) as e:
+        print(f"ERROR: Could not start server: {e}", file=sys.stderr)
+        return 1
+
+    print_section_header("EOD Report Server")
+    if args.socket:
+        print(f"Listening on unix socket: {args.socket}")
+    else:
+        host, port = server.server_address[:2]
+        print(f"Listening on: http://{host}:{port}")
+    print(f"Default tester: {server.default_tester}")
+    print("Press Ctrl+C to stop")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopping server")
+    finally:
+        server.server_close()
+        if args.socket:
+            try:
+                remove_stale_socket(args.socket)
+            except FileExistsError as e:
+                print(f"WARNING: {e}", file=sys.stderr)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
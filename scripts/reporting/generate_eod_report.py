@@ -15,20 +15,29 @@ Usage:
     # Archive old reports
     python generate_eod_report.py --archive --days 30
 
+    # Batch mode: a directory, glob or multi-document YAML file
+    python generate_eod_report.py --batch eod_inputs/2025-11/ --jobs 4
+
 Author: QA Team
 """
 
 import sys
 import argparse
+import copy
+import glob
+import io
+import os
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 import re
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from common.atomic_io import atomic_write_bytes
 from common.docx_utils import (
     get_template_path,
     get_report_output_path,
@@ -47,6 +56,9 @@ except ImportError:
 
 try:
     from docx import Document
+    from docx.oxml import OxmlElement
+    from docx.oxml.ns import qn
+    from docx.text.paragraph import Paragraph
 except ImportError:
     print("ERROR: python-docx is not installed.", file=sys.stderr)
     print("Please run: pip install -r requirements.txt", file=sys.stderr)
@@ -64,6 +76,11 @@ SECTIONS = [
     "6. Pending / Next Steps",
     "7. Testing Status",
 ]
+REQUIRED_FIELDS = ['date', 'product', 'status']
+HEADER_MARKER = "summarizing the testing activities and findings for"
+
+# Compiled template shared by batch reports, loaded once per process
+_worker_template = None
 
 
 def get_user_fullname() -> str:
@@ -144,17 +161,65 @@ def _is_section_heading(paragraph_text: str) -> bool:
     return bool(re.match(r'^\d+\.', stripped))
 
 
-def _find_paragraph_index(doc: Document, text: str) -> int:
-    """Find the index of a paragraph with exact text match."""
-    for i, p in enumerate(doc.paragraphs):
-        if p.text.strip() == text:
-            return i
-    return -1
+class CompiledTemplate:
+    """
+    EOD template with the location of the header and every section recorded.
+
+    Locations are positions among the <w:body> children, found in a single
+    pass when the template is compiled. Copies made with new_document() have
+    the same body layout, so every report is filled by jumping straight to
+    the recorded elements instead of searching the paragraphs again.
+
+    Raises:
+        ValueError: If any sections are missing
+    """
+
+    def __init__(self, doc: Document):
+        self.doc = doc
+        self.header_position: Optional[int] = None
+        # Section heading -> (heading position, positions of its content paragraphs)
+        self.sections: Dict[str, Tuple[int, List[int]]] = {}
+
+        body = doc._body
+        paragraphs = [
+            (position, Paragraph(element, body).text)
+            for position, element in enumerate(doc.element.body)
+            if element.tag == qn('w:p')
+        ]
+
+        heading_indexes = {}
+        for i, (position, text) in enumerate(paragraphs):
+            if self.header_position is None and HEADER_MARKER in text:
+                self.header_position = position
+            stripped = text.strip()
+            if stripped in SECTIONS and stripped not in heading_indexes:
+                heading_indexes[stripped] = i
+
+        missing_sections = [s for s in SECTIONS if s not in heading_indexes]
+        if missing_sections:
+            raise ValueError(
+                f"Template is missing required sections:\n" +
+                "\n".join(f"  - {s}" for s in missing_sections)
+            )
+
+        # A section's content runs until the next numbered paragraph
+        for section, i in heading_indexes.items():
+            content = []
+            for position, text in paragraphs[i + 1:]:
+                if _is_section_heading(text):
+                    break
+                content.append(position)
+            self.sections[section] = (paragraphs[i][0], content)
+
+    def new_document(self) -> Document:
+        """Get an independent copy of the template for one report."""
+        return copy_document(self.doc)
 
 
 def _replace_content_in_section(
-    doc: Document,
-    section_heading: str,
+    body,
+    heading_element,
+    content_elements: List[Any],
     new_content_lines: List[str],
     use_bullets: bool = False
 ) -> None:
@@ -162,62 +227,39 @@ def _replace_content_in_section(
     Replace content in a section.
 
     Args:
-        doc: Document object
-        section_heading: The exact heading text to find
+        body: Document body the section belongs to
+        heading_element: <w:p> element of the section heading
+        content_elements: <w:p> elements of the current section content
         new_content_lines: List of content lines to insert
         use_bullets: If True, format lines as bullets
     """
-    # Find section heading index
-    start_idx = _find_paragraph_index(doc, section_heading)
-    if start_idx < 0:
-        raise ValueError(f"Section heading not found: '{section_heading}'")
-
-    # Find where this section ends
-    end_idx = len(doc.paragraphs)
-    for i in range(start_idx + 1, len(doc.paragraphs)):
-        if _is_section_heading(doc.paragraphs[i].text):
-            end_idx = i
-            break
-
     # Delete existing content
-    paragraphs_to_delete = []
-    for i in range(start_idx + 1, end_idx):
-        paragraphs_to_delete.append(doc.paragraphs[i])
-
-    for p in paragraphs_to_delete:
-        delete_paragraph(p)
+    for element in content_elements:
+        element.getparent().remove(element)
 
     # Insert new content
-    heading_element = doc.paragraphs[start_idx]._element
-
     for line in new_content_lines:
+        new_p = Paragraph(OxmlElement('w:p'), body)
+        heading_element.addnext(new_p._element)
+        heading_element = new_p._element
+
         if use_bullets:
             try:
-                new_p = doc.add_paragraph(style='List Bullet')
+                new_p.style = 'List Bullet'
             except KeyError:
-                new_p = doc.add_paragraph()
                 new_p.add_run("• " + line)
-                heading_element.addnext(new_p._element)
-                heading_element = new_p._element
                 continue
-        else:
-            new_p = doc.add_paragraph()
 
         new_p.add_run(line)
-        heading_element.addnext(new_p._element)
-        heading_element = new_p._element
 
 
-def _replace_header_date(doc: Document, formatted_date: str) -> None:
-    """Replace the date in the header while preserving formatting."""
-    for p in doc.paragraphs:
-        if "summarizing the testing activities and findings for" in p.text:
-            for run in p.runs:
-                if "<DATE>" in run.text:
-                    run.text = run.text.replace("<DATE>", formatted_date)
-                elif "summarizing the testing activities and findings for" in run.text:
-                    p.text = f"Here is the end-of-day report summarizing the testing activities and findings for {formatted_date}."
-                    break
+def _replace_header_date(paragraph: Paragraph, formatted_date: str) -> None:
+    """Replace the date in the header paragraph while preserving formatting."""
+    for run in paragraph.runs:
+        if "<DATE>" in run.text:
+            run.text = run.text.replace("<DATE>", formatted_date)
+        elif HEADER_MARKER in run.text:
+            paragraph.text = f"Here is the end-of-day report summarizing the testing activities and findings for {formatted_date}."
             break
 
 
@@ -228,16 +270,61 @@ def validate_template_structure(doc: Document) -> None:
     Raises:
         ValueError: If any sections are missing
     """
-    missing_sections = []
-    for section in SECTIONS:
-        if _find_paragraph_index(doc, section) < 0:
-            missing_sections.append(section)
+    CompiledTemplate(doc)
 
-    if missing_sections:
-        raise ValueError(
-            f"Template is missing required sections:\n" +
-            "\n".join(f"  - {s}" for s in missing_sections)
-        )
+
+def load_eod_template() -> CompiledTemplate:
+    """
+    Load the EOD template, validate its structure and record its sections.
+
+    Returns:
+        Compiled template
+
+    Raises:
+        FileNotFoundError: If the template cannot be loaded
+        ValueError: If any sections are missing
+    """
+    template_path = get_template_path(TEMPLATE_NAME)
+    doc = load_docx_safely(template_path)
+    if doc is None:
+        raise FileNotFoundError(f"Could not load template: {template_path}")
+
+    return CompiledTemplate(doc)
+
+
+def copy_document(template: Document) -> Document:
+    """
+    Deep-copy a parsed document so it can be filled without re-parsing.
+
+    Args:
+        template: Parsed document to copy (left unchanged)
+
+    Returns:
+        Independent Document backed by a copy of the template's XML parts
+    """
+    doc = copy.deepcopy(template)
+    # Document caches a proxy for the <w:body> element once paragraphs are
+    # read. deepcopy copies that cached element separately from the document
+    # tree, so drop it and let python-docx rebuild it from the copied tree.
+    doc._Document__body = None
+    return doc
+
+
+def validate_eod_data(data: Any) -> Dict[str, Any]:
+    """
+    Check that parsed YAML holds the fields required for a report.
+
+    Raises:
+        ValueError: If the data is not a mapping or misses required fields
+    """
+    if not isinstance(data, dict):
+        raise ValueError("EOD input must be a mapping of fields (date, product, status, ...)")
+
+    missing_fields = [f for f in REQUIRED_FIELDS if f not in data]
+    if missing_fields:
+        raise ValueError(f"Missing required fields: {', '.join(missing_fields)}")
+
+    return data
 
 
 def load_yaml_input(yaml_path: Path) -> Dict[str, Any]:
@@ -263,13 +350,27 @@ def load_yaml_input(yaml_path: Path) -> Dict[str, Any]:
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML format: {e}")
 
-    # Validate required fields
-    required_fields = ['date', 'product', 'status']
-    missing_fields = [f for f in required_fields if f not in data]
-    if missing_fields:
-        raise ValueError(f"Missing required fields: {', '.join(missing_fields)}")
+    return validate_eod_data(data)
 
-    return data
+
+def load_yaml_documents(yaml_path: Path) -> List[Any]:
+    """
+    Load every document of a YAML file (documents separated by '---').
+
+    Documents are returned unvalidated; empty documents are skipped.
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If YAML is invalid
+    """
+    if not yaml_path.exists():
+        raise FileNotFoundError(f"Input file not found: {yaml_path}")
+
+    try:
+        with open(yaml_path, 'r', encoding='utf-8') as f:
+            return [doc for doc in yaml.safe_load_all(f) if doc is not None]
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML format: {e}")
 
 
 def format_product_section(data: Dict[str, Any]) -> List[str]:
@@ -368,6 +469,116 @@ def format_next_steps_section(data: Dict[str, Any]) -> List[str]:
     return next_steps
 
 
+def populate_eod_document(
+    doc: Document,
+    data: Dict[str, Any],
+    formatted_date: str,
+    template: Optional[CompiledTemplate] = None
+) -> None:
+    """
+    Fill a template document with one report's data.
+
+    Args:
+        doc: Template document (modified in place)
+        data: Validated EOD input data
+        formatted_date: Report date as shown in the header
+        template: Compiled template that doc is (a copy of); compiled from
+            doc itself if not given
+    """
+    if template is None:
+        template = CompiledTemplate(doc)
+
+    body = doc._body
+    elements = list(doc.element.body)
+
+    # Update header date
+    if template.header_position is not None:
+        _replace_header_date(Paragraph(elements[template.header_position], body), formatted_date)
+
+    # Replace each section
+    section_content = [
+        (format_product_section(data), False),
+        (format_areas_section(data), True),
+        (format_bugs_section(data), False),
+        (format_bug_fixes_section(data), False),
+        (format_requirements_section(data), False),
+        (format_next_steps_section(data), True),
+        ([data['status']], False),
+    ]
+    for section, (lines, use_bullets) in zip(SECTIONS, section_content):
+        heading_position, content_positions = template.sections[section]
+        _replace_content_in_section(
+            body,
+            elements[heading_position],
+            [elements[position] for position in content_positions],
+            lines,
+            use_bullets=use_bullets
+        )
+
+
+def get_default_output_path(date_obj: datetime, tester_name: str) -> Path:
+    """Get the standard report path: EOD_YYYY-MM-DD_TesterName.docx."""
+    file_date = date_obj.strftime("%Y-%m-%d")
+    filename = f"EOD_{file_date}_{tester_name.replace(' ', '_')}.docx"
+    return get_report_output_path(filename)
+
+
+def resolve_report_identity(
+    data: Dict[str, Any],
+    default_tester: Optional[str] = None
+) -> Tuple[datetime, Optional[str]]:
+    """
+    Validate input data and work out the report date and tester.
+
+    Handles unquoted YAML dates (parsed as date objects) and a missing or
+    null tester.
+
+    Args:
+        data: EOD input data
+        default_tester: Tester name used when the input has none
+
+    Returns:
+        tuple: (report date, tester name or default_tester)
+
+    Raises:
+        ValueError: If the input data is invalid
+    """
+    validate_eod_data(data)
+    # Unquoted YAML dates arrive as date objects
+    date_obj = parse_date_flexible(str(data['date']))
+    tester_name = (data.get('tester') or {}).get('name') or default_tester
+    return date_obj, tester_name
+
+
+def render_eod_report(
+    template: CompiledTemplate,
+    data: Dict[str, Any],
+    default_tester: str
+) -> Tuple[str, bytes]:
+    """
+    Render one report in memory from an already loaded template.
+
+    Args:
+        template: Compiled template (left unchanged)
+        data: EOD input data (validated here)
+        default_tester: Tester name used when the input has none
+
+    Returns:
+        tuple: (standard report filename, .docx file content)
+
+    Raises:
+        ValueError: If the input data is invalid
+    """
+    date_obj, tester_name = resolve_report_identity(data, default_tester)
+
+    doc = template.new_document()
+    populate_eod_document(doc, data, date_obj.strftime("%B %d, %Y"), template)
+
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return get_default_output_path(date_obj, tester_name).name, buffer.getvalue()
+
+
 def generate_eod_report(
     yaml_path: Path,
     output_path: Optional[Path] = None,
@@ -388,50 +599,30 @@ def generate_eod_report(
     print_section_header("Loading EOD Input Data")
     data = load_yaml_input(yaml_path)
 
-    # Parse date
-    date_obj = parse_date_flexible(data['date'])
+    # Parse date and get tester name
+    date_obj, tester_name = resolve_report_identity(data)
+    tester_name = tester_name or get_user_fullname()
     formatted_date = date_obj.strftime("%B %d, %Y")
     print(f"Report Date: {formatted_date}")
-
-    # Get tester name
-    tester_name = data.get('tester', {}).get('name', get_user_fullname())
     print(f"Tester: {tester_name}")
 
     # Load template
     print_section_header("Loading Template")
-    template_path = get_template_path(TEMPLATE_NAME)
-    doc = load_docx_safely(template_path)
-    if doc is None:
-        raise FileNotFoundError(f"Could not load template: {template_path}")
-
-    print(f"Template: {template_path}")
+    template = load_eod_template()
+    doc = template.doc
 
-    # Validate template structure
-    validate_template_structure(doc)
+    print(f"Template: {get_template_path(TEMPLATE_NAME)}")
     print("Template validation: OK")
 
     # Generate content
     print_section_header("Generating Report Content")
-
-    # Update header date
-    _replace_header_date(doc, formatted_date)
-
-    # Replace each section
-    _replace_content_in_section(doc, SECTIONS[0], format_product_section(data), use_bullets=False)
-    _replace_content_in_section(doc, SECTIONS[1], format_areas_section(data), use_bullets=True)
-    _replace_content_in_section(doc, SECTIONS[2], format_bugs_section(data), use_bullets=False)
-    _replace_content_in_section(doc, SECTIONS[3], format_bug_fixes_section(data), use_bullets=False)
-    _replace_content_in_section(doc, SECTIONS[4], format_requirements_section(data), use_bullets=False)
-    _replace_content_in_section(doc, SECTIONS[5], format_next_steps_section(data), use_bullets=True)
-    _replace_content_in_section(doc, SECTIONS[6], [data['status']], use_bullets=False)
+    populate_eod_document(doc, data, formatted_date, template)
 
     print("All sections populated successfully")
 
     # Determine output path
     if output_path is None:
-        file_date = date_obj.strftime("%Y-%m-%d")
-        filename = f"EOD_{file_date}_{tester_name.replace(' ', '_')}.docx"
-        output_path = get_report_output_path(filename)
+        output_path = get_default_output_path(date_obj, tester_name)
 
     # Save or preview
     if dry_run:
@@ -454,6 +645,164 @@ def generate_eod_report(
             raise IOError("Failed to save report")
 
 
+def find_batch_input_files(source: str) -> List[Path]:
+    """
+    Resolve the YAML files for a batch run.
+
+    Args:
+        source: A directory (all *.yaml / *.yml files in it), a glob
+            pattern, or a single YAML file
+
+    Returns:
+        Sorted list of YAML files
+
+    Raises:
+        FileNotFoundError: If nothing matches
+    """
+    path = Path(source)
+    if path.is_dir():
+        files = list(path.glob("*.yaml")) + list(path.glob("*.yml"))
+    elif path.is_file():
+        files = [path]
+    else:
+        files = [Path(p) for p in glob.glob(source)]
+
+    if not files:
+        raise FileNotFoundError(f"No YAML input files found: {source}")
+    return sorted(files)
+
+
+def _init_batch_worker() -> None:
+    """Load the template once per process (inherited as-is when forked)."""
+    global _worker_template
+    if _worker_template is None:
+        _worker_template = load_eod_template()
+
+
+def _generate_batch_report(job: Tuple[str, Dict[str, Any], str, str, bool]) -> Tuple[str, Optional[str], Optional[str]]:
+    """
+    Render and save one batch report from the parsed template.
+
+    Rendering goes through render_eod_report(), like single reports and
+    the report server.
+
+    Returns:
+        tuple: (label, output path or None, error message or None)
+    """
+    label, data, tester_name, output_path, dry_run = job
+    try:
+        _, content = render_eod_report(_worker_template, data, tester_name)
+        if not dry_run:
+            atomic_write_bytes(Path(output_path), content)
+        return label, output_path, None
+    except Exception as e:
+        return label, None, str(e)
+
+
+def generate_eod_batch(
+    source: str,
+    output_dir: Optional[Path] = None,
+    dry_run: bool = False,
+    jobs: int = 1
+) -> Tuple[List[Path], List[Tuple[str, str]]]:
+    """
+    Generate EOD reports for many inputs, loading the template only once.
+
+    Every YAML document found in source becomes one report. Inputs that fail
+    validation are reported and skipped; the remaining reports are still
+    generated.
+
+    Args:
+        source: Directory, glob pattern or (multi-document) YAML file
+        output_dir: Directory for the reports (default: documentation/reports)
+        dry_run: If True, don't save any files
+        jobs: Number of worker processes. 1 generates reports in-process
+
+    Returns:
+        tuple: (paths of generated reports, list of (input label, error))
+    """
+    print_section_header("Loading EOD Batch Input")
+    files = find_batch_input_files(source)
+
+    failures = []
+    batch_jobs = []
+    output_labels = {}
+    default_tester = None
+
+    for yaml_file in files:
+        try:
+            documents = load_yaml_documents(yaml_file)
+        except ValueError as e:
+            failures.append((yaml_file.name, str(e)))
+            continue
+
+        for doc_num, data in enumerate(documents, 1):
+            label = yaml_file.name if len(documents) == 1 else f"{yaml_file.name}#{doc_num}"
+            try:
+                date_obj, tester_name = resolve_report_identity(data)
+                if not tester_name:
+                    # Look the git user up once for the whole batch
+                    if default_tester is None:
+                        default_tester = get_user_fullname()
+                    tester_name = default_tester
+            except (ValueError, AttributeError) as e:
+                failures.append((label, str(e)))
+                continue
+
+            output_path = get_default_output_path(date_obj, tester_name)
+            if output_dir is not None:
+                output_path = output_dir / output_path.name
+
+            if output_path in output_labels:
+                failures.append((label, f"Same output file as {output_labels[output_path]}: {output_path.name}"))
+                continue
+            output_labels[output_path] = label
+
+            batch_jobs.append((label, data, tester_name, str(output_path), dry_run))
+
+    print(f"Input files: {len(files)}")
+    print(f"Reports to generate: {len(batch_jobs)}")
+
+    generated = []
+    succeeded = 0
+    if batch_jobs:
+        print_section_header("Generating Reports")
+        # Parse and validate the template once up front; forked workers
+        # inherit the parsed copy
+        _init_batch_worker()
+
+        if jobs > 1 and len(batch_jobs) > 1:
+            print(f"Using {min(jobs, len(batch_jobs))} worker processes")
+            with ProcessPoolExecutor(
+                max_workers=min(jobs, len(batch_jobs)),
+                initializer=_init_batch_worker
+            ) as executor:
+                results = list(executor.map(_generate_batch_report, batch_jobs))
+        else:
+            results = [_generate_batch_report(job) for job in batch_jobs]
+
+        for label, output_path, error in results:
+            if error:
+                failures.append((label, error))
+                continue
+
+            succeeded += 1
+            if dry_run:
+                print(f"[DRY-RUN] {label} -> {output_path}")
+            else:
+                print(f"Generated: {label} -> {output_path}")
+                generated.append(Path(output_path))
+
+    print_section_header("Batch Summary")
+    print(f"Reports {'previewed' if dry_run else 'generated'}: {succeeded}")
+    if failures:
+        print(f"Failed inputs: {len(failures)}")
+        for label, error in failures:
+            print(f"  {label}: {error}", file=sys.stderr)
+
+    return generated, failures
+
+
 def archive_old_reports(days_to_keep: int = 30, dry_run: bool = False) -> int:
     """
     Archive old EOD reports to archive directory.
@@ -521,6 +870,11 @@ Examples:
 
   # Preview archival
   python generate_eod_report.py --archive --days 30 --dry-run
+
+  # Generate one report per YAML document in a directory, glob or file
+  python generate_eod_report.py --batch eod_inputs/2025-11/ --jobs 4
+  python generate_eod_report.py --batch "eod_inputs/*.yaml"
+  python generate_eod_report.py --batch month_end.yaml
         """
     )
 
@@ -528,7 +882,7 @@ Examples:
         'input_file',
         nargs='?',
         type=Path,
-        help='YAML input file with EOD data'
+        help='YAML input file with EOD data (directory or glob with --batch)'
     )
 
     parser.add_argument(
@@ -553,7 +907,20 @@ Examples:
     parser.add_argument(
         '--output',
         type=Path,
-        help='Custom output path for the report'
+        help='Custom output path for the report (output directory with --batch)'
+    )
+
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='Generate a report for every YAML document in a directory, glob or multi-document file'
+    )
+
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Worker processes for --batch (0 = all CPU cores, default: 1)'
     )
 
     args = parser.parse_args()
@@ -570,6 +937,20 @@ Examples:
             print("\nERROR: input_file is required (unless using --archive)", file=sys.stderr)
             return 1
 
+        if args.batch:
+            jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+            generated, failures = generate_eod_batch(
+                str(args.input_file),
+                output_dir=args.output,
+                dry_run=args.dry_run,
+                jobs=jobs
+            )
+
+            if generated:
+                print("\nNext step: Upload these files to your Google Drive EOD folder.")
+
+            return 1 if failures else 0
+
         # Generate report
         output_path = generate_eod_report(
             args.input_file,
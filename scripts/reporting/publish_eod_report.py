@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Generate an EOD report and upload it to Google Drive in one command.
+
+Replaces running generate_eod_report.py and then
+upload_to_gdrive.py --upload ... --delete-yesterday. The report is rendered
+into memory and uploaded from there (no .docx is written unless --save is
+given). Connecting to Drive runs while the report renders, and the
+previous day's report is looked up while the new one uploads; it is only
+deleted once the upload has succeeded. Per-stage timings are printed at
+the end.
+
+Usage:
+    # Render, upload, and delete the previous day's report
+    python publish_eod_report.py eod_inputs/my_eod.yaml
+
+    # Also keep a local copy in documentation/reports/
+    python publish_eod_report.py eod_inputs/my_eod.yaml --save
+
+    # Render only (no Drive access)
+    python publish_eod_report.py eod_inputs/my_eod.yaml --dry-run
+
+Author: QA Team
+"""
+
+import sys
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from common.atomic_io import atomic_write_bytes
+from common.docx_utils import get_report_output_path, print_section_header
+from reporting.generate_eod_report import (
+    CompiledTemplate,
+    get_user_fullname,
+    load_eod_template,
+    load_yaml_input,
+    render_eod_report
+)
+from reporting.upload_to_gdrive import (
+    EOD_FILENAME_PATTERN,
+    GDRIVE_FOLDER_NAME,
+    DriveSession,
+    FolderCache,
+    delete_file,
+    find_yesterday_eod,
+    format_bytes,
+    get_credentials,
+    upload_bytes
+)
+
+STAGE_LABELS = {
+    'render': "Render report",
+    'connect': "Connect to Drive",
+    'upload': "Upload",
+    'delete': "Delete previous report",
+    'save': "Save local copy",
+    'total': "Total",
+}
+
+
+class PublishResult(NamedTuple):
+    """Outcome of publishing one report."""
+    filename: str
+    size: int
+    file_id: Optional[str]
+    deleted_previous: bool
+    timings: Dict[str, float]
+
+
+def _timed(func: Callable, *args, **kwargs) -> Tuple[Any, float]:
+    """Call func and return (result, seconds taken)."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def connect_drive(folder_name: str = GDRIVE_FOLDER_NAME, refresh: bool = False
+                  ) -> Tuple[DriveSession, str, FolderCache]:
+    """
+    Authenticate and find the report folder.
+
+    Args:
+        folder_name: Google Drive folder name
+        refresh: Look the folder up again instead of using the saved ID
+
+    Returns:
+        tuple: (session, folder ID, folder listing cache)
+
+    Raises:
+        RuntimeError: If authentication or the folder lookup fails
+    """
+    creds = get_credentials()
+    if not creds:
+        raise RuntimeError("Google Drive authentication failed")
+
+    session = DriveSession(creds)
+    folder_id = session.get_folder_id(folder_name, refresh=refresh)
+    if not folder_id:
+        session.close()
+        raise RuntimeError(f"Could not access folder: {folder_name}")
+
+    cache = FolderCache(folder_id)
+    if refresh:
+        cache.invalidate()
+    return session, folder_id, cache
+
+
+def publish_eod_report(
+    data: Dict[str, Any],
+    connect: Optional[Callable[[], Tuple[DriveSession, str, FolderCache]]] = None,
+    template: Optional[CompiledTemplate] = None,
+    default_tester: Optional[str] = None,
+    delete_previous: bool = True,
+    save: bool = False,
+    save_dir: Optional[Path] = None,
+    dry_run: bool = False
+) -> PublishResult:
+    """
+    Render a report in memory and upload it to Drive.
+
+    Stages run concurrently where they are independent: connecting to
+    Drive overlaps rendering, and looking up the previous day's report (on
+    its own connection) overlaps the upload. The previous report is only
+    deleted after the upload succeeds, so a failed upload never loses it.
+
+    Args:
+        data: EOD input data
+        connect: Callable returning (session, folder ID, cache)
+            (default: connect_drive with the standard folder)
+        template: Compiled template (loaded from the default path if None)
+        default_tester: Tester name for inputs without one (git config if None)
+        delete_previous: Delete the report dated the day before this one
+        save: Also write the report to disk
+        save_dir: Directory for the local copy (default: documentation/reports/)
+        dry_run: Render only, without connecting to Drive
+
+    Returns:
+        PublishResult with the uploaded file ID and per-stage timings
+
+    Raises:
+        ValueError: If the input data is invalid
+        RuntimeError: If connecting to Drive fails
+        HttpError: If the upload fails
+    """
+    if connect is None:
+        connect = connect_drive
+
+    def render():
+        nonlocal template, default_tester
+        if template is None:
+            template = load_eod_template()
+        if default_tester is None:
+            default_tester = get_user_fullname()
+        return render_eod_report(template, data, default_tester)
+
+    timings: Dict[str, float] = {}
+    start = time.perf_counter()
+    file_id = None
+    deleted = False
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        connecting = None if dry_run else executor.submit(_timed, connect)
+        try:
+            (filename, content), timings['render'] = _timed(render)
+        except Exception:
+            # Close the session the background connect opened
+            if connecting is not None and connecting.exception() is None:
+                (session, _, _), _ = connecting.result()
+                session.close()
+            raise
+
+        saving = None
+        if save:
+            save_path = save_dir / filename if save_dir else get_report_output_path(filename)
+            saving = executor.submit(_timed, _write_report, save_path, content)
+
+        if connecting is not None:
+            (session, folder_id, cache), timings['connect'] = connecting.result()
+            looking_up = None
+            try:
+                if delete_previous:
+                    match = EOD_FILENAME_PATTERN.match(filename)
+                    report_date = datetime.strptime(match.group(1), "%Y-%m-%d").date()
+                    # httplib2 connections are not thread-safe: give the
+                    # lookup its own service
+                    looking_up = executor.submit(
+                        _timed, find_yesterday_eod, session.new_service(),
+                        folder_id, match.group(2), cache, report_date)
+
+                uploaded, timings['upload'] = _timed(
+                    upload_bytes, session.service, content, filename, folder_id, cache=cache)
+                file_id = uploaded.get('id')
+                print(f"Uploaded: {filename} (ID: {file_id})")
+                if uploaded.get('webViewLink'):
+                    print(f"  Link: {uploaded['webViewLink']}")
+
+                if looking_up is not None:
+                    previous, timings['delete'] = looking_up.result()
+                    if previous is not None:
+                        deleted, seconds = _timed(delete_file, session.service, *previous, cache)
+                        timings['delete'] += seconds
+            finally:
+                # Never close the session under a running lookup
+                if looking_up is not None:
+                    wait([looking_up])
+                session.close()
+
+        if saving is not None:
+            _, timings['save'] = saving.result()
+
+    timings['total'] = time.perf_counter() - start
+    return PublishResult(filename, len(content), file_id, deleted, timings)
+
+
+def _write_report(path: Path, content: bytes) -> None:
+    atomic_write_bytes(path, content)
+    print(f"Saved local copy: {path}")
+
+
+def print_timings(timings: Dict[str, float]) -> None:
+    """Print stage timings, marking the stages that ran in the background."""
+    overlapped = {'connect': "overlapped with rendering", 'delete': "lookup overlapped with upload",
+                  'save': "in background"}
+    for stage, label in STAGE_LABELS.items():
+        if stage not in timings:
+            continue
+        note = f"  ({overlapped[stage]})" if stage in overlapped else ""
+        print(f"  {label:<24} {timings[stage]:6.2f}s{note}")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Generate an EOD report and upload it to Google Drive",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Render, upload, and delete the previous day's report
+  python publish_eod_report.py eod_inputs/my_eod.yaml
+
+  # Keep yesterday's report and save a local copy
+  python publish_eod_report.py eod_inputs/my_eod.yaml --keep-previous --save
+        """
+    )
+    parser.add_argument(
+        'input_file',
+        type=Path,
+        help='YAML input file with EOD data'
+    )
+    parser.add_argument(
+        '--save',
+        action='store_true',
+        help='Also save the report to documentation/reports/'
+    )
+    parser.add_argument(
+        '--keep-previous',
+        action='store_true',
+        help='Do not delete the previous day\'s report from Drive'
+    )
+    parser.add_argument(
+        '--folder',
+        type=str,
+        default=GDRIVE_FOLDER_NAME,
+        help=f'Google Drive folder name (default: {GDRIVE_FOLDER_NAME})'
+    )
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Look up the Drive folder again instead of using the saved ID'
+    )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Render the report without connecting to Drive'
+    )
+    args = parser.parse_args()
+
+    try:
+        print_section_header("Publishing EOD Report")
+        data = load_yaml_input(args.input_file)
+
+        result = publish_eod_report(
+            data,
+            connect=lambda: connect_drive(args.folder, args.refresh),
+            delete_previous=not args.keep_previous,
+            save=args.save,
+            dry_run=args.dry_run
+        )
+
+        print(f"\nReport: {result.filename} ({format_bytes(result.size)})")
+        if args.dry_run:
+            print("[DRY RUN] Not uploaded")
+        print("\nStage timings:")
+        print_timings(result.timings)
+        return 0
+
+    except FileNotFoundError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+    except (ValueError, RuntimeError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"ERROR: Unexpected error: {e}", file=sys.stderr)
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
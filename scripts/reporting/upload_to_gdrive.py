@@ -21,15 +21,35 @@ Usage:
     # Upload and delete yesterday's EOD
     python upload_to_gdrive.py --upload EOD_2025-11-10_nico.docx --delete-yesterday
 
+    # Upload a month's archive concurrently (resumable, chunked)
+    python upload_to_gdrive.py --upload-many documentation/reports/2025-11 --jobs 4
+
+    # Keep only each tester's last 7 days of EOD reports (preview first)
+    python upload_to_gdrive.py --keep-days 7 --dry-run
+
+    # Upload only new or changed reports (unchanged files are skipped)
+    python upload_to_gdrive.py --sync documentation/reports
+
 Author: QA Team
 """
 
 import sys
 import argparse
+import glob
+import hashlib
+import io
+import json
+import mimetypes
 import pickle
+import random
+import re
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict
+from datetime import date, datetime, timedelta
+from typing import Callable, Optional, List, Dict, NamedTuple, Tuple
 import os.path
 
 # Add parent to path for imports
@@ -39,14 +59,18 @@ from common.docx_utils import (
     get_report_output_path,
     print_section_header
 )
+from common.atomic_io import atomic_write_text
+from common.path_utils import get_project_root
 
 try:
     from google.auth.transport.requests import Request
     from google.oauth2.credentials import Credentials
     from google_auth_oauthlib.flow import InstalledAppFlow
-    from googleapiclient.discovery import build
+    from google_auth_httplib2 import AuthorizedHttp
+    from googleapiclient.discovery import build_from_document
+    from googleapiclient.discovery_cache import get_static_doc
     from googleapiclient.errors import HttpError
-    from googleapiclient.http import MediaFileUpload
+    from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload, build_http
 except ImportError:
     print("ERROR: Google API libraries not installed.", file=sys.stderr)
     print("Please run: pip install google-auth google-auth-oauthlib google-auth-httplib2 google-api-python-client", file=sys.stderr)
@@ -61,6 +85,54 @@ CREDENTIALS_FILE = 'credentials.json'
 
 # Google Drive folder name for EOD reports
 GDRIVE_FOLDER_NAME = "EOD Reports - Hello Britannica"
+DEFAULT_TESTER = "nico"
+
+# Resumable upload chunks must be a multiple of 256 KiB
+CHUNK_SIZE_UNIT = 256 * 1024
+DEFAULT_CHUNK_SIZE = 20 * CHUNK_SIZE_UNIT  # 5 MiB
+DEFAULT_UPLOAD_JOBS = 4
+
+# Responses worth retrying with exponential backoff
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+MAX_UPLOAD_RETRIES = 6
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 32.0
+
+# Folder listings are served from the local cache for this many seconds
+LISTING_CACHE_TTL = 300
+LIST_PAGE_SIZE = 1000
+FILE_FIELDS = 'id, name, createdTime, modifiedTime, size, md5Checksum, webViewLink'
+
+# Drive accepts up to 100 calls per batch request
+DELETE_BATCH_SIZE = 100
+EOD_FILENAME_PATTERN = re.compile(r'^EOD_(\d{4}-\d{2}-\d{2})_(.+)\.docx$')
+
+
+class UploadResult(NamedTuple):
+    """Outcome of one file in a bulk upload."""
+    path: Path
+    file_id: Optional[str]
+    error: Optional[str] = None
+    retries: int = 0
+    resumed: bool = False
+    metadata: Optional[Dict] = None
+
+
+class SyncResult(NamedTuple):
+    """Outcome of syncing local files to a Drive folder."""
+    new: List[Path]
+    updated: List[Path]
+    unchanged: List[Path]
+    failed: List[UploadResult]
+    bytes_uploaded: int
+    bytes_saved: int
+
+
+class RetentionPlan(NamedTuple):
+    """EOD reports to keep and delete in a retention sweep."""
+    cutoffs: Dict[str, date]  # tester -> oldest report date kept
+    keep: List[Dict]
+    delete: List[Dict]
 
 
 def get_credentials() -> Optional[Credentials]:
@@ -112,16 +184,295 @@ def get_credentials() -> Optional[Credentials]:
                 return None
 
         # Save credentials for next run
-        try:
-            with open(TOKEN_FILE, 'wb') as token:
-                pickle.dump(creds, token)
-            print(f"Credentials saved to {TOKEN_FILE}")
-        except Exception as e:
-            print(f"Warning: Could not save credentials: {e}", file=sys.stderr)
+        save_credentials(creds)
 
     return creds
 
 
+def save_credentials(creds: Credentials) -> None:
+    """
+    Save credentials to the token file for the next run.
+
+    Args:
+        creds: Google credentials object
+    """
+    try:
+        with open(TOKEN_FILE, 'wb') as token:
+            pickle.dump(creds, token)
+        print(f"Credentials saved to {TOKEN_FILE}")
+    except Exception as e:
+        print(f"Warning: Could not save credentials: {e}", file=sys.stderr)
+
+
+def _discovery_document(root_url: Optional[str] = None) -> str:
+    """
+    Get the Drive v3 discovery document bundled with the client library.
+
+    Args:
+        root_url: Rebase every URL (API, upload and batch) onto this server
+
+    Returns:
+        Discovery document as JSON text
+    """
+    document = get_static_doc('drive', 'v3')
+    if root_url is None:
+        return document
+    parsed = json.loads(document)
+    parsed['rootUrl'] = root_url
+    parsed['baseUrl'] = root_url + parsed['servicePath']
+    return json.dumps(parsed)
+
+
+def build_drive_service(credentials=None, root_url: Optional[str] = None, document: Optional[str] = None):
+    """
+    Build a Drive v3 service with its own HTTP connection.
+
+    Args:
+        credentials: Google credentials (None for an unauthenticated server)
+        root_url: Send requests to this server instead of Google's
+            (e.g. 'http://127.0.0.1:8080/' for a local fake Drive)
+        document: Discovery document JSON already loaded for root_url
+
+    Returns:
+        Google Drive API service instance
+    """
+    if document is None:
+        document = _discovery_document(root_url)
+    http = build_http()
+    if credentials is not None:
+        http = AuthorizedHttp(credentials, http=http)
+    # The client library modifies the parsed document, so parse per service
+    return build_from_document(json.loads(document), http=http)
+
+
+def get_session_path() -> Path:
+    """
+    Get the file holding Drive session state between runs.
+
+    Returns:
+        Path: data/cache/drive_session.json under the project root
+    """
+    return get_project_root() / "data" / "cache" / "drive_session.json"
+
+
+class DriveSession:
+    """
+    Drive connection state reused within a run and between runs.
+
+    The main service keeps one authorized HTTP connection alive for every
+    request of the run, worker services are built from a discovery document
+    loaded once, folder IDs are remembered on disk so later runs skip the
+    folder lookup, and access tokens refreshed during the run are saved to
+    the token file.
+
+    Example:
+        >>> with DriveSession(get_credentials()) as session:
+        ...     folder_id = session.get_folder_id(GDRIVE_FOLDER_NAME)
+        ...     list_files(session.service, folder_id)
+    """
+
+    def __init__(self, credentials=None, root_url: Optional[str] = None, session_path: Optional[Path] = None):
+        """
+        Args:
+            credentials: Google credentials (None for an unauthenticated server)
+            root_url: Send requests to this server instead of Google's
+            session_path: Session state file (default: data/cache/drive_session.json)
+        """
+        self.credentials = credentials
+        self.root_url = root_url
+        self.session_path = session_path or get_session_path()
+        self._initial_token = getattr(credentials, 'token', None)
+        self._document: Optional[str] = None
+        self._service = None
+        self._services: List = []
+        self._lock = threading.Lock()
+        self._folders: Dict[str, str] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.session_path.exists():
+            return
+        try:
+            with open(self.session_path, 'r', encoding='utf-8') as f:
+                self._folders = json.load(f).get('folders', {})
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"Warning: Ignoring unreadable session file {self.session_path}: {e}", file=sys.stderr)
+
+    def _save(self) -> None:
+        _write_json_file(self.session_path, {'folders': self._folders})
+
+    def new_service(self):
+        """Build another service with its own connection (one per thread)."""
+        with self._lock:
+            if self._document is None:
+                self._document = _discovery_document(self.root_url)
+            service = build_drive_service(self.credentials, self.root_url, self._document)
+            self._services.append(service)
+        return service
+
+    @property
+    def service(self):
+        """Service shared by all single-threaded calls of the run."""
+        if self._service is None:
+            self._service = self.new_service()
+        return self._service
+
+    def get_folder_id(self, folder_name: str, refresh: bool = False) -> Optional[str]:
+        """
+        Get a folder's ID, from the session file if it was looked up before.
+
+        Args:
+            folder_name: Name of the folder
+            refresh: Look the folder up again instead of using the saved ID
+
+        Returns:
+            Folder ID or None if the lookup fails
+        """
+        if not refresh and folder_name in self._folders:
+            print(f"Using saved folder: {folder_name} (ID: {self._folders[folder_name]})")
+            return self._folders[folder_name]
+
+        folder_id = get_or_create_folder(self.service, folder_name)
+        if folder_id:
+            self._folders[folder_name] = folder_id
+            self._save()
+        return folder_id
+
+    def forget_folder(self, folder_name: str) -> None:
+        """Drop a saved folder ID (e.g. after the folder was deleted)."""
+        if self._folders.pop(folder_name, None) is not None:
+            self._save()
+
+    def close(self) -> None:
+        """Save a token refreshed during the run and close connections."""
+        if self.credentials is not None and self.credentials.token != self._initial_token:
+            save_credentials(self.credentials)
+            self._initial_token = self.credentials.token
+        for service in self._services:
+            service._http.close()
+        self._services = []
+        self._service = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def get_listing_cache_dir() -> Path:
+    """
+    Get the directory holding cached Drive folder listings.
+
+    Returns:
+        Path: data/cache/drive_listings/ under the project root
+    """
+    return get_project_root() / "data" / "cache" / "drive_listings"
+
+
+class FolderCache:
+    """
+    Local copy of a Drive folder's file metadata, persisted between runs.
+
+    A full folder listing is reused for ttl seconds. Uploads and deletes
+    made through this script update the cached entries in place; changes
+    made elsewhere (web UI, other machines) show up once the TTL expires.
+
+    Example:
+        >>> cache = FolderCache(folder_id)
+        >>> files = list_files(service, folder_id, cache)   # Lists once
+        >>> find_file_by_name(service, folder_id, 'EOD_2025-11-10_nico.docx', cache)
+    """
+
+    def __init__(self, folder_id: str, cache_path: Optional[Path] = None, ttl: float = LISTING_CACHE_TTL):
+        """
+        Args:
+            folder_id: Drive folder the listing belongs to
+            cache_path: Cache file (default: data/cache/drive_listings/<folder_id>.json)
+            ttl: Seconds a listing stays valid
+        """
+        self.folder_id = folder_id
+        self.cache_path = cache_path or get_listing_cache_dir() / f"{folder_id}.json"
+        self.ttl = ttl
+        self.fetched_at: Optional[float] = None
+        self.files: Dict[str, Dict] = {}
+        # Uploads and deletes may update the cache from different threads
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if not self.cache_path.exists():
+            return
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable listing cache {self.cache_path}: {e}", file=sys.stderr)
+            return
+        if data.get('folder_id') == self.folder_id:
+            self.fetched_at = data.get('fetched_at')
+            self.files = data.get('files', {})
+
+    def _save(self) -> None:
+        _write_json_file(self.cache_path, {
+            'folder_id': self.folder_id,
+            'fetched_at': self.fetched_at,
+            'files': self.files,
+        })
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the cached listing is complete and within its TTL."""
+        return self.fetched_at is not None and time.time() - self.fetched_at < self.ttl
+
+    def listing(self) -> List[Dict]:
+        """Cached files, newest first (as listed by Drive)."""
+        with self._lock:
+            files = list(self.files.values())
+        return sorted(files, key=lambda f: f.get('createdTime', ''), reverse=True)
+
+    def find(self, file_name: str) -> Optional[Dict]:
+        """Newest cached file with this name, or None."""
+        for file in self.listing():
+            if file['name'] == file_name:
+                return file
+        return None
+
+    def store(self, files: List[Dict]) -> None:
+        """Replace the cache with a complete folder listing."""
+        with self._lock:
+            self.files = {file['id']: file for file in files}
+            self.fetched_at = time.time()
+            self._save()
+
+    def record(self, file: Dict) -> None:
+        """Add or update a file after uploading it."""
+        with self._lock:
+            if self.is_fresh:
+                self.files[file['id']] = file
+                self._save()
+
+    def discard(self, file_id: str) -> None:
+        """Forget a file after deleting it."""
+        with self._lock:
+            if self.files.pop(file_id, None) is not None:
+                self._save()
+
+    def invalidate(self) -> None:
+        """Drop the cached listing so the next lookup goes to Drive."""
+        with self._lock:
+            self.fetched_at = None
+            self.files = {}
+            if self.cache_path.exists():
+                self.cache_path.unlink()
+
+
+def _quote_query_value(value: str) -> str:
+    """Quote a string for use in a Drive search query."""
+    escaped = value.replace('\\', '\\\\').replace("'", "\\'")
+    return f"'{escaped}'"
+
+
 def get_or_create_folder(service, folder_name: str) -> Optional[str]:
     """
     Get or create a folder in Google Drive.
@@ -169,7 +520,7 @@ def get_or_create_folder(service, folder_name: str) -> Optional[str]:
         return None
 
 
-def upload_file(service, file_path: Path, folder_id: str) -> Optional[str]:
+def upload_file(service, file_path: Path, folder_id: str, cache: Optional[FolderCache] = None) -> Optional[str]:
     """
     Upload a file to Google Drive.
 
@@ -177,6 +528,7 @@ def upload_file(service, file_path: Path, folder_id: str) -> Optional[str]:
         service: Google Drive API service instance
         file_path: Path to file to upload
         folder_id: ID of the folder to upload to
+        cache: Folder listing cache to update with the new file
 
     Returns:
         File ID of uploaded file or None if upload fails
@@ -198,9 +550,12 @@ def upload_file(service, file_path: Path, folder_id: str) -> Optional[str]:
         file = service.files().create(
             body=file_metadata,
             media_body=media,
-            fields='id, name, webViewLink'
+            fields=FILE_FIELDS
         ).execute()
 
+        if cache is not None:
+            cache.record(file)
+
         file_id = file.get('id')
         web_link = file.get('webViewLink')
 
@@ -219,35 +574,503 @@ def upload_file(service, file_path: Path, folder_id: str) -> Optional[str]:
         return None
 
 
-def list_files(service, folder_id: str) -> List[Dict]:
+def get_upload_state_dir() -> Path:
+    """
+    Get the directory holding resume state for interrupted uploads.
+
+    Returns:
+        Path: data/cache/drive_uploads/ under the project root
+    """
+    return get_project_root() / "data" / "cache" / "drive_uploads"
+
+
+def _upload_state_path(state_dir: Path, file_path: Path, folder_id: str, file_id: Optional[str]) -> Path:
+    """Get the resume state file for uploading a file into a folder (or over a file)."""
+    target = f"{file_path.resolve()}|{folder_id}|{file_id or ''}"
+    key = hashlib.sha256(target.encode('utf-8')).hexdigest()[:16]
+    return state_dir / f"{file_path.name}-{key}.json"
+
+
+def _read_upload_state(state_path: Path, fingerprint: Dict) -> Optional[Dict]:
+    """Read resume state, ignoring it if the file changed since it was written."""
+    if not state_path.exists():
+        return None
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Ignoring unreadable upload state {state_path}: {e}", file=sys.stderr)
+        return None
+    if state.get('fingerprint') != fingerprint or not state.get('resumable_uri'):
+        return None
+    return state
+
+
+def _write_json_file(file_path: Path, data: Dict) -> None:
+    """Write a local state file, warning (not failing) on errors."""
+    try:
+        atomic_write_text(file_path, json.dumps(data))
+    except OSError as e:
+        print(f"Warning: Could not write {file_path}: {e}", file=sys.stderr)
+
+
+def backoff_delay(attempt: int) -> float:
+    """
+    Get the delay before a retry, doubling per attempt with random jitter.
+
+    Args:
+        attempt: Retry number (1 for the first retry)
+
+    Returns:
+        Delay in seconds
+    """
+    delay = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** (attempt - 1))
+    return delay * (0.5 + random.random() / 2)
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """Check whether a failed request should be retried."""
+    if isinstance(error, HttpError):
+        return error.resp.status in RETRYABLE_STATUSES
+    return isinstance(error, (ConnectionError, socket.timeout))
+
+
+def _error_status(error: Exception) -> Optional[int]:
+    return error.resp.status if isinstance(error, HttpError) else None
+
+
+def upload_file_resumable(
+    service,
+    file_path: Path,
+    folder_id: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    state_dir: Optional[Path] = None,
+    max_retries: int = MAX_UPLOAD_RETRIES,
+    sleep: Callable[[float], None] = time.sleep,
+    file_id: Optional[str] = None
+) -> UploadResult:
+    """
+    Upload a file in chunks, resuming an earlier interrupted upload if possible.
+
+    The upload session URL and progress are saved to state_dir after every
+    chunk, so a failed or killed upload continues from the last confirmed
+    byte on the next run. 429 and 5xx responses (and dropped connections)
+    are retried with exponential backoff.
+
+    Args:
+        service: Google Drive API service instance
+        file_path: Path to file to upload
+        folder_id: ID of the folder to upload to
+        chunk_size: Bytes per request (multiple of 256 KiB)
+        state_dir: Resume state directory (default: data/cache/drive_uploads/)
+        max_retries: Retries per file before giving up
+        sleep: Function used to wait between retries
+        file_id: Replace the content of this existing Drive file instead of
+            creating a new one
+
+    Returns:
+        UploadResult with the file ID, or the error if the upload failed
+    """
+    if state_dir is None:
+        state_dir = get_upload_state_dir()
+
+    stat = file_path.stat()
+    fingerprint = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    state_path = _upload_state_path(state_dir, file_path, folder_id, file_id)
+    state = _read_upload_state(state_path, fingerprint)
+
+    def new_request():
+        media = MediaFileUpload(
+            str(file_path),
+            mimetype=mimetypes.guess_type(file_path.name)[0] or 'application/octet-stream',
+            chunksize=chunk_size,
+            resumable=True
+        )
+        if file_id is not None:
+            return service.files().update(
+                fileId=file_id,
+                media_body=media,
+                fields=FILE_FIELDS
+            )
+        return service.files().create(
+            body={'name': file_path.name, 'parents': [folder_id]},
+            media_body=media,
+            fields=FILE_FIELDS
+        )
+
+    def save_state():
+        _write_json_file(state_path, {
+            'fingerprint': fingerprint,
+            'resumable_uri': request.resumable_uri,
+            'progress': request.resumable_progress,
+        })
+
+    request = new_request()
+    resumed = state is not None
+    if resumed:
+        request.resumable_uri = state['resumable_uri']
+        request.resumable_progress = state['progress']
+        # Ask the server how much it has received before sending more
+        request._in_error_state = True
+
+    retries = 0
+    response = None
+    while response is None:
+        try:
+            _, response = request.next_chunk()
+        except Exception as e:
+            if resumed and request.resumable_uri == state['resumable_uri'] \
+                    and _error_status(e) in (404, 410):
+                # The saved upload session has expired; start a new one
+                request = new_request()
+                continue
+            if request.resumable_uri:
+                save_state()
+            if not is_retryable_error(e) or retries >= max_retries:
+                return UploadResult(file_path, None, str(e), retries, resumed)
+            retries += 1
+            sleep(backoff_delay(retries))
+            continue
+
+        if response is None:
+            save_state()
+
+    if state_path.exists():
+        state_path.unlink()
+    return UploadResult(file_path, response.get('id'), None, retries, resumed, response)
+
+
+def upload_bytes(
+    service,
+    content: bytes,
+    file_name: str,
+    folder_id: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_retries: int = MAX_UPLOAD_RETRIES,
+    sleep: Callable[[float], None] = time.sleep,
+    cache: Optional[FolderCache] = None
+) -> Dict:
+    """
+    Upload in-memory content as a new file, without writing it to disk.
+
+    429 and 5xx responses (and dropped connections) are retried with
+    exponential backoff.
+
+    Args:
+        service: Google Drive API service instance
+        content: File content
+        file_name: Name of the file in Drive
+        folder_id: ID of the folder to upload to
+        chunk_size: Bytes per request (multiple of 256 KiB)
+        max_retries: Retries before giving up
+        sleep: Function used to wait between retries
+        cache: Folder listing cache to update with the new file
+
+    Returns:
+        Metadata of the uploaded file
+
+    Raises:
+        HttpError: If the upload fails
+    """
+    media = MediaIoBaseUpload(
+        io.BytesIO(content),
+        mimetype=mimetypes.guess_type(file_name)[0] or 'application/octet-stream',
+        chunksize=chunk_size,
+        resumable=True
+    )
+    request = service.files().create(
+        body={'name': file_name, 'parents': [folder_id]},
+        media_body=media,
+        fields=FILE_FIELDS
+    )
+
+    retries = 0
+    response = None
+    while response is None:
+        try:
+            _, response = request.next_chunk()
+        except Exception as e:
+            if not is_retryable_error(e) or retries >= max_retries:
+                raise
+            retries += 1
+            sleep(backoff_delay(retries))
+
+    if cache is not None:
+        cache.record(response)
+    return response
+
+
+def collect_upload_paths(sources: List[str]) -> List[Path]:
+    """
+    Expand files, directories (recursively) and glob patterns into files.
+
+    Args:
+        sources: File paths, directory paths or glob patterns
+
+    Returns:
+        Sorted unique list of files (hidden files are skipped)
+    """
+    paths = []
+    for source in sources:
+        source_path = Path(source)
+        if source_path.is_dir():
+            candidates = source_path.rglob('*')
+        elif source_path.exists():
+            candidates = [source_path]
+        else:
+            candidates = (Path(p) for p in glob.glob(source, recursive=True))
+        paths.extend(
+            p for p in candidates
+            if p.is_file() and not p.name.startswith('.')
+        )
+    return sorted(set(paths))
+
+
+def bulk_upload(
+    file_paths: List[Path],
+    folder_id: str,
+    service_factory: Callable,
+    jobs: int = DEFAULT_UPLOAD_JOBS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    state_dir: Optional[Path] = None,
+    max_retries: int = MAX_UPLOAD_RETRIES,
+    sleep: Callable[[float], None] = time.sleep,
+    cache: Optional[FolderCache] = None,
+    update_ids: Optional[Dict[Path, str]] = None
+) -> List[UploadResult]:
+    """
+    Upload many files concurrently with a bounded pool of worker threads.
+
+    HTTP connections are not thread-safe, so each worker builds its own
+    service with service_factory and reuses it for all of its files.
+
+    Args:
+        file_paths: Files to upload
+        folder_id: ID of the folder to upload to
+        service_factory: Callable returning a new Drive service
+        jobs: Maximum number of concurrent uploads
+        chunk_size: Bytes per request (multiple of 256 KiB)
+        state_dir: Resume state directory (default: data/cache/drive_uploads/)
+        max_retries: Retries per file before giving up
+        sleep: Function used to wait between retries
+        cache: Folder listing cache to update with the new files
+        update_ids: Existing Drive file ID per path, for files whose content
+            should be replaced in place
+
+    Returns:
+        UploadResult per file, in the order of file_paths
+    """
+    if chunk_size <= 0 or chunk_size % CHUNK_SIZE_UNIT:
+        raise ValueError(f"Chunk size must be a positive multiple of {CHUNK_SIZE_UNIT} bytes")
+
+    local = threading.local()
+
+    def upload(file_path: Path) -> UploadResult:
+        if not hasattr(local, 'service'):
+            local.service = service_factory()
+        try:
+            return upload_file_resumable(
+                local.service, file_path, folder_id, chunk_size,
+                state_dir, max_retries, sleep, (update_ids or {}).get(file_path)
+            )
+        except Exception as e:
+            return UploadResult(file_path, None, str(e))
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(file_paths)))) as executor:
+        futures = {executor.submit(upload, path): path for path in file_paths}
+        for future in as_completed(futures):
+            result = future.result()
+            results[futures[future]] = result
+            notes = []
+            if result.resumed:
+                notes.append("resumed")
+            if result.retries:
+                notes.append(f"{result.retries} retries")
+            suffix = f" ({', '.join(notes)})" if notes else ""
+            if result.error:
+                print(f"  FAILED: {result.path.name}: {result.error}{suffix}", file=sys.stderr)
+            else:
+                print(f"  Uploaded: {result.path.name} (ID: {result.file_id}){suffix}")
+                if cache is not None:
+                    cache.record(result.metadata)
+
+    return [results[path] for path in file_paths]
+
+
+def compute_md5(file_path: Path) -> str:
+    """
+    Compute the MD5 hash of a file, as reported by Drive in md5Checksum.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Hex digest of the file content
+    """
+    digest = hashlib.md5()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE_UNIT * 4), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def format_bytes(size: int) -> str:
+    """Format a byte count for display (e.g. '1.5 MB')."""
+    value = float(size)
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if value < 1024 or unit == 'GB':
+            return f"{int(value)} {unit}" if unit == 'B' else f"{value:.1f} {unit}"
+        value /= 1024
+
+
+def sync_files(
+    service,
+    file_paths: List[Path],
+    folder_id: str,
+    service_factory: Optional[Callable] = None,
+    cache: Optional[FolderCache] = None,
+    dry_run: bool = False,
+    jobs: int = DEFAULT_UPLOAD_JOBS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    state_dir: Optional[Path] = None,
+    sleep: Callable[[float], None] = time.sleep
+) -> SyncResult:
+    """
+    Upload only the files whose content is not already in the folder.
+
+    Each local file is compared by size and MD5 with the remote file of the
+    same name from the folder listing (cached if fresh). Identical files
+    are skipped, changed files are updated in place (keeping their Drive
+    ID and link) and new files are uploaded.
+
+    Args:
+        service: Google Drive API service instance
+        file_paths: Local files to sync
+        folder_id: ID of the folder to sync into
+        service_factory: Callable returning a new Drive service for the
+            upload workers (default: reuse service with a single worker)
+        cache: Folder listing cache
+        dry_run: Report what would be transferred without uploading
+        jobs: Maximum number of concurrent uploads
+        chunk_size: Bytes per upload request (multiple of 256 KiB)
+        state_dir: Resume state directory (default: data/cache/drive_uploads/)
+        sleep: Function used to wait between retries
+
+    Returns:
+        SyncResult with the files in each category and the bytes saved
+
+    Raises:
+        HttpError: If the folder could not be listed; nothing is uploaded
+    """
+    remote = {}
+    for file in list_files(service, folder_id, cache):
+        # Listings are newest first; the newest file wins a shared name
+        remote.setdefault(file['name'], file)
+
+    new, updated, unchanged = [], [], []
+    update_ids = {}
+    sizes = {}
+    for path in file_paths:
+        sizes[path] = path.stat().st_size
+        existing = remote.get(path.name)
+        if existing is None:
+            new.append(path)
+        elif (existing.get('size') == str(sizes[path])
+              and existing.get('md5Checksum') == compute_md5(path)):
+            unchanged.append(path)
+        else:
+            updated.append(path)
+            update_ids[path] = existing['id']
+
+    bytes_saved = sum(sizes[path] for path in unchanged)
+    for label, paths in (("New", new), ("Changed", updated), ("Unchanged", unchanged)):
+        if paths:
+            print(f"{label}: {len(paths)} file(s)")
+
+    failed = []
+    to_send = [path for path in file_paths if path in update_ids or path in new]
+    if dry_run:
+        if to_send:
+            print(f"\n[DRY RUN] Would upload {len(to_send)} file(s):")
+            for path in to_send:
+                action = "update" if path in update_ids else "new"
+                print(f"  • {path.name} ({action}, {format_bytes(sizes[path])})")
+    elif to_send:
+        if service_factory is None:
+            service_factory, jobs = (lambda: service), 1
+        results = bulk_upload(
+            to_send, folder_id, service_factory, jobs, chunk_size, state_dir,
+            sleep=sleep, cache=cache, update_ids=update_ids
+        )
+        failed = [result for result in results if result.error]
+
+    failed_paths = {result.path for result in failed}
+    bytes_uploaded = 0 if dry_run else sum(
+        sizes[path] for path in to_send if path not in failed_paths)
+    return SyncResult(
+        [p for p in new if p not in failed_paths],
+        [p for p in updated if p not in failed_paths],
+        unchanged,
+        failed,
+        bytes_uploaded,
+        bytes_saved
+    )
+
+
+def list_files(
+    service,
+    folder_id: str,
+    cache: Optional[FolderCache] = None,
+    page_size: int = LIST_PAGE_SIZE
+) -> List[Dict]:
     """
     List files in a Google Drive folder.
 
+    Follows nextPageToken until the whole folder is listed. With a cache,
+    a fresh cached listing is returned without contacting Drive, and a new
+    listing is stored in the cache.
+
     Args:
         service: Google Drive API service instance
         folder_id: ID of the folder
+        cache: Folder listing cache
+        page_size: Files requested per page (Drive allows up to 1000)
 
     Returns:
-        List of file dictionaries with id, name, createdTime
+        List of file dictionaries with id, name, createdTime, newest first
+
+    Raises:
+        HttpError: If the folder could not be listed. An empty list always
+            means an empty folder, never a failed listing.
     """
-    try:
-        query = f"'{folder_id}' in parents and trashed=false"
+    if cache is not None and cache.is_fresh:
+        return cache.listing()
+
+    query = f"{_quote_query_value(folder_id)} in parents and trashed=false"
+    files = []
+    page_token = None
+    while True:
         results = service.files().list(
             q=query,
             spaces='drive',
-            fields='files(id, name, createdTime, modifiedTime, webViewLink)',
-            orderBy='createdTime desc'
+            fields=f'nextPageToken, files({FILE_FIELDS})',
+            orderBy='createdTime desc',
+            pageSize=page_size,
+            pageToken=page_token
         ).execute()
 
-        files = results.get('files', [])
-        return files
+        files.extend(results.get('files', []))
+        page_token = results.get('nextPageToken')
+        if not page_token:
+            break
 
-    except HttpError as e:
-        print(f"ERROR: Could not list files: {e}", file=sys.stderr)
-        return []
+    if cache is not None:
+        cache.store(files)
+    return files
 
 
-def delete_file(service, file_id: str, file_name: str) -> bool:
+def delete_file(service, file_id: str, file_name: str, cache: Optional[FolderCache] = None) -> bool:
     """
     Delete a file from Google Drive.
 
@@ -255,6 +1078,7 @@ def delete_file(service, file_id: str, file_name: str) -> bool:
         service: Google Drive API service instance
         file_id: ID of file to delete
         file_name: Name of file (for logging)
+        cache: Folder listing cache to remove the file from
 
     Returns:
         True if successful, False otherwise
@@ -262,6 +1086,8 @@ def delete_file(service, file_id: str, file_name: str) -> bool:
     try:
         service.files().delete(fileId=file_id).execute()
         print(f"Deleted: {file_name}")
+        if cache is not None:
+            cache.discard(file_id)
         return True
 
     except HttpError as e:
@@ -269,54 +1095,299 @@ def delete_file(service, file_id: str, file_name: str) -> bool:
         return False
 
 
-def find_file_by_name(service, folder_id: str, file_name: str) -> Optional[str]:
+def find_file_by_name(
+    service,
+    folder_id: str,
+    file_name: str,
+    cache: Optional[FolderCache] = None
+) -> Optional[str]:
     """
     Find a file by name in a folder.
 
+    Served from a fresh cached listing when available; otherwise a single
+    query for the name is sent instead of listing the whole folder.
+
     Args:
         service: Google Drive API service instance
         folder_id: Folder ID to search in
         file_name: Name of file to find
+        cache: Folder listing cache
 
     Returns:
-        File ID if found, None otherwise
+        File ID if found (the newest if several share the name), None otherwise
     """
-    files = list_files(service, folder_id)
-    for file in files:
-        if file['name'] == file_name:
-            return file['id']
-    return None
+    if cache is not None and cache.is_fresh:
+        file = cache.find(file_name)
+        return file['id'] if file else None
+
+    try:
+        query = (f"name={_quote_query_value(file_name)} and "
+                 f"{_quote_query_value(folder_id)} in parents and trashed=false")
+        results = service.files().list(
+            q=query,
+            spaces='drive',
+            fields='files(id, name)',
+            orderBy='createdTime desc',
+            pageSize=1
+        ).execute()
+    except HttpError as e:
+        print(f"ERROR: Could not search for '{file_name}': {e}", file=sys.stderr)
+        return None
+
+    files = results.get('files', [])
+    return files[0]['id'] if files else None
 
 
-def delete_yesterday_eod(service, folder_id: str, tester_name: str) -> bool:
+def find_yesterday_eod(
+    service,
+    folder_id: str,
+    tester_name: str,
+    cache: Optional[FolderCache] = None,
+    today: Optional[date] = None
+) -> Optional[Tuple[str, str]]:
     """
-    Delete yesterday's EOD file from Google Drive.
+    Find yesterday's EOD file in Google Drive.
 
     Args:
         service: Google Drive API service instance
         folder_id: Folder ID containing EOD files
         tester_name: Name of the tester
+        cache: Folder listing cache
+        today: Date whose previous day's report is looked up (default: today)
 
     Returns:
-        True if file was found and deleted, False otherwise
+        Tuple of (file ID, file name) if found, None otherwise
     """
-    yesterday = datetime.now() - timedelta(days=1)
+    yesterday = (today or date.today()) - timedelta(days=1)
     yesterday_date = yesterday.strftime("%Y-%m-%d")
 
     # Try multiple possible filenames
-    possible_names = [
+    possible_names = dict.fromkeys([
         f"EOD_{yesterday_date}_{tester_name}.docx",
         f"EOD_{yesterday_date}_{tester_name.replace(' ', '_')}.docx",
-    ]
+    ])
 
     for file_name in possible_names:
-        file_id = find_file_by_name(service, folder_id, file_name)
+        file_id = find_file_by_name(service, folder_id, file_name, cache)
         if file_id:
             print(f"Found yesterday's EOD: {file_name}")
-            return delete_file(service, file_id, file_name)
+            return file_id, file_name
 
     print(f"No EOD file found for yesterday ({yesterday_date})")
-    return False
+    return None
+
+
+def delete_yesterday_eod(
+    service,
+    folder_id: str,
+    tester_name: str,
+    cache: Optional[FolderCache] = None,
+    today: Optional[date] = None
+) -> bool:
+    """
+    Delete yesterday's EOD file from Google Drive.
+
+    Args:
+        service: Google Drive API service instance
+        folder_id: Folder ID containing EOD files
+        tester_name: Name of the tester
+        cache: Folder listing cache
+        today: Date whose previous day's report is deleted (default: today)
+
+    Returns:
+        True if file was found and deleted, False otherwise
+    """
+    found = find_yesterday_eod(service, folder_id, tester_name, cache, today)
+    if found is None:
+        return False
+    file_id, file_name = found
+    return delete_file(service, file_id, file_name, cache)
+
+
+def _eod_tester(file_name: str) -> Optional[str]:
+    """Tester of an EOD report name, spaces written as underscores."""
+    match = EOD_FILENAME_PATTERN.match(file_name)
+    return match.group(2).replace(' ', '_') if match else None
+
+
+def plan_retention(
+    files: List[Dict],
+    keep_days: int,
+    tester_name: Optional[str] = None
+) -> RetentionPlan:
+    """
+    Split EOD reports into those to keep and those to delete.
+
+    Each tester keeps the reports of their keep_days most recent report
+    dates, so a tester who has not reported for a while still keeps their
+    last reports. Only files named like EOD_YYYY-MM-DD_Tester.docx are
+    considered; other files in the folder are never deleted.
+
+    Args:
+        files: Folder listing (dictionaries with id and name)
+        keep_days: Report dates to keep per tester
+        tester_name: Only sweep this tester's reports (all testers if None)
+
+    Returns:
+        RetentionPlan with each tester's older reports in delete
+    """
+    if keep_days < 1:
+        raise ValueError("keep_days must be at least 1")
+
+    only = tester_name.replace(' ', '_') if tester_name is not None else None
+    reports: Dict[str, List[Tuple[date, Dict]]] = {}
+    for file in files:
+        match = EOD_FILENAME_PATTERN.match(file['name'])
+        tester = _eod_tester(file['name'])
+        if not match or (only is not None and tester != only):
+            continue
+        try:
+            report_date = datetime.strptime(match.group(1), "%Y-%m-%d").date()
+        except ValueError:
+            continue
+        reports.setdefault(tester, []).append((report_date, file))
+
+    cutoffs = {}
+    keep, delete = [], []
+    for tester, dated in reports.items():
+        dates = sorted({report_date for report_date, _ in dated}, reverse=True)
+        cutoffs[tester] = dates[min(keep_days, len(dates)) - 1]
+        for report_date, file in dated:
+            (delete if report_date < cutoffs[tester] else keep).append(file)
+
+    by_name = lambda f: f['name']
+    return RetentionPlan(cutoffs, sorted(keep, key=by_name), sorted(delete, key=by_name))
+
+
+def batch_delete_files(
+    service,
+    files: List[Dict],
+    batch_size: int = DELETE_BATCH_SIZE,
+    max_retries: int = MAX_UPLOAD_RETRIES,
+    sleep: Callable[[float], None] = time.sleep,
+    cache: Optional[FolderCache] = None
+) -> Tuple[List[Dict], Dict[str, str]]:
+    """
+    Delete files through the Drive batch endpoint.
+
+    Each batch request carries up to batch_size deletes. Deletes rejected
+    with 429/5xx (individually or as a whole batch) are retried in a later
+    batch with exponential backoff. Files that are already gone count as
+    deleted.
+
+    Args:
+        service: Google Drive API service instance
+        files: Files to delete (dictionaries with id and name)
+        batch_size: Deletes per batch request (at most 100)
+        max_retries: Retry rounds before giving up on the remaining files
+        sleep: Function used to wait between retries
+        cache: Folder listing cache to remove deleted files from
+
+    Returns:
+        Tuple of (deleted files, {file ID: error} for files that failed)
+    """
+    deleted = []
+    failed = {}
+    pending = list(files)
+    attempt = 0
+
+    def fail(file: Dict, error: str) -> None:
+        failed[file['id']] = error
+        print(f"ERROR: Could not delete file '{file['name']}': {error}", file=sys.stderr)
+
+    while pending:
+        retry = []
+        for start in range(0, len(pending), batch_size):
+            group = {file['id']: file for file in pending[start:start + batch_size]}
+
+            def on_response(request_id, response, exception, group=group):
+                file = group[request_id]
+                if exception is None or _error_status(exception) == 404:
+                    deleted.append(file)
+                    print(f"Deleted: {file['name']}")
+                    if cache is not None:
+                        cache.discard(file['id'])
+                elif is_retryable_error(exception):
+                    retry.append(file)
+                else:
+                    fail(file, str(exception))
+
+            batch = service.new_batch_http_request(callback=on_response)
+            for file_id in group:
+                batch.add(service.files().delete(fileId=file_id), request_id=file_id)
+            try:
+                batch.execute()
+            except Exception as e:
+                if not is_retryable_error(e):
+                    raise
+                retry.extend(group.values())
+
+        if retry and attempt >= max_retries:
+            for file in retry:
+                fail(file, "Gave up after repeated 429/5xx responses")
+            break
+        if retry:
+            attempt += 1
+            sleep(backoff_delay(attempt))
+        pending = retry
+
+    return deleted, failed
+
+
+def sweep_retention(
+    service,
+    folder_id: str,
+    keep_days: int,
+    tester_name: Optional[str] = None,
+    dry_run: bool = False,
+    cache: Optional[FolderCache] = None,
+    batch_size: int = DELETE_BATCH_SIZE,
+    sleep: Callable[[float], None] = time.sleep
+) -> Tuple[RetentionPlan, List[Dict], Dict[str, str]]:
+    """
+    Delete each tester's EOD reports older than their last keep_days report dates.
+
+    The deletion set comes from one (paginated) folder listing; deletes are
+    sent in batches.
+
+    Args:
+        service: Google Drive API service instance
+        folder_id: Folder ID containing EOD files
+        keep_days: Report dates to keep per tester
+        tester_name: Only sweep this tester's reports (all testers if None)
+        dry_run: Report what would be deleted without deleting
+        cache: Folder listing cache
+        batch_size: Deletes per batch request
+        sleep: Function used to wait between retries
+
+    Returns:
+        Tuple of (plan, deleted files, {file ID: error} for failed deletes)
+
+    Raises:
+        HttpError: If the folder could not be listed; nothing is deleted
+    """
+    plan = plan_retention(list_files(service, folder_id, cache), keep_days, tester_name)
+
+    counts: Dict[str, List[int]] = {}
+    for index, files in enumerate((plan.keep, plan.delete)):
+        for file in files:
+            counts.setdefault(_eod_tester(file['name']), [0, 0])[index] += 1
+    for tester, (kept, to_delete) in sorted(counts.items()):
+        print(f"  {tester}: keep {kept} (dated {plan.cutoffs[tester].isoformat()} or later), "
+              f"delete {to_delete}")
+
+    if not plan.delete:
+        print("No reports to delete")
+        return plan, [], {}
+
+    if dry_run:
+        print(f"\n[DRY RUN] Would delete {len(plan.delete)} file(s):")
+        for file in plan.delete:
+            print(f"  • {file['name']}")
+        return plan, [], {}
+
+    deleted, failed = batch_delete_files(service, plan.delete, batch_size, sleep=sleep, cache=cache)
+    return plan, deleted, failed
 
 
 def main():
@@ -337,6 +1408,9 @@ Examples:
 
   # Upload today's EOD and delete yesterday's
   python upload_to_gdrive.py --upload EOD_2025-11-10_nico.docx --delete-yesterday --tester nico
+
+  # Upload every report in a directory, 8 at a time, in 8 MiB chunks
+  python upload_to_gdrive.py --upload-many documentation/reports/2025-11 --jobs 8 --chunk-size 8
         """
     )
 
@@ -346,6 +1420,35 @@ Examples:
         help='Path to file to upload'
     )
 
+    parser.add_argument(
+        '--upload-many',
+        nargs='+',
+        metavar='PATH',
+        help='Upload many files concurrently (files, directories or glob patterns)'
+    )
+
+    parser.add_argument(
+        '--sync',
+        nargs='+',
+        metavar='PATH',
+        help='Upload only new or changed files, updating changed ones in place'
+    )
+
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=DEFAULT_UPLOAD_JOBS,
+        help=f'Concurrent uploads with --upload-many/--sync (default: {DEFAULT_UPLOAD_JOBS})'
+    )
+
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        default=DEFAULT_CHUNK_SIZE // (1024 * 1024),
+        metavar='MIB',
+        help=f'Upload chunk size in MiB with --upload-many/--sync (default: {DEFAULT_CHUNK_SIZE // (1024 * 1024)})'
+    )
+
     parser.add_argument(
         '--list',
         action='store_true',
@@ -364,11 +1467,24 @@ Examples:
         help='Delete yesterday\'s EOD file'
     )
 
+    parser.add_argument(
+        '--keep-days',
+        type=int,
+        metavar='N',
+        help='Retention sweep: keep only the EOD reports of each tester\'s last N report dates'
+    )
+
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='With --keep-days or --sync, show what would change without changing it'
+    )
+
     parser.add_argument(
         '--tester',
         type=str,
-        default='nico',
-        help='Tester name (for finding yesterday\'s file)'
+        help=f'Tester name (for finding yesterday\'s file, default: {DEFAULT_TESTER}; '
+             'limits --keep-days to this tester)'
     )
 
     parser.add_argument(
@@ -378,14 +1494,45 @@ Examples:
         help=f'Google Drive folder name (default: {GDRIVE_FOLDER_NAME})'
     )
 
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help=f'Look up the folder again and ignore the cached folder listing (cached for {LISTING_CACHE_TTL} seconds)'
+    )
+
     args = parser.parse_args()
 
     # Validate arguments
-    if not any([args.upload, args.list, args.delete, args.delete_yesterday]):
+    if not any([args.upload, args.upload_many, args.sync, args.list, args.delete,
+                args.delete_yesterday, args.keep_days is not None]):
         parser.print_help()
-        print("\nERROR: Please specify an action (--upload, --list, --delete, or --delete-yesterday)", file=sys.stderr)
+        print("\nERROR: Please specify an action (--upload, --upload-many, --sync, --list, --delete, "
+              "--delete-yesterday or --keep-days)", file=sys.stderr)
+        return 1
+
+    if args.keep_days is not None and args.keep_days < 1:
+        print("ERROR: --keep-days must be at least 1", file=sys.stderr)
         return 1
 
+    if args.jobs < 1 or args.chunk_size < 1:
+        print("ERROR: --jobs and --chunk-size must be at least 1", file=sys.stderr)
+        return 1
+
+    upload_paths = []
+    if args.upload_many:
+        upload_paths = collect_upload_paths(args.upload_many)
+        if not upload_paths:
+            print("ERROR: No files found to upload", file=sys.stderr)
+            return 1
+
+    sync_paths = []
+    if args.sync:
+        sync_paths = collect_upload_paths(args.sync)
+        if not sync_paths:
+            print("ERROR: No files found to sync", file=sys.stderr)
+            return 1
+
+    session = None
     try:
         # Authenticate
         print_section_header("Google Drive Authentication")
@@ -394,15 +1541,20 @@ Examples:
             return 1
 
         # Build service
-        service = build('drive', 'v3', credentials=creds)
+        session = DriveSession(creds)
+        service = session.service
         print("Successfully connected to Google Drive API")
 
         # Get or create folder
         print_section_header(f"Accessing Folder: {args.folder}")
-        folder_id = get_or_create_folder(service, args.folder)
+        folder_id = session.get_folder_id(args.folder, refresh=args.refresh)
         if not folder_id:
             return 1
 
+        cache = FolderCache(folder_id)
+        if args.refresh:
+            cache.invalidate()
+
         # Handle actions
         if args.upload:
             print_section_header("Uploading File")
@@ -411,27 +1563,73 @@ Examples:
                 print(f"ERROR: File not found: {args.upload}", file=sys.stderr)
                 return 1
 
-            file_id = upload_file(service, args.upload, folder_id)
+            file_id = upload_file(service, args.upload, folder_id, cache)
             if not file_id:
                 return 1
 
+        if upload_paths:
+            print_section_header(f"Uploading {len(upload_paths)} File(s)")
+            results = bulk_upload(
+                upload_paths,
+                folder_id,
+                session.new_service,
+                jobs=args.jobs,
+                chunk_size=args.chunk_size * 1024 * 1024,
+                cache=cache
+            )
+            failed = [r for r in results if r.error]
+            print(f"\nUploaded {len(results) - len(failed)} of {len(results)} file(s)")
+            if failed:
+                print(f"ERROR: {len(failed)} upload(s) failed; re-run to resume them", file=sys.stderr)
+                return 1
+
+        if sync_paths:
+            print_section_header(f"Syncing {len(sync_paths)} File(s)")
+            result = sync_files(
+                service,
+                sync_paths,
+                folder_id,
+                session.new_service,
+                cache=cache,
+                dry_run=args.dry_run,
+                jobs=args.jobs,
+                chunk_size=args.chunk_size * 1024 * 1024
+            )
+            print(f"\nSynced: {len(result.new)} new, {len(result.updated)} updated, "
+                  f"{len(result.unchanged)} unchanged")
+            print(f"Uploaded {format_bytes(result.bytes_uploaded)}, "
+                  f"skipped {format_bytes(result.bytes_saved)} already in Drive")
+            if result.failed:
+                print(f"ERROR: {len(result.failed)} upload(s) failed; re-run to resume them", file=sys.stderr)
+                return 1
+
         if args.delete:
             print_section_header(f"Deleting File: {args.delete}")
-            file_id = find_file_by_name(service, folder_id, args.delete)
+            file_id = find_file_by_name(service, folder_id, args.delete, cache)
             if not file_id:
                 print(f"ERROR: File not found: {args.delete}", file=sys.stderr)
                 return 1
 
-            if not delete_file(service, file_id, args.delete):
+            if not delete_file(service, file_id, args.delete, cache):
                 return 1
 
         if args.delete_yesterday:
             print_section_header("Deleting Yesterday's EOD")
-            delete_yesterday_eod(service, folder_id, args.tester)
+            delete_yesterday_eod(service, folder_id, args.tester or DEFAULT_TESTER, cache)
+
+        if args.keep_days is not None:
+            print_section_header(f"Retention Sweep: Last {args.keep_days} Day(s)")
+            _, _, failed = sweep_retention(
+                service, folder_id, args.keep_days, args.tester, args.dry_run, cache)
+            if failed:
+                return 1
 
         if args.list:
             print_section_header("Files in Google Drive")
-            files = list_files(service, folder_id)
+            from_cache = cache.is_fresh
+            files = list_files(service, folder_id, cache)
+            if from_cache:
+                print("(Cached listing; use --refresh to list from Google Drive)\n")
 
             if not files:
                 print("No files found in folder")
@@ -450,12 +1648,18 @@ Examples:
 
     except HttpError as e:
         print(f"ERROR: Google Drive API error: {e}", file=sys.stderr)
+        if e.resp.status == 404 and session is not None:
+            # The saved folder ID may point to a deleted folder
+            session.forget_folder(args.folder)
         return 1
     except Exception as e:
         print(f"ERROR: Unexpected error: {e}", file=sys.stderr)
         import traceback
         traceback.print_exc()
         return 1
+    finally:
+        if session is not None:
+            session.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Google Drive v3 REST API, used by the Drive tests.
+
+Implements the subset of the API used by upload_to_gdrive.py against an
+in-memory file store:
+
+    GET    /drive/v3/files                   - List files (q, orderBy, paging)
+    GET    /drive/v3/files/<id>              - File metadata
+    POST   /drive/v3/files                   - Create a metadata-only file (folders)
+    DELETE /drive/v3/files/<id>              - Delete a file
+    POST   /upload/drive/v3/files            - Start a resumable upload (create)
+    PATCH  /upload/drive/v3/files/<id>       - Start a resumable upload (update)
+    PUT    <upload session URL>              - Upload a chunk / query progress
+    POST   /batch/drive/v3                   - Batch of GET/DELETE file requests
+
+Point a Drive service at it with
+build_drive_service(root_url=server.root_url).
+
+Example:
+    >>> server = start_fake_drive()
+    >>> server.fail_next(503, method='PUT')   # Next chunk upload fails
+    >>> server.stop()
+"""
+
+import hashlib
+import json
+import re
+import uuid
+from email.parser import BytesParser
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+FOLDER_MIMETYPE = 'application/vnd.google-apps.folder'
+DEFAULT_PAGE_SIZE = 100
+
+_CONTENT_RANGE = re.compile(r'bytes (?:(\d+)-(\d+)|\*)/(\d+|\*)')
+
+# (status, JSON payload or None, extra headers)
+Response = Tuple[int, Any, Dict[str, str]]
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+
+
+def _error(status: int, message: str) -> Response:
+    return status, {'error': {'code': status, 'message': message}}, {}
+
+
+class _Fault:
+    """An injected error response."""
+
+    def __init__(self, status: int, method: Optional[str], path: Optional[str], after: int):
+        self.status = status
+        self.method = method
+        self.path = path
+        self.after = after
+
+    def matches(self, method: str, path: str) -> bool:
+        if self.method and self.method != method:
+            return False
+        return not self.path or path.startswith(self.path)
+
+
+class FakeDriveHandler(BaseHTTPRequestHandler):
+    """Route requests to the server's in-memory Drive."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+    def _send(self, status: int, payload: Any = None, headers: Optional[Dict[str, str]] = None,
+              body: Optional[bytes] = None) -> None:
+        if body is None:
+            body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if payload is not None:
+            self.send_header('Content-Type', 'application/json; charset=UTF-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _dispatch(self, method: str) -> None:
+        body = self._read_body()
+        if method == 'POST' and urlparse(self.path).path == '/batch/drive/v3':
+            fault = self.server.take_fault(method, '/batch/drive/v3')
+            if fault:
+                self._send(*_error(fault, 'Injected fault'))
+            else:
+                self._batch(body)
+            return
+        status, payload, headers = self._route(method, self.path, self.headers, body)
+        self._send(status, payload, headers)
+
+    def _route(self, method: str, target: str, headers, body: bytes) -> Response:
+        url = urlparse(target)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        drive = self.server
+
+        fault = drive.take_fault(method, url.path)
+        drive.log_request(method, url.path, query, len(body))
+        if fault:
+            return _error(fault, 'Injected fault')
+
+        parts = [part for part in url.path.split('/') if part]
+        if 'upload_id' in query and method == 'PUT':
+            return self._upload_chunk(query['upload_id'], headers, body)
+        if parts[:3] == ['upload', 'drive', 'v3'] and parts[3:4] == ['files']:
+            file_id = parts[4] if len(parts) > 4 else None
+            return self._start_upload(file_id, query, headers, body)
+        if parts[:3] == ['drive', 'v3', 'files']:
+            file_id = parts[3] if len(parts) > 3 else None
+            return self._files(method, file_id, query, body)
+        return _error(404, f'Unknown path: {url.path}')
+
+    def _batch(self, body: bytes) -> None:
+        """Answer a multipart/mixed batch with one application/http part per request."""
+        content_type = self.headers.get('Content-Type', '')
+        message = BytesParser().parsebytes(
+            f'Content-Type: {content_type}\r\n\r\n'.encode('utf-8') + body)
+        if not message.is_multipart():
+            self._send(*_error(400, 'Batch body must be multipart/mixed'))
+            return
+        self.server.batches.append(len(message.get_payload()))
+
+        boundary = f'batch_{uuid.uuid4().hex}'
+        out = []
+        for part in message.get_payload():
+            raw = part.get_payload(decode=True)
+            request_line, _, rest = raw.partition(b'\n')
+            method, target, _ = request_line.decode('utf-8').strip().split(' ', 2)
+            inner = BytesParser().parsebytes(rest)
+            status, payload, _ = self._route(method, target, inner, inner.get_payload(decode=True) or b'')
+
+            part_body = json.dumps(payload) if payload is not None else ''
+            out.append(
+                f'--{boundary}\r\n'
+                'Content-Type: application/http\r\n'
+                f'Content-ID: <response-{part["Content-ID"].strip("<>")}>\r\n\r\n'
+                f'HTTP/1.1 {status} {self.responses.get(status, ("",))[0]}\r\n'
+                'Content-Type: application/json; charset=UTF-8\r\n'
+                f'Content-Length: {len(part_body.encode("utf-8"))}\r\n\r\n'
+                f'{part_body}\r\n'
+            )
+        out.append(f'--{boundary}--\r\n')
+        self._send(200, headers={'Content-Type': f'multipart/mixed; boundary={boundary}'},
+                   body=''.join(out).encode('utf-8'))
+
+    def _files(self, method: str, file_id: Optional[str], query: Dict[str, str], body: bytes) -> Response:
+        drive = self.server
+        if file_id is None and method == 'GET':
+            try:
+                files = drive.query_files(query.get('q', ''), query.get('orderBy'))
+            except ValueError as e:
+                return _error(400, str(e))
+            offset = int(query.get('pageToken') or 0)
+            page_size = min(int(query.get('pageSize') or DEFAULT_PAGE_SIZE), 1000)
+            page = {'files': files[offset:offset + page_size]}
+            if offset + page_size < len(files):
+                page['nextPageToken'] = str(offset + page_size)
+            return 200, page, {}
+        if file_id is None and method == 'POST':
+            metadata = json.loads(body or b'{}')
+            return 200, drive.put_file(metadata, None), {}
+        if file_id not in drive.files:
+            return _error(404, f'File not found: {file_id}')
+        if method == 'GET':
+            return 200, drive.files[file_id], {}
+        if method == 'DELETE':
+            drive.delete_file(file_id)
+            return 204, None, {}
+        return _error(405, f'Unsupported method: {method}')
+
+    def _start_upload(self, file_id: Optional[str], query: Dict[str, str], headers, body: bytes) -> Response:
+        drive = self.server
+        if query.get('uploadType') != 'resumable':
+            return _error(400, 'Only resumable uploads are supported')
+        if file_id is not None and file_id not in drive.files:
+            return _error(404, f'File not found: {file_id}')
+
+        total = headers.get('X-Upload-Content-Length')
+        upload_id = drive.create_session(
+            json.loads(body or b'{}'),
+            file_id,
+            int(total) if total else None
+        )
+        location = f"{drive.root_url}upload/drive/v3/files?uploadType=resumable&upload_id={upload_id}"
+        return 200, None, {'Location': location}
+
+    def _upload_chunk(self, upload_id: str, headers, body: bytes) -> Response:
+        drive = self.server
+        session = drive.sessions.get(upload_id)
+        if session is None:
+            return _error(404, 'Upload session not found')
+
+        match = _CONTENT_RANGE.match(headers.get('Content-Range', ''))
+        if match and match.group(3) != '*':
+            session['total'] = int(match.group(3))
+
+        data = session['data']
+        if match and match.group(1) is not None:
+            start = int(match.group(1))
+            # Only contiguous chunks are accepted; the 308 below tells the
+            # client where to resume from
+            if start == len(data):
+                data.extend(body)
+                drive.bytes_received += len(body)
+
+        if session['total'] is not None and len(data) >= session['total']:
+            if session['result'] is None:
+                session['result'] = drive.put_file(
+                    session['metadata'], bytes(data), session['file_id'])
+            return 200, session['result'], {}
+
+        return 308, None, ({'Range': f'bytes=0-{len(data) - 1}'} if data else {})
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_PUT(self):
+        self._dispatch('PUT')
+
+    def do_PATCH(self):
+        self._dispatch('PATCH')
+
+    def do_DELETE(self):
+        self._dispatch('DELETE')
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeDriveServer(ThreadingHTTPServer):
+    """In-memory Drive file store served over local HTTP."""
+
+    daemon_threads = True
+
+    def __init__(self, address=('127.0.0.1', 0)):
+        super().__init__(address, FakeDriveHandler)
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.contents: Dict[str, bytes] = {}
+        self.sessions: Dict[str, Dict[str, Any]] = {}
+        self.requests: List[Dict[str, Any]] = []
+        self.batches: List[int] = []
+        self.connections = 0
+        self.bytes_received = 0
+        self._faults: List[_Fault] = []
+        self._lock = threading.RLock()
+        self._next_id = 1
+
+    @property
+    def root_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}/'
+
+    def process_request(self, request, client_address):
+        with self._lock:
+            self.connections += 1
+        super().process_request(request, client_address)
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def fail_next(self, status: int, count: int = 1, method: Optional[str] = None,
+                  path: Optional[str] = None, after: int = 0) -> None:
+        """
+        Answer upcoming matching requests with an error status.
+
+        Args:
+            status: HTTP status to return (e.g. 429, 503)
+            count: Number of requests to fail
+            method: Only fail requests with this method
+            path: Only fail requests whose path starts with this prefix
+            after: Let this many matching requests through first
+        """
+        with self._lock:
+            for index in range(count):
+                self._faults.append(_Fault(status, method, path, after if index == 0 else 0))
+
+    def take_fault(self, method: str, path: str) -> Optional[int]:
+        with self._lock:
+            for fault in self._faults:
+                if fault.matches(method, path):
+                    if fault.after > 0:
+                        fault.after -= 1
+                        return None
+                    self._faults.remove(fault)
+                    return fault.status
+        return None
+
+    def log_request(self, method: str, path: str, query: Dict[str, str], size: int) -> None:
+        with self._lock:
+            self.requests.append({'method': method, 'path': path, 'query': query, 'size': size})
+
+    def add_file(self, name: str, content: bytes = b'', parents: Optional[List[str]] = None,
+                 created_time: Optional[str] = None, mime_type: Optional[str] = None) -> str:
+        """Add a file directly to the store and return its ID."""
+        metadata = {'name': name, 'parents': parents or []}
+        if mime_type:
+            metadata['mimeType'] = mime_type
+        resource = self.put_file(metadata, content)
+        if created_time:
+            resource['createdTime'] = resource['modifiedTime'] = created_time
+        return resource['id']
+
+    def put_file(self, metadata: Dict[str, Any], content: Optional[bytes],
+                 file_id: Optional[str] = None) -> Dict[str, Any]:
+        """Create a file, or update an existing one when file_id is given."""
+        with self._lock:
+            if file_id is None:
+                file_id = f'file{self._next_id:05d}'
+                self._next_id += 1
+                resource = {
+                    'id': file_id,
+                    'name': metadata.get('name', 'Untitled'),
+                    'mimeType': metadata.get('mimeType', 'application/octet-stream'),
+                    'parents': metadata.get('parents', []),
+                    'createdTime': _now(),
+                    'webViewLink': f'https://drive.example/file/d/{file_id}/view',
+                }
+                self.files[file_id] = resource
+            else:
+                resource = self.files[file_id]
+                resource.update({k: v for k, v in metadata.items() if k in ('name', 'mimeType')})
+
+            resource['modifiedTime'] = _now()
+            if content is not None:
+                self.contents[file_id] = content
+                resource['size'] = str(len(content))
+                resource['md5Checksum'] = hashlib.md5(content).hexdigest()
+            return resource
+
+    def delete_file(self, file_id: str) -> None:
+        with self._lock:
+            self.files.pop(file_id, None)
+            self.contents.pop(file_id, None)
+
+    def create_session(self, metadata: Dict[str, Any], file_id: Optional[str],
+                       total: Optional[int]) -> str:
+        with self._lock:
+            upload_id = uuid.uuid4().hex
+            self.sessions[upload_id] = {
+                'metadata': metadata,
+                'file_id': file_id,
+                'total': total,
+                'data': bytearray(),
+                'result': None,
+            }
+            return upload_id
+
+    def query_files(self, q: str, order_by: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Evaluate the supported subset of the Drive query language."""
+        conditions = []
+        for clause in filter(None, (c.strip() for c in q.split(' and '))):
+            match = re.fullmatch(r"(name|mimeType)\s*(=|!=|contains)\s*'((?:[^'\\]|\\.)*)'", clause)
+            if match:
+                field, op, value = match.groups()
+                value = value.replace("\\'", "'")
+                if op == '=':
+                    conditions.append(lambda f, k=field, v=value: f.get(k) == v)
+                elif op == '!=':
+                    conditions.append(lambda f, k=field, v=value: f.get(k) != v)
+                else:
+                    conditions.append(lambda f, k=field, v=value: v in f.get(k, ''))
+                continue
+            match = re.fullmatch(r"'([^']+)' in parents", clause)
+            if match:
+                conditions.append(lambda f, p=match.group(1): p in f.get('parents', []))
+                continue
+            if clause.replace(' ', '') == 'trashed=false':
+                continue
+            raise ValueError(f'Unsupported query clause: {clause}')
+
+        with self._lock:
+            files = [dict(f) for f in self.files.values() if all(c(f) for c in conditions)]
+
+        for key in reversed((order_by or 'name').split(',')):
+            field, _, direction = key.strip().partition(' ')
+            files.sort(key=lambda f: f.get(field, ''), reverse=direction == 'desc')
+        return files
+
+
+def start_fake_drive() -> FakeDriveServer:
+    """Start a fake Drive server on a free localhost port in a background thread."""
+    server = FakeDriveServer()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    return server
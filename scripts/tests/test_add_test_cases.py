@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the markdown test case tokenizer.
+
+Run tests:
+    python -m pytest scripts/tests/test_add_test_cases.py -v
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from analysis.add_test_cases import (
+    add_test_cases_to_excel,
+    iter_markdown_test_cases,
+    iter_test_case_rows,
+    journal_test_cases
+)
+from common.excel_utils import iter_sheet_rows, load_excel_streaming
+from common.mutation_journal import MutationJournal, compact_journal
+from test_excel_utils import HEADERS, ExcelTestCase
+
+MARKDOWN = """# New Test Cases to Add
+
+## SECTION 1: ADMIN - TEACHER URL GENERATION (2 Test Cases)
+
+### Module: Admin - Teacher Management
+
+| Test ID | Title | Priority | Pre-condition | Test Steps | Expected Result |
+|---------|-------|----------|---------------|------------|-----------------|
+| **AO013** | Generate invitation URL | P0 | Admin is logged in | 1. Open page<br>2. Click "Invite" | - URL generated<br>- Copy button shown |
+| **AO014** | Unique URLs | P1 | Admin is logged in | 1. Generate twice | - Codes differ |
+
+## SECTION 4: SECURITY TESTING (1 Test Case)
+
+### Module: Security - Authentication
+
+| **SEC001** | Too few columns | P0 |
+| **SEC002** | Session timeout | P0 | User is logged in | 1. Wait 30 minutes | - Session expired |
+"""
+
+
+class TestMarkdownTokenizer(unittest.TestCase):
+    """Test parsing test case tables from markdown."""
+
+    def test_rows_are_parsed_with_section_and_module(self):
+        """Rows get the current section's sheet and module."""
+        rows = list(iter_test_case_rows(MARKDOWN.splitlines()))
+
+        self.assertEqual([(sheet, tc['test_id']) for sheet, tc in rows], [
+            ('Admin Onboard', 'AO013'),
+            ('Admin Onboard', 'AO014'),
+            ('Security Testing', 'SEC002'),
+        ])
+        sheet, first = rows[0]
+        self.assertEqual(first['module'], 'Admin - Teacher Management')
+        self.assertEqual(first['title'], 'Generate invitation URL')
+        self.assertEqual(first['priority'], 'P0')
+        self.assertEqual(first['test_steps'], '1. Open page\n2. Click "Invite"')
+        self.assertEqual(first['expected_result'], 'URL generated\nCopy button shown')
+        self.assertEqual(rows[2][1]['module'], 'Security - Authentication')
+
+    def test_rows_before_a_section_are_ignored(self):
+        lines = ['| **X001** | a | P0 | b | c | d |'] + MARKDOWN.splitlines()
+        rows = list(iter_test_case_rows(lines))
+        self.assertNotIn('X001', [tc['test_id'] for _, tc in rows])
+
+    def test_rows_are_yielded_lazily(self):
+        """Rows are yielded as soon as their line is read."""
+        consumed = []
+
+        def lines():
+            for line in MARKDOWN.splitlines():
+                consumed.append(line)
+                yield line
+
+        sheet, test_case = next(iter_test_case_rows(lines()))
+
+        self.assertEqual(test_case['test_id'], 'AO013')
+        self.assertTrue(consumed[-1].startswith('| **AO013**'))
+
+    def test_stream_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / 'cases.md'
+            path.write_text(MARKDOWN, encoding='utf-8')
+
+            rows = list(iter_markdown_test_cases(path))
+
+        self.assertEqual([sheet for sheet, _ in rows],
+                         ['Admin Onboard', 'Admin Onboard', 'Security Testing'])
+
+    def test_missing_file_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            list(iter_markdown_test_cases(Path('/nonexistent/cases.md')))
+
+
+
+class TestAddToExcel(ExcelTestCase):
+    """Test appending parsed test cases to the workbook."""
+
+    def test_cases_are_appended_per_sheet(self):
+        """Cases follow each sheet's data; missing sheets get headers."""
+        rows = list(iter_test_case_rows(MARKDOWN.splitlines()))
+        rows.append(('Negative Scenarios', rows[-1][1]))
+
+        stats = add_test_cases_to_excel(self.xlsx_path, iter(rows))
+
+        self.assertEqual(stats, {'Admin Onboard': 2, 'Teacher - Email': 0,
+                                 'Security Testing': 1, 'Negative Scenarios': 1})
+        wb = load_excel_streaming(self.xlsx_path)
+        admin = [row.values for row in iter_sheet_rows(wb['Admin Onboard'], 6, 7, 8)]
+        negative = [row.values for row in iter_sheet_rows(wb['Negative Scenarios'], max_col=8)]
+        security_ids = [row.test_id for row in iter_sheet_rows(wb['Security Testing'], 3, 3, 1)]
+        wb.close()
+
+        self.assertEqual([values[0] for values in admin], ['AO013', 'AO014'])
+        self.assertEqual(admin[1][:3], ('AO014', 'Admin - Teacher Management', 'Unique URLs'))
+        self.assertEqual(admin[1][6:], (None, None))
+        self.assertEqual(security_ids, ['SEC002'])
+        self.assertEqual(list(negative[0]), HEADERS)
+        self.assertEqual(negative[1][0], 'SEC002')
+
+    def test_interleaved_sections_stay_in_order(self):
+        """A section that comes back continues below its earlier rows."""
+        admin, _, security = iter_test_case_rows(MARKDOWN.splitlines())
+        second = ('Admin Onboard', dict(admin[1], test_id='AO015'))
+
+        stats = add_test_cases_to_excel(self.xlsx_path, iter([admin, security, second]))
+
+        self.assertEqual(stats['Admin Onboard'], 2)
+        wb = load_excel_streaming(self.xlsx_path)
+        ids = [row.test_id for row in iter_sheet_rows(wb['Admin Onboard'], 5, 7, 1)]
+        wb.close()
+        self.assertEqual(ids, ['AO003', 'AO013', 'AO015'])
+
+    def test_journal_mode_matches_direct_add(self):
+        """Journaled cases end up in the same rows once compacted."""
+        journal = MutationJournal(self.tmp_path / 'journal.jsonl')
+
+        stats = journal_test_cases(journal, iter_test_case_rows(MARKDOWN.splitlines()))
+        result = compact_journal(self.xlsx_path, journal.path)
+
+        self.assertEqual(stats['Admin Onboard'], 2)
+        self.assertEqual(result.inserted, sum(stats.values()))
+        wb = load_excel_streaming(self.xlsx_path)
+        admin = [row.values for row in iter_sheet_rows(wb['Admin Onboard'], 6, 7, 8)]
+        wb.close()
+        self.assertEqual(admin[1][:3], ('AO014', 'Admin - Teacher Management', 'Unique URLs'))
+        self.assertEqual(admin[1][6:], (None, None))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
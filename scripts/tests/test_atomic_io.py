@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Unit tests for atomic file writes and backup rotation.
+
+Run tests:
+    python -m pytest scripts/tests/test_atomic_io.py -v
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add parent directories to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from openpyxl import load_workbook
+
+from common import atomic_io
+from common.atomic_io import (
+    atomic_write,
+    atomic_write_text,
+    link_or_copy,
+    list_backups,
+    rotate_backup
+)
+from common.excel_utils import save_excel_safely
+from test_excel_utils import ExcelTestCase
+
+
+class TestAtomicWrite(unittest.TestCase):
+    """Test writing through a temporary file and rename."""
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self._tmpdir.name)
+        self.target = self.tmp_path / 'out' / 'file.txt'
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def test_creates_file_and_parent(self):
+        atomic_write_text(self.target, 'hello')
+
+        self.assertEqual(self.target.read_text(encoding='utf-8'), 'hello')
+        self.assertEqual([p.name for p in self.target.parent.iterdir()], ['file.txt'])
+
+    def test_failed_write_leaves_target_untouched(self):
+        atomic_write_text(self.target, 'old')
+
+        def fail(f):
+            f.write(b'partial')
+            raise RuntimeError('interrupted')
+
+        with self.assertRaises(RuntimeError):
+            atomic_write(self.target, fail)
+
+        self.assertEqual(self.target.read_text(encoding='utf-8'), 'old')
+        self.assertEqual([p.name for p in self.target.parent.iterdir()], ['file.txt'])
+
+    @unittest.skipIf(os.name == 'nt', 'POSIX permissions')
+    def test_keeps_file_mode(self):
+        atomic_write_text(self.target, 'old')
+        os.chmod(self.target, 0o640)
+
+        atomic_write_text(self.target, 'new')
+
+        self.assertEqual(self.target.stat().st_mode & 0o777, 0o640)
+
+
+class TestBackupRotation(unittest.TestCase):
+    """Test keeping the previous versions of a file."""
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self._tmpdir.name)
+        self.target = self.tmp_path / 'book.xlsx'
+        self.backup_dir = self.tmp_path / 'backups'
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def write(self, text):
+        atomic_write(self.target, lambda f: f.write(text.encode()), backups=2,
+                     backup_dir=self.backup_dir)
+
+    def test_previous_versions_are_rotated(self):
+        for version in ('v1', 'v2', 'v3', 'v4'):
+            self.write(version)
+
+        backups = list_backups(self.target, self.backup_dir)
+
+        self.assertEqual([p.read_text() for p in backups], ['v2', 'v3'])
+        self.assertEqual(self.target.read_text(), 'v4')
+
+    def test_backup_survives_replacement_of_target(self):
+        """A hard-linked backup keeps the old content after the rename."""
+        self.write('v1')
+        with mock.patch.object(atomic_io, '_reflink', return_value=False):
+            self.write('v2')
+
+        [backup] = list_backups(self.target, self.backup_dir)
+        self.assertEqual(backup.read_text(), 'v1')
+
+    def test_other_backups_are_never_pruned(self):
+        self.backup_dir.mkdir()
+        original = self.backup_dir / 'book - ORIGINAL.xlsx'
+        original.write_text('original')
+        for version in ('v1', 'v2', 'v3', 'v4'):
+            self.write(version)
+
+        self.assertTrue(original.exists())
+
+    def test_no_backup_of_missing_file(self):
+        self.assertIsNone(rotate_backup(self.target, 3, self.backup_dir))
+        self.assertIsNone(rotate_backup(self.target, 0, self.backup_dir))
+
+    def test_link_falls_back_to_copy(self):
+        self.target.write_text('data')
+        cross_device = OSError(18, 'Invalid cross-device link')
+
+        with mock.patch.object(atomic_io, '_reflink', return_value=False), \
+                mock.patch.object(atomic_io.os, 'link', side_effect=cross_device):
+            method = link_or_copy(self.target, self.tmp_path / 'copy.xlsx')
+
+        self.assertEqual(method, 'copy')
+        self.assertEqual((self.tmp_path / 'copy.xlsx').read_text(), 'data')
+
+
+class TestSaveExcelSafely(ExcelTestCase):
+    """Test that workbook saves go through the atomic layer."""
+
+    def test_failed_save_keeps_previous_file(self):
+        wb = load_workbook(self.xlsx_path)
+        before = self.xlsx_path.read_bytes()
+
+        with mock.patch.object(wb, 'save', side_effect=RuntimeError('disk full')):
+            self.assertFalse(save_excel_safely(wb, self.xlsx_path))
+
+        self.assertEqual(self.xlsx_path.read_bytes(), before)
+        self.assertEqual([p.name for p in self.tmp_path.iterdir()], ['sample.xlsx'])
+
+    def test_save_with_backup(self):
+        wb = load_workbook(self.xlsx_path)
+        wb['Admin Onboard']['H2'] = 'changed'
+        backup_dir = self.tmp_path / 'backups'
+
+        self.assertTrue(save_excel_safely(wb, self.xlsx_path, backups=1, backup_dir=backup_dir))
+
+        [backup] = list_backups(self.xlsx_path, backup_dir)
+        self.assertIsNone(load_workbook(backup)['Admin Onboard']['H2'].value)
+        self.assertEqual(load_workbook(self.xlsx_path)['Admin Onboard']['H2'].value, 'changed')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the test case ID index.
+
+Run tests:
+    python -m pytest scripts/tests/test_case_index.py -v
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add parent directories to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from common.excel_utils import load_excel_streaming
+from common import case_index
+from common.case_index import build_test_case_index, load_test_case_index
+from test_excel_utils import ExcelTestCase
+
+
+class TestTestCaseIndex(ExcelTestCase):
+    """Test building, querying and persisting the index."""
+
+    def build(self):
+        wb = load_excel_streaming(self.xlsx_path)
+        index = build_test_case_index(wb)
+        wb.close()
+        return index
+
+    def test_lookup_fields(self):
+        """Entries carry sheet, row, title, module and status."""
+        index = self.build()
+        entry = index.get('AO002')
+
+        self.assertEqual(entry.sheet, 'Admin Onboard')
+        self.assertEqual(entry.row, 3)
+        self.assertEqual(entry.title, 'Verify admin login')
+        self.assertEqual(entry.module, 'Admin Login')
+        self.assertEqual(entry.status, 'Failed')
+
+    def test_sheet_scoped_lookup(self):
+        """Lookups can be restricted to a sheet."""
+        index = self.build()
+
+        self.assertIsNotNone(index.get('SEC001', 'Security Testing'))
+        self.assertIsNone(index.get('SEC001', 'Admin Onboard'))
+        self.assertNotIn('AO999', index)
+
+    def test_counts_and_order(self):
+        """Per-sheet IDs keep row order and skip empty rows."""
+        index = self.build()
+
+        self.assertEqual(index.sheet_ids('Admin Onboard'), ['AO001', 'AO002', 'AO003'])
+        self.assertEqual(index.count('Security Testing'), 1)
+        self.assertEqual(len(index), 4)
+
+    def test_persisted_index_is_reused(self):
+        """The JSON index round-trips and is rebuilt when the workbook changes."""
+        index_path = self.tmp_path / 'test_case_index.json'
+        cache_dir = self.tmp_path / 'cache'
+        first = load_test_case_index(self.xlsx_path, index_path=index_path, cache_dir=cache_dir)
+        self.assertTrue(index_path.exists())
+
+        reloaded = case_index.TestCaseIndex.load(index_path)
+        self.assertEqual(list(reloaded), list(first))
+        self.assertEqual(reloaded.source_hash, first.source_hash)
+
+        from openpyxl import load_workbook
+        wb = load_workbook(self.xlsx_path)
+        wb['Security Testing'].append(['SEC002', 'Auth', 'Verify XSS is escaped'])
+        wb.save(self.xlsx_path)
+
+        rebuilt = load_test_case_index(self.xlsx_path, index_path=index_path, cache_dir=cache_dir)
+        self.assertIn('SEC002', rebuilt)
+        self.assertNotEqual(rebuilt.source_hash, first.source_hash)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
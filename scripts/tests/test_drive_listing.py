@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Unit tests for paginated Drive folder listing and the listing cache.
+
+Requests go to a local fake Drive server (fake_drive.py).
+
+Run tests:
+    python -m pytest scripts/tests/test_drive_listing.py -v
+"""
+
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fake_drive import start_fake_drive
+from reporting.upload_to_gdrive import (
+    FolderCache,
+    build_drive_service,
+    delete_file,
+    delete_yesterday_eod,
+    find_file_by_name,
+    list_files,
+    upload_file
+)
+
+
+class ListingTestCase(unittest.TestCase):
+    """Base class with a fake Drive folder and a scratch cache file."""
+
+    def setUp(self):
+        self.server = start_fake_drive()
+        self.addCleanup(self.server.stop)
+        self.service = build_drive_service(root_url=self.server.root_url)
+        self.folder_id = self.server.add_file('EOD Reports', parents=['root'])
+
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        self.tmp_path = Path(self._tmpdir.name)
+        self.cache = FolderCache(self.folder_id, self.tmp_path / 'listing.json')
+
+    def add_report(self, name, created='2025-11-01T09:00:00.000Z'):
+        return self.server.add_file(name, b'report', [self.folder_id], created_time=created)
+
+    def list_requests(self):
+        return [r for r in self.server.requests
+                if r['method'] == 'GET' and r['path'] == '/drive/v3/files']
+
+
+class TestPaginatedListing(ListingTestCase):
+    """Test listings that span several pages."""
+
+    def test_follows_next_page_token(self):
+        """All pages are fetched, so large folders are not truncated."""
+        for index in range(250):
+            self.add_report(f'EOD_{index:03d}.docx')
+        self.server.add_file('Elsewhere.docx', parents=['other-folder'])
+
+        files = list_files(self.service, self.folder_id, page_size=100)
+
+        self.assertEqual(len(files), 250)
+        self.assertEqual(len({f['id'] for f in files}), 250)
+        self.assertEqual(len(self.list_requests()), 3)
+
+    def test_listing_includes_checksums(self):
+        """Listed files carry size and md5Checksum."""
+        self.add_report('EOD_2025-11-10_QA_Tester.docx')
+
+        file = list_files(self.service, self.folder_id)[0]
+
+        self.assertEqual(file['size'], '6')
+        self.assertIn('md5Checksum', file)
+
+
+class TestNameLookup(ListingTestCase):
+    """Test finding files by name."""
+
+    def test_uncached_lookup_is_one_targeted_query(self):
+        """Without a listing, one name= query is sent."""
+        self.add_report('Other.docx')
+        file_id = self.add_report("EOD_2025-11-10_O'Brien.docx")
+
+        self.assertEqual(find_file_by_name(self.service, self.folder_id,
+                                           "EOD_2025-11-10_O'Brien.docx"), file_id)
+
+        requests = self.list_requests()
+        self.assertEqual(len(requests), 1)
+        self.assertIn("name='EOD_2025-11-10_O\\'Brien.docx'", requests[0]['query']['q'])
+
+    def test_newest_duplicate_wins(self):
+        """Duplicate names resolve to the most recently created file."""
+        self.add_report('EOD.docx', '2025-11-01T09:00:00.000Z')
+        newest = self.add_report('EOD.docx', '2025-11-02T09:00:00.000Z')
+
+        self.assertEqual(find_file_by_name(self.service, self.folder_id, 'EOD.docx'), newest)
+        list_files(self.service, self.folder_id, self.cache)
+        self.assertEqual(find_file_by_name(self.service, self.folder_id, 'EOD.docx', self.cache), newest)
+
+    def test_cached_lookups_skip_drive(self):
+        """A fresh listing answers lookups, including misses, locally."""
+        file_id = self.add_report('EOD_2025-11-10_QA_Tester.docx')
+        list_files(self.service, self.folder_id, self.cache)
+        requests_before = len(self.server.requests)
+
+        self.assertEqual(find_file_by_name(self.service, self.folder_id,
+                                           'EOD_2025-11-10_QA_Tester.docx', self.cache), file_id)
+        self.assertIsNone(find_file_by_name(self.service, self.folder_id, 'Missing.docx', self.cache))
+        self.assertEqual(len(list_files(self.service, self.folder_id, self.cache)), 1)
+
+        self.assertEqual(len(self.server.requests), requests_before)
+
+    def test_delete_yesterday_uses_cache(self):
+        """Yesterday's report is found and deleted without a listing request."""
+        yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+        file_id = self.add_report(f'EOD_{yesterday}_QA_Tester.docx')
+        list_files(self.service, self.folder_id, self.cache)
+
+        self.assertTrue(delete_yesterday_eod(self.service, self.folder_id, 'QA_Tester', self.cache))
+
+        self.assertNotIn(file_id, self.server.files)
+        self.assertEqual(len(self.list_requests()), 1)
+        self.assertEqual(self.cache.listing(), [])
+
+
+class TestFolderCache(ListingTestCase):
+    """Test cache persistence, expiry and invalidation."""
+
+    def test_cache_persists_between_runs(self):
+        """A new cache object for the same file reuses the listing."""
+        self.add_report('EOD_2025-11-10_QA_Tester.docx')
+        list_files(self.service, self.folder_id, self.cache)
+
+        reloaded = FolderCache(self.folder_id, self.cache.cache_path)
+
+        self.assertTrue(reloaded.is_fresh)
+        self.assertEqual(reloaded.listing(), self.cache.listing())
+        self.assertFalse(FolderCache('another-folder', self.cache.cache_path).is_fresh)
+
+    def test_expired_listing_is_refetched(self):
+        """Listings older than the TTL go back to Drive."""
+        list_files(self.service, self.folder_id, self.cache)
+        self.add_report('EOD_2025-11-11_QA_Tester.docx')
+        self.cache.fetched_at -= self.cache.ttl + 1
+
+        files = list_files(self.service, self.folder_id, self.cache)
+
+        self.assertEqual(len(files), 1)
+        self.assertEqual(len(self.list_requests()), 2)
+
+    def test_upload_and_delete_update_cache(self):
+        """Uploads are added to and deletes removed from the cached listing."""
+        list_files(self.service, self.folder_id, self.cache)
+        path = self.tmp_path / 'EOD_2025-11-12_QA_Tester.docx'
+        path.write_bytes(b'new report')
+
+        file_id = upload_file(self.service, path, self.folder_id, self.cache)
+        self.assertEqual(find_file_by_name(self.service, self.folder_id, path.name, self.cache), file_id)
+
+        self.assertTrue(delete_file(self.service, file_id, path.name, self.cache))
+        self.assertIsNone(find_file_by_name(self.service, self.folder_id, path.name, self.cache))
+        self.assertEqual(len(self.list_requests()), 1)
+
+    def test_invalidate(self):
+        """Invalidation removes the cache file."""
+        list_files(self.service, self.folder_id, self.cache)
+        self.assertTrue(self.cache.cache_path.exists())
+
+        self.cache.invalidate()
+
+        self.assertFalse(self.cache.is_fresh)
+        self.assertFalse(self.cache.cache_path.exists())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
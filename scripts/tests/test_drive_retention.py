@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Unit tests for Drive retention sweeps and batched deletes.
+
+Requests go to a local fake Drive server (fake_drive.py).
+
+Run tests:
+    python -m pytest scripts/tests/test_drive_retention.py -v
+"""
+
+import sys
+import tempfile
+import unittest
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fake_drive import start_fake_drive
+from reporting.upload_to_gdrive import (
+    FolderCache,
+    HttpError,
+    batch_delete_files,
+    build_drive_service,
+    list_files,
+    plan_retention,
+    sweep_retention
+)
+
+TODAY = date(2025, 11, 20)
+
+
+def eod_name(days_ago, tester='QA_Tester'):
+    return f"EOD_{(TODAY - timedelta(days=days_ago)).isoformat()}_{tester}.docx"
+
+
+class TestPlanRetention(unittest.TestCase):
+    """Test choosing which reports a sweep deletes."""
+
+    def setUp(self):
+        names = [eod_name(days) for days in range(10)]
+        names += [eod_name(days, 'Other_Tester') for days in (0, 8)]
+        names += ['Bug_Report_Admin.docx', 'EOD_2025-13-01_QA_Tester.docx', 'EOD_notes.docx']
+        self.files = [{'id': f'id{i}', 'name': name} for i, name in enumerate(names)]
+
+    def test_keeps_last_report_dates_for_every_tester(self):
+        """Each tester keeps the reports of their own most recent dates."""
+        plan = plan_retention(self.files, 7)
+
+        self.assertEqual(plan.cutoffs, {'QA_Tester': TODAY - timedelta(days=6),
+                                        'Other_Tester': TODAY - timedelta(days=8)})
+        self.assertEqual(len(plan.keep), 9)
+        self.assertEqual([f['name'] for f in plan.delete],
+                         sorted([eod_name(7), eod_name(8), eod_name(9)]))
+
+    def test_inactive_tester_keeps_last_reports(self):
+        """Reports are counted by date, not by age: a pause deletes nothing."""
+        files = [{'id': f'id{days}', 'name': eod_name(days, 'Away_Tester')} for days in (30, 31, 40)]
+        files.append({'id': 'dup', 'name': eod_name(30, 'Away Tester')})
+
+        plan = plan_retention(files, 2)
+
+        self.assertEqual(plan.cutoffs, {'Away_Tester': TODAY - timedelta(days=31)})
+        self.assertEqual(len(plan.keep), 3)
+        self.assertEqual([f['name'] for f in plan.delete], [eod_name(40, 'Away_Tester')])
+
+    def test_tester_filter(self):
+        """A tester name limits the sweep to that tester's reports."""
+        plan = plan_retention(self.files, 1, tester_name='Other Tester')
+
+        self.assertEqual([f['name'] for f in plan.keep], [eod_name(0, 'Other_Tester')])
+        self.assertEqual([f['name'] for f in plan.delete], [eod_name(8, 'Other_Tester')])
+
+    def test_other_files_are_never_deleted(self):
+        """Non-EOD names and invalid dates are ignored."""
+        plan = plan_retention(self.files, 1)
+
+        names = {f['name'] for f in plan.delete}
+        self.assertEqual(len(names), 10)
+        self.assertNotIn('Bug_Report_Admin.docx', names)
+        self.assertNotIn('EOD_2025-13-01_QA_Tester.docx', names)
+
+    def test_invalid_keep_days(self):
+        with self.assertRaises(ValueError):
+            plan_retention(self.files, 0)
+
+
+class TestBatchedDeletes(unittest.TestCase):
+    """Test sweeps and batch deletes against the fake server."""
+
+    def setUp(self):
+        self.server = start_fake_drive()
+        self.addCleanup(self.server.stop)
+        self.service = build_drive_service(root_url=self.server.root_url)
+        self.folder_id = self.server.add_file('EOD Reports', parents=['root'])
+        self.delays = []
+
+    def add_reports(self, count, start_days_ago=0, tester='QA_Tester'):
+        return [self.server.add_file(eod_name(start_days_ago + days, tester), b'x', [self.folder_id])
+                for days in range(count)]
+
+    def sweep(self, keep_days, **kwargs):
+        return sweep_retention(self.service, self.folder_id, keep_days,
+                               sleep=self.delays.append, **kwargs)
+
+    def test_sweep_deletes_in_batches(self):
+        """One listing, then deletes grouped into batch requests."""
+        kept = self.add_reports(7)
+        self.add_reports(230, start_days_ago=7)
+
+        plan, deleted, failed = self.sweep(7, batch_size=100)
+
+        self.assertEqual(len(plan.delete), 230)
+        self.assertEqual(len(deleted), 230)
+        self.assertEqual(failed, {})
+        self.assertEqual(self.server.batches, [100, 100, 30])
+        self.assertEqual(self.server.files.keys() - {self.folder_id}, set(kept))
+        listings = [r for r in self.server.requests if r['path'] == '/drive/v3/files']
+        self.assertEqual(len(listings), 1)
+
+    def test_dry_run_deletes_nothing(self):
+        """A dry run reports the plan without sending deletes."""
+        self.add_reports(10)
+
+        plan, deleted, _ = self.sweep(3, dry_run=True)
+
+        self.assertEqual(len(plan.delete), 7)
+        self.assertEqual(deleted, [])
+        self.assertEqual(self.server.batches, [])
+        self.assertEqual(len(self.server.files), 11)
+
+    def test_throttled_deletes_are_retried(self):
+        """Deletes rejected with 429 inside a batch go out again after a backoff."""
+        self.add_reports(5, start_days_ago=10)
+        self.server.fail_next(429, count=2, method='DELETE')
+
+        _, deleted, failed = self.sweep(1)
+
+        self.assertEqual(len(deleted), 4)
+        self.assertEqual(failed, {})
+        self.assertEqual(self.server.batches, [4, 2])
+        self.assertEqual(len(self.delays), 1)
+
+    def test_failed_batch_request_is_retried(self):
+        """A 503 for the whole batch request retries every delete in it."""
+        ids = self.add_reports(3)
+        self.server.fail_next(503, method='POST', path='/batch')
+        files = [self.server.files[file_id] for file_id in ids]
+
+        deleted, failed = batch_delete_files(self.service, files, sleep=self.delays.append)
+
+        self.assertEqual(len(deleted), 3)
+        self.assertEqual(failed, {})
+        self.assertEqual(len(self.delays), 1)
+
+    def test_permanent_errors_and_missing_files(self):
+        """403s are reported as failures; already-deleted files count as deleted."""
+        ids = self.add_reports(3)
+        files = [dict(self.server.files[file_id]) for file_id in ids]
+        self.server.delete_file(ids[0])
+        self.server.fail_next(403, method='DELETE', path=f'/drive/v3/files/{ids[1]}')
+
+        deleted, failed = batch_delete_files(self.service, files, sleep=self.delays.append)
+
+        self.assertEqual({f['id'] for f in deleted}, {ids[0], ids[2]})
+        self.assertEqual(list(failed), [ids[1]])
+        self.assertEqual(self.delays, [])
+
+    def test_failed_listing_deletes_nothing(self):
+        """A listing error stops the sweep instead of reporting nothing to delete."""
+        self.add_reports(5)
+        self.server.fail_next(403, method='GET', path='/drive/v3/files')
+
+        with self.assertRaises(HttpError):
+            self.sweep(1)
+
+        self.assertEqual(self.server.batches, [])
+        self.assertEqual(len(self.server.files), 6)
+
+    def test_sweep_updates_cache(self):
+        """Deleted files are dropped from the cached listing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = FolderCache(self.folder_id, Path(tmpdir) / 'listing.json')
+            self.add_reports(4)
+
+            self.sweep(2, cache=cache)
+
+            self.assertEqual(len(cache.listing()), 2)
+            self.assertEqual(len(list_files(self.service, self.folder_id, cache)), 2)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
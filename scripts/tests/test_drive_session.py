@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the persistent Drive session.
+
+Requests go to a local fake Drive server (fake_drive.py).
+
+Run tests:
+    python -m pytest scripts/tests/test_drive_session.py -v
+"""
+
+import pickle
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from google.oauth2.credentials import Credentials
+
+from fake_drive import start_fake_drive
+import reporting.upload_to_gdrive as upload_to_gdrive
+from reporting.upload_to_gdrive import DriveSession, list_files
+
+FOLDER_NAME = 'EOD Reports - Hello Britannica'
+
+
+class TestDriveSession(unittest.TestCase):
+    """Test session reuse within and between runs."""
+
+    def setUp(self):
+        self.server = start_fake_drive()
+        self.addCleanup(self.server.stop)
+
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        self.tmp_path = Path(self._tmpdir.name)
+        self.session_path = self.tmp_path / 'drive_session.json'
+
+    def new_session(self, credentials=None):
+        session = DriveSession(credentials, self.server.root_url, self.session_path)
+        self.addCleanup(session.close)
+        return session
+
+    def folder_requests(self):
+        return [r for r in self.server.requests if r['path'] == '/drive/v3/files']
+
+    def test_folder_id_is_saved_between_runs(self):
+        """The second run gets the folder ID without a lookup."""
+        folder_id = self.new_session().get_folder_id(FOLDER_NAME)
+        requests_after_first_run = len(self.server.requests)
+
+        self.assertEqual(self.new_session().get_folder_id(FOLDER_NAME), folder_id)
+
+        self.assertEqual(len(self.server.requests), requests_after_first_run)
+        self.assertEqual(self.server.files[folder_id]['name'], FOLDER_NAME)
+
+    def test_refresh_and_forget_look_up_again(self):
+        """refresh=True and forget_folder() both force a new lookup."""
+        session = self.new_session()
+        folder_id = session.get_folder_id(FOLDER_NAME)
+
+        self.assertEqual(session.get_folder_id(FOLDER_NAME, refresh=True), folder_id)
+        session.forget_folder(FOLDER_NAME)
+        self.assertEqual(self.new_session().get_folder_id(FOLDER_NAME), folder_id)
+
+        # Create + refresh lookup + lookup after forgetting
+        self.assertEqual(len(self.folder_requests()), 4)
+
+    def test_service_reuses_one_connection(self):
+        """Requests of a run share one kept-alive connection."""
+        session = self.new_session()
+        folder_id = session.get_folder_id(FOLDER_NAME)
+        for _ in range(5):
+            list_files(session.service, folder_id)
+
+        self.assertIs(session.service, session.service)
+        self.assertEqual(self.server.connections, 1)
+
+    def test_worker_services_share_discovery_document(self):
+        """Worker services are separate but built from one loaded document."""
+        session = self.new_session()
+        first = session.new_service()
+        document = session._document
+        second = session.new_service()
+
+        self.assertIsNot(first, second)
+        self.assertIsNot(first._http, second._http)
+        self.assertIs(session._document, document)
+        self.assertEqual(second.files().list(q='trashed=false').execute(), {'files': []})
+
+    def test_refreshed_token_is_saved_on_close(self):
+        """A token refreshed during the run is written to the token file."""
+        token_file = self.tmp_path / 'token.pickle'
+        original = upload_to_gdrive.TOKEN_FILE
+        upload_to_gdrive.TOKEN_FILE = str(token_file)
+        self.addCleanup(setattr, upload_to_gdrive, 'TOKEN_FILE', original)
+
+        credentials = Credentials(token='initial-token')
+        session = self.new_session(credentials)
+        session.close()
+        self.assertFalse(token_file.exists())
+
+        credentials.token = 'refreshed-token'
+        session.close()
+
+        with open(token_file, 'rb') as f:
+            self.assertEqual(pickle.load(f).token, 'refreshed-token')
+
+    def test_unreadable_session_file_is_ignored(self):
+        """A corrupt session file falls back to a lookup."""
+        self.session_path.write_text('{not json', encoding='utf-8')
+
+        self.assertIsNotNone(self.new_session().get_folder_id(FOLDER_NAME))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
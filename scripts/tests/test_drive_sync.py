@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Unit tests for content-hash deduplicated Drive sync.
+
+Requests go to a local fake Drive server (fake_drive.py).
+
+Run tests:
+    python -m pytest scripts/tests/test_drive_sync.py -v
+"""
+
+import hashlib
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fake_drive import start_fake_drive
+from reporting.upload_to_gdrive import (
+    CHUNK_SIZE_UNIT,
+    FolderCache,
+    HttpError,
+    build_drive_service,
+    compute_md5,
+    format_bytes,
+    sync_files
+)
+
+
+class TestSyncFiles(unittest.TestCase):
+    """Test skipping, updating and uploading files by content hash."""
+
+    def setUp(self):
+        self.server = start_fake_drive()
+        self.addCleanup(self.server.stop)
+        self.service = build_drive_service(root_url=self.server.root_url)
+        self.folder_id = self.server.add_file('EOD Reports', parents=['root'])
+
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        self.tmp_path = Path(self._tmpdir.name)
+        self.cache = FolderCache(self.folder_id, self.tmp_path / 'listing.json')
+
+        self.unchanged = self.write('EOD_2025-11-10_QA_Tester.docx', b'same report' * 100)
+        self.changed = self.write('EOD_2025-11-11_QA_Tester.docx', b'edited report')
+        self.new = self.write('EOD_2025-11-12_QA_Tester.docx', b'brand new report')
+        self.unchanged_id = self.server.add_file(self.unchanged.name, self.unchanged.read_bytes(),
+                                                 [self.folder_id])
+        self.changed_id = self.server.add_file(self.changed.name, b'original report', [self.folder_id])
+
+    def write(self, name, content):
+        path = self.tmp_path / name
+        path.write_bytes(content)
+        return path
+
+    def sync(self, **kwargs):
+        return sync_files(self.service, [self.unchanged, self.changed, self.new], self.folder_id,
+                          cache=self.cache, state_dir=self.tmp_path / 'state',
+                          chunk_size=CHUNK_SIZE_UNIT, sleep=lambda seconds: None, **kwargs)
+
+    def uploads(self):
+        return [r for r in self.server.requests if r['path'].startswith('/upload')
+                and r['method'] != 'PUT']
+
+    def test_sync_skips_updates_and_uploads(self):
+        """Identical files are skipped, changed ones updated, new ones created."""
+        result = self.sync()
+
+        self.assertEqual(result.unchanged, [self.unchanged])
+        self.assertEqual(result.updated, [self.changed])
+        self.assertEqual(result.new, [self.new])
+        self.assertEqual(result.failed, [])
+        self.assertEqual(result.bytes_saved, self.unchanged.stat().st_size)
+        self.assertEqual(result.bytes_uploaded,
+                         self.changed.stat().st_size + self.new.stat().st_size)
+
+        # The changed file keeps its ID and gets the new content
+        self.assertEqual(self.server.contents[self.changed_id], b'edited report')
+        self.assertEqual(len(self.server.files), 4)
+        methods = sorted(r['method'] for r in self.uploads())
+        self.assertEqual(methods, ['PATCH', 'POST'])
+
+    def test_second_sync_uploads_nothing(self):
+        """After a sync, the cached listing shows everything as unchanged."""
+        self.sync()
+        requests_before = len(self.server.requests)
+
+        result = self.sync()
+
+        self.assertEqual(len(result.unchanged), 3)
+        self.assertEqual(result.bytes_uploaded, 0)
+        self.assertEqual(len(self.server.requests), requests_before)
+
+    def test_same_size_different_content_is_updated(self):
+        """Files are compared by MD5, not just size."""
+        self.changed.write_bytes(b'original_report')
+
+        result = self.sync()
+
+        self.assertEqual(result.updated, [self.changed])
+        self.assertEqual(self.server.files[self.changed_id]['md5Checksum'],
+                         hashlib.md5(b'original_report').hexdigest())
+
+    def test_dry_run_transfers_nothing(self):
+        """A dry run classifies files without uploading."""
+        result = self.sync(dry_run=True)
+
+        self.assertEqual(len(result.updated) + len(result.new), 2)
+        self.assertEqual(result.bytes_uploaded, 0)
+        self.assertEqual(self.uploads(), [])
+        self.assertEqual(self.server.contents[self.changed_id], b'original report')
+
+    def test_failed_uploads_are_reported(self):
+        """Files whose upload fails are not counted as synced."""
+        self.server.fail_next(403, method='POST', path='/upload')
+
+        result = self.sync()
+
+        self.assertEqual([r.path for r in result.failed], [self.new])
+        self.assertEqual(result.new, [])
+        self.assertEqual(result.updated, [self.changed])
+
+    def test_failed_listing_uploads_nothing(self):
+        """A listing error stops the sync instead of re-uploading every file."""
+        self.server.fail_next(403, method='GET', path='/drive/v3/files')
+
+        with self.assertRaises(HttpError):
+            self.sync()
+
+        self.assertEqual(self.uploads(), [])
+
+
+class TestHelpers(unittest.TestCase):
+    """Test hashing and size formatting."""
+
+    def test_compute_md5(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / 'report.docx'
+            path.write_bytes(b'x' * (CHUNK_SIZE_UNIT * 5))
+            self.assertEqual(compute_md5(path), hashlib.md5(path.read_bytes()).hexdigest())
+
+    def test_format_bytes(self):
+        self.assertEqual(format_bytes(512), '512 B')
+        self.assertEqual(format_bytes(1536), '1.5 KB')
+        self.assertEqual(format_bytes(5 * 1024 * 1024), '5.0 MB')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Unit tests for concurrent resumable Google Drive uploads.
+
+Uploads run against a local fake Drive server (fake_drive.py).
+
+Run tests:
+    python -m pytest scripts/tests/test_drive_upload.py -v
+"""
+
+import hashlib
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fake_drive import start_fake_drive
+from reporting.upload_to_gdrive import (
+    CHUNK_SIZE_UNIT,
+    build_drive_service,
+    bulk_upload,
+    collect_upload_paths,
+    upload_file_resumable
+)
+
+
+class DriveTestCase(unittest.TestCase):
+    """Base class with a fake Drive server and a scratch directory."""
+
+    def setUp(self):
+        self.server = start_fake_drive()
+        self.addCleanup(self.server.stop)
+        self.service = build_drive_service(root_url=self.server.root_url)
+        self.folder_id = self.server.add_file('EOD Reports', parents=['root'])
+
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        self.tmp_path = Path(self._tmpdir.name)
+        self.state_dir = self.tmp_path / 'state'
+        self.delays = []
+
+    def make_file(self, name, size):
+        path = self.tmp_path / name
+        path.write_bytes(os.urandom(size))
+        return path
+
+    def remote_content(self, name):
+        matches = [f['id'] for f in self.server.files.values() if f['name'] == name]
+        self.assertEqual(len(matches), 1, f'Expected one remote file named {name}')
+        return self.server.contents[matches[0]]
+
+    def upload(self, path, **kwargs):
+        return upload_file_resumable(
+            self.service, path, self.folder_id, CHUNK_SIZE_UNIT,
+            state_dir=self.state_dir, sleep=self.delays.append, **kwargs
+        )
+
+
+class TestResumableUpload(DriveTestCase):
+    """Test chunked uploads, retries and resume state."""
+
+    def test_chunked_upload(self):
+        """A file larger than one chunk arrives intact in the folder."""
+        path = self.make_file('EOD_2025-11-10_QA_Tester.docx', CHUNK_SIZE_UNIT * 2 + 1000)
+
+        result = self.upload(path)
+
+        self.assertIsNone(result.error)
+        self.assertEqual(self.remote_content(path.name), path.read_bytes())
+        self.assertEqual(self.server.files[result.file_id]['parents'], [self.folder_id])
+        chunk_puts = [r for r in self.server.requests if r['method'] == 'PUT']
+        self.assertEqual(len(chunk_puts), 3)
+        self.assertEqual(list(self.state_dir.glob('*.json')), [])
+
+    def test_retries_429_and_5xx_with_backoff(self):
+        """Throttling and server errors are retried with growing delays."""
+        path = self.make_file('EOD_2025-11-11_QA_Tester.docx', CHUNK_SIZE_UNIT + 10)
+        self.server.fail_next(429, method='POST', path='/upload')
+        self.server.fail_next(503, count=2, method='PUT')
+
+        result = self.upload(path)
+
+        self.assertIsNone(result.error)
+        self.assertEqual(result.retries, 3)
+        self.assertEqual(len(self.delays), 3)
+        self.assertLess(self.delays[0], self.delays[2])
+        self.assertEqual(self.remote_content(path.name), path.read_bytes())
+
+    def test_client_errors_are_not_retried(self):
+        """A 403 fails the file immediately."""
+        path = self.make_file('EOD_2025-11-12_QA_Tester.docx', 100)
+        self.server.fail_next(403, method='POST', path='/upload')
+
+        result = self.upload(path)
+
+        self.assertIsNotNone(result.error)
+        self.assertEqual(self.delays, [])
+        self.assertEqual(self.server.files.keys() - {self.folder_id}, set())
+
+    def test_interrupted_upload_resumes(self):
+        """A failed upload continues from the saved session on the next run."""
+        path = self.make_file('Bug_Report_Admin.docx', CHUNK_SIZE_UNIT * 3)
+        self.server.fail_next(503, method='PUT', after=2)
+
+        failed = self.upload(path, max_retries=0)
+
+        self.assertIsNotNone(failed.error)
+        self.assertEqual(len(list(self.state_dir.glob('*.json'))), 1)
+        self.assertEqual(self.server.bytes_received, CHUNK_SIZE_UNIT * 2)
+
+        resumed = self.upload(path)
+
+        self.assertIsNone(resumed.error)
+        self.assertTrue(resumed.resumed)
+        # Only the missing chunk was sent again
+        self.assertEqual(self.server.bytes_received, CHUNK_SIZE_UNIT * 3)
+        self.assertEqual(self.remote_content(path.name), path.read_bytes())
+        self.assertEqual(list(self.state_dir.glob('*.json')), [])
+
+    def test_expired_session_restarts(self):
+        """An upload session the server no longer knows starts over."""
+        path = self.make_file('Bug_Report_Expired.docx', CHUNK_SIZE_UNIT * 2)
+        self.server.fail_next(503, method='PUT', after=1)
+        self.upload(path, max_retries=0)
+        self.server.sessions.clear()
+
+        result = self.upload(path)
+
+        self.assertIsNone(result.error)
+        self.assertEqual(self.remote_content(path.name), path.read_bytes())
+
+    def test_changed_file_ignores_old_state(self):
+        """Resume state is dropped when the local file was modified."""
+        path = self.make_file('EOD_2025-11-13_QA_Tester.docx', CHUNK_SIZE_UNIT * 2)
+        self.server.fail_next(503, method='PUT', after=1)
+        self.upload(path, max_retries=0)
+
+        path.write_bytes(os.urandom(CHUNK_SIZE_UNIT + 5))
+        result = self.upload(path)
+
+        self.assertFalse(result.resumed)
+        self.assertEqual(self.server.files[result.file_id]['md5Checksum'],
+                         hashlib.md5(path.read_bytes()).hexdigest())
+
+
+class TestBulkUpload(DriveTestCase):
+    """Test concurrent uploads over a worker pool."""
+
+    def test_uploads_all_files_concurrently(self):
+        """Every file is uploaded and results keep the input order."""
+        paths = [self.make_file(f'EOD_2025-11-{day:02d}_QA_Tester.docx', CHUNK_SIZE_UNIT + day)
+                 for day in range(1, 9)]
+        services = []
+
+        def service_factory():
+            services.append(build_drive_service(root_url=self.server.root_url))
+            return services[-1]
+
+        self.server.fail_next(503, count=2, method='PUT')
+        results = bulk_upload(paths, self.folder_id, service_factory, jobs=3,
+                              chunk_size=CHUNK_SIZE_UNIT, state_dir=self.state_dir,
+                              sleep=self.delays.append)
+
+        self.assertEqual([r.path for r in results], paths)
+        self.assertTrue(all(r.error is None for r in results))
+        self.assertLessEqual(len(services), 3)
+        for path in paths:
+            self.assertEqual(self.remote_content(path.name), path.read_bytes())
+
+    def test_invalid_chunk_size(self):
+        """Chunk sizes must be a multiple of 256 KiB."""
+        with self.assertRaises(ValueError):
+            bulk_upload([], self.folder_id, lambda: self.service, chunk_size=1000)
+
+    def test_collect_upload_paths(self):
+        """Directories, files and glob patterns expand to unique files."""
+        reports = self.tmp_path / 'reports' / '2025-11'
+        reports.mkdir(parents=True)
+        first = reports / 'EOD_2025-11-10_QA_Tester.docx'
+        second = reports / 'EOD_2025-11-11_QA_Tester.docx'
+        for path in (first, second, reports / '.hidden'):
+            path.write_bytes(b'x')
+
+        paths = collect_upload_paths([
+            str(self.tmp_path / 'reports'),
+            str(first),
+            str(reports / '*.docx'),
+        ])
+
+        self.assertEqual(paths, [first, second])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
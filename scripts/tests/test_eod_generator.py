@@ -10,9 +10,11 @@ Or run without pytest:
 """
 
 import sys
+import tempfile
 from pathlib import Path
 import unittest
 from datetime import datetime
+from unittest import mock
 
 # Add parent directories to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -26,9 +28,27 @@ from reporting.generate_eod_report import (
     format_bug_fixes_section,
     format_requirements_section,
     format_next_steps_section,
-    get_user_fullname
+    get_user_fullname,
+    CompiledTemplate,
+    SECTIONS,
+    copy_document,
+    find_batch_input_files,
+    populate_eod_document,
+    generate_eod_batch,
+    load_eod_template
 )
 
+from docx import Document
+
+
+EOD_YAML = """date: "{date}"
+tester:
+  name: "QA Tester"
+product:
+  name: "Hello Britannica"
+status: "Testing in progress"
+"""
+
 
 class TestDateParsing(unittest.TestCase):
     """Test flexible date parsing."""
@@ -247,6 +267,153 @@ class TestUserName(unittest.TestCase):
         self.assertGreater(len(name), 0)
 
 
+def build_template_document():
+    """Small document with the EOD header and all section headings."""
+    doc = Document()
+    doc.add_paragraph("Hi,")
+    doc.add_paragraph("Here is the end-of-day report summarizing the testing activities and findings for <DATE>.")
+    for section in SECTIONS:
+        doc.add_paragraph(section)
+        doc.add_paragraph(f"Old content of {section[:2]}")
+        doc.add_paragraph("More old content")
+    doc.add_paragraph("Regards")
+    return doc
+
+
+class TestCompiledTemplate(unittest.TestCase):
+    """Test section anchors recorded by template compilation."""
+
+    DATA = {
+        'date': '07-11-2025',
+        'product': {'name': 'Test App'},
+        'areas_covered': ['Login', 'Games'],
+        'status': 'Stable',
+    }
+
+    def test_sections_recorded(self):
+        """Every section maps to its heading and current content paragraphs."""
+        template = CompiledTemplate(build_template_document())
+        self.assertEqual(template.header_position, 1)
+        self.assertEqual(template.sections[SECTIONS[0]], (2, [3, 4]))
+        self.assertEqual(template.sections[SECTIONS[6]], (20, [21, 22, 23]))
+
+    def test_missing_section_raises(self):
+        """Templates without all headings are rejected."""
+        doc = Document()
+        doc.add_paragraph(SECTIONS[0])
+        with self.assertRaises(ValueError) as ctx:
+            CompiledTemplate(doc)
+        self.assertIn(SECTIONS[1], str(ctx.exception))
+
+    def test_populate_copy_from_anchors(self):
+        """Copies are filled at the recorded anchors; the template is untouched."""
+        template = CompiledTemplate(build_template_document())
+        doc = template.new_document()
+
+        populate_eod_document(doc, self.DATA, 'November 07, 2025', template)
+
+        texts = [p.text for p in doc.paragraphs]
+        self.assertIn('November 07, 2025', texts[1])
+        start = texts.index(SECTIONS[1])
+        self.assertEqual(texts[start + 1:start + 4], ['Login', 'Games', SECTIONS[2]])
+        self.assertEqual(doc.paragraphs[start + 1].style.name, 'List Bullet')
+        # The last section runs to the end of the document
+        self.assertEqual(texts[-2:], [SECTIONS[6], 'Stable'])
+        self.assertNotIn('More old content', texts)
+        self.assertIn('More old content', [p.text for p in template.doc.paragraphs])
+
+
+class TestBatchGeneration(unittest.TestCase):
+    """Test batch report generation from a shared parsed template."""
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self._tmpdir.name)
+        self.input_dir = self.tmp_path / 'inputs'
+        self.output_dir = self.tmp_path / 'reports'
+        self.input_dir.mkdir()
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def write_input(self, name, *dates):
+        path = self.input_dir / name
+        path.write_text("---\n".join(EOD_YAML.format(date=d) for d in dates), encoding='utf-8')
+        return path
+
+    def header_text(self, path):
+        doc = Document(str(path))
+        return next(p.text for p in doc.paragraphs if 'summarizing' in p.text)
+
+    def test_copy_document_is_independent(self):
+        """Filling a copy leaves the parsed template untouched."""
+        template = load_eod_template().doc
+        original = template.paragraphs[0].text
+
+        doc = copy_document(template)
+        doc.paragraphs[0].text = 'Changed'
+
+        self.assertEqual(doc.paragraphs[0].text, 'Changed')
+        self.assertEqual(template.paragraphs[0].text, original)
+
+    def test_find_inputs_from_directory_and_glob(self):
+        """Directories and glob patterns resolve to sorted YAML files."""
+        b = self.write_input('b.yaml', '02-11-2025')
+        a = self.write_input('a.yml', '01-11-2025')
+        (self.input_dir / 'notes.txt').write_text('ignored')
+
+        self.assertEqual(find_batch_input_files(str(self.input_dir)), [a, b])
+        self.assertEqual(find_batch_input_files(str(self.input_dir / '*.yaml')), [b])
+        with self.assertRaises(FileNotFoundError):
+            find_batch_input_files(str(self.input_dir / '*.json'))
+
+    def test_multi_document_yaml(self):
+        """Each YAML document becomes its own report, also with worker processes."""
+        source = self.write_input('month.yaml', '01-11-2025', '02-11-2025', '03-11-2025')
+
+        generated, failures = generate_eod_batch(str(source), output_dir=self.output_dir, jobs=2)
+
+        self.assertEqual(failures, [])
+        self.assertEqual([p.name for p in generated], [
+            'EOD_2025-11-01_QA_Tester.docx',
+            'EOD_2025-11-02_QA_Tester.docx',
+            'EOD_2025-11-03_QA_Tester.docx',
+        ])
+        self.assertIn('November 02, 2025', self.header_text(generated[1]))
+
+    def test_invalid_inputs_are_reported(self):
+        """Bad documents and duplicate outputs fail without stopping the batch."""
+        self.write_input('good.yaml', '01-11-2025', '01-11-2025')
+        (self.input_dir / 'bad.yaml').write_text('date: "05-11-2025"\n', encoding='utf-8')
+
+        generated, failures = generate_eod_batch(str(self.input_dir), output_dir=self.output_dir)
+
+        self.assertEqual(len(generated), 1)
+        self.assertEqual([label for label, _ in failures], ['bad.yaml', 'good.yaml#2'])
+        self.assertIn('Missing required fields', failures[0][1])
+
+    def test_unquoted_date_and_null_tester(self):
+        """Batch inputs accept what single reports accept."""
+        (self.input_dir / 'a.yaml').write_text(
+            'date: 2025-11-04\ntester:\nproduct: {}\nstatus: "OK"\n', encoding='utf-8')
+
+        with mock.patch('reporting.generate_eod_report.get_user_fullname', return_value='QA Tester'):
+            generated, failures = generate_eod_batch(str(self.input_dir), output_dir=self.output_dir)
+
+        self.assertEqual(failures, [])
+        self.assertEqual([p.name for p in generated], ['EOD_2025-11-04_QA_Tester.docx'])
+        self.assertIn('November 04, 2025', self.header_text(generated[0]))
+
+    def test_dry_run_writes_nothing(self):
+        """Dry-run batches render reports without saving them."""
+        self.write_input('a.yaml', '01-11-2025')
+        generated, failures = generate_eod_batch(
+            str(self.input_dir), output_dir=self.output_dir, dry_run=True)
+
+        self.assertEqual((generated, failures), ([], []))
+        self.assertFalse(self.output_dir.exists())
+
+
 def run_tests():
     """Run all tests."""
     # Create test suite
@@ -262,6 +429,8 @@ def run_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestFormatRequirements))
     suite.addTests(loader.loadTestsFromTestCase(TestFormatNextSteps))
     suite.addTests(loader.loadTestsFromTestCase(TestUserName))
+    suite.addTests(loader.loadTestsFromTestCase(TestCompiledTemplate))
+    suite.addTests(loader.loadTestsFromTestCase(TestBatchGeneration))
 
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the EOD report server.
+
+Run tests:
+    python -m pytest scripts/tests/test_eod_server.py -v
+"""
+
+import http.client
+import io
+import json
+import socket
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+# Add parent directories to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from docx import Document
+
+from reporting.eod_server import content_disposition, create_server
+from reporting.generate_eod_report import load_eod_template
+
+
+EOD_YAML = b"""date: "07-11-2025"
+product:
+  name: "Hello Britannica"
+status: "Regression testing completed"
+"""
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection over a Unix domain socket."""
+
+    def __init__(self, socket_path):
+        super().__init__('localhost')
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.socket_path)
+
+
+class ServerTestCase(unittest.TestCase):
+    """Base class running a server in a background thread."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.template = load_eod_template()
+
+    def start_server(self, **kwargs):
+        server = create_server(template=self.template, default_tester='QA_Tester', **kwargs)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def request(self, method, path, body=None):
+        conn = self.connect()
+        conn.request(method, path, body=body)
+        response = conn.getresponse()
+        result = (response.status, dict(response.getheaders()), response.read())
+        conn.close()
+        return result
+
+
+class TestTCPServer(ServerTestCase):
+    """Test rendering over localhost HTTP."""
+
+    def setUp(self):
+        self.server = self.start_server(host='127.0.0.1', port=0)
+
+    def connect(self):
+        return http.client.HTTPConnection(*self.server.server_address[:2])
+
+    def test_health(self):
+        """Health reports the warm tester identity."""
+        status, _, body = self.request('GET', '/health')
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body)['tester'], 'QA_Tester')
+
+    def test_render_returns_docx(self):
+        """A valid YAML body returns the generated document."""
+        status, headers, body = self.request('POST', '/render', EOD_YAML)
+
+        self.assertEqual(status, 200)
+        self.assertIn('EOD_2025-11-07_QA_Tester.docx', headers['Content-Disposition'])
+        doc = Document(io.BytesIO(body))
+        texts = [p.text for p in doc.paragraphs]
+        self.assertTrue(any('November 07, 2025' in t for t in texts))
+        self.assertIn('Regression testing completed', texts)
+
+    def test_render_accepts_json(self):
+        """JSON bodies work as well as YAML."""
+        payload = json.dumps({'date': '2025-11-08', 'product': {}, 'status': 'OK',
+                              'tester': {'name': 'Other Tester'}})
+        status, headers, _ = self.request('POST', '/render', payload.encode('utf-8'))
+
+        self.assertEqual(status, 200)
+        self.assertIn('EOD_2025-11-08_Other_Tester.docx', headers['Content-Disposition'])
+
+    def test_tester_name_cannot_inject_headers(self):
+        """Quotes and line breaks in the tester name never reach the header raw."""
+        payload = json.dumps({'date': '2025-11-08', 'product': {}, 'status': 'OK',
+                              'tester': {'name': 'Eve"\r\nSet-Cookie: x=1'}})
+        status, headers, _ = self.request('POST', '/render', payload.encode('utf-8'))
+
+        self.assertEqual(status, 200)
+        self.assertNotIn('Set-Cookie', headers)
+        self.assertNotIn('\r', headers['Content-Disposition'])
+        self.assertEqual(headers['Content-Disposition'].count('"'), 2)
+
+    def test_invalid_input_is_rejected(self):
+        """Missing fields and bad paths return JSON errors."""
+        status, _, body = self.request('POST', '/render', b'date: "07-11-2025"\n')
+        self.assertEqual(status, 400)
+        self.assertIn('Missing required fields', json.loads(body)['error'])
+
+        status, _, _ = self.request('POST', '/render', b'date: [unclosed\n')
+        self.assertEqual(status, 400)
+
+        status, _, _ = self.request('GET', '/render')
+        self.assertEqual(status, 404)
+
+
+class TestUnixSocketServer(ServerTestCase):
+    """Test rendering over a Unix domain socket."""
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        self.socket_path = str(Path(self._tmpdir.name) / 'eod.sock')
+        self.server = self.start_server(socket_path=Path(self.socket_path))
+
+    def connect(self):
+        return UnixHTTPConnection(self.socket_path)
+
+    def test_render_over_unix_socket(self):
+        """The same API is served on a Unix socket."""
+        status, headers, body = self.request('POST', '/render', EOD_YAML)
+
+        self.assertEqual(status, 200)
+        self.assertTrue(body.startswith(b'PK'))
+        self.assertEqual(self.server.reports_rendered, 1)
+
+
+class TestServerHelpers(unittest.TestCase):
+    """Test header building and socket path checks."""
+
+    def test_content_disposition(self):
+        header = content_disposition('EOD_2025-11-07_José "QA".docx')
+
+        self.assertIn('filename="EOD_2025-11-07_Jos_ _QA_.docx"', header)
+        self.assertIn("filename*=UTF-8''EOD_2025-11-07_Jos%C3%A9%20%22QA%22.docx", header)
+
+    def test_refuses_to_replace_regular_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / 'eod.sock'
+            path.write_text('keep me')
+
+            with self.assertRaises(FileExistsError):
+                create_server(socket_path=path, template=object(), default_tester='QA_Tester')
+
+            self.assertEqual(path.read_text(), 'keep me')
+
+    def test_stale_socket_is_replaced(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / 'eod.sock'
+            stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            stale.bind(str(path))
+            stale.close()
+
+            server = create_server(socket_path=path, template=object(), default_tester='QA_Tester')
+            server.server_close()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Unit tests for common Excel utilities.
+
+Run tests:
+    python -m pytest scripts/tests/test_excel_utils.py -v
+
+Or run without pytest:
+    python scripts/tests/test_excel_utils.py
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from openpyxl import Workbook
+from openpyxl.styles import Alignment, Font
+
+from common.excel_utils import (
+    append_rows,
+    cell_style_signature,
+    load_excel_streaming,
+    load_excel_safely,
+    iter_sheet_rows,
+    get_data_extent,
+    row_content_hash,
+    SheetRow
+)
+
+
+HEADERS = ['#', 'Module', 'Tittle', 'Pre-Conditioin', 'Steps to folow',
+           'Expected results', 'Pass/Failed', 'Notes']
+
+
+def build_sample_workbook(path: Path) -> Path:
+    """Create a small workbook shaped like the master test case file."""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = 'Admin Onboard'
+    ws.append(HEADERS)
+    ws.append(['AO001', 'Admin Registration', 'Verify admin registration', 'None',
+               '1. Open page', 'Form is shown', 'Pass', None])
+    ws.append(['AO002', 'Admin Login', 'Verify admin login', 'Has account',
+               '1. Log in', 'Dashboard is shown', 'Failed', 'Flaky'])
+    # Row 4 intentionally left empty
+    ws.cell(row=5, column=1, value='AO003')
+    ws.cell(row=5, column=3, value='Verify logout')
+    # Formatted but empty cell, inflating max_row/max_column like the real file
+    ws.cell(row=50, column=20).font = Font(bold=True)
+
+    security = wb.create_sheet('Security Testing')
+    security.append(HEADERS)
+    security.append(['SEC001', 'Auth', 'Verify SQL injection is rejected', None,
+                     None, None, 'Failed', None])
+
+    wb.save(path)
+    wb.close()
+    return path
+
+
+class ExcelTestCase(unittest.TestCase):
+    """Base class providing a temporary sample workbook."""
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self._tmpdir.name)
+        self.xlsx_path = build_sample_workbook(self.tmp_path / 'sample.xlsx')
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+
+class TestStreamingReader(ExcelTestCase):
+    """Test the streaming row iterator."""
+
+    def test_iter_rows_from_streaming_workbook(self):
+        """Rows keep their sheet row numbers, including empty rows."""
+        wb = load_excel_streaming(self.xlsx_path)
+        rows = list(iter_sheet_rows(wb['Admin Onboard'], min_row=2, max_row=5))
+        wb.close()
+
+        self.assertEqual([r.row for r in rows], [2, 3, 4, 5])
+        self.assertEqual(rows[0].test_id, 'AO001')
+        self.assertTrue(rows[2].is_empty)
+        self.assertIsNone(rows[2].test_id)
+        self.assertEqual(rows[3].value(3), 'Verify logout')
+
+    def test_max_col_limits_values(self):
+        """Only the requested number of columns is returned."""
+        wb = load_excel_streaming(self.xlsx_path)
+        rows = list(iter_sheet_rows(wb['Admin Onboard'], max_row=1, max_col=3))
+        wb.close()
+
+        self.assertEqual(rows[0].values, ('#', 'Module', 'Tittle'))
+
+    def test_value_out_of_range(self):
+        """Columns beyond the row width read as None."""
+        row = SheetRow(2, ('AO001',))
+        self.assertEqual(row.value(1), 'AO001')
+        self.assertIsNone(row.value(8))
+        self.assertIsNone(row.value(0))
+
+    def test_missing_file_raises(self):
+        """Loading a missing workbook raises FileNotFoundError."""
+        with self.assertRaises(FileNotFoundError):
+            load_excel_streaming(self.tmp_path / 'missing.xlsx')
+
+
+class TestDataExtent(ExcelTestCase):
+    """Test real used-range detection."""
+
+    def test_extent_ignores_formatted_empty_cells(self):
+        """Regular and read-only worksheets report the same data range."""
+        full_wb = load_excel_safely(self.xlsx_path)
+        stream_wb = load_excel_streaming(self.xlsx_path)
+
+        for wb in (full_wb, stream_wb):
+            ws = wb['Admin Onboard']
+            self.assertEqual(ws.max_row, 50)
+            self.assertEqual(get_data_extent(ws), (5, 8))
+            wb.close()
+
+    def test_empty_extent_yields_no_rows(self):
+        """An empty range produces no rows instead of the whole sheet."""
+        wb = load_excel_streaming(self.xlsx_path)
+        rows = list(iter_sheet_rows(wb['Admin Onboard'], max_row=0))
+        wb.close()
+        self.assertEqual(rows, [])
+
+
+class TestRowContentHash(unittest.TestCase):
+    """Test row hashing used to detect changed rows."""
+
+    def test_trailing_empty_cells_ignored(self):
+        """Reading a row with a wider column bound does not change its hash."""
+        self.assertEqual(row_content_hash(('AO001', 'Login')),
+                         row_content_hash(('AO001', 'Login', None, None)))
+
+    def test_different_content_differs(self):
+        """Changed values and shifted columns produce different hashes."""
+        base = row_content_hash(('AO001', 'Login'))
+        self.assertNotEqual(base, row_content_hash(('AO001', 'Logout')))
+        self.assertNotEqual(base, row_content_hash((None, 'AO001', 'Login')))
+        self.assertNotEqual(row_content_hash((1,)), row_content_hash(('1',)))
+
+
+
+class TestAppendRows(ExcelTestCase):
+    """Test bulk appending of records as rows."""
+
+    COLUMNS = ['test_id', 'module', 'title', None, 'steps']
+
+    def setUp(self):
+        super().setUp()
+        self.wb = load_excel_safely(self.xlsx_path)
+        self.ws = self.wb['Admin Onboard']
+
+    def tearDown(self):
+        self.wb.close()
+        super().tearDown()
+
+    def records(self, count):
+        return ({'test_id': f'AO{n:03d}', 'module': 'Import', 'title': f'Case {n}',
+                 'steps': '1. Step'} for n in range(100, 100 + count))
+
+    def test_appends_after_last_value(self):
+        """Rows go after the data, not after formatted empty rows."""
+        result = append_rows(self.ws, self.records(3), self.COLUMNS)
+
+        self.assertEqual((result.first_row, result.count, result.last_row), (6, 3, 8))
+        rows = [row.values for row in iter_sheet_rows(self.ws, 6, 8, 5)]
+        self.assertEqual(rows[0], ('AO100', 'Import', 'Case 100', None, '1. Step'))
+        self.assertEqual(rows[2][0], 'AO102')
+
+    def test_style_row_is_applied(self):
+        """Every appended cell gets the template row's style."""
+        self.ws['A2'].font = Font(bold=True)
+        self.ws['E2'].alignment = Alignment(wrap_text=True)
+
+        append_rows(self.ws, self.records(50), self.COLUMNS, style_row=2)
+
+        for row in (6, 55):
+            self.assertEqual(cell_style_signature(self.ws.cell(row, 1)),
+                             cell_style_signature(self.ws['A2']))
+            self.assertTrue(self.ws.cell(row, 5).alignment.wrap_text)
+        self.assertFalse(self.ws.cell(6, 2).font.bold)
+
+    def test_sequences_and_start_row(self):
+        """Plain sequences are written from column A at the given row."""
+        result = append_rows(self.ws, [('AO200', 'Direct')], start_row=60)
+        self.ws.append(['AO201'])
+
+        self.assertEqual(result.first_row, 60)
+        self.assertEqual(self.ws['B60'].value, 'Direct')
+        self.assertEqual(self.ws['A61'].value, 'AO201')
+
+    def test_saved_rows_round_trip(self):
+        append_rows(self.ws, self.records(2), self.COLUMNS)
+        self.wb.save(self.xlsx_path)
+
+        wb = load_excel_streaming(self.xlsx_path)
+        ids = [row.test_id for row in iter_sheet_rows(wb['Admin Onboard'], 6, 7, 1)]
+        wb.close()
+        self.assertEqual(ids, ['AO100', 'AO101'])
+
+    def test_empty_records(self):
+        result = append_rows(self.ws, [], self.COLUMNS)
+        self.assertEqual(result.count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the workbook mutation journal.
+
+Run tests:
+    python -m pytest scripts/tests/test_mutation_journal.py -v
+"""
+
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+# Add parent directories to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from openpyxl import load_workbook
+from openpyxl.styles import Font
+
+from common.mutation_journal import (
+    OP_DELETE,
+    OP_INSERT,
+    OP_UPDATE,
+    JournalEntry,
+    MutationJournal,
+    compact_journal,
+    fold_entries
+)
+from test_excel_utils import HEADERS, ExcelTestCase
+
+
+class TestFoldEntries(unittest.TestCase):
+    """Test collapsing journal entries into net row changes."""
+
+    def test_later_fields_win(self):
+        changes = fold_entries([
+            JournalEntry(OP_INSERT, 'S', 'T1', {'Tittle': 'a', 'Notes': 'n'}),
+            JournalEntry(OP_UPDATE, 'S', 'T1', {'Tittle': 'b'}),
+        ])
+
+        change = changes['S']['T1']
+        self.assertEqual((change.delete, change.op), (False, OP_INSERT))
+        self.assertEqual(change.fields, {'Tittle': 'b', 'Notes': 'n'})
+
+    def test_delete_then_insert_recreates_row(self):
+        changes = fold_entries([
+            JournalEntry(OP_UPDATE, 'S', 'T1', {'Tittle': 'a'}),
+            JournalEntry(OP_DELETE, 'S', 'T1', {}),
+            JournalEntry(OP_INSERT, 'S', 'T1', {'Tittle': 'c'}),
+        ])
+
+        change = changes['S']['T1']
+        self.assertEqual((change.delete, change.op, change.fields), (True, OP_INSERT, {'Tittle': 'c'}))
+
+
+class TestMutationJournal(ExcelTestCase):
+    """Test recording and compacting journal entries."""
+
+    def setUp(self):
+        super().setUp()
+        self.journal = MutationJournal(self.tmp_path / 'journal' / 'sample.jsonl')
+
+    def compact(self, **kwargs):
+        return compact_journal(self.xlsx_path, self.journal.path, **kwargs)
+
+    def load_sheet(self, name='Admin Onboard'):
+        wb = load_workbook(self.xlsx_path)
+        self.addCleanup(wb.close)
+        return wb[name]
+
+    def test_record_and_read(self):
+        self.journal.update('Admin Onboard', 'AO001', {'Pass/Failed': 'Failed'})
+        self.journal.delete('Admin Onboard', 'AO002')
+
+        entries, offset = self.journal.read()
+
+        self.assertEqual([(e.op, e.key) for e in entries], [(OP_UPDATE, 'AO001'), (OP_DELETE, 'AO002')])
+        self.assertEqual(entries[0].fields, {'Pass/Failed': 'Failed'})
+        self.assertTrue(entries[0].ts)
+        self.assertEqual(offset, self.journal.path.stat().st_size)
+
+    def test_torn_last_record_is_ignored(self):
+        self.journal.update('Admin Onboard', 'AO001', {'Notes': 'ok'})
+        with open(self.journal.path, 'a', encoding='utf-8') as f:
+            f.write('{"op": "update", "sheet": "Admin')
+
+        entries, offset = self.journal.read()
+
+        self.assertEqual(len(entries), 1)
+        self.assertLess(offset, self.journal.path.stat().st_size)
+
+    def test_invalid_entry_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.journal.record([JournalEntry('upsert', 'Admin Onboard', 'AO001', {})])
+        with self.assertRaises(ValueError):
+            self.journal.insert('Admin Onboard', '', {})
+        self.assertFalse(self.journal.path.exists())
+
+    def test_record_waits_for_lock_holder(self):
+        """Another journal on the same file blocks while the lock is held."""
+        other = MutationJournal(self.journal.path)
+        done = threading.Event()
+
+        def record():
+            other.update('Admin Onboard', 'AO002', {'Notes': 'late'})
+            done.set()
+
+        with self.journal.lock():
+            self.journal.update('Admin Onboard', 'AO001', {'Notes': 'first'})
+            entries, offset = self.journal.read()
+            thread = threading.Thread(target=record)
+            thread.start()
+            self.assertFalse(done.wait(0.2))
+            self.journal.trim(offset)
+        thread.join(5)
+
+        self.assertTrue(done.is_set())
+        self.assertEqual([e.key for e in self.journal.read()[0]], ['AO002'])
+
+    def test_compact_applies_all_changes_in_one_save(self):
+        self.journal.update('Admin Onboard', 'AO001', {'Pass/Failed': 'Failed', 'H': 'Retest'})
+        self.journal.delete('Admin Onboard', 'AO002')
+        self.journal.insert('Admin Onboard', 'AO004', {'#': 'AO004', 'Tittle': 'Verify reset'})
+
+        result = self.compact()
+
+        self.assertEqual((result.entries, result.inserted, result.updated, result.deleted),
+                         (3, 1, 1, 1))
+        self.assertTrue(result.saved)
+        ws = self.load_sheet()
+        self.assertEqual([ws['G2'].value, ws['H2'].value], ['Failed', 'Retest'])
+        ids = [row[0] for row in ws.iter_rows(min_row=2, values_only=True) if row[0]]
+        self.assertEqual(ids, ['AO001', 'AO003', 'AO004'])
+        self.assertEqual(ws['C5'].value, 'Verify reset')
+        self.assertEqual(self.journal.path.read_bytes(), b'')
+
+    def test_inserted_rows_take_last_row_style(self):
+        wb = load_workbook(self.xlsx_path)
+        wb['Admin Onboard']['C5'].font = Font(italic=True)
+        wb.save(self.xlsx_path)
+        wb.close()
+        self.journal.insert('Admin Onboard', 'AO004', {'Tittle': 'Verify reset'})
+
+        self.compact()
+
+        self.assertTrue(self.load_sheet()['C6'].font.italic)
+
+    def test_compaction_is_idempotent(self):
+        """Replaying the same journal again leaves the workbook unchanged."""
+        self.journal.insert('Admin Onboard', 'AO004', {'Tittle': 'Verify reset'})
+        self.journal.delete('Admin Onboard', 'AO002')
+        entries, _ = self.journal.read()
+
+        self.compact()
+        self.journal.record(entries)
+        result = self.compact()
+
+        self.assertEqual((result.inserted, result.updated, result.deleted, result.skipped),
+                         (0, 0, 0, 1))
+        ids = [row[0] for row in self.load_sheet().iter_rows(min_row=2, values_only=True) if row[0]]
+        self.assertEqual(ids, ['AO001', 'AO003', 'AO004'])
+
+    def test_insert_into_new_sheet_creates_headers(self):
+        fields = dict.fromkeys(HEADERS)
+        fields.update({'#': 'NEG001', 'Module': 'Auth'})
+        self.journal.insert('Negative Scenarios', 'NEG001', fields)
+
+        self.compact()
+
+        ws = self.load_sheet('Negative Scenarios')
+        self.assertEqual([c.value for c in ws[1]], HEADERS)
+        self.assertTrue(ws['A1'].font.bold)
+        self.assertEqual([ws['A2'].value, ws['B2'].value], ['NEG001', 'Auth'])
+
+    def test_insert_of_existing_case_keeps_row(self):
+        """A journaled insert never overwrites a filled-in result."""
+        self.journal.insert('Admin Onboard', 'AO002', {'Tittle': 'Other', 'Pass/Failed': None,
+                                                       'Notes': None})
+
+        result = self.compact()
+
+        self.assertEqual((result.inserted, result.updated, result.skipped), (0, 0, 1))
+        ws = self.load_sheet()
+        self.assertEqual([ws['C3'].value, ws['G3'].value, ws['H3'].value],
+                         ['Verify admin login', 'Failed', 'Flaky'])
+        ids = [row[0] for row in ws.iter_rows(min_row=2, values_only=True) if row[0]]
+        self.assertEqual(ids, ['AO001', 'AO002', 'AO003'])
+
+    def test_update_of_missing_case_is_skipped(self):
+        self.journal.update('Admin Onboard', 'AO999', {'Notes': 'x'})
+
+        result = self.compact()
+
+        self.assertEqual(result.skipped, 1)
+
+    def test_dry_run_keeps_workbook_and_journal(self):
+        self.journal.delete('Admin Onboard', 'AO001')
+        before = self.xlsx_path.read_bytes()
+
+        result = self.compact(dry_run=True)
+
+        self.assertEqual(result.deleted, 1)
+        self.assertFalse(result.saved)
+        self.assertEqual(self.xlsx_path.read_bytes(), before)
+        self.assertEqual(len(self.journal), 1)
+
+    def test_empty_journal(self):
+        result = self.compact()
+
+        self.assertEqual(result.entries, 0)
+        self.assertFalse(result.saved)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the generate-and-upload EOD pipeline.
+
+Uploads go to a local fake Drive server (fake_drive.py).
+
+Run tests:
+    python -m pytest scripts/tests/test_publish_eod_report.py -v
+"""
+
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from docx import Document
+
+from fake_drive import start_fake_drive
+from reporting.generate_eod_report import load_eod_template
+from reporting.publish_eod_report import publish_eod_report
+from reporting.upload_to_gdrive import (
+    DriveSession,
+    FolderCache,
+    HttpError,
+    build_drive_service,
+    upload_bytes
+)
+
+EOD_DATA = {
+    'date': '07-11-2025',
+    'product': {'name': 'Hello Britannica'},
+    'status': 'Regression testing completed',
+}
+
+
+class TestPublishEODReport(unittest.TestCase):
+    """Test rendering and uploading in one pipeline."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.template = load_eod_template()
+
+    def setUp(self):
+        self.server = start_fake_drive()
+        self.addCleanup(self.server.stop)
+        self.folder_id = self.server.add_file('EOD Reports', parents=['root'])
+
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        self.tmp_path = Path(self._tmpdir.name)
+
+    def connect(self):
+        session = DriveSession(None, self.server.root_url, self.tmp_path / 'session.json')
+        cache = FolderCache(self.folder_id, self.tmp_path / 'listing.json')
+        return session, self.folder_id, cache
+
+    def publish(self, data=None, **kwargs):
+        return publish_eod_report(data or EOD_DATA, self.connect, self.template, 'QA_Tester', **kwargs)
+
+    def test_report_is_uploaded_from_memory(self):
+        """The rendered report lands in the folder without a local file."""
+        result = self.publish(save_dir=self.tmp_path)
+
+        self.assertEqual(result.filename, 'EOD_2025-11-07_QA_Tester.docx')
+        content = self.server.contents[result.file_id]
+        self.assertEqual(len(content), result.size)
+        texts = [p.text for p in Document(io.BytesIO(content)).paragraphs]
+        self.assertIn('Regression testing completed', texts)
+        self.assertEqual(list(self.tmp_path.glob('*.docx')), [])
+
+    def test_previous_day_report_is_deleted(self):
+        """The report dated the day before is deleted; others are kept."""
+        previous = self.server.add_file('EOD_2025-11-06_QA_Tester.docx', b'old', [self.folder_id])
+        older = self.server.add_file('EOD_2025-11-05_QA_Tester.docx', b'old', [self.folder_id])
+        other = self.server.add_file('EOD_2025-11-06_Other_Tester.docx', b'old', [self.folder_id])
+
+        result = self.publish()
+
+        self.assertTrue(result.deleted_previous)
+        self.assertNotIn(previous, self.server.files)
+        self.assertIn(older, self.server.files)
+        self.assertIn(other, self.server.files)
+        self.assertIn(result.file_id, self.server.files)
+
+    def test_failed_upload_keeps_previous_report(self):
+        """The previous report is only deleted once the new one is uploaded."""
+        previous = self.server.add_file('EOD_2025-11-06_QA_Tester.docx', b'old', [self.folder_id])
+        self.server.fail_next(403, method='POST', path='/upload')
+
+        with self.assertRaises(HttpError):
+            self.publish()
+
+        self.assertIn(previous, self.server.files)
+        self.assertEqual([r for r in self.server.requests if r['method'] == 'DELETE'], [])
+
+    def test_keep_previous_and_save(self):
+        """Deletion can be skipped and a local copy saved."""
+        previous = self.server.add_file('EOD_2025-11-06_QA_Tester.docx', b'old', [self.folder_id])
+
+        result = self.publish(delete_previous=False, save=True, save_dir=self.tmp_path)
+
+        self.assertFalse(result.deleted_previous)
+        self.assertIn(previous, self.server.files)
+        saved = self.tmp_path / result.filename
+        self.assertEqual(saved.read_bytes(), self.server.contents[result.file_id])
+
+    def test_timings_cover_every_stage(self):
+        """Each stage that ran reports its duration."""
+        result = self.publish(save=True, save_dir=self.tmp_path)
+
+        self.assertEqual(set(result.timings),
+                         {'render', 'connect', 'upload', 'delete', 'save', 'total'})
+        self.assertTrue(all(seconds >= 0 for seconds in result.timings.values()))
+        self.assertGreaterEqual(result.timings['total'], result.timings['upload'])
+
+    def test_dry_run_does_not_connect(self):
+        """A dry run renders only."""
+        result = self.publish(dry_run=True)
+
+        self.assertIsNone(result.file_id)
+        self.assertEqual(set(result.timings), {'render', 'total'})
+        self.assertEqual(self.server.requests, [])
+
+    def test_invalid_input_is_rejected(self):
+        """Invalid data fails before anything is uploaded."""
+        with self.assertRaises(ValueError):
+            self.publish({'date': '07-11-2025'})
+        self.assertEqual(len(self.server.files), 1)
+
+
+class TestUploadBytes(unittest.TestCase):
+    """Test uploading in-memory content."""
+
+    def setUp(self):
+        self.server = start_fake_drive()
+        self.addCleanup(self.server.stop)
+        self.service = build_drive_service(root_url=self.server.root_url)
+
+    def test_upload_retries_server_errors(self):
+        """5xx responses are retried with backoff."""
+        delays = []
+        self.server.fail_next(503, method='POST', path='/upload')
+        self.server.fail_next(500, method='PUT')
+
+        file = upload_bytes(self.service, b'report bytes', 'EOD.docx', 'folder', sleep=delays.append)
+
+        self.assertEqual(self.server.contents[file['id']], b'report bytes')
+        self.assertEqual(self.server.files[file['id']]['parents'], ['folder'])
+        self.assertEqual(len(delays), 2)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the workbook snapshot cache.
+
+Run tests:
+    python -m pytest scripts/tests/test_snapshot_cache.py -v
+"""
+
+import os
+import sys
+import unittest
+from pathlib import Path
+
+# Add parent directories to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from common.excel_utils import iter_sheet_rows, count_non_empty_rows, get_data_extent
+from common import snapshot_cache
+from common.snapshot_cache import load_workbook_snapshot
+from test_excel_utils import ExcelTestCase
+
+
+class TestSnapshotCache(ExcelTestCase):
+    """Test snapshot building and cache invalidation."""
+
+    def setUp(self):
+        super().setUp()
+        self.cache_dir = self.tmp_path / 'cache'
+        self.builds = 0
+        self._real_build = snapshot_cache.build_workbook_snapshot
+
+        def counting_build(*args, **kwargs):
+            self.builds += 1
+            return self._real_build(*args, **kwargs)
+
+        snapshot_cache.build_workbook_snapshot = counting_build
+
+    def tearDown(self):
+        snapshot_cache.build_workbook_snapshot = self._real_build
+        super().tearDown()
+
+    def load(self, **kwargs):
+        return load_workbook_snapshot(self.xlsx_path, cache_dir=self.cache_dir, **kwargs)
+
+    def test_snapshot_matches_workbook(self):
+        """Snapshot rows behave like worksheet rows."""
+        snapshot = self.load()
+        ws = snapshot['Admin Onboard']
+
+        self.assertEqual(snapshot.sheetnames, ['Admin Onboard', 'Security Testing'])
+        ids = [r.test_id for r in iter_sheet_rows(ws, min_row=2) if r.test_id]
+        self.assertEqual(ids, ['AO001', 'AO002', 'AO003'])
+        self.assertEqual(count_non_empty_rows(ws), 4)
+        self.assertEqual(len(next(ws.iter_rows(max_row=1, max_col=8))), 8)
+
+    def test_snapshot_data_extent(self):
+        """Snapshots report the data range without the formatted padding."""
+        ws = self.load()['Admin Onboard']
+        self.assertEqual(ws.max_row, 50)
+        self.assertEqual(get_data_extent(ws), (5, 8))
+
+    def test_unchanged_workbook_uses_cache(self):
+        """A second load of the same file does not reparse it."""
+        self.load()
+        self.load()
+        self.assertEqual(self.builds, 1)
+
+    def test_touched_workbook_reuses_cache_by_hash(self):
+        """A new mtime with identical content still hits the cache."""
+        self.load()
+        stat = self.xlsx_path.stat()
+        os.utime(self.xlsx_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.load()
+        self.assertEqual(self.builds, 1)
+
+    def test_modified_workbook_is_reparsed(self):
+        """Changing the workbook content invalidates the snapshot."""
+        self.load()
+        from openpyxl import load_workbook
+        wb = load_workbook(self.xlsx_path)
+        wb['Admin Onboard'].append(['AO004', 'Admin Login', 'New case'])
+        wb.save(self.xlsx_path)
+
+        snapshot = self.load()
+        ids = [r.test_id for r in iter_sheet_rows(snapshot['Admin Onboard'], min_row=2)]
+        self.assertIn('AO004', ids)
+        self.assertEqual(self.builds, 2)
+
+    def test_styles_are_cached_separately(self):
+        """Style snapshots are opt-in and keyed separately from values."""
+        values = self.load()
+        styled = self.load(include_styles=True)
+
+        self.assertFalse(values.has_styles)
+        self.assertTrue(styled.has_styles)
+        self.assertIsNotNone(styled['Admin Onboard'].style_at(1, 1))
+        self.assertEqual(self.builds, 2)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
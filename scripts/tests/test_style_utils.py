@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the style mapping copy engine.
+
+Run tests:
+    python -m pytest scripts/tests/test_style_utils.py -v
+"""
+
+import sys
+import unittest
+from copy import copy
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from openpyxl import Workbook
+from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+
+from common.excel_utils import cell_style_signature
+from common.style_utils import StyleHasher, StyleMapper, compare_sheet_styles
+
+
+def build_styled_workbook():
+    """Workbook with a styled header row and a styled data row."""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = 'Admin Onboard'
+    thin = Side(style='thin', color='FF000000')
+    for col_idx in range(1, 4):
+        header = ws.cell(row=1, column=col_idx, value=f'H{col_idx}')
+        header.font = Font(bold=True, color='FFFFFFFF')
+        header.fill = PatternFill('solid', fgColor='FF1F4E78')
+        header.border = Border(left=thin, right=thin, top=thin, bottom=thin)
+
+        data = ws.cell(row=2, column=col_idx, value=f'AO00{col_idx}')
+        data.alignment = Alignment(wrap_text=True, vertical='top')
+        data.number_format = '0.00%' if col_idx == 2 else 'yyyy-mm-dd hh:mm'
+    return wb
+
+
+class TestStyleMapper(unittest.TestCase):
+    """Test copying styles between workbooks by style table index."""
+
+    def setUp(self):
+        self.source_wb = build_styled_workbook()
+        self.source_ws = self.source_wb['Admin Onboard']
+        self.target_wb = Workbook()
+        self.target_ws = self.target_wb.active
+        # Pre-existing style in the target, so indices differ between books
+        self.target_ws['Z1'].font = Font(italic=True, size=20)
+
+    def test_copy_matches_attribute_copy(self):
+        """Mapped styles render the same as copying each attribute."""
+        expected_wb = Workbook()
+        expected_ws = expected_wb.active
+        for row in self.source_ws.iter_rows(max_row=2, max_col=3):
+            for cell in row:
+                target = expected_ws.cell(row=cell.row, column=cell.column)
+                target.font = copy(cell.font)
+                target.fill = copy(cell.fill)
+                target.border = copy(cell.border)
+                target.alignment = copy(cell.alignment)
+                target.number_format = cell.number_format
+                target.protection = copy(cell.protection)
+
+        mapper = StyleMapper(self.source_wb, self.target_wb)
+        styled = mapper.copy_range(self.source_ws, self.target_ws, 1, 2, 3)
+
+        self.assertEqual(styled, 6)
+        for row_idx in (1, 2):
+            for col_idx in (1, 2, 3):
+                self.assertEqual(
+                    cell_style_signature(self.target_ws.cell(row=row_idx, column=col_idx)),
+                    cell_style_signature(expected_ws.cell(row=row_idx, column=col_idx))
+                )
+
+    def test_each_style_is_mapped_once(self):
+        """Repeated styles reuse the cached target indices."""
+        mapper = StyleMapper(self.source_wb, self.target_wb)
+        mapper.copy_range(self.source_ws, self.target_ws, 1, 2, 3)
+        fonts_before = len(self.target_wb._fonts)
+
+        mapper.copy_range(self.source_ws, self.target_ws, 3, 200, 3, source_row=2)
+
+        # One header style plus two data styles (different number formats)
+        self.assertEqual(mapper.mapped_count, 3)
+        self.assertEqual(len(self.target_wb._fonts), fonts_before)
+        self.assertEqual(self.target_ws['B200'].number_format, '0.00%')
+        self.assertTrue(self.target_ws['C150'].alignment.wrap_text)
+
+    def test_unstyled_source_leaves_target_unchanged(self):
+        """Cells without a source style keep their current formatting."""
+        mapper = StyleMapper(self.source_wb, self.target_wb)
+        self.target_ws['A10'].font = Font(underline='single')
+
+        mapper.copy_range(self.source_ws, self.target_ws, 10, 10, 3)
+        # Range copies read the source cell map without creating cells
+        self.assertNotIn((10, 1), self.source_ws._cells)
+
+        mapper.copy_style(self.source_ws['A10'], self.target_ws['A10'])
+        self.assertEqual(self.target_ws['A10'].font.underline, 'single')
+
+
+class TestStyleComparison(unittest.TestCase):
+    """Test hashed full-sheet formatting comparison."""
+
+    def setUp(self):
+        self.original_wb = build_styled_workbook()
+        self.original_ws = self.original_wb['Admin Onboard']
+        self.result_wb = Workbook()
+        self.result_ws = self.result_wb.active
+        StyleMapper(self.original_wb, self.result_wb).copy_range(
+            self.original_ws, self.result_ws, 1, 2, 3)
+
+    def test_hash_matches_signature_equality(self):
+        """Cells with equal signatures hash equally across workbooks."""
+        original = StyleHasher(self.original_wb)
+        result = StyleHasher(self.result_wb)
+        for row_idx in (1, 2, 5):
+            for col_idx in (1, 2, 3):
+                self.assertEqual(original.cell_hash(self.original_ws, row_idx, col_idx),
+                                 result.cell_hash(self.result_ws, row_idx, col_idx))
+        self.assertNotEqual(original.cell_hash(self.original_ws, 1, 1),
+                            original.cell_hash(self.original_ws, 2, 1))
+        # Missing cells hash as the default style without being created
+        self.assertNotIn((5, 1), self.original_ws._cells)
+
+    def test_identical_formatting_has_no_mismatches(self):
+        """A restored copy compares clean over the whole range."""
+        comparison = compare_sheet_styles(self.original_ws, self.result_ws, 10, 5)
+        self.assertEqual(comparison.cells_checked, 50)
+        self.assertEqual(comparison.mismatched_rows, [])
+        self.assertEqual(comparison.mismatched_cells, [])
+
+    def test_mismatches_are_reported_by_cell(self):
+        """Only the cells whose formatting differs are reported."""
+        self.result_ws['B2'].number_format = 'General'
+        self.result_ws['C1'].font = Font(bold=False)
+
+        comparison = compare_sheet_styles(self.original_ws, self.result_ws, 10, 5)
+
+        self.assertEqual(comparison.mismatched_rows, [1, 2])
+        self.assertEqual(comparison.mismatched_cells, [(1, 3), (2, 2)])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the SQLite test case store.
+
+Run tests:
+    python -m pytest scripts/tests/test_suite_db.py -v
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add parent directories to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from openpyxl import load_workbook
+
+from common.suite_db import open_suite_db, query_test_cases, status_counts, sync_suite_db
+from test_excel_utils import ExcelTestCase
+
+
+class TestSuiteDb(ExcelTestCase):
+    """Test exporting and querying the sample workbook."""
+
+    def setUp(self):
+        super().setUp()
+        self.conn = open_suite_db(self.tmp_path / 'suite.sqlite')
+        self.addCleanup(self.conn.close)
+
+    def sync(self, **kwargs):
+        return sync_suite_db(self.conn, self.xlsx_path, cache_dir=self.tmp_path / 'cache', **kwargs)
+
+    def edit(self, func):
+        wb = load_workbook(self.xlsx_path)
+        func(wb)
+        wb.save(self.xlsx_path)
+        wb.close()
+
+    def test_initial_export(self):
+        result = self.sync()
+
+        self.assertEqual((result.inserted, result.updated, result.deleted), (4, 0, 0))
+        self.assertFalse(result.up_to_date)
+        [case] = query_test_cases(self.conn, test_id='AO002')
+        self.assertEqual((case['sheet'], case['row'], case['module'], case['status'], case['notes']),
+                         ('Admin Onboard', 3, 'Admin Login', 'Failed', 'Flaky'))
+
+    def test_unchanged_workbook_is_not_read(self):
+        self.sync()
+
+        result = self.sync()
+
+        self.assertTrue(result.up_to_date)
+        self.assertEqual(result.unchanged, 4)
+
+    def test_incremental_sync(self):
+        self.sync()
+
+        def change(wb):
+            ws = wb['Admin Onboard']
+            ws.delete_rows(2)                    # AO001 removed, the rest move up
+            ws['G2'] = 'Pass'                    # AO002 changed
+            ws.append(['AO004', 'Admin Logout', 'Verify logout again'])
+        self.edit(change)
+        result = self.sync()
+
+        self.assertEqual((result.inserted, result.updated, result.deleted, result.unchanged),
+                         (1, 1, 1, 2))
+        rows = query_test_cases(self.conn, sheet='Admin Onboard')
+        self.assertEqual([(r['test_id'], r['row']) for r in rows],
+                         [('AO002', 2), ('AO003', 4), ('AO004', 50)])
+        self.assertEqual(rows[0]['status'], 'Pass')
+
+    def test_removed_sheet_is_dropped(self):
+        self.sync()
+        self.edit(lambda wb: wb.remove(wb['Security Testing']))
+
+        result = self.sync()
+
+        self.assertEqual(result.deleted, 1)
+        self.assertEqual(query_test_cases(self.conn, sheet='Security Testing'), [])
+
+    def test_filters(self):
+        self.sync()
+
+        failed = query_test_cases(self.conn, status='failed')
+        security = query_test_cases(self.conn, sheet='Security Testing', status='Failed')
+        found = query_test_cases(self.conn, search='login')
+        limited = query_test_cases(self.conn, limit=2)
+
+        self.assertEqual([r['test_id'] for r in failed], ['AO002', 'SEC001'])
+        self.assertEqual([r['test_id'] for r in security], ['SEC001'])
+        self.assertEqual([r['test_id'] for r in found], ['AO002'])
+        self.assertEqual([r['test_id'] for r in limited], ['AO001', 'AO002'])
+
+    def test_status_counts(self):
+        self.sync()
+
+        counts = status_counts(self.conn)
+
+        self.assertEqual(counts, {'Admin Onboard': {None: 1, 'Failed': 1, 'Pass': 1},
+                                  'Security Testing': {'Failed': 1}})
+
+    def test_indexes_are_used(self):
+        plan = self.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM test_cases WHERE sheet = ? AND status = ? COLLATE NOCASE",
+            ('Security Testing', 'Failed')).fetchall()
+
+        self.assertIn('idx_test_cases_sheet_status', str([tuple(row) for row in plan]))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the columnar test suite model.
+
+Run tests:
+    python -m pytest scripts/tests/test_suite_table.py -v
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add parent directories to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from common.excel_utils import load_excel_streaming
+from common.suite_table import (
+    SUITE_COLUMNS,
+    build_suite_table,
+    load_suite_table,
+    mask_and,
+    mask_or
+)
+from test_excel_utils import ExcelTestCase
+
+
+class TestSuiteTable(ExcelTestCase):
+    """Test loading the suite into columns and querying it."""
+
+    def build(self):
+        wb = load_excel_streaming(self.xlsx_path)
+        suite = build_suite_table(wb)
+        wb.close()
+        return suite
+
+    def test_columns_hold_test_cases(self):
+        """Each field is a column aligned with the source rows."""
+        admin = self.build()['Admin Onboard']
+
+        self.assertEqual(set(admin.columns), set(SUITE_COLUMNS))
+        self.assertEqual(admin['test_id'], ['AO001', 'AO002', 'AO003'])
+        self.assertEqual(admin.rows, [2, 3, 5])
+        self.assertEqual(admin['status'], ['Pass', 'Failed', None])
+        self.assertEqual(admin['notes'], [None, 'Flaky', None])
+        self.assertEqual(admin['expected'][0], 'Form is shown')
+
+    def test_counts(self):
+        suite = self.build()
+
+        self.assertEqual(suite.counts(), {'Admin Onboard': 3, 'Security Testing': 1})
+        self.assertEqual(len(suite), 4)
+        self.assertEqual(suite.value_counts('status'), {'Failed': 2, 'Pass': 1, None: 1})
+
+    def test_filter_and_masks(self):
+        """Masks select test cases across every column."""
+        admin = self.build()['Admin Onboard']
+
+        failed = admin.filter(admin.equals('status', 'Failed'))
+        self.assertEqual(failed['test_id'], ['AO002'])
+        self.assertEqual(failed.rows, [3])
+
+        either = mask_or(admin.isin('test_id', ['AO001']), admin.equals('status', 'Failed'))
+        self.assertEqual(admin.filter(either)['test_id'], ['AO001', 'AO002'])
+        both = mask_and(either, admin.where('module', lambda m: m and 'Login' in m))
+        self.assertEqual(admin.filter(both)['title'], ['Verify admin login'])
+
+        with self.assertRaises(ValueError):
+            admin.filter([True])
+
+    def test_group_by(self):
+        admin = self.build()['Admin Onboard']
+
+        groups = admin.group_by('status')
+
+        self.assertEqual(list(groups), ['Pass', 'Failed', None])
+        self.assertEqual(groups[None]['test_id'], ['AO003'])
+
+    def test_lookup_and_missing(self):
+        admin = self.build()['Admin Onboard']
+
+        self.assertEqual(admin.get('AO002')['row'], 3)
+        self.assertIsNone(admin.get('AO999'))
+        self.assertIn('AO001', admin)
+        self.assertEqual(admin.missing(['AO001', 'AO999', 'AO100']), ['AO999', 'AO100'])
+
+    def test_cached_and_direct_loads_match(self):
+        """Loading through the snapshot cache gives the same columns."""
+        cached = load_suite_table(self.xlsx_path, cache_dir=self.tmp_path / 'cache')
+        direct = load_suite_table(self.xlsx_path, use_cache=False)
+
+        for sheet in direct:
+            self.assertEqual(cached[sheet.title].columns, sheet.columns)
+            self.assertEqual(cached[sheet.title].rows, sheet.rows)
+        self.assertTrue(cached.source_hash)
+
+    def test_missing_file_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            load_suite_table(self.tmp_path / 'missing.xlsx')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the workbook diff engine.
+
+Run tests:
+    python -m pytest scripts/tests/test_workbook_diff.py -v
+"""
+
+import json
+import shutil
+import sys
+import unittest
+from pathlib import Path
+
+# Add parent directories to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from openpyxl import load_workbook
+
+from common.workbook_diff import (
+    diff_to_patch,
+    diff_workbook_files,
+    format_diff,
+    read_sheet_rows,
+    write_patch
+)
+from test_excel_utils import HEADERS, ExcelTestCase
+
+
+class TestWorkbookDiff(ExcelTestCase):
+    """Test diffing an edited copy of the sample workbook."""
+
+    def setUp(self):
+        super().setUp()
+        self.new_path = self.tmp_path / 'new.xlsx'
+        shutil.copy(self.xlsx_path, self.new_path)
+
+    def edit(self, func):
+        wb = load_workbook(self.new_path)
+        func(wb)
+        wb.save(self.new_path)
+        wb.close()
+
+    def diff(self):
+        return diff_workbook_files(self.xlsx_path, self.new_path,
+                                   cache_dir=self.tmp_path / 'cache')
+
+    def test_identical_workbooks(self):
+        diff = self.diff()
+
+        self.assertEqual(diff.changed_sheets, [])
+        self.assertEqual(diff.totals()['unchanged'], 4)
+        self.assertEqual(diff_to_patch(diff), [])
+
+    def test_added_removed_and_modified_cases(self):
+        """Cases are matched by test ID regardless of row."""
+        def change(wb):
+            ws = wb['Admin Onboard']
+            ws.delete_rows(2)                    # AO001 removed, AO002 moves up
+            ws['G2'] = 'Pass'                    # AO002 status changed
+            ws['H2'] = None                      # AO002 notes cleared
+            ws.append(['AO004', 'Admin Logout', 'Verify logout again'])
+        self.edit(change)
+
+        sheet = self.diff().sheets[0]
+
+        self.assertEqual(sheet.status, 'changed')
+        self.assertEqual([r.key for r in sheet.removed], ['AO001'])
+        self.assertEqual([(r.key, r.row) for r in sheet.added], [('AO004', 50)])
+        self.assertEqual(sheet.unchanged, 1)
+        [change] = sheet.modified
+        self.assertEqual((change.key, change.old_row, change.new_row), ('AO002', 3, 2))
+        self.assertEqual(change.changes, {'Pass/Failed': ('Failed', 'Pass'),
+                                          'Notes': ('Flaky', None)})
+
+    def test_new_and_removed_sheets(self):
+        def change(wb):
+            del wb['Security Testing']
+            ws = wb.create_sheet('Negative Scenarios')
+            ws.append(HEADERS)
+            ws.append(['NEG001', 'Auth', 'Verify empty email'])
+        self.edit(change)
+
+        statuses = {s.sheet: s.status for s in self.diff().sheets}
+
+        self.assertEqual(statuses, {'Admin Onboard': 'unchanged', 'Negative Scenarios': 'added',
+                                    'Security Testing': 'removed'})
+
+    def test_patch_operations(self):
+        """The patch uses escaped JSON Pointers and add/remove/replace per field."""
+        def change(wb):
+            ws = wb['Admin Onboard']
+            ws['G2'] = 'Failed'
+            ws['H2'] = 'Retest'
+            ws['C3'] = None
+            ws.append(['AO009', 'Admin', 'New case'])
+        self.edit(change)
+
+        patch = diff_to_patch(self.diff())
+
+        self.assertEqual(patch, [
+            {'op': 'replace', 'path': '/Admin Onboard/cases/AO001/Pass~1Failed', 'value': 'Failed'},
+            {'op': 'add', 'path': '/Admin Onboard/cases/AO001/Notes', 'value': 'Retest'},
+            {'op': 'remove', 'path': '/Admin Onboard/cases/AO002/Tittle'},
+            {'op': 'add', 'path': '/Admin Onboard/cases/AO009',
+             'value': {'#': 'AO009', 'Module': 'Admin', 'Tittle': 'New case'}},
+        ])
+
+        patch_path = self.tmp_path / 'out' / 'patch.json'
+        self.assertTrue(write_patch(self.diff(), patch_path))
+        self.assertEqual(json.loads(patch_path.read_text(encoding='utf-8')), patch)
+
+    def test_report_lists_changes(self):
+        self.edit(lambda wb: wb['Admin Onboard'].append(['AO009', 'Admin', 'New case']))
+
+        report = format_diff(self.diff())
+
+        self.assertIn("SHEET: Admin Onboard (+1 added, -0 removed, ~0 modified, 3 unchanged)", report)
+        self.assertIn("  + AO009 (row 51) 'New case'", report)
+        self.assertNotIn('Security Testing', report)
+
+    def test_rows_without_unique_ids_get_stable_keys(self):
+        """Repeated IDs are numbered; rows without an ID are keyed by content."""
+        def change(wb):
+            ws = wb['Security Testing']
+            ws.append(['SEC001', 'Auth', 'Second row with the same ID'])
+            ws.append([None, 'Section note'])
+        self.edit(change)
+
+        wb = load_workbook(self.new_path, read_only=True)
+        fields, rows = read_sheet_rows(wb['Security Testing'])
+        wb.close()
+
+        self.assertEqual(fields[:3], ['#', 'Module', 'Tittle'])
+        keys = list(rows)
+        self.assertEqual(keys[:2], ['SEC001', 'SEC001@2'])
+        self.assertTrue(keys[2].startswith('row:'))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the three-way workbook merge.
+
+Run tests:
+    python -m pytest scripts/tests/test_workbook_merge.py -v
+"""
+
+import shutil
+import sys
+import unittest
+from pathlib import Path
+
+# Add parent directories to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from openpyxl import load_workbook
+from openpyxl.styles import PatternFill
+
+from common.workbook_merge import DELETE_MODIFY, MODIFY_MODIFY, merge_values, merge_workbook_files
+from test_excel_utils import HEADERS, ExcelTestCase
+
+BASE_FILL = PatternFill(start_color='FFFFFF00', end_color='FFFFFF00', fill_type='solid')
+
+
+class TestMergeValues(unittest.TestCase):
+    """Test the cell-by-cell merge of one row."""
+
+    def test_one_sided_changes_are_combined(self):
+        merged, conflicts = merge_values(('A', 'b', 'c'), ('A', 'B', 'c'), ('A', 'b', 'C'),
+                                         ['x', 'y', 'z'])
+
+        self.assertEqual(merged, ('A', 'B', 'C'))
+        self.assertEqual(conflicts, [])
+
+    def test_conflict_keeps_preferred_side(self):
+        merged, conflicts = merge_values(('A', 'b'), ('A', 'ours'), ('A', 'theirs'), ['x', 'y'],
+                                         prefer='theirs')
+
+        self.assertEqual(merged, ('A', 'theirs'))
+        self.assertEqual(conflicts, [('y', 'b', 'ours', 'theirs')])
+
+    def test_rows_of_different_length(self):
+        merged, conflicts = merge_values(('A',), ('A', None, 'note'), ('A',), ['x'])
+
+        self.assertEqual(merged, ('A', None, 'note'))
+        self.assertEqual(conflicts, [])
+
+
+class TestMergeWorkbookFiles(ExcelTestCase):
+    """Test merging two edited copies of the sample workbook."""
+
+    def setUp(self):
+        super().setUp()
+        # Give the base data rows a fill so restyled rows can be checked
+        wb = load_workbook(self.xlsx_path)
+        for cell in wb['Admin Onboard'][2][:8]:
+            cell.fill = BASE_FILL
+        wb.save(self.xlsx_path)
+        wb.close()
+
+        self.ours_path = self.tmp_path / 'ours.xlsx'
+        self.theirs_path = self.tmp_path / 'theirs.xlsx'
+        self.output_path = self.tmp_path / 'merged.xlsx'
+        shutil.copy(self.xlsx_path, self.ours_path)
+        shutil.copy(self.xlsx_path, self.theirs_path)
+
+    def edit(self, path, func):
+        wb = load_workbook(path)
+        func(wb)
+        wb.save(path)
+        wb.close()
+
+    def merge(self, **kwargs):
+        return merge_workbook_files(self.xlsx_path, self.ours_path, self.theirs_path,
+                                    self.output_path, cache_dir=self.tmp_path / 'cache',
+                                    **kwargs)
+
+    def load_result(self):
+        wb = load_workbook(self.output_path)
+        self.addCleanup(wb.close)
+        return wb
+
+    def test_no_changes(self):
+        """The requested output is still written, as a copy of ours."""
+        result = self.merge()
+
+        self.assertFalse(result.changed)
+        self.assertTrue(result.saved)
+        self.assertEqual(self.output_path.read_bytes(), self.ours_path.read_bytes())
+        self.assertEqual(result.conflicts, [])
+
+    def test_no_changes_in_place(self):
+        before = self.ours_path.read_bytes()
+
+        result = merge_workbook_files(self.xlsx_path, self.ours_path, self.theirs_path,
+                                      cache_dir=self.tmp_path / 'cache')
+
+        self.assertFalse(result.saved)
+        self.assertEqual(self.ours_path.read_bytes(), before)
+
+    def test_sheet_added_by_us(self):
+        def change(wb):
+            ws = wb.create_sheet('Negative Scenarios')
+            ws.append(HEADERS)
+            ws.append(['NEG001', 'Auth', 'Verify empty email'])
+        self.edit(self.ours_path, change)
+
+        result = self.merge()
+
+        self.assertEqual([p.status for p in result.sheets], ['unchanged', 'unchanged', 'kept'])
+        self.assertEqual(self.load_result()['Negative Scenarios']['A2'].value, 'NEG001')
+
+    def test_changes_from_both_sides_are_combined(self):
+        self.edit(self.ours_path, lambda wb: wb['Admin Onboard'].__setitem__('H2', 'ours note'))
+        self.edit(self.theirs_path, lambda wb: wb['Admin Onboard'].__setitem__('G3', 'Pass'))
+
+        result = self.merge()
+
+        self.assertTrue(result.saved)
+        self.assertEqual(result.conflicts, [])
+        ws = self.load_result()['Admin Onboard']
+        self.assertEqual(ws['H2'].value, 'ours note')
+        self.assertEqual(ws['G3'].value, 'Pass')
+        self.assertEqual(ws['A5'].value, 'AO003')
+
+    def test_conflicting_cell(self):
+        self.edit(self.ours_path, lambda wb: wb['Admin Onboard'].__setitem__('C3', 'Ours title'))
+        self.edit(self.theirs_path, lambda wb: wb['Admin Onboard'].__setitem__('C3', 'Their title'))
+
+        result = self.merge(prefer='theirs')
+
+        [conflict] = result.conflicts
+        self.assertEqual((conflict.key, conflict.field, conflict.kind),
+                         ('AO002', 'Tittle', MODIFY_MODIFY))
+        self.assertEqual((conflict.base, conflict.ours, conflict.theirs),
+                         ('Verify admin login', 'Ours title', 'Their title'))
+        self.assertEqual(self.load_result()['Admin Onboard']['C3'].value, 'Their title')
+
+    def test_rows_added_by_them_are_appended_with_base_style(self):
+        self.edit(self.theirs_path,
+                  lambda wb: wb['Admin Onboard'].append(['AO004', 'Admin', 'Verify reset']))
+
+        result = self.merge()
+
+        self.assertEqual(result.totals()['appended'], 1)
+        ws = self.load_result()['Admin Onboard']
+        self.assertEqual(ws['A6'].value, 'AO004')
+        self.assertEqual(ws['A6'].fill.start_color.rgb, 'FFFFFF00')
+
+    def test_row_changed_by_us_gets_base_style_back(self):
+        def change(wb):
+            ws = wb['Admin Onboard']
+            ws['G2'] = 'Failed'
+            ws['G2'].fill = PatternFill(fill_type=None)
+        self.edit(self.ours_path, change)
+        self.edit(self.theirs_path, lambda wb: wb['Security Testing'].__setitem__('H2', 'Done'))
+
+        self.merge()
+
+        ws = self.load_result()['Admin Onboard']
+        self.assertEqual(ws['G2'].value, 'Failed')
+        self.assertEqual(ws['G2'].fill.start_color.rgb, 'FFFFFF00')
+
+    def test_delete_and_modify(self):
+        """A row deleted on one side and changed on the other is kept."""
+        self.edit(self.ours_path, lambda wb: wb['Admin Onboard'].delete_rows(3))
+        self.edit(self.theirs_path, lambda wb: wb['Admin Onboard'].__setitem__('G3', 'Pass'))
+
+        result = self.merge()
+
+        [conflict] = result.conflicts
+        self.assertEqual((conflict.key, conflict.kind), ('AO002', DELETE_MODIFY))
+        ws = self.load_result()['Admin Onboard']
+        ids = [row[0] for row in ws.iter_rows(min_row=2, values_only=True) if row[0]]
+        self.assertEqual(ids, ['AO001', 'AO003', 'AO002'])
+
+    def test_untouched_row_deleted_by_them_is_removed(self):
+        self.edit(self.ours_path, lambda wb: wb['Admin Onboard'].__setitem__('H2', 'ours note'))
+        self.edit(self.theirs_path, lambda wb: wb['Admin Onboard'].delete_rows(3))
+
+        result = self.merge()
+
+        self.assertEqual(result.conflicts, [])
+        ws = self.load_result()['Admin Onboard']
+        self.assertEqual([ws['A2'].value, ws['A3'].value], ['AO001', None])
+        self.assertEqual(ws['A4'].value, 'AO003')
+
+    def test_sheet_added_by_them(self):
+        def change(wb):
+            ws = wb.create_sheet('Negative Scenarios')
+            ws.append(HEADERS)
+            ws.append(['NEG001', 'Auth', 'Verify empty email'])
+        self.edit(self.theirs_path, change)
+
+        result = self.merge()
+
+        self.assertEqual([p.status for p in result.sheets], ['unchanged', 'unchanged', 'added'])
+        wb = self.load_result()
+        self.assertEqual(wb.sheetnames, ['Admin Onboard', 'Security Testing', 'Negative Scenarios'])
+        self.assertEqual(wb['Negative Scenarios']['A2'].value, 'NEG001')
+
+    def test_dry_run_writes_nothing(self):
+        self.edit(self.theirs_path, lambda wb: wb['Admin Onboard'].__setitem__('G3', 'Pass'))
+
+        result = self.merge(dry_run=True)
+
+        self.assertFalse(result.saved)
+        self.assertFalse(self.output_path.exists())
+        self.assertEqual(result.totals()['rewritten'], 1)
+
+    def test_invalid_prefer(self):
+        with self.assertRaises(ValueError):
+            self.merge(prefer='both')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
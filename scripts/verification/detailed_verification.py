@@ -9,11 +9,12 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from common.excel_utils import (
-    load_excel_safely,
     get_excel_path,
     print_section_header,
     print_separator
 )
+from common.case_index import load_test_case_index
+from common.suite_table import load_suite_table
 
 
 def detailed_verification(excel_path: Path):
@@ -29,7 +30,8 @@ def detailed_verification(excel_path: Path):
     print_section_header("DETAILED VERIFICATION OF ADDED TEST CASES")
 
     try:
-        wb = load_excel_safely(excel_path)
+        suite = load_suite_table(excel_path)
+        index = load_test_case_index(excel_path)
     except Exception as e:
         print(f"Error: Failed to load Excel file: {e}", file=sys.stderr)
         return False
@@ -65,22 +67,10 @@ def detailed_verification(excel_path: Path):
         print(f"SHEET: {sheet_name}")
         print(f"{'='*80}")
 
-        if sheet_name not in wb.sheetnames:
+        if sheet_name not in suite:
             print(f"ERROR: Sheet not found!")
             continue
 
-        ws = wb[sheet_name]
-
-        # Get all test IDs from the sheet
-        all_test_ids = []
-        test_id_to_title = {}
-        for row in range(2, ws.max_row + 1):
-            test_id = ws.cell(row, 1).value
-            if test_id:
-                all_test_ids.append(str(test_id))
-                title = ws.cell(row, 3).value
-                test_id_to_title[str(test_id)] = title
-
         expected = data['range']
         found = 0
         missing = 0
@@ -90,8 +80,9 @@ def detailed_verification(excel_path: Path):
         print("-" * 80)
 
         for test_id in expected:
-            if test_id in all_test_ids:
-                title = test_id_to_title.get(test_id, 'N/A')
+            entry = index.get(test_id, sheet_name)
+            if entry:
+                title = entry.title if entry.title is not None else 'N/A'
                 print(f"[OK] {test_id}: {title[:60]}...")
                 found += 1
                 total_verified += 1
@@ -119,13 +110,10 @@ def detailed_verification(excel_path: Path):
     print("\nADDITIONAL STATISTICS")
     print_separator()
 
+    counts = suite.counts()
     for sheet_name in ['Admin Onboard', 'Teacher - Email', 'Security Testing', 'Negative Scenarios']:
-        if sheet_name in wb.sheetnames:
-            ws = wb[sheet_name]
-            test_count = sum(1 for row in range(2, ws.max_row + 1) if ws.cell(row, 1).value)
-            print(f"{sheet_name}: {test_count} total test cases")
-
-    wb.close()
+        if sheet_name in counts:
+            print(f"{sheet_name}: {counts[sheet_name]} total test cases")
 
     return total_missing == 0
 
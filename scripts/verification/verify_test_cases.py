@@ -9,11 +9,12 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from common.excel_utils import (
-    load_excel_safely,
     get_excel_path,
     print_section_header,
     print_separator
 )
+from common.case_index import load_test_case_index
+from common.suite_table import load_suite_table
 
 
 def verify_test_cases(excel_path: Path):
@@ -29,7 +30,8 @@ def verify_test_cases(excel_path: Path):
     print_section_header("VERIFICATION REPORT", "=", 60)
 
     try:
-        wb = load_excel_safely(excel_path)
+        suite = load_suite_table(excel_path)
+        index = load_test_case_index(excel_path)
     except Exception as e:
         print(f"Error: Failed to load Excel file: {e}", file=sys.stderr)
         return False
@@ -47,19 +49,15 @@ def verify_test_cases(excel_path: Path):
         print(f"Sheet: {sheet_name}")
         print(f"{'='*60}")
 
-        if sheet_name not in wb.sheetnames:
+        if sheet_name not in suite:
             print(f"ERROR: Sheet '{sheet_name}' not found!")
             continue
 
-        ws = wb[sheet_name]
-        print(f"Total rows: {ws.max_row}")
+        sheet = suite[sheet_name]
+        print(f"Total rows: {sheet.max_row}")
 
-        # Count test cases
-        found_ids = []
-        for row in range(2, ws.max_row + 1):
-            test_id = ws.cell(row, 1).value
-            if test_id:
-                found_ids.append(str(test_id))
+        # Look up test cases
+        found_ids = index.sheet_ids(sheet_name)
 
         print(f"Total test cases: {len(found_ids)}")
 
@@ -70,13 +68,9 @@ def verify_test_cases(excel_path: Path):
         # Check for specific test IDs
         print(f"\nChecking for new test cases:")
         for test_id in test_ids:
-            if test_id in found_ids:
-                # Get the row for this test ID
-                for row in range(2, ws.max_row + 1):
-                    if str(ws.cell(row, 1).value) == test_id:
-                        title = ws.cell(row, 3).value
-                        print(f"  [OK] {test_id}: {title}")
-                        break
+            entry = index.get(test_id, sheet_name)
+            if entry:
+                print(f"  [OK] {test_id}: {entry.title}")
             else:
                 print(f"  [MISSING] {test_id}: NOT FOUND")
 
@@ -85,19 +79,10 @@ def verify_test_cases(excel_path: Path):
     print("SUMMARY OF ALL SHEETS")
     print(f"{'='*60}")
 
-    for sheet_name in wb.sheetnames:
-        ws = wb[sheet_name]
-        # Count rows with data
-        test_count = 0
-        for row in range(2, ws.max_row + 1):
-            if ws.cell(row, 1).value:
-                test_count += 1
-
+    for sheet_name, test_count in suite.counts().items():
         if test_count > 0:
             print(f"{sheet_name}: {test_count} test cases")
 
-    wb.close()
-
     print_separator("=", 60)
     print("Verification complete!")
     print_separator("=", 60)